@@ -25,6 +25,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.agents.specialists.hermes.hermes_agent_simple import (
     SimpleHermesAgent, PersonaConfig, IntentBucket
 )
+from src.agents.specialists.hermes.hermes_with_llm import HermesWithLLM
 from src.agents.specialists.hermes.persona_system import PersonaLibrary
 
 console = Console()
@@ -33,7 +34,8 @@ console = Console()
 class HermesTerminalUI:
     """Terminal UI for interacting with Hermes."""
     
-    def __init__(self):
+    def __init__(self, use_llm: bool = False):
+        self.use_llm = use_llm
         self.hermes = None
         self.session = None
         self.history = InMemoryHistory()
@@ -56,6 +58,25 @@ class HermesTerminalUI:
         
         return layout
     
+    def _create_hermes(self, config: PersonaConfig):
+        """Create Hermes, keeping the session store across persona changes."""
+        sessions = self.hermes.sessions if self.hermes else None
+        if self.use_llm:
+            return HermesWithLLM(persona_config=config, session_store=sessions)
+        return SimpleHermesAgent(persona_config=config, session_store=sessions)
+    
+    async def _stream_response(self, user_input: str):
+        """Print Hermes' reply token by token as the LLM streams it."""
+        self.session, chunks = await self.hermes.stream_conversation(
+            user_input,
+            session_id=self.session.session_id if self.session else None
+        )
+        
+        console.print("\n[bold green]Hermes:[/bold green] ", end="")
+        async for chunk in chunks:
+            console.print(chunk, end="", markup=False, highlight=False)
+        console.print()
+    
     def _update_header(self):
         """Update the header panel."""
         header = Panel(
@@ -187,7 +208,7 @@ class HermesTerminalUI:
         if choice in personas:
             template = personas[choice]
             config = PersonaConfig(**template.to_config())
-            self.hermes = SimpleHermesAgent(persona_config=config)
+            self.hermes = self._create_hermes(config)
             console.print(f"[green]✓ Switched to {template.name} persona[/green]")
         else:
             console.print("[red]Invalid choice[/red]")
@@ -235,7 +256,7 @@ class HermesTerminalUI:
         # Initialize Hermes with default persona
         persona = PersonaLibrary.get_business_persona()
         config = PersonaConfig(**persona.to_config())
-        self.hermes = SimpleHermesAgent(persona_config=config)
+        self.hermes = self._create_hermes(config)
         
         # Welcome message
         console.clear()
@@ -301,11 +322,14 @@ class HermesTerminalUI:
                         continue
                 
                 # Process conversation
-                with console.status("[cyan]Hermes is thinking...[/cyan]"):
-                    response, self.session = self.hermes.process_conversation(
-                        user_input,
-                        session_id=self.session.session_id if self.session else None
-                    )
+                if self.use_llm:
+                    await self._stream_response(user_input)
+                else:
+                    with console.status("[cyan]Hermes is thinking...[/cyan]"):
+                        response, self.session = self.hermes.process_conversation(
+                            user_input,
+                            session_id=self.session.session_id if self.session else None
+                        )
                 
                 # Show notification if ready for handoff
                 if self.session.ready_for_handoff and self.session.turn_count == len(self.session.messages) // 2:
@@ -330,8 +354,8 @@ class HermesTerminalUI:
 
 
 async def main():
-    """Run the Hermes Terminal UI."""
-    ui = HermesTerminalUI()
+    """Run the Hermes Terminal UI (pass --llm to stream replies from the LLM router)."""
+    ui = HermesTerminalUI(use_llm="--llm" in sys.argv)
     await ui.run()
 
 
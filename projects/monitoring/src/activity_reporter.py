@@ -0,0 +1,380 @@
+"""
+Shared, non-blocking activity and heartbeat reporting for monitored agents.
+
+Agents hand events to the per-process ActivityReporter and return at once.
+A background task sends queued activities in batches to
+``/api/activities/batch`` over one pooled aiohttp session, and only the
+latest heartbeat of each agent is sent. Under backpressure, info-level
+activities are sampled and the oldest queued activities dropped. While the
+server is unreachable, batches are spilled to a local JSONL file and
+replayed once it is back.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger('activity_reporter')
+
+# Activity statuses that are never sampled out under backpressure
+PRIORITY_STATUSES = frozenset({'error', 'warning'})
+
+
+class ActivityReporter:
+    """Batches activities and heartbeats from every agent in the process."""
+
+    def __init__(
+        self,
+        monitoring_url: str,
+        api_key: str,
+        max_queue: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        sample_watermark: float = 0.8,
+        sample_every: int = 10,
+        spill_path: Optional[str] = None,
+        max_spill_bytes: int = 16 * 1024 * 1024,
+        request_timeout: float = 5.0,
+        max_retry_delay: float = 60.0
+    ):
+        """
+        Args:
+            monitoring_url: Base URL of the monitoring server
+            api_key: API key sent with every request
+            max_queue: Activities held in memory; the oldest are dropped beyond it
+            batch_size: Activities per bulk request
+            flush_interval: Maximum seconds an activity waits before sending
+            sample_watermark: Queue fill ratio above which info events are sampled
+            sample_every: Under sampling, keep one in this many info events
+            spill_path: JSONL file for activities that could not be sent
+            max_spill_bytes: Size beyond which spilled activities are dropped
+            request_timeout: Timeout in seconds for each request
+            max_retry_delay: Upper bound of the backoff while the server is down
+        """
+        self.monitoring_url = monitoring_url.rstrip('/')
+        self.api_key = api_key
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sample_watermark = sample_watermark
+        self.sample_every = sample_every
+        self.max_spill_bytes = max_spill_bytes
+        self.request_timeout = request_timeout
+        self.max_retry_delay = max_retry_delay
+
+        if spill_path is None:
+            # Only names the spill file for this server
+            url_hash = hashlib.sha1(
+                self.monitoring_url.encode(), usedforsecurity=False
+            ).hexdigest()[:12]
+            spill_dir = os.getenv('MONITORING_SPILL_DIR', tempfile.gettempdir())
+            spill_path = os.path.join(spill_dir, f'aios_activity_spill_{url_hash}.jsonl')
+        self.spill_path = Path(spill_path)
+        self.replay_path = self.spill_path.with_name(f'{self.spill_path.stem}.replay.jsonl')
+
+        self.queue: deque = deque()
+        self.heartbeats: Dict[str, Dict[str, Any]] = {}
+        self.stats = {
+            'queued': 0,
+            'sent': 0,
+            'dropped': 0,
+            'sampled_out': 0,
+            'rejected': 0,
+            'spilled': 0,
+            'replayed': 0,
+            'heartbeats_sent': 0,
+            'heartbeats_coalesced': 0
+        }
+
+        self.retry_delay = 0.0
+        self._sample_count = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def online(self) -> bool:
+        """Whether the last request to the server went through."""
+        return self.retry_delay == 0.0
+
+    def report(self, activity: Dict[str, Any]) -> bool:
+        """
+        Queue an activity without waiting for the network.
+
+        Returns False if the activity was sampled out.
+        """
+        self._start()
+
+        if (len(self.queue) >= self.sample_watermark * self.max_queue
+                and activity.get('status') not in PRIORITY_STATUSES):
+            self._sample_count += 1
+            if self._sample_count % self.sample_every:
+                self.stats['sampled_out'] += 1
+                return False
+
+        if len(self.queue) >= self.max_queue:
+            self.queue.popleft()
+            self.stats['dropped'] += 1
+
+        self.queue.append(activity)
+        self.stats['queued'] += 1
+        if len(self.queue) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def heartbeat(self, registration_id: str, status_data: Dict[str, Any]):
+        """Queue a heartbeat; an unsent earlier one for the agent is replaced."""
+        self._start()
+        if registration_id in self.heartbeats:
+            self.stats['heartbeats_coalesced'] += 1
+        self.heartbeats[registration_id] = status_data
+        self._wakeup.set()
+
+    async def flush(self):
+        """Send queued heartbeats and activities now."""
+        self._bind_loop()
+        async with self._flush_lock:
+            await self._send_heartbeats()
+
+            if not await self._replay_spill():
+                self._spill_queue()
+                return
+
+            while self.queue:
+                count = min(self.batch_size, len(self.queue))
+                batch = [self.queue.popleft() for _ in range(count)]
+                if not await self._post_batch(batch):
+                    self._spill(batch)
+                    self._spill_queue()
+                    return
+
+    async def close(self):
+        """Stop the background task, flush what is left and close the session."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _bind_loop(self):
+        """Create loop-bound state, again if the running loop has changed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._session = None
+        self._task = None
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+
+    def _start(self):
+        """Start the background sender if it is not running."""
+        self._bind_loop()
+        if self._task is None or self._task.done():
+            self._task = self._loop.create_task(self._run())
+
+    async def _run(self):
+        """Flush on a full batch, a heartbeat or every flush interval."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"Activity reporter flush failed: {e}")
+
+            if self.retry_delay:
+                await asyncio.sleep(self.retry_delay)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """The pooled session shared by all requests."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={'X-API-Key': self.api_key},
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            )
+        return self._session
+
+    def _mark(self, online: bool):
+        """Reset or grow the retry backoff."""
+        if online:
+            self.retry_delay = 0.0
+        else:
+            self.retry_delay = min(max(1.0, self.retry_delay * 2), self.max_retry_delay)
+
+    async def _post_batch(self, batch: List[Dict[str, Any]]) -> bool:
+        """
+        Send one batch of activities.
+
+        Returns False if it should be retried later; batches the server
+        rejects as invalid are dropped. A 400 without the server's
+        ``invalid_payload`` code is retried, as it may be a storage failure.
+        """
+        try:
+            async with self._get_session().post(
+                f'{self.monitoring_url}/api/activities/batch',
+                data=json.dumps({'activities': batch}, default=str),
+                headers={'Content-Type': 'application/json'}
+            ) as response:
+                if (response.status == 429 or response.status >= 500
+                        or (response.status == 400
+                            and not await self._is_invalid_payload(response))):
+                    self._mark(online=False)
+                    return False
+
+                self._mark(online=True)
+                if response.status != 200:
+                    self.stats['rejected'] += len(batch)
+                    logger.warning(f"Activity batch rejected: {response.status}")
+                    return True
+
+                self.stats['sent'] += len(batch)
+                return True
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            logger.debug(f"Monitoring server unreachable: {e}")
+            self._mark(online=False)
+            return False
+
+    @staticmethod
+    async def _is_invalid_payload(response: aiohttp.ClientResponse) -> bool:
+        """Whether an error response says the request body itself was invalid."""
+        try:
+            body = await response.json(content_type=None)
+        except (ValueError, aiohttp.ClientError):
+            return False
+        return isinstance(body, dict) and body.get('code') == 'invalid_payload'
+
+    async def _send_heartbeats(self):
+        """Send the latest heartbeat of each agent concurrently."""
+        if not self.heartbeats:
+            return
+        heartbeats, self.heartbeats = self.heartbeats, {}
+        results = await asyncio.gather(
+            *(self._post_heartbeat(registration_id, status_data)
+              for registration_id, status_data in heartbeats.items()),
+            return_exceptions=True
+        )
+        self.stats['heartbeats_sent'] += sum(1 for result in results if result is True)
+
+    async def _post_heartbeat(self, registration_id: str, status_data: Dict[str, Any]) -> bool:
+        """Send one heartbeat; a failed one is superseded by the next."""
+        try:
+            async with self._get_session().post(
+                f'{self.monitoring_url}/api/agents/{registration_id}/heartbeat',
+                data=json.dumps(status_data, default=str),
+                headers={'Content-Type': 'application/json'}
+            ) as response:
+                if response.status != 200:
+                    logger.warning(f"Heartbeat failed for {registration_id}: {response.status}")
+                return response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            logger.debug(f"Heartbeat for {registration_id} not sent: {e}")
+            return False
+
+    def _spill_queue(self):
+        """Move everything still queued to the spill file."""
+        if self.queue:
+            batch = list(self.queue)
+            self.queue.clear()
+            self._spill(batch)
+
+    def _spill(self, activities: List[Dict[str, Any]]):
+        """Append activities to the spill file, up to its size limit."""
+        try:
+            size = self.spill_path.stat().st_size if self.spill_path.exists() else 0
+            lines = []
+            for activity in activities:
+                line = json.dumps(activity, default=str) + '\n'
+                if size + len(line) > self.max_spill_bytes:
+                    break
+                size += len(line)
+                lines.append(line)
+
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.spill_path, 'a') as f:
+                f.writelines(lines)
+
+            self.stats['spilled'] += len(lines)
+            self.stats['dropped'] += len(activities) - len(lines)
+        except OSError as e:
+            logger.warning(f"Could not spill activities: {e}")
+            self.stats['dropped'] += len(activities)
+
+    def _read_replay(self) -> List[Dict[str, Any]]:
+        """Load the activities waiting to be replayed, skipping torn lines."""
+        activities = []
+        with open(self.replay_path) as f:
+            for line in f:
+                try:
+                    activities.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return activities
+
+    async def _replay_spill(self) -> bool:
+        """
+        Send spilled activities before newer ones.
+
+        Returns False if the server is still unreachable.
+        """
+        if not self.replay_path.exists():
+            if not self.spill_path.exists():
+                return True
+            os.replace(self.spill_path, self.replay_path)
+
+        activities = self._read_replay()
+        for start in range(0, len(activities), self.batch_size):
+            batch = activities[start:start + self.batch_size]
+            if not await self._post_batch(batch):
+                with open(self.replay_path, 'w') as f:
+                    f.writelines(
+                        json.dumps(activity, default=str) + '\n'
+                        for activity in activities[start:]
+                    )
+                return False
+            self.stats['replayed'] += len(batch)
+
+        self.replay_path.unlink()
+        return True
+
+
+_reporters: Dict[Tuple[str, str], ActivityReporter] = {}
+
+
+def get_reporter(monitoring_url: str, api_key: str) -> ActivityReporter:
+    """The process-wide reporter for a monitoring server and API key."""
+    key = (monitoring_url, api_key)
+    reporter = _reporters.get(key)
+    if reporter is None:
+        reporter = _reporters[key] = ActivityReporter(monitoring_url, api_key)
+    return reporter
+
+
+async def close_reporters():
+    """Flush and close every reporter in the process."""
+    for reporter in list(_reporters.values()):
+        await reporter.close()
+    _reporters.clear()
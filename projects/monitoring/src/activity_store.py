@@ -2,11 +2,12 @@
 Activity storage with overflow to disk.
 """
 
-import json
-import os
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from collections import deque
+from itertools import islice
+
+from .segment_log import SegmentedLog
 
 
 class PersistentActivityStore:
@@ -15,20 +16,13 @@ class PersistentActivityStore:
     def __init__(self, memory_size: int = 1000, disk_path: str = "activities.jsonl"):
         self.memory_store = deque(maxlen=memory_size)
         self.disk_path = disk_path
-        self.total_count = 0
+        self.log = SegmentedLog(disk_path)
+        self.total_count = self.log.total_count
         self._load_from_disk()
         
     def _load_from_disk(self):
-        """Load recent activities from disk."""
-        if os.path.exists(self.disk_path):
-            with open(self.disk_path, 'r') as f:
-                for line in f:
-                    try:
-                        activity = json.loads(line)
-                        self.memory_store.append(activity)
-                        self.total_count += 1
-                    except json.JSONDecodeError:
-                        pass
+        """Load the most recent activities (the memory window) from disk."""
+        self.memory_store.extend(self.log.tail(self.memory_store.maxlen))
                         
     def add(self, activity: Dict[str, Any]) -> Dict[str, Any]:
         """Add activity to store."""
@@ -39,19 +33,25 @@ class PersistentActivityStore:
         self.memory_store.append(activity)
         self.total_count += 1
         
-        # Persist to disk
-        with open(self.disk_path, 'a') as f:
-            f.write(json.dumps(activity) + '\n')
+        # Persist to disk (buffered, flushed periodically)
+        self.log.append(activity)
             
         return activity
     
+    def close(self):
+        """Flush and close the on-disk log."""
+        self.log.close()
+    
     def query(self, agent_id: Optional[str] = None, 
               limit: int = 100, 
               offset: int = 0) -> List[Dict[str, Any]]:
-        """Query activities with filters."""
-        activities = list(self.memory_store)
+        """Query activities with filters.
+        
+        Reads lazily so only the first offset + limit matches are visited.
+        """
+        activities = iter(self.memory_store)
         
         if agent_id:
-            activities = [a for a in activities if a.get('agent_id') == agent_id]
+            activities = (a for a in activities if a.get('agent_id') == agent_id)
             
-        return activities[offset:offset + limit]
+        return list(islice(activities, offset, offset + limit))
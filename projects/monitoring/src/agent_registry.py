@@ -16,6 +16,13 @@ from dataclasses import dataclass, asdict
 import aiohttp
 from aiohttp import web
 
+try:
+    # When imported as part of the monitoring package
+    from .activity_reporter import get_reporter
+except ImportError:
+    # When this directory is on sys.path (agents import the mixin directly)
+    from activity_reporter import get_reporter
+
 
 @dataclass
 class AgentRegistration:
@@ -256,7 +263,7 @@ class AgentRegistry:
         """Store agent registration in database."""
         try:
             if hasattr(self.monitoring_server, 'db') and self.monitoring_server.db:
-                await self.monitoring_server.db.execute("""
+                await self.monitoring_server.db.execute_write("""
                     INSERT OR REPLACE INTO agent_registrations (
                         agent_id, name, agent_type, capabilities, endpoint, 
                         status, registered_at, last_heartbeat, metadata
@@ -272,7 +279,6 @@ class AgentRegistry:
                     registration.last_heartbeat.isoformat(),
                     json.dumps(registration.metadata)
                 ))
-                await self.monitoring_server.db.commit()
         except Exception as e:
             print(f"Error storing registration: {e}")
     
@@ -280,12 +286,11 @@ class AgentRegistry:
         """Update agent registration status in database."""
         try:
             if hasattr(self.monitoring_server, 'db') and self.monitoring_server.db:
-                await self.monitoring_server.db.execute("""
+                await self.monitoring_server.db.execute_write("""
                     UPDATE agent_registrations 
                     SET status = ?, last_heartbeat = ?
                     WHERE agent_id = ?
                 """, (status, datetime.utcnow().isoformat(), agent_id))
-                await self.monitoring_server.db.commit()
         except Exception as e:
             print(f"Error updating registration status: {e}")
     
@@ -399,6 +404,7 @@ class AgentRegistrationMixin:
         self.registration_id = None
         self.heartbeat_interval = 30  # seconds
         self.heartbeat_task = None
+        self.reporter = get_reporter(monitoring_url, api_key)
         
     async def register_with_monitoring(self) -> bool:
         """Register this agent with the monitoring server."""
@@ -484,33 +490,26 @@ class AgentRegistrationMixin:
             except Exception as e:
                 print(f"Heartbeat error: {e}")
     
+    def _heartbeat_status(self) -> Dict[str, Any]:
+        """Status data sent with each heartbeat."""
+        return {
+            'status': getattr(self, 'state', 'active'),
+            'metadata': {
+                'current_tasks': len(getattr(self, 'current_tasks', {})),
+                'tasks_completed': len(getattr(self, 'task_history', [])),
+                'uptime_seconds': getattr(self, 'uptime_seconds', 0),
+                'memory_usage': len(getattr(self, 'memory', {})),
+                'last_heartbeat': datetime.utcnow().isoformat()
+            }
+        }
+    
     async def _send_heartbeat(self):
-        """Send heartbeat to monitoring server."""
+        """Queue a heartbeat with the shared reporter; it is sent in the background."""
         try:
             if not self.registration_id:
                 return
             
-            status_data = {
-                'status': getattr(self, 'state', 'active'),
-                'metadata': {
-                    'current_tasks': len(getattr(self, 'current_tasks', {})),
-                    'tasks_completed': len(getattr(self, 'task_history', [])),
-                    'uptime_seconds': getattr(self, 'uptime_seconds', 0),
-                    'memory_usage': len(getattr(self, 'memory', {})),
-                    'last_heartbeat': datetime.utcnow().isoformat()
-                }
-            }
+            self.reporter.heartbeat(self.registration_id, self._heartbeat_status())
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f'{self.monitoring_url}/api/agents/{self.registration_id}/heartbeat',
-                    json=status_data,
-                    headers={'X-API-Key': self.api_key}
-                ) as response:
-                    if response.status != 200:
-                        result = await response.json()
-                        if not result.get('success'):
-                            print(f"Heartbeat failed: {result.get('error')}")
-                            
         except Exception as e:
             print(f"Error sending heartbeat: {e}")
\ No newline at end of file
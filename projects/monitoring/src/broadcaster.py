@@ -0,0 +1,226 @@
+"""
+Fan-out WebSocket broadcaster for the monitoring server.
+
+Each message is serialized once and pushed as a pre-encoded frame onto
+bounded per-client queues. Every client has its own sender task, so a slow
+dashboard only ever delays itself: when its queue is full the oldest frames
+are dropped, and frames sharing a coalesce key replace each other.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Optional, Set
+
+logger = logging.getLogger('enhanced_monitoring_server')
+
+
+def _as_set(value) -> Set[str]:
+    """Normalize a filter value (single item or list) to a set."""
+    if value is None:
+        return set()
+    if isinstance(value, (list, tuple, set)):
+        return {str(item) for item in value}
+    return {str(value)}
+
+
+@dataclass
+class SubscriptionFilter:
+    """Server-side subscription filter; empty sets match everything."""
+    agent_ids: Set[str] = field(default_factory=set)
+    types: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'SubscriptionFilter':
+        """Build a filter from a client ``subscribe`` message."""
+        data = data or {}
+        return cls(
+            agent_ids=_as_set(data.get('agent_ids', data.get('agent_id'))),
+            types=_as_set(data.get('types', data.get('type')))
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'agent_ids': sorted(self.agent_ids),
+            'types': sorted(self.types)
+        }
+
+    def matches(self, agent_id: Optional[str], activity_type: Optional[str]) -> bool:
+        """Check whether a message passes this filter."""
+        if self.agent_ids and agent_id not in self.agent_ids:
+            return False
+        if self.types and activity_type not in self.types:
+            return False
+        return True
+
+
+class BroadcastClient:
+    """A connected WebSocket client with its own bounded send queue."""
+
+    def __init__(self, ws, max_queue_size: int = 256):
+        self.ws = ws
+        self.max_queue_size = max_queue_size
+        self.filter = SubscriptionFilter()
+
+        # Pending frames keyed by coalesce key (or a unique sequence number)
+        self._pending: 'OrderedDict[Hashable, str]' = OrderedDict()
+        self._sequence = itertools.count()
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        # Counters
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self._unreported_drops = 0
+
+    @property
+    def queued(self) -> int:
+        """Number of frames waiting to be sent."""
+        return len(self._pending)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the client can no longer receive frames."""
+        return self.ws.closed or (self._task is not None and self._task.done())
+
+    def start(self):
+        """Start the client's sender task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._drain())
+
+    def enqueue(self, frame: str, coalesce_key: Optional[Hashable] = None):
+        """Queue a pre-encoded frame without blocking."""
+        if coalesce_key is not None and coalesce_key in self._pending:
+            # Latest state wins; keep the original queue position
+            self._pending[coalesce_key] = frame
+            self.coalesced += 1
+            return
+
+        if len(self._pending) >= self.max_queue_size:
+            self._pending.popitem(last=False)
+            self.dropped += 1
+            self._unreported_drops += 1
+
+        key = coalesce_key if coalesce_key is not None else ('seq', next(self._sequence))
+        self._pending[key] = frame
+        self._ready.set()
+
+    def send_json(self, message: Dict[str, Any]):
+        """Queue a message for this client only."""
+        self.enqueue(json.dumps(message, default=str))
+
+    async def _drain(self):
+        """Send queued frames until the connection closes."""
+        try:
+            while not self.ws.closed:
+                await self._ready.wait()
+                self._ready.clear()
+
+                while self._pending and not self.ws.closed:
+                    if self._unreported_drops:
+                        # Let the client know it missed messages
+                        notice = json.dumps({
+                            'type': 'overflow',
+                            'dropped': self._unreported_drops
+                        })
+                        self._unreported_drops = 0
+                        await self.ws.send_str(notice)
+
+                    _, frame = self._pending.popitem(last=False)
+                    await self.ws.send_str(frame)
+                    self.sent += 1
+
+        except (ConnectionResetError, ConnectionAbortedError, RuntimeError) as e:
+            logger.debug(f"WebSocket client send failed: {e}")
+        finally:
+            self._pending.clear()
+
+    async def close(self):
+        """Stop the sender task."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get client queue statistics."""
+        return {
+            'queued': self.queued,
+            'sent': self.sent,
+            'dropped': self.dropped,
+            'coalesced': self.coalesced,
+            'filters': self.filter.to_dict()
+        }
+
+
+class WebSocketBroadcaster:
+    """Fans messages out to connected clients through per-client queues."""
+
+    def __init__(self, max_queue_size: int = 256):
+        self.max_queue_size = max_queue_size
+        self.clients: Set[BroadcastClient] = set()
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def register(self, ws) -> BroadcastClient:
+        """Register a prepared WebSocket and start its sender task."""
+        client = BroadcastClient(ws, self.max_queue_size)
+        client.start()
+        self.clients.add(client)
+        return client
+
+    async def unregister(self, client: BroadcastClient):
+        """Remove a client and stop its sender task."""
+        self.clients.discard(client)
+        await client.close()
+
+    def publish(
+        self,
+        message: Dict[str, Any],
+        agent_id: Optional[str] = None,
+        activity_type: Optional[str] = None,
+        coalesce_key: Optional[Hashable] = None
+    ) -> int:
+        """Serialize a message once and queue it for matching clients.
+
+        Never awaits; returns the number of clients the frame was queued for.
+        """
+        frame = None
+        delivered = 0
+
+        for client in list(self.clients):
+            if client.closed:
+                self.clients.discard(client)
+                continue
+            if not client.filter.matches(agent_id, activity_type):
+                continue
+
+            if frame is None:
+                frame = json.dumps(message, default=str)
+            client.enqueue(frame, coalesce_key)
+            delivered += 1
+
+        return delivered
+
+    async def close(self):
+        """Stop all client sender tasks."""
+        clients = list(self.clients)
+        self.clients.clear()
+        await asyncio.gather(*(client.close() for client in clients))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get aggregate broadcaster statistics."""
+        return {
+            'clients': len(self.clients),
+            'queued': sum(client.queued for client in self.clients),
+            'dropped': sum(client.dropped for client in self.clients),
+            'coalesced': sum(client.coalesced for client in self.clients)
+        }
@@ -1,42 +1,201 @@
 """
 SQLite database layer for monitoring server.
 Handles persistent storage of activities and agent data.
+
+Activities are stored in daily partition tables (``activities_YYYYMMDD``)
+so retention drops whole tables, and per-minute and per-hour rollups are
+maintained on ingestion so statistics never scan raw activity rows.
 """
 
 import asyncio
 import aiosqlite
+import base64
 import json
+import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
+# API field name -> activity column, in table column order
+ACTIVITY_FIELDS = {
+    'id': 'id',
+    'agent_id': 'agent_id',
+    'agent_name': 'agent_name',
+    'type': 'activity_type',
+    'status': 'status',
+    'message': 'message',
+    'metadata': 'metadata',
+    'api_key': 'api_key',
+    'stored_at': 'stored_at',
+    'timestamp': 'created_at',
+}
+
+
+def partition_day(timestamp: Optional[str]) -> str:
+    """Return the YYYY-MM-DD partition day for an ISO timestamp."""
+    if timestamp:
+        day = str(timestamp)[:10]
+        try:
+            datetime.strptime(day, '%Y-%m-%d')
+            return day
+        except ValueError:
+            pass
+    return datetime.utcnow().strftime('%Y-%m-%d')
+
+
+# Partition tables are the only identifiers interpolated into SQL
+PARTITION_TABLE_PATTERN = re.compile(r'activities_\d{8}')
+
+
+def partition_table(day: str) -> str:
+    """Return the table name holding activities for a partition day.
+    
+    Raises ValueError unless the name has the ``activities_YYYYMMDD`` form,
+    so the result is safe to interpolate into SQL.
+    """
+    table = f"activities_{day.replace('-', '')}"
+    if not PARTITION_TABLE_PATTERN.fullmatch(table):
+        raise ValueError(f"Invalid partition day: {day!r}")
+    return table
+
+
+def encode_cursor(position: Tuple[str, str]) -> str:
+    """Encode a (stored_at, id) keyset position as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps(list(position)).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor produced by ``encode_cursor``."""
+    try:
+        stored_at, activity_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return str(stored_at), str(activity_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
 class MonitoringDatabase:
-    """SQLite database for monitoring data persistence."""
+    """SQLite database for monitoring data persistence.
+    
+    Activity writes go through an ingestion queue drained by a single writer
+    task, which group-commits everything queued into one transaction. Every
+    other write holds the same write lock, so no write can commit or roll
+    back the writer's open transaction on the shared connection.
+    """
     
-    def __init__(self, db_path: str = "monitoring.db"):
+    # Connection pragmas: WAL lets readers run alongside the writer and
+    # synchronous=NORMAL only fsyncs at checkpoints instead of every commit.
+    PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -64000,  # KiB
+        'temp_store': 'MEMORY',
+        'wal_autocheckpoint': 10000,
+    }
+    
+    # Statements used by the ingestion writer
+    ACTIVITY_COLUMNS = """
+        id TEXT PRIMARY KEY,
+        agent_id TEXT,
+        agent_name TEXT,
+        activity_type TEXT,
+        status TEXT,
+        message TEXT,
+        metadata TEXT,
+        api_key TEXT,
+        stored_at TIMESTAMP,
+        created_at TIMESTAMP
+    """
+    
+    ACTIVITY_INSERT = """
+        INSERT INTO {table} (
+            id, agent_id, agent_name, activity_type, status, 
+            message, metadata, api_key, stored_at, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    ROLLUP_UPSERT = """
+        INSERT INTO activity_rollups (minute, agent_id, activity_type, count)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(minute, agent_id, activity_type) DO UPDATE SET
+            count = activity_rollups.count + excluded.count
+    """
+    
+    HOURLY_UPSERT = """
+        INSERT INTO activity_hourly_rollups (hour, count) VALUES (?, ?)
+        ON CONFLICT(hour) DO UPDATE SET
+            count = activity_hourly_rollups.count + excluded.count
+    """
+    
+    AGENT_UPSERT = """
+        INSERT INTO agents (
+            id, name, status, last_seen, first_seen, total_activities
+        ) VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            name = excluded.name,
+            status = excluded.status,
+            last_seen = excluded.last_seen,
+            total_activities = agents.total_activities + excluded.total_activities
+    """
+    
+    def __init__(
+        self,
+        db_path: str = "monitoring.db",
+        batch_size: int = 1000,
+        flush_interval: float = 0.01,
+        max_queue_size: int = 100000
+    ):
         self.db_path = db_path
         self.db = None
         
+        # Group-commit settings
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+        
+        # Partition days with an existing table, oldest first
+        self._partitions: List[str] = []
+        
     async def initialize(self):
-        """Initialize database and create tables."""
+        """Initialize database, create tables and start the writer."""
         self.db = await aiosqlite.connect(self.db_path)
+        await self.configure_connection()
         await self.create_tables()
         await self.create_indexes()
+        await self.load_partitions()
+        await self.backfill_hourly_rollups()
+        await self.migrate_legacy_activities()
+        
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._writer_task = asyncio.create_task(self._ingest_loop())
+        
+    async def configure_connection(self):
+        """Apply performance pragmas to the connection."""
+        for name, value in self.PRAGMAS.items():
+            await self.db.execute(f"PRAGMA {name} = {value}")
         
     async def create_tables(self):
         """Create necessary database tables."""
         await self.db.executescript("""
-            CREATE TABLE IF NOT EXISTS activities (
-                id TEXT PRIMARY KEY,
+            CREATE TABLE IF NOT EXISTS activity_partitions (
+                day TEXT PRIMARY KEY,
+                table_name TEXT,
+                row_count INTEGER DEFAULT 0
+            );
+            
+            CREATE TABLE IF NOT EXISTS activity_rollups (
+                minute TEXT,
                 agent_id TEXT,
-                agent_name TEXT,
                 activity_type TEXT,
-                status TEXT,
-                message TEXT,
-                metadata TEXT,
-                api_key TEXT,
-                stored_at TIMESTAMP,
-                created_at TIMESTAMP
+                count INTEGER DEFAULT 0,
+                PRIMARY KEY (minute, agent_id, activity_type)
+            );
+            
+            CREATE TABLE IF NOT EXISTS activity_hourly_rollups (
+                hour TEXT PRIMARY KEY,
+                count INTEGER DEFAULT 0
             );
             
             CREATE TABLE IF NOT EXISTS agents (
@@ -62,119 +221,404 @@ class MonitoringDatabase:
     async def create_indexes(self):
         """Create database indexes for performance."""
         await self.db.executescript("""
-            CREATE INDEX IF NOT EXISTS idx_activities_agent_id ON activities(agent_id);
-            CREATE INDEX IF NOT EXISTS idx_activities_stored_at ON activities(stored_at);
-            CREATE INDEX IF NOT EXISTS idx_activities_type ON activities(activity_type);
+            CREATE INDEX IF NOT EXISTS idx_rollups_agent ON activity_rollups(agent_id, minute);
             CREATE INDEX IF NOT EXISTS idx_agents_last_seen ON agents(last_seen);
         """)
         await self.db.commit()
         
-    async def store_activity(self, activity: Dict[str, Any]) -> str:
-        """Store activity in database."""
-        activity_id = activity.get('id')
-        agent_id = activity.get('agent_id')
+    async def load_partitions(self):
+        """Load the list of existing activity partitions."""
+        cursor = await self.db.execute(
+            "SELECT day FROM activity_partitions ORDER BY day"
+        )
+        self._partitions = [row[0] for row in await cursor.fetchall()]
         
+        for day in self._partitions:
+            await self.create_partition_indexes(partition_table(day))
+        await self.db.commit()
+        
+    async def create_partition_indexes(self, table: str):
+        """Create keyset indexes on a partition table.
+        
+        Each index ends in (stored_at, id) so filtered reads come back in
+        pagination order straight from the index.
+        """
+        await self.db.executescript(f"""
+            DROP INDEX IF EXISTS idx_{table}_agent_id;
+            DROP INDEX IF EXISTS idx_{table}_type;
+            CREATE INDEX IF NOT EXISTS idx_{table}_stored_at ON {table}(stored_at, id);
+            CREATE INDEX IF NOT EXISTS idx_{table}_agent ON {table}(agent_id, stored_at, id);
+            CREATE INDEX IF NOT EXISTS idx_{table}_activity_type ON {table}(activity_type, stored_at, id);
+        """)
+        
+    async def backfill_hourly_rollups(self):
+        """Build hourly rollups from minute rollups written before they existed."""
+        cursor = await self.db.execute("SELECT 1 FROM activity_hourly_rollups LIMIT 1")
+        if await cursor.fetchone():
+            return
+            
         await self.db.execute("""
-            INSERT INTO activities (
-                id, agent_id, agent_name, activity_type, status, 
-                message, metadata, api_key, stored_at, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            activity_id,
-            agent_id,
-            activity.get('agent_name'),
-            activity.get('type'),
-            activity.get('status'),
-            activity.get('message'),
-            json.dumps(activity.get('metadata', {})),
-            activity.get('api_key'),
-            activity.get('stored_at'),
-            activity.get('timestamp', activity.get('stored_at'))
-        ))
+            INSERT INTO activity_hourly_rollups (hour, count)
+            SELECT substr(minute, 1, 13), SUM(count) FROM activity_rollups GROUP BY 1
+        """)
+        await self.db.commit()
         
-        # Update agent info
-        if agent_id:
-            await self.update_agent(agent_id, activity)
+    async def ensure_partition(self, day: str) -> str:
+        """Create the partition table for a day if needed and return its name.
+        
+        Callers must hold the write lock once the writer is running.
+        """
+        table = partition_table(day)
+        if day in self._partitions:
+            return table
             
+        await self.db.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ({self.ACTIVITY_COLUMNS})"
+        )
+        await self.create_partition_indexes(table)
+        await self.db.execute(
+            "INSERT OR IGNORE INTO activity_partitions (day, table_name, row_count) "
+            "VALUES (?, ?, 0)",
+            (day, table)
+        )
         await self.db.commit()
-        return activity_id
         
-    async def update_agent(self, agent_id: str, activity: Dict[str, Any]):
-        """Update agent information."""
-        agent_name = activity.get('agent_name', 'Unknown')
-        status = activity.get('status', 'active')
+        self._partitions.append(day)
+        self._partitions.sort()
+        return table
         
-        # Check if agent exists
+    async def migrate_legacy_activities(self):
+        """Move rows from the unpartitioned ``activities`` table, if present."""
+        cursor = await self.db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'activities'"
+        )
+        if not await cursor.fetchone():
+            return
+            
         cursor = await self.db.execute(
-            "SELECT id FROM agents WHERE id = ?", (agent_id,)
+            "SELECT DISTINCT substr(stored_at, 1, 10) FROM activities"
         )
-        exists = await cursor.fetchone()
+        raw_days = [row[0] for row in await cursor.fetchall()]
+        migrated = set()
         
-        if exists:
-            # Update existing agent
+        for raw_day in raw_days:
+            day = partition_day(raw_day)
+            migrated.add(day)
+            table = await self.ensure_partition(day)
+            # Rows with unparseable timestamps land in today's partition
+            await self.db.execute(
+                f"INSERT OR IGNORE INTO {table} SELECT * FROM activities "  # noqa: S608
+                "WHERE substr(stored_at, 1, 10) IS ?",
+                (raw_day,)
+            )
             await self.db.execute("""
-                UPDATE agents SET 
-                    name = ?, status = ?, last_seen = ?, 
-                    total_activities = total_activities + 1
-                WHERE id = ?
-            """, (agent_name, status, activity.get('stored_at'), agent_id))
-        else:
-            # Create new agent
+                INSERT INTO activity_rollups (minute, agent_id, activity_type, count)
+                SELECT COALESCE(substr(stored_at, 1, 16), ?), COALESCE(agent_id, ''),
+                       COALESCE(activity_type, ''), COUNT(*)
+                FROM activities WHERE substr(stored_at, 1, 10) IS ?
+                GROUP BY 1, 2, 3
+                ON CONFLICT(minute, agent_id, activity_type) DO UPDATE SET
+                    count = activity_rollups.count + excluded.count
+            """, (day, raw_day))
             await self.db.execute("""
-                INSERT INTO agents (
-                    id, name, status, last_seen, first_seen, total_activities
-                ) VALUES (?, ?, ?, ?, ?, 1)
-            """, (
-                agent_id, agent_name, status, 
-                activity.get('stored_at'), activity.get('stored_at')
+                INSERT INTO activity_hourly_rollups (hour, count)
+                SELECT COALESCE(substr(stored_at, 1, 13), ?), COUNT(*)
+                FROM activities WHERE substr(stored_at, 1, 10) IS ?
+                GROUP BY 1
+                ON CONFLICT(hour) DO UPDATE SET
+                    count = activity_hourly_rollups.count + excluded.count
+            """, (day, raw_day))
+            
+        for day in migrated:
+            table = partition_table(day)
+            await self.db.execute(f"""
+                UPDATE activity_partitions
+                SET row_count = (SELECT COUNT(*) FROM {table})
+                WHERE day = ?
+            """, (day,))  # noqa: S608
+            
+        await self.db.execute("DROP TABLE activities")
+        await self.db.commit()
+        
+    async def store_activity(self, activity: Dict[str, Any]) -> str:
+        """Store activity in database.
+        
+        Returns once the transaction containing the activity has committed.
+        """
+        await self.store_activities([activity])
+        return activity.get('id')
+        
+    async def store_activities(self, activities: List[Dict[str, Any]]) -> List[str]:
+        """Store multiple activities, waiting for them to be committed."""
+        if not activities:
+            return []
+            
+        if self._writer_task is None or self._writer_task.done():
+            raise RuntimeError("Database writer is not running")
+            
+        loop = asyncio.get_running_loop()
+        futures = []
+        for activity in activities:
+            future = loop.create_future()
+            await self._queue.put((activity, future))
+            futures.append(future)
+            
+        await asyncio.gather(*futures)
+        return [activity.get('id') for activity in activities]
+        
+    async def update_agent(self, agent_id: str, activity: Dict[str, Any]):
+        """Update agent information."""
+        await self.execute_write(self.AGENT_UPSERT, (
+            agent_id,
+            activity.get('agent_name', 'Unknown'),
+            activity.get('status', 'active'),
+            activity.get('stored_at'),
+            activity.get('stored_at'),
+            1
+        ))
+        
+    async def execute_write(self, sql: str, params: tuple = ()):
+        """Execute and commit a single write, serialized with the writer."""
+        async with self._write_lock:
+            try:
+                await self.db.execute(sql, params)
+                await self.db.commit()
+            except Exception:
+                await self._rollback()
+                raise
+        
+    async def _ingest_loop(self):
+        """Drain the ingestion queue, committing each drained batch at once."""
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+                
+            batch = [item]
+            stop = False
+            deadline = asyncio.get_running_loop().time() + self.flush_interval
+            
+            # Collect whatever arrives until the batch is full or the
+            # flush interval elapses
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - asyncio.get_running_loop().time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except TimeoutError:
+                        break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                
+            try:
+                async with self._write_lock:
+                    await self._commit_batch(batch)
+            except Exception as e:
+                # Never let a failed batch take the writer down with it
+                self._resolve(batch, e)
+            if stop:
+                return
+                
+    async def _commit_batch(self, batch: List[tuple]):
+        """Write a batch in one transaction and resolve its waiters.
+        
+        Called by the writer with the write lock held.
+        """
+        try:
+            await self._write_activities([activity for activity, _ in batch])
+        except Exception as e:
+            if not await self._rollback():
+                # The connection is unusable; retrying would fail the same way
+                self._resolve(batch, e)
+                return
+            if len(batch) == 1:
+                self._resolve(batch, e)
+                return
+            # Retry individually so one bad activity (e.g. a duplicate id)
+            # only fails its own caller
+            for item in batch:
+                await self._commit_batch([item])
+            return
+            
+        self._resolve(batch)
+        
+    async def _write_activities(self, activities: List[Dict[str, Any]]):
+        """Insert activities and upsert aggregated agent counters and rollups."""
+        partitions: Dict[str, list] = {}
+        agents: Dict[str, list] = {}
+        rollups: Dict[tuple, int] = {}
+        hourly: Dict[str, int] = {}
+        
+        for activity in activities:
+            agent_id = activity.get('agent_id')
+            stored_at = activity.get('stored_at')
+            day = partition_day(stored_at)
+            partitions.setdefault(day, []).append((
+                activity.get('id'),
+                agent_id,
+                activity.get('agent_name'),
+                activity.get('type'),
+                activity.get('status'),
+                activity.get('message'),
+                json.dumps(activity.get('metadata', {})),
+                activity.get('api_key'),
+                stored_at,
+                activity.get('timestamp', stored_at)
             ))
             
+            minute = str(stored_at)[:16] if stored_at else day
+            rollup_key = (minute, agent_id or '', activity.get('type') or '')
+            rollups[rollup_key] = rollups.get(rollup_key, 0) + 1
+            hour = str(stored_at)[:13] if stored_at else day
+            hourly[hour] = hourly.get(hour, 0) + 1
+            
+            if agent_id:
+                # One upsert per agent per batch; latest activity wins
+                name = activity.get('agent_name', 'Unknown')
+                status = activity.get('status', 'active')
+                if agent_id in agents:
+                    entry = agents[agent_id]
+                    entry[1], entry[2], entry[3] = name, status, stored_at
+                    entry[5] += 1
+                else:
+                    agents[agent_id] = [agent_id, name, status, stored_at, stored_at, 1]
+                    
+        # Partition DDL commits on its own so a failed batch can't leave the
+        # partition list pointing at a rolled-back table
+        tables = {day: await self.ensure_partition(day) for day in partitions}
+        
+        for day, rows in partitions.items():
+            await self.db.executemany(
+                self.ACTIVITY_INSERT.format(table=tables[day]), rows
+            )
+            await self.db.execute(
+                "UPDATE activity_partitions SET row_count = row_count + ? WHERE day = ?",
+                (len(rows), day)
+            )
+        await self.db.executemany(
+            self.ROLLUP_UPSERT,
+            [key + (count,) for key, count in rollups.items()]
+        )
+        await self.db.executemany(self.HOURLY_UPSERT, hourly.items())
+        if agents:
+            await self.db.executemany(self.AGENT_UPSERT, agents.values())
+        await self.db.commit()
+        
+    async def _rollback(self) -> bool:
+        """Roll back the open transaction, returning False if that failed."""
+        try:
+            await self.db.rollback()
+            return True
+        except Exception:
+            return False
+            
+    @staticmethod
+    def _resolve(batch: List[tuple], error: Optional[Exception] = None):
+        """Complete the futures of committed (or failed) activities."""
+        for _, future in batch:
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+                
     async def get_activities(
         self, 
         limit: int = 100, 
         since: Optional[datetime] = None,
         agent_id: Optional[str] = None,
-        activity_type: Optional[str] = None
+        activity_type: Optional[str] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
-        """Get activities with filtering."""
-        query = "SELECT * FROM activities WHERE 1=1"
+        """Get activities with filtering, newest first."""
+        return [
+            activity
+            async for activity, _ in self.iter_activities(
+                limit, since, agent_id, activity_type, cursor, fields
+            )
+        ]
+        
+    async def iter_activities(
+        self,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        agent_id: Optional[str] = None,
+        activity_type: Optional[str] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> AsyncIterator[Tuple[Dict[str, Any], Tuple[str, str]]]:
+        """Stream one page of activities, newest first.
+        
+        Pages are keyset-paginated on (stored_at, id): pass the cursor
+        encoded from the last yielded position to continue. Only the
+        requested ``fields`` are read and returned. Yields
+        ``(activity, position)`` pairs.
+        """
+        fields = list(fields) if fields else list(ACTIVITY_FIELDS)
+        unknown = [name for name in fields if name not in ACTIVITY_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown activity fields: {', '.join(unknown)}")
+            
+        columns = ', '.join(['stored_at', 'id'] + [ACTIVITY_FIELDS[name] for name in fields])
+        conditions = []
         params = []
         
         if since:
-            query += " AND stored_at > ?"
+            conditions.append("stored_at > ?")
             params.append(since.isoformat())
             
         if agent_id:
-            query += " AND agent_id = ?"
+            conditions.append("agent_id = ?")
             params.append(agent_id)
             
         if activity_type:
-            query += " AND activity_type = ?"
+            conditions.append("activity_type = ?")
             params.append(activity_type)
             
-        query += " ORDER BY stored_at DESC LIMIT ?"
-        params.append(limit)
-        
-        cursor = await self.db.execute(query, params)
-        rows = await cursor.fetchall()
-        
-        activities = []
-        for row in rows:
-            activity = {
-                'id': row[0],
-                'agent_id': row[1],
-                'agent_name': row[2],
-                'type': row[3],
-                'status': row[4],
-                'message': row[5],
-                'metadata': json.loads(row[6]) if row[6] else {},
-                'api_key': row[7],
-                'stored_at': row[8],
-                'timestamp': row[9]
-            }
-            activities.append(activity)
+        position = decode_cursor(cursor) if cursor else None
+        if position:
+            conditions.append("(stored_at, id) < (?, ?)")
+            params.extend(position)
             
-        return activities
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        since_day = since.strftime('%Y-%m-%d') if since else None
+        cursor_day = position[0][:10] if position else None
+        
+        remaining = limit
+        for day in reversed(self._partitions):
+            if since_day and day < since_day:
+                break
+            if cursor_day and day > cursor_day:
+                continue
+                
+            # Columns come from ACTIVITY_FIELDS and values are bound
+            query = (
+                f"SELECT {columns} FROM {partition_table(day)} {where} "  # noqa: S608
+                "ORDER BY stored_at DESC, id DESC LIMIT ?"
+            )
+            async with self.db.execute(query, params + [remaining]) as rows:
+                async for row in rows:
+                    remaining -= 1
+                    yield self._row_to_activity(row[2:], fields), (row[0], row[1])
+                    
+            if remaining <= 0:
+                break
+                
+    @staticmethod
+    def _row_to_activity(row, fields: List[str]) -> Dict[str, Any]:
+        """Convert an activity row to its API representation."""
+        activity = dict(zip(fields, row, strict=True))
+        if 'metadata' in activity:
+            activity['metadata'] = json.loads(activity['metadata']) if activity['metadata'] else {}
+        return activity
         
     async def get_agents(self) -> List[Dict[str, Any]]:
         """Get all agents with their status."""
@@ -200,40 +644,118 @@ class MonitoringDatabase:
         
     async def get_activity_count(self) -> int:
         """Get total activity count."""
-        cursor = await self.db.execute("SELECT COUNT(*) FROM activities")
+        cursor = await self.db.execute(
+            "SELECT COALESCE(SUM(row_count), 0) FROM activity_partitions"
+        )
         row = await cursor.fetchone()
         return row[0] if row else 0
         
+    async def get_activity_rollups(
+        self,
+        since: datetime,
+        agent_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get per-minute activity counts, optionally for a single agent."""
+        query = (
+            "SELECT minute, agent_id, activity_type, count FROM activity_rollups "
+            "WHERE minute >= ?"
+        )
+        params = [since.isoformat()[:16]]
+        
+        if agent_id:
+            query += " AND agent_id = ?"
+            params.append(agent_id)
+            
+        query += " ORDER BY minute"
+        
+        cursor = await self.db.execute(query, params)
+        return [
+            {
+                'minute': row[0],
+                'agent_id': row[1] or None,
+                'type': row[2] or None,
+                'count': row[3]
+            }
+            for row in await cursor.fetchall()
+        ]
+        
     async def cleanup_old_activities(self, days: int = 30):
-        """Clean up activities older than specified days."""
+        """Clean up activities older than specified days.
+        
+        Whole partitions before the cutoff day are dropped; only the cutoff
+        day's partition needs a row-level delete.
+        """
         cutoff = datetime.utcnow() - timedelta(days=days)
         
-        cursor = await self.db.execute(
-            "DELETE FROM activities WHERE stored_at < ?", 
-            (cutoff.isoformat(),)
+        async with self._write_lock:
+            try:
+                return await self._delete_before(cutoff)
+            except Exception:
+                await self._rollback()
+                raise
+                
+    async def _delete_before(self, cutoff: datetime) -> int:
+        """Drop and delete activities before the cutoff, then commit."""
+        cutoff_day = cutoff.strftime('%Y-%m-%d')
+        deleted = 0
+        dropped = []
+        
+        for day in [day for day in self._partitions if day <= cutoff_day]:
+            table = partition_table(day)
+            
+            if day < cutoff_day:
+                cursor = await self.db.execute(
+                    "SELECT row_count FROM activity_partitions WHERE day = ?", (day,)
+                )
+                row = await cursor.fetchone()
+                deleted += row[0] if row else 0
+                
+                await self.db.execute(f"DROP TABLE IF EXISTS {table}")
+                await self.db.execute(
+                    "DELETE FROM activity_partitions WHERE day = ?", (day,)
+                )
+                dropped.append(day)
+            else:
+                cursor = await self.db.execute(
+                    f"DELETE FROM {table} WHERE stored_at < ?",  # noqa: S608
+                    (cutoff.isoformat(),)
+                )
+                deleted += cursor.rowcount
+                await self.db.execute(
+                    "UPDATE activity_partitions SET row_count = row_count - ? WHERE day = ?",
+                    (cursor.rowcount, day)
+                )
+                
+        await self.db.execute(
+            "DELETE FROM activity_rollups WHERE minute < ?",
+            (cutoff.isoformat()[:16],)
+        )
+        await self.db.execute(
+            "DELETE FROM activity_hourly_rollups WHERE hour < ?",
+            (cutoff.isoformat()[:13],)
         )
-        deleted = cursor.rowcount
         await self.db.commit()
         
+        for day in dropped:
+            self._partitions.remove(day)
         return deleted
         
     async def get_statistics(self) -> Dict[str, Any]:
-        """Get database statistics."""
+        """Get database statistics from partition counts and rollups."""
         stats = {}
         
         # Activity counts
-        cursor = await self.db.execute("SELECT COUNT(*) FROM activities")
-        stats['total_activities'] = (await cursor.fetchone())[0]
+        stats['total_activities'] = await self.get_activity_count()
         
         # Agent counts
         cursor = await self.db.execute("SELECT COUNT(*) FROM agents")
         stats['total_agents'] = (await cursor.fetchone())[0]
         
-        # Activities in last 24 hours
+        # Activities in last 24 hours, to the hour: at most 25 hourly rows
         yesterday = datetime.utcnow() - timedelta(days=1)
         cursor = await self.db.execute(
-            "SELECT COUNT(*) FROM activities WHERE stored_at > ?",
-            (yesterday.isoformat(),)
+            "SELECT COALESCE(SUM(count), 0) FROM activity_hourly_rollups WHERE hour >= ?",
+            (yesterday.isoformat()[:13],)
         )
         stats['activities_24h'] = (await cursor.fetchone())[0]
         
@@ -245,10 +767,17 @@ class MonitoringDatabase:
         )
         stats['active_agents'] = (await cursor.fetchone())[0]
         
+        stats['partitions'] = len(self._partitions)
+        
         return stats
         
     async def close(self):
-        """Close database connection."""
+        """Flush queued activities and close database connection."""
+        if self._writer_task and not self._writer_task.done():
+            await self._queue.put(None)
+            await self._writer_task
+        self._writer_task = None
+        
         if self.db:
             await self.db.close()
             
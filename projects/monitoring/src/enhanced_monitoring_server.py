@@ -9,25 +9,24 @@ Features:
 """
 
 import asyncio
+import heapq
 import json
 import os
 import time
-import weakref
 import hashlib
 import secrets
 import logging
-from typing import Set, Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timezone
 from aiohttp import web, WSMsgType
 import aiohttp_cors
 import jwt
 from functools import wraps
 
 from .agent_registry import AgentRegistry
-from .database import MonitoringDatabase
-
-# Rate limiting store (in production, use Redis)
-RATE_LIMIT_STORE = {}
+from .broadcaster import BroadcastClient, SubscriptionFilter, WebSocketBroadcaster
+from .database import ACTIVITY_FIELDS, MonitoringDatabase, decode_cursor, encode_cursor
+from .rate_limiter import create_rate_limiter
 
 class AuthenticationError(Exception):
     """Authentication related errors."""
@@ -57,7 +56,7 @@ def require_auth(f):
         
         # Rate limiting
         client_ip = request.remote
-        if not self.check_rate_limit(client_ip, api_key):
+        if not await self.check_rate_limit(client_ip, api_key):
             return web.json_response(
                 {'error': 'Rate limit exceeded'}, 
                 status=429
@@ -75,7 +74,11 @@ class EnhancedMonitoringServer:
     def __init__(self, port: int = 6795):
         self.port = port
         self.app = web.Application()
-        self.websockets: Set[weakref.ref] = set()
+        
+        # WebSocket fan-out with bounded per-client queues
+        self.broadcaster = WebSocketBroadcaster(
+            max_queue_size=int(os.getenv('WS_CLIENT_QUEUE_SIZE', '256'))
+        )
         
         # Initialize database
         self.db = None
@@ -86,8 +89,21 @@ class EnhancedMonitoringServer:
         self.api_keys = {self.master_api_key: {'name': 'master', 'created': datetime.utcnow()}}
         self.jwt_secret = os.getenv('JWT_SECRET', secrets.token_urlsafe(32))
         
-        # Rate limiting (requests per minute)
+        # Rate limiting (requests per minute); set RATE_LIMIT_REDIS_URL to
+        # share limits across monitor replicas
         self.rate_limit = int(os.getenv('RATE_LIMIT', '100'))
+        self.rate_limiter = create_rate_limiter(
+            self.rate_limit,
+            window=60.0,
+            redis_url=os.getenv('RATE_LIMIT_REDIS_URL'),
+            max_keys=int(os.getenv('RATE_LIMIT_MAX_KEYS', '100000'))
+        )
+        
+        # Maximum activities accepted by a single batch request
+        self.max_batch_size = int(os.getenv('MAX_ACTIVITY_BATCH', '5000'))
+        
+        # Maximum activities returned by a single page
+        self.max_page_size = int(os.getenv('MAX_ACTIVITY_PAGE', '1000'))
         
         # Agent registry
         self.agent_registry = AgentRegistry(self)
@@ -136,27 +152,9 @@ class EnhancedMonitoringServer:
         """Validate API key."""
         return api_key in self.api_keys
     
-    def check_rate_limit(self, client_ip: str, api_key: str) -> bool:
+    async def check_rate_limit(self, client_ip: str, api_key: str) -> bool:
         """Check rate limiting for client."""
-        key = f"{client_ip}:{api_key}"
-        now = datetime.utcnow()
-        
-        if key not in RATE_LIMIT_STORE:
-            RATE_LIMIT_STORE[key] = []
-        
-        # Clean old requests
-        RATE_LIMIT_STORE[key] = [
-            req_time for req_time in RATE_LIMIT_STORE[key] 
-            if now - req_time < timedelta(minutes=1)
-        ]
-        
-        # Check limit
-        if len(RATE_LIMIT_STORE[key]) >= self.rate_limit:
-            return False
-        
-        # Add current request
-        RATE_LIMIT_STORE[key].append(now)
-        return True
+        return await self.rate_limiter.allow(f"{client_ip}:{api_key}")
     
     def setup_routes(self):
         """Configure server routes."""
@@ -168,6 +166,7 @@ class EnhancedMonitoringServer:
         
         # Authenticated endpoints
         self.app.router.add_post('/api/activities', self.post_activity)
+        self.app.router.add_post('/api/activities/batch', self.post_activities_batch)
         self.app.router.add_get('/api/activities', self.get_activities)
         self.app.router.add_get('/api/agents', self.get_agents)
         
@@ -204,13 +203,12 @@ class EnhancedMonitoringServer:
         ws = web.WebSocketResponse()
         await ws.prepare(request)
         
-        # Store weak reference with auth info
-        ws_ref = weakref.ref(ws)
-        self.websockets.add(ws_ref)
+        # All sends to this socket go through its broadcaster queue
+        client = self.broadcaster.register(ws)
         
         try:
             # Send initial authenticated state
-            await ws.send_json({
+            client.send_json({
                 'type': 'connection',
                 'status': 'connected',
                 'authenticated': True,
@@ -222,9 +220,9 @@ class EnhancedMonitoringServer:
                 if msg.type == WSMsgType.TEXT:
                     try:
                         data = json.loads(msg.data)
-                        await self.handle_ws_message(data, ws, api_key)
+                        await self.handle_ws_message(data, client, api_key)
                     except json.JSONDecodeError:
-                        await ws.send_json({
+                        client.send_json({
                             'type': 'error',
                             'message': 'Invalid JSON'
                         })
@@ -242,11 +240,13 @@ class EnhancedMonitoringServer:
             except:
                 pass
         finally:
-            self.websockets.discard(ws_ref)
+            await self.broadcaster.unregister(client)
             
         return ws
     
-    async def handle_ws_message(self, data: Dict[str, Any], ws, api_key: str):
+    async def handle_ws_message(
+        self, data: Dict[str, Any], client: BroadcastClient, api_key: str
+    ):
         """Process authenticated WebSocket messages."""
         msg_type = data.get('type')
         
@@ -259,149 +259,295 @@ class EnhancedMonitoringServer:
                 await self.broadcast_activity(activity)
                 
             elif msg_type == 'ping':
-                await ws.send_json({
+                client.send_json({
                     'type': 'pong',
                     'timestamp': datetime.utcnow().isoformat()
                 })
                 
             elif msg_type == 'subscribe':
-                # Subscribe to specific activity types
-                filters = data.get('filters', {})
-                await ws.send_json({
+                # Subscribe to specific agents and/or activity types
+                client.filter = SubscriptionFilter.from_dict(data.get('filters'))
+                client.send_json({
                     'type': 'subscribed',
-                    'filters': filters
+                    'filters': client.filter.to_dict()
                 })
                 
             else:
-                await ws.send_json({
+                client.send_json({
                     'type': 'error',
                     'message': f'Unknown message type: {msg_type}'
                 })
                 
         except Exception as e:
-            await ws.send_json({
+            client.send_json({
                 'type': 'error',
                 'message': str(e)
             })
     
-    async def store_activity(self, activity: Dict[str, Any]) -> Dict[str, Any]:
-        """Store activity with enhanced metadata."""
-        # Add server metadata
+    def _prepare_activity(self, activity: Dict[str, Any]) -> Dict[str, Any]:
+        """Add server metadata to an incoming activity."""
         activity.update({
             'stored_at': datetime.utcnow().isoformat(),
             'server_version': '1.0.0',
             'id': activity.get('id', secrets.token_urlsafe(8))
         })
+        return activity
+    
+    async def store_activity(self, activity: Dict[str, Any]) -> Dict[str, Any]:
+        """Store activity with enhanced metadata."""
+        activities = await self.store_activities([activity])
+        return activities[0]
+    
+    async def store_activities(self, activities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Store multiple activities, committed together when possible."""
+        activities = [self._prepare_activity(activity) for activity in activities]
         
         # Store in database if available
         if self.db:
-            await self.db.store_activity(activity)
+            await self.db.store_activities(activities)
         else:
             # Fallback to in-memory store
             if not hasattr(self, '_activities'):
                 self._activities = []
             
-            self._activities.append(activity)
+            self._activities.extend(activities)
             
             # Keep only last 1000 in memory
             if len(self._activities) > 1000:
                 self._activities = self._activities[-1000:]
         
-        return activity
+        return activities
     
     async def broadcast_activity(self, activity: Dict[str, Any]):
-        """Broadcast activity to authenticated clients."""
+        """Broadcast activity to authenticated clients.
+        
+        Only queues the pre-encoded frame per client; sending happens in each
+        client's own task. Heartbeats coalesce per agent for slow clients.
+        """
         message = {
             'type': 'activity',
             'activity': activity,
             'timestamp': datetime.utcnow().isoformat()
         }
         
-        # Send to all connected clients
-        disconnected = []
-        for ws_ref in list(self.websockets):
-            ws = ws_ref()
-            if ws is not None and not ws.closed:
-                try:
-                    await ws.send_json(message)
-                except (ConnectionResetError, ConnectionAbortedError):
-                    disconnected.append(ws_ref)
-            else:
-                disconnected.append(ws_ref)
-        
-        # Clean up disconnected clients
-        for ws_ref in disconnected:
-            self.websockets.discard(ws_ref)
+        agent_id = activity.get('agent_id')
+        activity_type = activity.get('type')
+        coalesce_key = None
+        if activity_type == 'heartbeat' and agent_id:
+            coalesce_key = ('heartbeat', agent_id)
+        
+        self.broadcaster.publish(
+            message,
+            agent_id=agent_id,
+            activity_type=activity_type,
+            coalesce_key=coalesce_key
+        )
     
     async def health_check(self, request):
         """Public health check endpoint."""
         return web.json_response({
             'status': 'healthy',
             'version': '1.0.0',
-            'connections': len(self.websockets),
+            'connections': len(self.broadcaster),
+            'broadcast': self.broadcaster.get_stats(),
+            'rate_limiter': self.rate_limiter.get_stats(),
             'uptime': time.time(),
             'features': ['authentication', 'rate_limiting', 'websockets']
         })
     
+    @staticmethod
+    def _invalid_payload(message: str, status: int = 400):
+        """Reject a request body; clients should not retry it."""
+        return web.json_response(
+            {'error': message, 'code': 'invalid_payload'}, 
+            status=status
+        )
+    
     @require_auth
     async def post_activity(self, request):
         """Store new activity via REST API."""
         try:
             data = await request.json()
+        except ValueError:
+            return self._invalid_payload('Invalid JSON body')
+        
+        if not isinstance(data, dict):
+            return self._invalid_payload('Expected an activity object')
+        
+        try:
             activity = await self.store_activity(data)
-            await self.broadcast_activity(activity)
-            
-            return web.json_response({
-                'status': 'stored',
-                'activity_id': activity['id']
-            })
-            
         except Exception as e:
+            self.logger.error(f"Error storing activity: {e}")
             return web.json_response(
-                {'error': str(e)}, 
-                status=400
+                {'error': 'Failed to store activity'}, 
+                status=500
+            )
+        
+        await self.broadcast_activity(activity)
+        return web.json_response({
+            'status': 'stored',
+            'activity_id': activity['id']
+        })
+    
+    @require_auth
+    async def post_activities_batch(self, request):
+        """Store a batch of activities via REST API.
+        
+        Accepts either a JSON list or an object with an ``activities`` list.
+        Malformed batches are rejected with a 4xx and ``code: invalid_payload``;
+        storage failures return a 500 so that clients retry them.
+        """
+        try:
+            data = await request.json()
+        except ValueError:
+            return self._invalid_payload('Invalid JSON body')
+        
+        activities = data.get('activities') if isinstance(data, dict) else data
+        if not isinstance(activities, list) or not all(
+            isinstance(activity, dict) for activity in activities
+        ):
+            return self._invalid_payload('Expected a list of activity objects')
+        
+        if len(activities) > self.max_batch_size:
+            return self._invalid_payload(
+                f'Batch exceeds {self.max_batch_size} activities', status=413
+            )
+        
+        try:
+            activities = await self.store_activities(activities)
+        except Exception as e:
+            self.logger.error(f"Error storing activity batch: {e}")
+            return web.json_response(
+                {'error': 'Failed to store activities'}, 
+                status=500
             )
+        
+        for activity in activities:
+            await self.broadcast_activity(activity)
+        
+        return web.json_response({
+            'status': 'stored',
+            'count': len(activities),
+            'activity_ids': [activity['id'] for activity in activities]
+        })
     
     @require_auth
     async def get_activities(self, request):
-        """Get stored activities with filtering."""
+        """Get stored activities with filtering and cursor pagination.
+        
+        Query parameters: ``limit``, ``since``, ``agent_id``, ``type``,
+        ``cursor`` (``next_cursor`` from the previous page) and ``fields``
+        (comma-separated projection).
+        
+        Activities are returned newest first, ordered by ``(stored_at, id)``;
+        follow ``next_cursor`` to page back through older ones. The response
+        is ``{"activities", "count", "total", "next_cursor"}`` whether it is
+        served from the database or the in-memory fallback.
+        """
         try:
             # Get query parameters
-            limit = int(request.query.get('limit', 100))
+            limit = min(int(request.query.get('limit', 100)), self.max_page_size)
+            if limit <= 0:
+                raise ValueError('limit must be positive')
             since = request.query.get('since')
             agent_id = request.query.get('agent_id')
+            activity_type = request.query.get('type')
+            cursor = request.query.get('cursor')
+            fields = request.query.get('fields')
             
-            # Get activities (from memory for now)
-            activities = getattr(self, '_activities', [])
-            
-            # Apply filters
+            since_dt = None
             if since:
                 since_dt = datetime.fromisoformat(since.replace('Z', '+00:00'))
-                activities = [
-                    a for a in activities 
-                    if datetime.fromisoformat(a['stored_at']) > since_dt
-                ]
+                if since_dt.tzinfo:
+                    # Stored timestamps are naive UTC
+                    since_dt = since_dt.astimezone(timezone.utc).replace(tzinfo=None)
             
-            if agent_id:
-                activities = [
-                    a for a in activities 
-                    if a.get('agent_id') == agent_id
-                ]
+            if fields:
+                fields = [name.strip() for name in fields.split(',') if name.strip()]
+                unknown = [name for name in fields if name not in ACTIVITY_FIELDS]
+                if unknown:
+                    raise ValueError(f"Unknown activity fields: {', '.join(unknown)}")
             
-            # Apply limit
-            activities = activities[-limit:]
-            
-            return web.json_response({
-                'activities': activities,
-                'count': len(activities),
-                'total': len(getattr(self, '_activities', []))
-            })
+            position = decode_cursor(cursor) if cursor else None
             
         except Exception as e:
             return web.json_response(
                 {'error': str(e)}, 
                 status=400
             )
+        
+        try:
+            if self.db:
+                # The page is bounded by max_page_size, so it is read in full
+                # before responding and a failed read is a clean error
+                page = [
+                    entry async for entry in self.db.iter_activities(
+                        limit=limit,
+                        since=since_dt,
+                        agent_id=agent_id,
+                        activity_type=activity_type,
+                        cursor=cursor,
+                        fields=fields or None
+                    )
+                ]
+                total = await self.db.get_activity_count()
+            else:
+                page = self._get_memory_activities(
+                    limit, since_dt, agent_id, activity_type, position, fields or None
+                )
+                total = len(getattr(self, '_activities', []))
+        except Exception as e:
+            self.logger.error(f"Error reading activities: {e}")
+            return web.json_response(
+                {'error': 'Failed to read activities'}, 
+                status=500
+            )
+        
+        # Full page: the last position is where the next page starts
+        next_cursor = encode_cursor(page[-1][1]) if len(page) == limit else None
+        return web.json_response({
+            'activities': [activity for activity, _ in page],
+            'count': len(page),
+            'total': total,
+            'next_cursor': next_cursor
+        }, dumps=lambda data: json.dumps(data, default=str))
+    
+    def _get_memory_activities(
+        self,
+        limit: int,
+        since: Optional[datetime],
+        agent_id: Optional[str],
+        activity_type: Optional[str],
+        position: Optional[Tuple[str, str]],
+        fields: Optional[List[str]]
+    ) -> List[Tuple[Dict[str, Any], Tuple[str, str]]]:
+        """Read a page from the in-memory fallback store.
+        
+        Mirrors ``MonitoringDatabase.iter_activities``: newest first by
+        ``(stored_at, id)`` and returned as ``(activity, position)`` pairs.
+        """
+        since_iso = since.isoformat() if since else None
+        matches = []
+        
+        for activity in getattr(self, '_activities', []):
+            key = (str(activity.get('stored_at')), str(activity.get('id')))
+            if since_iso and key[0] <= since_iso:
+                continue
+            if agent_id and activity.get('agent_id') != agent_id:
+                continue
+            if activity_type and activity.get('type') != activity_type:
+                continue
+            if position and key >= position:
+                continue
+            matches.append((key, activity))
+        
+        page = heapq.nlargest(limit, matches, key=lambda match: match[0])
+        if fields:
+            return [
+                ({name: activity.get(name) for name in fields}, key)
+                for key, activity in page
+            ]
+        return [(activity, key) for key, activity in page]
     
     @require_auth
     async def get_agents(self, request):
@@ -618,6 +764,10 @@ class EnhancedMonitoringServer:
         except KeyboardInterrupt:
             self.logger.info("Shutting down...")
             await runner.cleanup()
+            await self.broadcaster.close()
+            await self.rate_limiter.close()
+            # Flush queued activities before exiting
+            await self.db.close()
     
     def run(self):
         """Start the enhanced server."""
@@ -13,6 +13,8 @@ from typing import Dict, Any, Optional
 import websockets
 from pathlib import Path
 
+from ..segment_log import SegmentedLog
+
 
 class AgentActivityLogger:
     """
@@ -38,8 +40,8 @@ class AgentActivityLogger:
         self.connected = False
         self.log_file = Path(f"logs/{agent_id}.jsonl")
         
-        # Create logs directory if it doesn't exist
-        self.log_file.parent.mkdir(exist_ok=True)
+        # Segmented log with a persistent buffered writer (creates logs/)
+        self.activity_log = SegmentedLog(self.log_file)
         
         # Current task tracking
         self.current_task_id = None
@@ -116,8 +118,14 @@ class AgentActivityLogger:
     
     def _write_to_file(self, activity: Dict[str, Any]):
         """Write activity to log file."""
-        with open(self.log_file, 'a') as f:
-            f.write(json.dumps(activity) + '\n')
+        self.activity_log.append(activity)
+    
+    async def close(self):
+        """Close the monitor connection and flush the activity log."""
+        if self.websocket:
+            await self.websocket.close()
+            self.connected = False
+        self.activity_log.close()
     
     async def start_task(self, task_id: str, description: str):
         """Log task start."""
@@ -0,0 +1,169 @@
+"""
+Sliding-window rate limiting for the monitoring server.
+
+Uses the sliding-window-counter approximation: each key keeps the request
+count of the current and previous fixed window, and the previous count is
+weighted by how much of it still overlaps the sliding window. That is two
+counters per key and O(1) work per request.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger('enhanced_monitoring_server')
+
+
+class SlidingWindowRateLimiter:
+    """In-process sliding-window limiter with an LRU-bounded key table."""
+
+    def __init__(self, limit: int, window: float = 60.0, max_keys: int = 100000):
+        """
+        Args:
+            limit: Requests allowed per window
+            window: Window length in seconds
+            max_keys: Maximum tracked keys; least recently seen are evicted
+        """
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+
+        # key -> (window index, current count, previous count)
+        self._counters: 'OrderedDict[str, Tuple[int, int, int]]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    def _estimate(self, key: str, now: float) -> Tuple[int, int, int, float]:
+        """Return the rolled-forward counters and the sliding estimate."""
+        window_index = int(now // self.window)
+        current, previous = 0, 0
+
+        state = self._counters.get(key)
+        if state is not None:
+            index, count, prev_count = state
+            if index == window_index:
+                current, previous = count, prev_count
+            elif index == window_index - 1:
+                previous = count
+
+        overlap = 1.0 - (now % self.window) / self.window
+        return window_index, current, previous, previous * overlap + current
+
+    async def allow(self, key: str) -> bool:
+        """Record a request for ``key`` if it is within the limit."""
+        window_index, current, previous, estimate = self._estimate(key, time.time())
+        if estimate >= self.limit:
+            return False
+
+        self._counters[key] = (window_index, current + 1, previous)
+        self._counters.move_to_end(key)
+        if len(self._counters) > self.max_keys:
+            self._counters.popitem(last=False)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics."""
+        return {'backend': 'memory', 'tracked_keys': len(self._counters)}
+
+    async def close(self):
+        """Release resources (nothing to release in-process)."""
+
+
+class RedisRateLimiter:
+    """Sliding-window limiter shared by several servers through Redis."""
+
+    # Checks and increments atomically: KEYS = current, previous window keys;
+    # ARGV = previous-window weight, limit, key TTL
+    SCRIPT = """
+        local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+        local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+        if previous * tonumber(ARGV[1]) + current >= tonumber(ARGV[2]) then
+            return 0
+        end
+        redis.call('INCR', KEYS[1])
+        redis.call('EXPIRE', KEYS[1], ARGV[3])
+        return 1
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        limit: int,
+        window: float = 60.0,
+        prefix: str = "monitoring:ratelimit"
+    ):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise ImportError("RedisRateLimiter requires the 'redis' package") from e
+
+        self.limit = limit
+        self.window = window
+        self.prefix = prefix
+        self.redis = redis.from_url(redis_url, decode_responses=True)
+        self._script = self.redis.register_script(self.SCRIPT)
+
+        # Requests allowed because Redis could not be reached
+        self.fail_open_count = 0
+        self._unlogged_fail_opens = 0
+        self._last_fail_open_log = 0.0
+
+    async def allow(self, key: str) -> bool:
+        """Record a request for ``key`` if it is within the limit.
+
+        Fails open if Redis is unavailable so monitoring keeps working;
+        such decisions are counted and logged at most once per window.
+        """
+        now = time.time()
+        window_index = int(now // self.window)
+        overlap = 1.0 - (now % self.window) / self.window
+
+        try:
+            allowed = await self._script(
+                keys=[
+                    f"{self.prefix}:{key}:{window_index}",
+                    f"{self.prefix}:{key}:{window_index - 1}",
+                ],
+                args=[overlap, self.limit, int(self.window * 2) + 1]
+            )
+        except Exception as e:
+            self._record_fail_open(e, now)
+            return True
+
+        return bool(allowed)
+
+    def _record_fail_open(self, error: Exception, now: float):
+        """Count a request allowed without a limit check and log periodically."""
+        self.fail_open_count += 1
+        self._unlogged_fail_opens += 1
+        if now - self._last_fail_open_log < self.window:
+            return
+
+        logger.warning(
+            f"Rate limiter backend error, allowed {self._unlogged_fail_opens} "
+            f"request(s) unchecked ({self.fail_open_count} total): {error}"
+        )
+        self._unlogged_fail_opens = 0
+        self._last_fail_open_log = now
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics."""
+        return {'backend': 'redis', 'fail_open': self.fail_open_count}
+
+    async def close(self):
+        """Close the Redis connection."""
+        await self.redis.aclose()
+
+
+def create_rate_limiter(
+    limit: int,
+    window: float = 60.0,
+    redis_url: Optional[str] = None,
+    max_keys: int = 100000
+):
+    """Create a Redis-backed limiter when a URL is given, else in-process."""
+    if redis_url:
+        return RedisRateLimiter(redis_url, limit, window)
+    return SlidingWindowRateLimiter(limit, window, max_keys)
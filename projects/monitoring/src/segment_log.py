@@ -0,0 +1,286 @@
+"""
+Segmented append-only JSONL log.
+
+Records are appended to size-bounded segment files through a persistent
+buffered writer. Sealed segments are listed in an index file with the
+offset (global record number) and count of each, and a clean close
+checkpoints the active segment's count, so opening a log only counts the
+records written since then. Tails are read backwards from the end of each
+segment.
+
+Layout for ``logs/agent.jsonl``::
+
+    logs/agent-000000.jsonl      sealed segment
+    logs/agent-000001.jsonl      active segment
+    logs/agent.index.json        {"segments": [{"name", "offset", "count", "bytes"}],
+                                  "active": {"name", "count", "bytes"}}
+"""
+
+import asyncio
+import atexit
+import json
+import os
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+class SegmentedLog:
+    """Append-only JSONL log split into rotated segments."""
+
+    # Bytes read per step when scanning a segment
+    read_block_size = 64 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        max_segment_bytes: int = 8 * 1024 * 1024,
+        flush_interval: float = 1.0,
+        buffer_size: int = 64 * 1024
+    ):
+        """
+        Open (or create) a segmented log.
+
+        Args:
+            path: Logical log path; segments and index are created beside it
+            max_segment_bytes: Size at which the active segment is sealed
+            flush_interval: Maximum seconds a record may sit in the buffer
+            buffer_size: Write buffer size in bytes
+        """
+        path = Path(path)
+        self.directory = path.parent
+        self.prefix = path.stem
+        self.legacy_path = path
+        self.index_path = self.directory / f"{self.prefix}.index.json"
+
+        self.max_segment_bytes = max_segment_bytes
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+
+        self.segments: List[Dict[str, Any]] = []
+        self.active_count = 0
+        self.active_bytes = 0
+        self._file = None
+        self._last_flush = time.monotonic()
+        self._flush_scheduled = False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._open()
+        atexit.register(self.close)
+
+    @property
+    def total_count(self) -> int:
+        """Number of records in the log."""
+        return self._active_offset + self.active_count
+
+    @property
+    def _active_offset(self) -> int:
+        if not self.segments:
+            return 0
+        last = self.segments[-1]
+        return last['offset'] + last['count']
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / f"{self.prefix}-{number:06d}.jsonl"
+
+    @property
+    def active_path(self) -> Path:
+        """Path of the segment currently being written."""
+        return self._segment_path(len(self.segments))
+
+    def _open(self):
+        """Load the index, adopt a legacy single-file log and open for append."""
+        checkpoint = {}
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r') as f:
+                    index = json.load(f)
+                self.segments = index.get('segments', [])
+                checkpoint = index.get('active') or {}
+            except (OSError, ValueError):
+                self._rebuild_index()
+
+        if not self.segments and self.legacy_path.exists() and not self.active_path.exists():
+            # Pre-segmentation logs become the first segment
+            os.replace(self.legacy_path, self.active_path)
+
+        # Only records written to the active segment since the last clean
+        # close need counting
+        if self.active_path.exists():
+            self.active_bytes = self._truncate_torn_record(self.active_path)
+            start = 0
+            if (checkpoint.get('name') == self.active_path.name
+                    and checkpoint.get('bytes', 0) <= self.active_bytes):
+                self.active_count = checkpoint['count']
+                start = checkpoint['bytes']
+            self.active_count += self._count_records(self.active_path, start)
+
+        self._file = open(self.active_path, 'a', buffering=self.buffer_size)
+
+        if self.active_bytes >= self.max_segment_bytes:
+            self.rotate()
+
+    def _truncate_torn_record(self, path: Path) -> int:
+        """Drop a partial last record left by a crash; return the file size."""
+        with open(path, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                step = min(self.read_block_size, position)
+                position -= step
+                f.seek(position)
+                newline = f.read(step).rfind(b'\n')
+                if newline != -1:
+                    position += newline + 1
+                    break
+            if position != end:
+                f.truncate(position)
+        return position
+
+    def _count_records(self, path: Path, start: int = 0) -> int:
+        """Count the records in a segment from a byte offset."""
+        count = 0
+        with open(path, 'rb') as f:
+            f.seek(start)
+            while chunk := f.read(self.read_block_size):
+                count += chunk.count(b'\n')
+        return count
+
+    def _rebuild_index(self):
+        """Recover the sealed segment list from the segment files on disk."""
+        paths = sorted(self.directory.glob(f"{self.prefix}-[0-9]*.jsonl"))
+        self.segments = []
+        offset = 0
+        # The newest segment stays active
+        for path in paths[:-1]:
+            self._truncate_torn_record(path)
+            count = self._count_records(path)
+            self.segments.append({
+                'name': path.name,
+                'offset': offset,
+                'count': count,
+                'bytes': path.stat().st_size
+            })
+            offset += count
+        self._write_index()
+
+    def append(self, record: Dict[str, Any]):
+        """Append a record; it becomes durable at the next flush."""
+        line = json.dumps(record, default=str) + '\n'
+        self._file.write(line)
+        self.active_count += 1
+        self.active_bytes += len(line.encode())
+
+        if self.active_bytes >= self.max_segment_bytes:
+            self.rotate()
+        elif time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Flush after the interval even if no further records arrive."""
+        if self._flush_scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_scheduled = True
+        loop.call_later(self.flush_interval, self.flush)
+
+    def flush(self):
+        """Flush buffered records to the operating system."""
+        self._flush_scheduled = False
+        self._last_flush = time.monotonic()
+        if self._file and not self._file.closed:
+            self._file.flush()
+
+    def rotate(self):
+        """Seal the active segment and start a new one."""
+        if self.active_count == 0:
+            return
+
+        self._file.close()
+        self.segments.append({
+            'name': self.active_path.name,
+            'offset': self._active_offset,
+            'count': self.active_count,
+            'bytes': self.active_bytes
+        })
+        self._write_index()
+
+        self.active_count = 0
+        self.active_bytes = 0
+        self._file = open(self.active_path, 'a', buffering=self.buffer_size)
+
+    def _write_index(self, checkpoint: bool = False):
+        """Atomically replace the segment index.
+
+        With ``checkpoint`` the active segment's count is recorded too, so
+        the next open does not have to count it.
+        """
+        index: Dict[str, Any] = {'segments': self.segments}
+        if checkpoint:
+            index['active'] = {
+                'name': self.active_path.name,
+                'count': self.active_count,
+                'bytes': self.active_bytes
+            }
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def tail(self, limit: int) -> List[Dict[str, Any]]:
+        """Read the newest ``limit`` records, oldest first."""
+        if limit <= 0:
+            return []
+
+        self.flush()
+        paths = [self.directory / segment['name'] for segment in self.segments]
+        paths.append(self.active_path)
+
+        records: deque = deque()
+        for path in reversed(paths):
+            if not path.exists():
+                continue
+            for line in reversed(self._read_last_lines(path, limit - len(records))):
+                try:
+                    records.appendleft(json.loads(line))
+                except json.JSONDecodeError:
+                    pass
+            if len(records) >= limit:
+                break
+
+        return list(records)
+
+    def _read_last_lines(self, path: Path, count: int) -> List[bytes]:
+        """Read the last ``count`` lines of a segment, scanning back from the end."""
+        with open(path, 'rb') as f:
+            position = f.seek(0, os.SEEK_END)
+            blocks: deque = deque()
+            newlines = 0
+            # One newline more than needed guarantees ``count`` whole lines
+            while position > 0 and newlines <= count:
+                step = min(self.read_block_size, position)
+                position -= step
+                f.seek(position)
+                block = f.read(step)
+                newlines += block.count(b'\n')
+                blocks.appendleft(block)
+
+        lines = b''.join(blocks).splitlines()
+        if position > 0:
+            # The first line may start before the window
+            lines = lines[1:]
+        return [line for line in lines[-count:] if line.strip()]
+
+    def close(self):
+        """Flush and close the active segment, checkpointing its count."""
+        if self._file and not self._file.closed:
+            self._file.flush()
+            self._file.close()
+            self._write_index(checkpoint=True)
+        atexit.unregister(self.close)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Intent Detection Benchmark - AIOSv3.1
+Compares the per-table substring scans Hermes used to run with the shared
+KeywordMatcher (substring and compiled modes) over a corpus of long user
+messages, and shows how each scales as keyword tables grow.
+"""
+
+import os
+import random
+import string
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.agents.specialists.hermes.intent_tracker import IntentTracker
+from src.agents.specialists.hermes.keyword_matcher import KeywordMatcher
+
+
+def build_corpus(keywords, messages: int = 100, words: int = 400,
+                 keyword_rate: float = 0.05, seed: int = 42):
+    """Generate long messages of random words with a share of keywords."""
+    rng = random.Random(seed)
+    vocabulary = [
+        ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 10)))
+        for _ in range(5000)
+    ]
+    return [
+        " ".join(
+            rng.choice(keywords) if rng.random() < keyword_rate else rng.choice(vocabulary)
+            for _ in range(words)
+        )
+        for _ in range(messages)
+    ]
+
+
+def per_table_scan(tables, text: str):
+    """The previous approach: lower-case and substring-check table by table."""
+    return {
+        name: [keyword for keyword, _ in table if keyword in text.lower()]
+        for name, table in tables.items()
+    }
+
+
+def matcher_scan(matcher, text: str):
+    """One scan with a KeywordMatcher, read back per table."""
+    hits = matcher.scan(text)
+    return {name: hits.matches(name) for name in matcher.tables}
+
+
+def time_per_message(func, corpus, repeat: int = 5) -> float:
+    """Best-of-``repeat`` average time per message, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in corpus:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(corpus) * 1000
+
+
+def compare(tables, corpus):
+    """Time the per-table scan against both matcher modes."""
+    substring = KeywordMatcher(tables, compile_threshold=10 ** 9)
+    compiled = KeywordMatcher(tables, compile_threshold=0)
+
+    # All approaches must agree before timing them
+    for text in corpus[:20]:
+        expected = per_table_scan(substring.tables, text)
+        assert matcher_scan(substring, text) == expected
+        assert matcher_scan(compiled, text) == expected
+
+    return (
+        time_per_message(lambda t: per_table_scan(substring.tables, t), corpus),
+        time_per_message(substring.scan, corpus),
+        time_per_message(compiled.scan, corpus),
+    )
+
+
+def main():
+    tracker = IntentTracker()
+    tables = {name: dict(table) for name, table in tracker.keyword_matcher.tables.items()}
+    keywords = sorted({k for table in tables.values() for k in table})
+
+    print(f"Hermes tables ({len(keywords)} distinct keywords)")
+    for words in (50, 400, 2000):
+        corpus = build_corpus(keywords, words=words)
+        per_table, substring, compiled = compare(tables, corpus)
+        detect = time_per_message(tracker.detect_intent, corpus)
+        print(f"  {words:>5} words: per-table {per_table:.3f} ms, "
+              f"substring {substring:.3f} ms, compiled {compiled:.3f} ms, "
+              f"detect_intent {detect:.3f} ms")
+
+    print("Growing tables (400-word messages)")
+    rng = random.Random(7)
+    for size in (150, 500, 2000, 5000):
+        synthetic = sorted({
+            ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 12)))
+            for _ in range(size)
+        })
+        grown = {f"table{i}": synthetic[i::10] for i in range(10)}
+        corpus = build_corpus(synthetic, words=400)
+        per_table, substring, compiled = compare(grown, corpus)
+        print(f"  {len(synthetic):>5} keywords: per-table {per_table:.3f} ms, "
+              f"substring {substring:.3f} ms, compiled {compiled:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+JavaScript Bug Detection Benchmark - AIOSv3.1
+Compares the previous JavaScriptBugDetector approach (pattern strings
+recompiled per detector, line numbers counted from the start of the file
+for every finding) with the precomputed line index and combined token scan,
+on multi-MB unminified and minified bundles.
+"""
+
+import os
+import random
+import re
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.agents.specialists.bug_detector import JavaScriptBugDetector
+
+SNIPPETS = [
+    "function handle{n}(event) {{ if (event.type == 'click') {{ update{n}(event.data); }} }}",
+    "const el{n} = document.getElementById('item-{n}');",
+    "el{n}.addEventListener('click', handle{n});",
+    "if (value{n} === undefined) {{ value{n} = defaults[{n}]; }}",
+    "container.innerHTML = '<li>' + query.item{n} + '</li>';",
+    "const config{n} = eval('(' + raw{n} + ')');",
+    "for (let i = 0; i < items.length; i++) {{ total += items[i].price * {n}; }}",
+    "return fetch('/api/items/{n}').then(r => r.json()).then(d => render(d));",
+]
+
+
+def build_bundle(size: int, minified: bool, seed: int = 42) -> str:
+    """Generate roughly ``size`` characters of JavaScript."""
+    rng = random.Random(seed)
+    statements = []
+    length = 0
+    n = 0
+    while length < size:
+        statement = rng.choice(SNIPPETS).format(n=n)
+        statements.append(statement)
+        length += len(statement) + 1
+        n += 1
+    if minified:
+        # Minifiers emit a few very long lines
+        per_line = max(1, len(statements) // 4)
+        return "\n".join(
+            ";".join(statements[i:i + per_line]) for i in range(0, len(statements), per_line)
+        )
+    return "\n".join(statements)
+
+
+def previous_findings(code: str):
+    """The previous approach: per-detector patterns, line counted per finding."""
+    lines = []
+    for pattern, flags in ((r'\.innerHTML\s*=\s*[^;]+(?:input|param|query|data)', re.IGNORECASE),
+                           (r'\beval\s*\(', 0),
+                           (r'[^!=]==[^=]', 0)):
+        for match in re.finditer(pattern, code, flags):
+            lines.append(code[:match.start()].count('\n') + 1)
+    re.finditer(r'document\.getElementById\([^)]+\)', code)
+    len(re.findall(r'addEventListener\s*\(', code))
+    len(re.findall(r'removeEventListener\s*\(', code))
+    re.search(r'\bundefined\b', code)
+    return lines
+
+
+def timed(func, code: str):
+    """Run ``func`` once and return (seconds, result)."""
+    start = time.perf_counter()
+    result = func(code)
+    return time.perf_counter() - start, result
+
+
+def main():
+    detector = JavaScriptBugDetector()
+    for minified in (False, True):
+        for size in (256 * 1024, 1024 * 1024, 4 * 1024 * 1024):
+            code = build_bundle(size, minified)
+            label = f"{'minified' if minified else 'unminified':>10} {size // 1024:>5} KB"
+
+            new_time, bugs = timed(lambda c: detector.analyze_code(c, "bundle.js"), code)
+            new_lines = [bug.line_number for bug in bugs if bug.line_number is not None]
+
+            # The previous approach is quadratic; only time it on smaller inputs
+            if size <= 1024 * 1024:
+                old_time, old_lines = timed(previous_findings, code)
+                assert sorted(old_lines) == sorted(new_lines)
+                print(f"  {label}: previous {old_time:7.2f}s, current {new_time:6.3f}s "
+                      f"({len(bugs):,} findings, {old_time / new_time:,.0f}x)")
+            else:
+                print(f"  {label}: previous  (skipped), current {new_time:6.3f}s "
+                      f"({len(bugs):,} findings)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,14 @@ state tracking, and integration with the AIOSv3 infrastructure.
 """
 
 import asyncio
+import itertools
+import json
 import logging
 import time
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Optional, Set
 
 from pydantic import BaseModel, Field
 
@@ -22,6 +24,7 @@ from .exceptions import (
     TaskExecutionError,
     TaskValidationError,
 )
+from .task_history import TaskHistory
 from .types import (
     AgentHealth,
     AgentMetadata,
@@ -57,7 +60,7 @@ class TaskResult(BaseModel):
 
     task_id: str
     agent_id: str
-    status: str  # "success", "error", "partial", "timeout"
+    status: str  # "success", "error", "partial", "timeout", "cancelled"
     result: Optional[dict[str, Any]] = None
     error: Optional[str] = None
     execution_time: float
@@ -80,6 +83,7 @@ class AgentConfig(BaseModel):
     task_timeout_seconds: float = Field(default=300.0, gt=0)
     health_check_interval: float = Field(default=30.0, gt=0)
     memory_retention_hours: int = Field(default=24, ge=1)
+    task_history_size: int = Field(default=1000, ge=1)
     auto_restart: bool = True
 
 
@@ -127,8 +131,22 @@ class BaseAgent(ABC):
 
         # Task management
         self.current_tasks: Dict[str, Task] = {}
-        self.task_history: List[TaskResult] = []
-        self.task_queue: asyncio.Queue = asyncio.Queue()
+        # Recent results plus running aggregates; records pushed out of the
+        # ring are flushed to the memory store when there is one
+        self.task_history = TaskHistory(
+            capacity=config.task_history_size if config else 1000,
+            keep_evicted=memory_store is not None,
+        )
+        # Submitted tasks waiting for a worker, as (priority, sequence, task,
+        # future) so equal priorities run first in, first out
+        self.task_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._task_sequence = itertools.count()
+        self._pending_tasks: Dict[str, asyncio.Future] = {}
+        self._running_tasks: Dict[str, asyncio.Task] = {}
+        self._workers: Set[asyncio.Task] = set()
+        # Set whenever no task is executing, so shutdown can drain without polling
+        self._idle_event = asyncio.Event()
+        self._idle_event.set()
 
         # Memory and statistics
         self.memory: Dict[str, Any] = {}
@@ -279,6 +297,9 @@ class BaseAgent(ABC):
         """
         Execute a task and return the result.
 
+        The task counts towards ``current_tasks`` while it runs and is given
+        ``task_timeout_seconds`` to finish.
+
         Args:
             task: The task to execute
 
@@ -286,6 +307,10 @@ class BaseAgent(ABC):
             TaskResult: The result of the task execution
         """
         start_time = asyncio.get_event_loop().time()
+        model_id = "unknown"
+
+        self.current_tasks[task.id] = task
+        self._idle_event.clear()
 
         try:
             self.logger.info(f"Executing task {task.id}: {task.description}")
@@ -300,7 +325,10 @@ class BaseAgent(ABC):
             model_id = await self._route_to_model(task)
 
             # Execute the task
-            result = await self._execute_task_internal(task, model_id)
+            timeout = self.config.task_timeout_seconds if self.config else None
+            result = await asyncio.wait_for(
+                self._execute_task_internal(task, model_id), timeout=timeout
+            )
 
             execution_time = asyncio.get_event_loop().time() - start_time
 
@@ -314,13 +342,42 @@ class BaseAgent(ABC):
             )
 
             # Store in history
-            self.task_history.append(task_result)
+            self._record_task_result(task_result)
 
             self.logger.info(
                 f"Task {task.id} completed successfully in {execution_time:.2f}s"
             )
             return task_result
 
+        except asyncio.TimeoutError:
+            execution_time = asyncio.get_event_loop().time() - start_time
+
+            task_result = TaskResult(
+                task_id=task.id,
+                agent_id=self.id,
+                status="timeout",
+                error=f"Task timed out after {execution_time:.2f}s",
+                execution_time=execution_time,
+                model_used=model_id,
+            )
+
+            self._record_task_result(task_result)
+            self.logger.error(f"Task {task.id} timed out")
+            return task_result
+
+        except asyncio.CancelledError:
+            self._record_task_result(
+                TaskResult(
+                    task_id=task.id,
+                    agent_id=self.id,
+                    status="cancelled",
+                    execution_time=asyncio.get_event_loop().time() - start_time,
+                    model_used=model_id,
+                )
+            )
+            self.logger.info(f"Task {task.id} cancelled")
+            raise
+
         except Exception as e:
             execution_time = asyncio.get_event_loop().time() - start_time
 
@@ -333,10 +390,167 @@ class BaseAgent(ABC):
                 model_used="unknown",
             )
 
-            self.task_history.append(task_result)
+            self._record_task_result(task_result)
             self.logger.error(f"Task {task.id} failed: {e}")
             return task_result
 
+        finally:
+            self.current_tasks.pop(task.id, None)
+            if not self.current_tasks:
+                self._idle_event.set()
+
+    def submit_task(self, task: Task) -> "asyncio.Future[TaskResult]":
+        """
+        Queue a task for the agent's worker pool.
+
+        Up to ``max_concurrent_tasks`` tasks run at once; queued tasks start
+        in priority order, oldest first within a priority.
+
+        Args:
+            task: The task to execute
+
+        Returns:
+            asyncio.Future: Resolves to the TaskResult, or is cancelled if the
+            task is cancelled
+
+        Raises:
+            AgentStateError: If the agent is shutting down
+        """
+        if self.state in (AgentState.STOPPING, AgentState.STOPPED):
+            raise AgentStateError(
+                f"Agent {self.name} is not accepting tasks", self.id, self.state.value
+            )
+
+        self._start_workers()
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending_tasks[task.id] = future
+        self.task_queue.put_nowait(
+            (task.priority.value, next(self._task_sequence), task, future)
+        )
+        return future
+
+    def cancel_task(self, task_id: str) -> bool:
+        """
+        Cancel a queued or running task submitted with ``submit_task``.
+
+        Args:
+            task_id: ID of the task to cancel
+
+        Returns:
+            bool: True if the task was found and cancelled
+        """
+        future = self._pending_tasks.get(task_id)
+        return future.cancel() if future is not None else False
+
+    def _start_workers(self) -> None:
+        """Start the worker pool if it is not running."""
+        if self._workers:
+            return
+
+        max_tasks = self.config.max_concurrent_tasks if self.config else 1
+        for _ in range(max_tasks):
+            worker = asyncio.create_task(self._task_worker())
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+
+    async def _stop_workers(self) -> None:
+        """Cancel the worker pool along with running and queued tasks."""
+        running = list(self._running_tasks.values())
+        for task in running + list(self._workers):
+            task.cancel()
+        if running or self._workers:
+            await asyncio.gather(*running, *self._workers, return_exceptions=True)
+        self._workers.clear()
+
+        while not self.task_queue.empty():
+            _, _, _, future = self.task_queue.get_nowait()
+            future.cancel()
+            self.task_queue.task_done()
+        self._pending_tasks.clear()
+
+    async def _task_worker(self) -> None:
+        """Run queued tasks one at a time until cancelled."""
+        while True:
+            _, _, task, future = await self.task_queue.get()
+            try:
+                if not future.cancelled():
+                    await self._run_submitted_task(task, future)
+            finally:
+                self._pending_tasks.pop(task.id, None)
+                self.task_queue.task_done()
+
+    async def _run_submitted_task(self, task: Task, future: asyncio.Future) -> None:
+        """Execute a dequeued task and resolve its future."""
+        running = asyncio.create_task(self.execute_task(task))
+        self._running_tasks[task.id] = running
+        # Cancelling the future, e.g. through cancel_task, cancels the run
+        future.add_done_callback(lambda f: running.cancel() if f.cancelled() else None)
+
+        try:
+            # Unlike awaiting it, asyncio.wait leaves ``running`` alone if the
+            # worker is cancelled; _stop_workers cancels it explicitly
+            await asyncio.wait({running})
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        finally:
+            self._running_tasks.pop(task.id, None)
+
+        if future.done():
+            return
+        if running.cancelled():
+            future.cancel()
+        elif running.exception() is not None:
+            future.set_exception(running.exception())
+        else:
+            future.set_result(running.result())
+
+    def _record_task_result(self, task_result: TaskResult) -> None:
+        """Add a result to the history and refresh the agent statistics."""
+        history = self.task_history
+        history.append(task_result)
+
+        self.stats.tasks_completed = history.total
+        self.stats.tasks_failed = history.failed
+        self.stats.success_rate = history.success_rate
+        self.stats.average_execution_time = history.average_latency
+        self.stats.total_cost = history.total_cost
+        self.stats.models_used = history.model_counts
+        self.stats.last_active = history.last_completed
+
+        if history.evicted_count >= history.flush_batch_size:
+            flush_task = asyncio.create_task(self._flush_task_history())
+            self._background_tasks.add(flush_task)
+            flush_task.add_done_callback(self._background_tasks.discard)
+
+    async def _flush_task_history(self) -> None:
+        """Store task records evicted from the history in the memory store."""
+        records = self.task_history.drain_evicted()
+        if not records or not self.memory_store:
+            return
+
+        from src.core.memory.base import MemoryEntry, MemoryPriority, MemoryType
+
+        entry = MemoryEntry(
+            content=json.dumps([record.to_dict() for record in records]),
+            memory_type=MemoryType.EPISODIC,
+            priority=MemoryPriority.LOW,
+            agent_id=self.id,
+            categories=["task_history"],
+            metadata={
+                "record_count": len(records),
+                "first_task_id": records[0].task_id,
+                "last_task_id": records[-1].task_id,
+            },
+        )
+        try:
+            await self.memory_store.store_memory(entry)
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to flush {len(records)} task records to memory: {e}"
+            )
+
     def can_handle_task(self, task: Task) -> bool:
         """
         Check if this agent can handle the given task.
@@ -457,7 +671,7 @@ class BaseAgent(ABC):
             "can_accept_tasks": self.can_accept_tasks,
             "capabilities": self.capabilities,
             "current_tasks": len(self.current_tasks),
-            "tasks_completed": len(self.task_history),
+            "tasks_completed": self.task_history.total,
             "memory_size": len(self.memory),
             "uptime_seconds": self.uptime_seconds,
             "error_count": self.error_count,
@@ -507,7 +721,7 @@ class BaseAgent(ABC):
             score -= error_penalty
 
         # Consider task success rate if we have history
-        if len(self.task_history) > 0:
+        if self.task_history.total > 0:
             success_rate = self.stats.success_rate
             score = (score + success_rate) / 2
 
@@ -553,6 +767,7 @@ class BaseAgent(ABC):
     async def _save_memory(self) -> None:
         """Save current memory to persistent storage."""
         if self.memory_store:
+            await self._flush_task_history()
             try:
                 # Implementation would depend on memory store interface
                 pass
@@ -567,8 +782,12 @@ class BaseAgent(ABC):
             self._background_tasks.add(health_task)
             health_task.add_done_callback(self._background_tasks.discard)
 
+        self._start_workers()
+
     async def _stop_background_tasks(self) -> None:
         """Stop all background tasks."""
+        await self._stop_workers()
+
         for task in self._background_tasks:
             task.cancel()
 
@@ -578,11 +797,14 @@ class BaseAgent(ABC):
         self._background_tasks.clear()
 
     async def _wait_for_tasks_completion(self, timeout: float = 30.0) -> None:
-        """Wait for current tasks to complete."""
-        if not self.current_tasks:
+        """Wait for current and queued tasks to complete."""
+        if not self.current_tasks and self.task_queue.empty():
             return
 
-        self.logger.info(f"Waiting for {len(self.current_tasks)} tasks to complete")
+        self.logger.info(
+            f"Waiting for {len(self.current_tasks)} running and "
+            f"{self.task_queue.qsize()} queued tasks to complete"
+        )
 
         try:
             await asyncio.wait_for(self._wait_for_all_tasks(), timeout=timeout)
@@ -592,9 +814,10 @@ class BaseAgent(ABC):
             )
 
     async def _wait_for_all_tasks(self) -> None:
-        """Wait until all current tasks are completed."""
-        while self.current_tasks:
-            await asyncio.sleep(0.1)
+        """Wait until the queue is drained and no task is executing."""
+        if self._workers:
+            await self.task_queue.join()
+        await self._idle_event.wait()
 
     async def _health_check_loop(self) -> None:
         """Background health check loop."""
@@ -713,12 +936,14 @@ class BaseAgent(ABC):
 
             # Create task from assignment
             from .agent import Task
-            from .types import TaskType
+            from .types import TaskPriority, TaskType
 
             task = Task(
                 type=TaskType(task_type_str),
                 description=description,
                 parameters=parameters,
+                # Message and task priorities share their numeric levels
+                priority=TaskPriority(message.priority.value),
                 assigned_agent_id=self.id,
                 context={"assigned_by": message.sender_id},
             )
@@ -733,19 +958,15 @@ class BaseAgent(ABC):
                     )
                 return
 
-            # Execute the task
-            result = await self.execute_task(task)
-
-            # Send result if response is required
+            # Queue the task and reply once it completes, so the message
+            # loop is free to hand further tasks to the worker pool
+            future = self.submit_task(task)
             if message.requires_response:
-                await self.communication.send_response(
-                    request_message=message,
-                    content={
-                        "task_result": result.model_dump(),
-                        "execution_successful": result.status == "success",
-                    },
-                    success=True,
+                reply_task = asyncio.create_task(
+                    self._send_task_result(message, future)
                 )
+                self._background_tasks.add(reply_task)
+                reply_task.add_done_callback(self._background_tasks.discard)
 
         except Exception as e:
             self.logger.error(f"Error handling task assignment: {e}")
@@ -759,6 +980,32 @@ class BaseAgent(ABC):
                 except Exception:
                     pass  # Avoid cascading errors
 
+    async def _send_task_result(self, message: Any, future: asyncio.Future) -> None:
+        """Send the result of an assigned task once it completes."""
+        try:
+            # Shielded so that stopping the reply does not cancel the task
+            result = await asyncio.shield(future)
+            content = {
+                "task_result": result.model_dump(),
+                "execution_successful": result.status == "success",
+            }
+            success = True
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            content = {"error": "Task was cancelled"}
+            success = False
+        except Exception as e:
+            content = {"error": str(e)}
+            success = False
+
+        try:
+            await self.communication.send_response(
+                request_message=message, content=content, success=success
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to send task result: {e}")
+
     async def _handle_task_delegation_message(self, message: Any) -> None:
         """Handle task delegation messages."""
         # For now, treat delegation the same as assignment
@@ -171,8 +171,14 @@ class EnhancedTaskResult(BaseModel):
 class EnhancedBaseAgent(ABC):
     """Enhanced base class for all agents with full infrastructure integration."""
     
-    def __init__(self, config: EnhancedAgentConfig):
-        """Initialize the enhanced agent with all infrastructure components."""
+    def __init__(self, config: EnhancedAgentConfig, llm_router: Optional[LLMRouter] = None):
+        """Initialize the enhanced agent with all infrastructure components.
+
+        Args:
+            config: Agent configuration
+            llm_router: Router shared with other agents; its owner initializes
+                and cleans it up. A private router is created if omitted.
+        """
         self.config = config
         self.agent_id = config.agent_id
         self.agent_type = config.agent_type
@@ -191,12 +197,16 @@ class EnhancedBaseAgent(ABC):
         self.memory = MockMemoryManager(self.agent_id)
         
         # Initialize LLM router
-        self.router = LLMRouter()
+        self._owns_router = llm_router is None
+        self.router = llm_router or LLMRouter()
         
         # Task tracking
         self._current_task: Optional[EnhancedTask] = None
         self._task_history: List[EnhancedTaskResult] = []
         
+        # Rendered once, then sent unchanged as a cacheable prompt prefix
+        self._system_prompt: Optional[str] = None
+        
         # Internal state
         self._initialized = False
         self._shutdown_event = asyncio.Event()
@@ -218,8 +228,8 @@ class EnhancedBaseAgent(ABC):
             # Initialize memory manager
             await self.memory.initialize()
             
-            # Initialize router (if it has initialize method)
-            if hasattr(self.router, 'initialize'):
+            # Initialize router (if it has initialize method and is ours)
+            if self._owns_router and hasattr(self.router, 'initialize'):
                 await self.router.initialize()
             
             # Start health monitoring (if it has this method)
@@ -267,8 +277,8 @@ class EnhancedBaseAgent(ABC):
             # Cleanup memory
             await self.memory.cleanup()
             
-            # Cleanup router (if it has cleanup method)
-            if hasattr(self.router, 'cleanup'):
+            # Cleanup router (if it has cleanup method and is ours)
+            if self._owns_router and hasattr(self.router, 'cleanup'):
                 await self.router.cleanup()
             
             # Transition to stopped
@@ -359,11 +369,13 @@ class EnhancedBaseAgent(ABC):
             
             # Route and execute request
             llm_request = LLMRequest(
-                messages=[{"role": "user", "content": full_prompt}],
+                messages=self._build_messages(full_prompt),
                 model_id="mock-cto-model",  # Will be overridden by routing decision
                 max_tokens=self.config.max_tokens,
                 temperature=self.config.temperature,
-                stream=False
+                stream=False,
+                cache_prefix_messages=1,
+                metadata={"prompt_cache_key": self.agent_type.value}
             )
             
             # Create routing policy from strategy
@@ -456,11 +468,13 @@ class EnhancedBaseAgent(ABC):
             )
         
         request = LLMRequest(
-            messages=[{"role": "user", "content": prompt}],
+            messages=self._build_messages(prompt),
             model_id=kwargs.get("model_id", "mock-cto-model"),  # Will be overridden by routing
             max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
             temperature=kwargs.get("temperature", self.config.temperature),
-            stream=kwargs.get("stream", False)
+            stream=kwargs.get("stream", False),
+            cache_prefix_messages=1,
+            metadata={"prompt_cache_key": self.agent_type.value}
         )
         
         # Create routing policy from strategy
@@ -586,14 +600,29 @@ class EnhancedBaseAgent(ABC):
         
         return "\\n\\n".join(contexts) if contexts else ""
     
+    @property
+    def system_prompt(self) -> str:
+        """The agent's system prompt, rendered on first use."""
+        if self._system_prompt is None:
+            self._system_prompt = self._get_system_prompt()
+        return self._system_prompt
+    
+    def _get_system_prompt(self) -> str:
+        """Render the static system prompt; it must not depend on the task."""
+        return (f"You are a {self.config.name} agent with the following capabilities: " +
+                ", ".join([cap.value for cap in self.config.capabilities]))
+    
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """Put the stable system prompt ahead of the per-request prompt."""
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+    
     async def _build_prompt(self, task: EnhancedTask, context: str) -> str:
-        """Build the full prompt including context."""
+        """Build the per-task prompt that follows the system prompt."""
         parts = []
         
-        # Add agent identity
-        parts.append(f"You are a {self.config.name} agent with the following capabilities: " +
-                    ", ".join([cap.value for cap in self.config.capabilities]))
-        
         # Add context if available
         if context:
             parts.append(f"Context:\\n{context}")
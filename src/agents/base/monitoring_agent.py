@@ -7,6 +7,8 @@ the monitoring server and sends heartbeats.
 
 import asyncio
 import logging
+import uuid
+from datetime import datetime
 from typing import Optional, Dict, Any
 
 from .agent import BaseAgent, AgentConfig
@@ -65,6 +67,7 @@ class MonitoringAgent(AgentRegistrationMixin, BaseAgent):
         """Enhanced shutdown with monitoring cleanup."""
         if self.monitoring_enabled:
             await self._report_activity("shutdown", "info", "Agent shutting down")
+            await self.reporter.flush()
             await self.unregister_from_monitoring()
             self.logger.info("Unregistered from monitoring server")
         
@@ -128,15 +131,11 @@ class MonitoringAgent(AgentRegistrationMixin, BaseAgent):
         message: str, 
         metadata: Optional[Dict[str, Any]] = None
     ):
-        """Report activity to monitoring server."""
+        """Queue an activity for the shared reporter; it never waits on the network."""
         if not self.monitoring_enabled:
             return
         
         try:
-            import aiohttp
-            from datetime import datetime
-            import uuid
-            
             activity = {
                 'id': str(uuid.uuid4()),
                 'agent_id': self.id,
@@ -148,28 +147,22 @@ class MonitoringAgent(AgentRegistrationMixin, BaseAgent):
                 'timestamp': datetime.utcnow().isoformat()
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f'{self.monitoring_url}/api/activities',
-                    json=activity,
-                    headers={'X-API-Key': self.api_key}
-                ) as response:
-                    if response.status != 200:
-                        self.logger.warning(f"Failed to report activity: {response.status}")
-                        
+            self.reporter.report(activity)
+            
         except Exception as e:
             self.logger.warning(f"Error reporting activity: {e}")
     
-    async def _send_heartbeat(self):
-        """Enhanced heartbeat with additional agent metrics."""
+    def _heartbeat_status(self) -> Dict[str, Any]:
+        """Heartbeat status with additional agent metrics."""
         try:
-            # Get enhanced status data
-            status_data = {
+            return {
                 'status': self.state.value if hasattr(self.state, 'value') else str(self.state),
                 'metadata': {
                     'current_tasks': len(self.current_tasks),
-                    'tasks_completed': len(self.task_history),
-                    'success_rate': self._calculate_success_rate(),
+                    'tasks_completed': self.task_history.total,
+                    'success_rate': self.task_history.success_rate,
+                    'ewma_latency': self.task_history.ewma_latency,
+                    'models_used': dict(self.task_history.model_counts),
                     'uptime_seconds': self.uptime_seconds,
                     'memory_usage': len(self.memory),
                     'error_count': self.error_count,
@@ -178,25 +171,19 @@ class MonitoringAgent(AgentRegistrationMixin, BaseAgent):
                     'capabilities': self.capabilities,
                     'agent_type': self.agent_type.value if hasattr(self.agent_type, 'value') else str(self.agent_type),
                     'is_busy': self.is_busy,
-                    'can_accept_tasks': self.can_accept_tasks
+                    'can_accept_tasks': self.can_accept_tasks,
+                    'last_heartbeat': datetime.utcnow().isoformat()
                 }
             }
             
-            # Call parent heartbeat with enhanced data
-            await super()._send_heartbeat()
-            
         except Exception as e:
             self.logger.warning(f"Enhanced heartbeat error: {e}")
             # Fallback to basic heartbeat
-            await super()._send_heartbeat()
+            return super()._heartbeat_status()
     
     def _calculate_success_rate(self) -> float:
         """Calculate task success rate."""
-        if not self.task_history:
-            return 1.0
-        
-        successful_tasks = sum(1 for result in self.task_history if result.status == "success")
-        return successful_tasks / len(self.task_history)
+        return self.task_history.success_rate
     
     def enable_monitoring(self):
         """Enable monitoring integration."""
@@ -0,0 +1,219 @@
+"""
+Bounded task history for agents.
+
+Keeps a fixed-size ring buffer of compact task records together with
+running aggregates (success rate, EWMA latency, per-model counts and a
+latency histogram) that are updated in O(1) per task, so status and health
+reporting cost the same after a million tasks as after ten. Records pushed
+out of the ring can be collected and flushed to a memory backend.
+"""
+
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+# Upper bounds, in seconds, of the latency histogram buckets (last is +inf)
+DEFAULT_LATENCY_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class TaskRecord:
+    """Compact summary of a task result kept in the history ring buffer."""
+
+    __slots__ = (
+        "task_id",
+        "status",
+        "execution_time",
+        "model_used",
+        "cost_estimate",
+        "created_at",
+        "error",
+    )
+
+    # Failure messages are truncated to keep records small
+    max_error_length = 500
+
+    def __init__(
+        self,
+        task_id: str,
+        status: str,
+        execution_time: float,
+        model_used: str,
+        cost_estimate: float = 0.0,
+        created_at: Optional[datetime] = None,
+        error: Optional[str] = None,
+    ):
+        self.task_id = task_id
+        self.status = status
+        self.execution_time = execution_time
+        self.model_used = model_used
+        self.cost_estimate = cost_estimate
+        self.created_at = created_at or datetime.utcnow()
+        self.error = error[: self.max_error_length] if error else None
+
+    @classmethod
+    def from_result(cls, result: Any) -> "TaskRecord":
+        """Summarize a TaskResult, dropping its result payload."""
+        return cls(
+            task_id=result.task_id,
+            status=result.status,
+            execution_time=result.execution_time,
+            model_used=result.model_used,
+            cost_estimate=result.cost_estimate,
+            created_at=result.created_at,
+            error=result.error,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "task_id": self.task_id,
+            "status": self.status,
+            "execution_time": self.execution_time,
+            "model_used": self.model_used,
+            "cost_estimate": self.cost_estimate,
+            "created_at": self.created_at.isoformat(),
+            "error": self.error,
+        }
+
+    def __repr__(self) -> str:
+        return f"TaskRecord(task_id={self.task_id!r}, status={self.status!r})"
+
+
+class TaskHistory:
+    """
+    Ring buffer of recent task records with streaming aggregates.
+
+    Iterating, indexing and ``len()`` cover the retained records only;
+    ``total`` and the other aggregates cover every task ever recorded.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        ewma_alpha: float = 0.2,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        keep_evicted: bool = False,
+        flush_batch_size: int = 100,
+    ):
+        """
+        Args:
+            capacity: Number of recent records retained
+            ewma_alpha: Weight of the newest latency in the moving average
+            latency_buckets: Ascending histogram bucket upper bounds in seconds
+            keep_evicted: Collect records pushed out of the ring for flushing
+            flush_batch_size: Evicted records that make a flush worthwhile
+        """
+        self.capacity = capacity
+        self.ewma_alpha = ewma_alpha
+        self.latency_buckets = tuple(latency_buckets)
+        self.keep_evicted = keep_evicted
+        self.flush_batch_size = flush_batch_size
+
+        self._records: deque = deque(maxlen=capacity)
+        # Bounded too, so a failing backend cannot grow memory without limit
+        self._evicted: deque = deque(maxlen=flush_batch_size * 10)
+
+        self.total = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.total_cost = 0.0
+        self.total_latency = 0.0
+        self.ewma_latency = 0.0
+        self.model_counts: Dict[str, int] = {}
+        self.latency_histogram: List[int] = [0] * (len(self.latency_buckets) + 1)
+        self.last_completed: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[TaskRecord]:
+        return iter(self._records)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[TaskRecord, List[TaskRecord]]:
+        if isinstance(index, slice):
+            return list(self._records)[index]
+        return self._records[index]
+
+    @property
+    def success_rate(self) -> float:
+        """Share of all recorded tasks that succeeded (1.0 before any task)."""
+        return self.succeeded / self.total if self.total else 1.0
+
+    @property
+    def average_latency(self) -> float:
+        """Mean execution time of all recorded tasks."""
+        return self.total_latency / self.total if self.total else 0.0
+
+    @property
+    def evicted_count(self) -> int:
+        """Evicted records waiting to be flushed."""
+        return len(self._evicted)
+
+    def append(self, result: Any) -> TaskRecord:
+        """Record a TaskResult and update the aggregates."""
+        record = TaskRecord.from_result(result)
+
+        if self.keep_evicted and len(self._records) == self.capacity:
+            self._evicted.append(self._records[0])
+        self._records.append(record)
+
+        self.total += 1
+        if record.status == "success":
+            self.succeeded += 1
+        elif record.status == "error":
+            self.failed += 1
+        self.total_cost += record.cost_estimate
+        self.model_counts[record.model_used] = (
+            self.model_counts.get(record.model_used, 0) + 1
+        )
+
+        latency = record.execution_time
+        self.total_latency += latency
+        if self.total == 1:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency += self.ewma_alpha * (latency - self.ewma_latency)
+        self.latency_histogram[bisect_left(self.latency_buckets, latency)] += 1
+        self.last_completed = record.created_at
+
+        return record
+
+    def recent(self, limit: int) -> List[TaskRecord]:
+        """The newest ``limit`` records, oldest first."""
+        if limit <= 0:
+            return []
+        records = list(islice(reversed(self._records), limit))
+        records.reverse()
+        return records
+
+    def drain_evicted(self) -> List[TaskRecord]:
+        """Take the evicted records collected since the last drain."""
+        records = list(self._evicted)
+        self._evicted.clear()
+        return records
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregates as a dictionary, for status and heartbeat payloads."""
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "success_rate": self.success_rate,
+            "ewma_latency": self.ewma_latency,
+            "average_latency": self.average_latency,
+            "total_cost": self.total_cost,
+            "model_counts": dict(self.model_counts),
+            "latency_histogram": {
+                **{
+                    f"le_{bound:g}": count
+                    for bound, count in zip(
+                        self.latency_buckets, self.latency_histogram, strict=False
+                    )
+                },
+                "le_inf": self.latency_histogram[-1],
+            },
+        }
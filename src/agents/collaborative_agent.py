@@ -96,7 +96,7 @@ class CollaborativeAgent(EnhancedBaseAgent):
     """
     
     def __init__(self, config: CollaborativeAgentConfig, llm_router: Optional[LLMRouter] = None):
-        super().__init__(config)
+        super().__init__(config, llm_router=llm_router)
         
         self.collab_config = config
         self.role = config.role
@@ -108,10 +108,6 @@ class CollaborativeAgent(EnhancedBaseAgent):
         self.collaborators: Dict[str, Any] = {}
         self.assigned_tasks: List[Dict[str, Any]] = []
         self.current_assignment: Optional[Dict[str, Any]] = None
-        
-        # Use provided router or create default
-        if llm_router:
-            self.router = llm_router
     
     async def _on_initialize(self) -> None:
         """Initialize collaborative agent."""
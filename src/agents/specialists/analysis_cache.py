@@ -0,0 +1,155 @@
+"""
+Content-addressed cache for QA analysis results.
+
+Bug detection results and LLM review outputs are stored in SQLite under the
+hash of the content they were computed from plus a version string: the
+analyzer fingerprint for detector results, the prompt version for reviews.
+Iterative review cycles then only pay for what changed, and entries written
+by older rules or prompts are dropped instead of served.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis_cache (
+    kind TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    version TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (kind, content_hash, version)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_analysis_cache_used ON analysis_cache (last_used);
+"""
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 hex digest of text content."""
+    return hashlib.sha256(content.encode("utf-8", errors="replace")).hexdigest()
+
+
+def version_hash(*parts: Any) -> str:
+    """Short, stable version string for a prompt template and its parameters."""
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class AnalysisCache:
+    """
+    SQLite-backed cache of analysis results keyed by content and version.
+
+    Values are stored as JSON. The cache may be shared across threads and
+    by several agents pointing at the same database file.
+    """
+
+    def __init__(self, db_path: str = ":memory:", max_entries: int = 100000):
+        """
+        Open (or create) an analysis cache.
+
+        Args:
+            db_path: SQLite database path, or ":memory:"
+            max_entries: Entries kept; the least recently used are pruned
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "writes": 0, "invalidated": 0}
+
+        self._lock = threading.RLock()
+        self._writes_since_prune = 0
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        if db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+
+    def get(self, kind: str, key: str, version: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            kind: Kind of analysis, e.g. "bug_detection" or "code_review"
+            key: Content hash the value was computed from
+            version: Analyzer or prompt version the value was computed with
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value FROM analysis_cache WHERE kind = ? AND content_hash = ? AND version = ?",
+                (kind, key, version)
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+
+            self.stats["hits"] += 1
+            self.conn.execute(
+                "UPDATE analysis_cache SET last_used = ? WHERE kind = ? AND content_hash = ? AND version = ?",
+                (time.time(), kind, key, version)
+            )
+            self.conn.commit()
+        return json.loads(row[0])
+
+    def put(self, kind: str, key: str, version: str, value: Any):
+        """Store a JSON-serializable value."""
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, key, version, json.dumps(value, default=str), now, now)
+            )
+            self.stats["writes"] += 1
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= 1000:
+                self._prune()
+            self.conn.commit()
+
+    def invalidate(self, kind: str, keep_version: Optional[str] = None) -> int:
+        """
+        Drop the entries of a kind, except those of ``keep_version``.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if keep_version is None:
+                cursor = self.conn.execute("DELETE FROM analysis_cache WHERE kind = ?", (kind,))
+            else:
+                cursor = self.conn.execute(
+                    "DELETE FROM analysis_cache WHERE kind = ? AND version != ?",
+                    (kind, keep_version)
+                )
+            self.conn.commit()
+            self.stats["invalidated"] += cursor.rowcount
+            if cursor.rowcount:
+                logger.info(f"Invalidated {cursor.rowcount} cached {kind} results")
+            return cursor.rowcount
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+    def _prune(self):
+        """Remove the least recently used entries beyond ``max_entries``."""
+        self._writes_since_prune = 0
+        self.conn.execute(
+            "DELETE FROM analysis_cache WHERE (kind, content_hash, version) IN ("
+            "SELECT kind, content_hash, version FROM analysis_cache "
+            "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
@@ -133,7 +133,8 @@ class BackendAgent(MonitoringAgent):
         self.db_designer = DatabaseDesigner()
         
         # Initialize message queue for collaboration
-        self.message_queue = MessageQueue()
+        if self.message_queue is None:
+            self.message_queue = MessageQueue()
         self.collaboration_partners = {}  # Track active collaborations
         
     async def on_start(self) -> None:
@@ -1051,7 +1052,7 @@ class BackendAgent(MonitoringAgent):
             "message_queue_status": "active" if hasattr(self, 'message_queue') else "inactive",
             "greeting": self.personality.format_message(
                 "greeting", 
-                f"Status: {status['state']}, Tasks completed: {len(self.task_history)}"
+                f"Status: {status['state']}, Tasks completed: {self.task_history.total}"
             ),
         }
         
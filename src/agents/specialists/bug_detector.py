@@ -6,13 +6,22 @@ pattern recognition, security vulnerability detection, and code quality assessme
 """
 
 import ast
+import dataclasses
+import hashlib
+import itertools
+import os
 import re
 import json
-from typing import Dict, List, Optional, Tuple, Any, Union, Set
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
+from .analysis_cache import AnalysisCache
+
 
 class BugSeverity(Enum):
     """Severity levels for detected bugs."""
@@ -94,6 +103,26 @@ class BugReport:
     references: List[str] = field(default_factory=list)
     tags: List[str] = field(default_factory=list)
     detected_at: datetime = field(default_factory=datetime.now)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = dataclasses.asdict(self)
+        data['severity'] = self.severity.value
+        data['category'] = self.category.value
+        data['bug_type'] = self.bug_type.value
+        data['detected_at'] = self.detected_at.isoformat()
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BugReport':
+        """Create a bug report from ``to_dict`` output."""
+        return cls(**{
+            **data,
+            'severity': BugSeverity(data['severity']),
+            'category': BugCategory(data['category']),
+            'bug_type': BugType(data['bug_type']),
+            'detected_at': datetime.fromisoformat(data['detected_at'])
+        })
 
 
 @dataclass
@@ -120,13 +149,35 @@ class BugAnalysisResult:
     analysis_summary: str
 
 
+@dataclass
+class PathScanResult:
+    """Results of scanning files and directory trees."""
+    bugs_by_file: Dict[str, List[BugReport]]
+    analysis: BugAnalysisResult
+    files_scanned: int
+    files_analyzed: int  # Files not served from the result cache
+    scan_time: float
+
+
+# Node types with a statement list body, checked for unreachable code
+BODY_NODE_TYPES = tuple(
+    node_type for node_type in vars(ast).values()
+    if isinstance(node_type, type) and issubclass(node_type, ast.AST)
+    and 'body' in node_type._fields
+)
+
+
 class PythonBugDetector:
     """Python-specific bug detection using AST analysis."""
     
+    # Analysis passes, in the order their findings are reported
+    SECURITY, PERFORMANCE, LOGIC, ERROR_HANDLING, QUALITY = range(5)
+    
     def __init__(self):
         self.security_patterns = self._initialize_security_patterns()
         self.performance_patterns = self._initialize_performance_patterns()
         self.logic_patterns = self._initialize_logic_patterns()
+        self.rules = self._initialize_rules()
     
     def analyze_code(self, code: str, file_path: str = "unknown") -> List[BugReport]:
         """Analyze Python code for bugs and issues."""
@@ -135,12 +186,16 @@ class PythonBugDetector:
         try:
             tree = ast.parse(code)
             
-            # Run different analysis passes
-            bugs.extend(self._analyze_security_issues(tree, code, file_path))
-            bugs.extend(self._analyze_performance_issues(tree, code, file_path))
-            bugs.extend(self._analyze_logic_issues(tree, code, file_path))
-            bugs.extend(self._analyze_error_handling(tree, code, file_path))
-            bugs.extend(self._analyze_code_quality(tree, code, file_path))
+            # One traversal; each node only runs the rules for its type
+            findings = [[] for _ in range(self.QUALITY + 1)]
+            rules = self.rules
+            for node in ast.walk(tree):
+                for analysis_pass, condition, create_bug in rules.get(type(node), ()):
+                    if condition(node, code):
+                        findings[analysis_pass].append(create_bug(node, file_path))
+            
+            for pass_findings in findings:
+                bugs.extend(pass_findings)
             
         except SyntaxError as e:
             bugs.append(BugReport(
@@ -157,104 +212,49 @@ class PythonBugDetector:
         
         return bugs
     
-    def _analyze_security_issues(self, tree: ast.AST, code: str, file_path: str) -> List[BugReport]:
-        """Detect security vulnerabilities in Python code."""
-        bugs = []
-        
-        for node in ast.walk(tree):
-            # SQL Injection detection
-            if isinstance(node, ast.Call):
-                if self._is_sql_vulnerable(node, code):
-                    bugs.append(self._create_sql_injection_bug(node, file_path))
-            
-            # Hardcoded secrets detection
-            if isinstance(node, ast.Assign):
-                if self._has_hardcoded_secrets(node, code):
-                    bugs.append(self._create_hardcoded_secret_bug(node, file_path))
-            
-            # Insecure randomness
-            if isinstance(node, ast.Call):
-                if self._uses_insecure_random(node):
-                    bugs.append(self._create_insecure_random_bug(node, file_path))
-        
-        return bugs
-    
-    def _analyze_performance_issues(self, tree: ast.AST, code: str, file_path: str) -> List[BugReport]:
-        """Detect performance issues in Python code."""
-        bugs = []
-        
-        for node in ast.walk(tree):
-            # Inefficient loops
-            if isinstance(node, ast.For):
-                if self._is_inefficient_loop(node):
-                    bugs.append(self._create_inefficient_loop_bug(node, file_path))
-            
-            # Unnecessary computations in loops
-            if isinstance(node, (ast.For, ast.While)):
-                if self._has_unnecessary_computation(node):
-                    bugs.append(self._create_unnecessary_computation_bug(node, file_path))
-        
-        return bugs
-    
-    def _analyze_logic_issues(self, tree: ast.AST, code: str, file_path: str) -> List[BugReport]:
-        """Detect logic errors in Python code."""
-        bugs = []
-        
-        for node in ast.walk(tree):
-            # Infinite loop detection
-            if isinstance(node, ast.While):
-                if self._is_potential_infinite_loop(node):
-                    bugs.append(self._create_infinite_loop_bug(node, file_path))
-            
-            # Unreachable code
-            if self._is_unreachable_code(node):
-                bugs.append(self._create_unreachable_code_bug(node, file_path))
-            
-            # Missing validation
-            if isinstance(node, ast.FunctionDef):
-                if self._missing_input_validation(node):
-                    bugs.append(self._create_missing_validation_bug(node, file_path))
-        
-        return bugs
-    
-    def _analyze_error_handling(self, tree: ast.AST, code: str, file_path: str) -> List[BugReport]:
-        """Analyze error handling patterns."""
-        bugs = []
-        
-        for node in ast.walk(tree):
-            # Empty except blocks
-            if isinstance(node, ast.ExceptHandler):
-                if len(node.body) == 1 and isinstance(node.body[0], ast.Pass):
-                    bugs.append(self._create_empty_except_bug(node, file_path))
-            
-            # Broad exception catching
-            if isinstance(node, ast.ExceptHandler):
-                if self._is_too_broad_exception(node):
-                    bugs.append(self._create_broad_exception_bug(node, file_path))
+    def _initialize_rules(self) -> Dict[type, List[Tuple[int, Callable, Callable]]]:
+        """Map each AST node type to its (pass, condition, report factory) rules."""
+        rules_by_pass = [
+            # Security
+            (self.SECURITY, (ast.Call,), self._is_sql_vulnerable,
+             self._create_sql_injection_bug),
+            (self.SECURITY, (ast.Assign,), self._has_hardcoded_secrets,
+             self._create_hardcoded_secret_bug),
+            (self.SECURITY, (ast.Call,), lambda node, code: self._uses_insecure_random(node),
+             self._create_insecure_random_bug),
+            # Performance
+            (self.PERFORMANCE, (ast.For,), lambda node, code: self._is_inefficient_loop(node),
+             self._create_inefficient_loop_bug),
+            (self.PERFORMANCE, (ast.For, ast.While),
+             lambda node, code: self._has_unnecessary_computation(node),
+             self._create_unnecessary_computation_bug),
+            # Logic
+            (self.LOGIC, (ast.While,), lambda node, code: self._is_potential_infinite_loop(node),
+             self._create_infinite_loop_bug),
+            (self.LOGIC, BODY_NODE_TYPES, lambda node, code: self._is_unreachable_code(node),
+             self._create_unreachable_code_bug),
+            (self.LOGIC, (ast.FunctionDef,), lambda node, code: self._missing_input_validation(node),
+             self._create_missing_validation_bug),
+            # Error handling
+            (self.ERROR_HANDLING, (ast.ExceptHandler,), lambda node, code: self._is_empty_except(node),
+             self._create_empty_except_bug),
+            (self.ERROR_HANDLING, (ast.ExceptHandler,),
+             lambda node, code: self._is_too_broad_exception(node),
+             self._create_broad_exception_bug),
+            # Code quality
+            (self.QUALITY, (ast.FunctionDef,), lambda node, code: self._is_long_method(node),
+             self._create_long_method_bug),
+            (self.QUALITY, (ast.If,), lambda node, code: self._is_complex_condition(node),
+             self._create_complex_condition_bug),
+            (self.QUALITY, (ast.Constant,), lambda node, code: self._is_magic_number(node),
+             self._create_magic_number_bug),
+        ]
         
-        return bugs
-    
-    def _analyze_code_quality(self, tree: ast.AST, code: str, file_path: str) -> List[BugReport]:
-        """Analyze code quality issues."""
-        bugs = []
-        
-        for node in ast.walk(tree):
-            # Long methods
-            if isinstance(node, ast.FunctionDef):
-                if self._is_long_method(node):
-                    bugs.append(self._create_long_method_bug(node, file_path))
-            
-            # Complex conditions
-            if isinstance(node, ast.If):
-                if self._is_complex_condition(node):
-                    bugs.append(self._create_complex_condition_bug(node, file_path))
-            
-            # Magic numbers
-            if isinstance(node, ast.Num):
-                if self._is_magic_number(node):
-                    bugs.append(self._create_magic_number_bug(node, file_path))
-        
-        return bugs
+        rules: Dict[type, List[Tuple[int, Callable, Callable]]] = {}
+        for analysis_pass, node_types, condition, create_bug in rules_by_pass:
+            for node_type in node_types:
+                rules.setdefault(node_type, []).append((analysis_pass, condition, create_bug))
+        return rules
     
     # Security detection helpers
     def _is_sql_vulnerable(self, node: ast.Call, code: str) -> bool:
@@ -345,6 +345,10 @@ class PythonBugDetector:
         return False
     
     # Error handling helpers
+    def _is_empty_except(self, node: ast.ExceptHandler) -> bool:
+        """Check for except blocks that only pass."""
+        return len(node.body) == 1 and isinstance(node.body[0], ast.Pass)
+    
     def _is_too_broad_exception(self, node: ast.ExceptHandler) -> bool:
         """Check for overly broad exception handling."""
         if node.type is None:  # bare except:
@@ -374,11 +378,11 @@ class PythonBugDetector:
         else:
             return 1
     
-    def _is_magic_number(self, node: ast.Num) -> bool:
+    def _is_magic_number(self, node: ast.Constant) -> bool:
         """Check for magic numbers."""
-        if isinstance(node.n, (int, float)):
+        if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
             # Common non-magic numbers
-            if node.n in [0, 1, -1, 2, 10, 100, 1000]:
+            if node.value in [0, 1, -1, 2, 10, 100, 1000]:
                 return False
             return True
         return False
@@ -567,12 +571,12 @@ class PythonBugDetector:
             confidence_score=0.7
         )
     
-    def _create_magic_number_bug(self, node: ast.Num, file_path: str) -> BugReport:
+    def _create_magic_number_bug(self, node: ast.Constant, file_path: str) -> BugReport:
         """Create magic number bug report."""
         return BugReport(
             id=f"magic_number_{hash(str(node.lineno))}",
             title="Magic Number",
-            description=f"Magic number {node.n} should be replaced with a named constant",
+            description=f"Magic number {node.value} should be replaced with a named constant",
             severity=BugSeverity.LOW,
             category=BugCategory.MAINTAINABILITY,
             bug_type=BugType.MAGIC_NUMBER,
@@ -605,35 +609,68 @@ class PythonBugDetector:
         }
 
 
+class LineIndex:
+    """Maps character offsets in a text to 1-based line numbers."""
+    
+    def __init__(self, text: str):
+        self.line_starts = [0]
+        position = text.find('\n')
+        while position != -1:
+            self.line_starts.append(position + 1)
+            position = text.find('\n', position + 1)
+    
+    def line_of(self, offset: int) -> int:
+        """Line number of the character at ``offset``."""
+        return bisect_right(self.line_starts, offset)
+
+
 class JavaScriptBugDetector:
     """JavaScript/TypeScript specific bug detection using regex patterns."""
     
+    # Patterns are compiled once, when the class is defined
+    INNER_HTML_PATTERN = re.compile(r'\.innerHTML\s*=\s*[^;]+(?:input|param|query|data)', re.IGNORECASE)
+    DOM_ACCESS_PATTERN = re.compile(r'document\.getElementById\([^)]+\)')
+    LOOSE_EQUALITY_PATTERN = re.compile(r'[^!=]==[^=]')
+    
+    # Token patterns that can never overlap one another, found in one
+    # combined scan with a named group each
+    TOKEN_PATTERN = re.compile(
+        r'(?P<eval>\beval\s*\()'
+        r'|(?P<add_listener>addEventListener\s*\()'
+        r'|(?P<remove_listener>removeEventListener\s*\()'
+        r'|(?P<undefined>\bundefined\b)'
+    )
+    
     def analyze_code(self, code: str, file_path: str = "unknown") -> List[BugReport]:
         """Analyze JavaScript/TypeScript code for bugs."""
         bugs = []
         
+        # Shared by the detectors: line lookups and the combined token scan
+        lines = LineIndex(code)
+        tokens: Dict[str, List[int]] = {name: [] for name in self.TOKEN_PATTERN.groupindex}
+        for match in self.TOKEN_PATTERN.finditer(code):
+            tokens[match.lastgroup].append(match.start())
+        
         # Security issues
-        bugs.extend(self._detect_xss_vulnerabilities(code, file_path))
-        bugs.extend(self._detect_eval_usage(code, file_path))
+        bugs.extend(self._detect_xss_vulnerabilities(code, file_path, lines))
+        bugs.extend(self._detect_eval_usage(code, file_path, lines, tokens))
         
         # Performance issues
         bugs.extend(self._detect_inefficient_dom_access(code, file_path))
-        bugs.extend(self._detect_memory_leaks(code, file_path))
+        bugs.extend(self._detect_memory_leaks(code, file_path, tokens))
         
         # Logic issues
-        bugs.extend(self._detect_type_coercion_issues(code, file_path))
-        bugs.extend(self._detect_undefined_variables(code, file_path))
+        bugs.extend(self._detect_type_coercion_issues(code, file_path, lines))
+        bugs.extend(self._detect_undefined_variables(code, file_path, tokens))
         
         return bugs
     
-    def _detect_xss_vulnerabilities(self, code: str, file_path: str) -> List[BugReport]:
+    def _detect_xss_vulnerabilities(self, code: str, file_path: str, lines: LineIndex) -> List[BugReport]:
         """Detect XSS vulnerabilities in JavaScript."""
         bugs = []
         
         # innerHTML with user input
-        innerHTML_pattern = r'\.innerHTML\s*=\s*[^;]+(?:input|param|query|data)'
-        for match in re.finditer(innerHTML_pattern, code, re.IGNORECASE):
-            line_num = code[:match.start()].count('\n') + 1
+        for match in self.INNER_HTML_PATTERN.finditer(code):
             bugs.append(BugReport(
                 id=f"xss_innerHTML_{hash(match.group())}",
                 title="XSS Vulnerability - innerHTML",
@@ -642,20 +679,21 @@ class JavaScriptBugDetector:
                 category=BugCategory.SECURITY,
                 bug_type=BugType.XSS_VULNERABILITY,
                 file_path=file_path,
-                line_number=line_num,
+                line_number=lines.line_of(match.start()),
                 suggested_fix="Use textContent or properly sanitize input",
                 confidence_score=0.8
             ))
         
         return bugs
     
-    def _detect_eval_usage(self, code: str, file_path: str) -> List[BugReport]:
+    def _detect_eval_usage(
+        self, code: str, file_path: str, lines: LineIndex, tokens: Dict[str, List[int]]
+    ) -> List[BugReport]:
         """Detect dangerous eval usage."""
         bugs = []
         
-        eval_pattern = r'\beval\s*\('
-        for match in re.finditer(eval_pattern, code):
-            line_num = code[:match.start()].count('\n') + 1
+        for start in tokens['eval']:
+            match = self.TOKEN_PATTERN.match(code, start)
             bugs.append(BugReport(
                 id=f"eval_usage_{hash(match.group())}",
                 title="Dangerous eval() Usage",
@@ -664,7 +702,7 @@ class JavaScriptBugDetector:
                 category=BugCategory.SECURITY,
                 bug_type=BugType.XSS_VULNERABILITY,
                 file_path=file_path,
-                line_number=line_num,
+                line_number=lines.line_of(start),
                 suggested_fix="Avoid eval() and use safer alternatives like JSON.parse()",
                 confidence_score=0.9
             ))
@@ -675,10 +713,9 @@ class JavaScriptBugDetector:
         """Detect inefficient DOM access patterns."""
         bugs = []
         
-        # Multiple getElementById calls
-        dom_pattern = r'document\.getElementById\([^)]+\)'
-        matches = list(re.finditer(dom_pattern, code))
-        if len(matches) > 5:  # Threshold for inefficient access
+        # Multiple getElementById calls; stop counting past the threshold
+        matches = self.DOM_ACCESS_PATTERN.finditer(code)
+        if sum(1 for _ in itertools.islice(matches, 6)) > 5:  # Threshold for inefficient access
             bugs.append(BugReport(
                 id=f"inefficient_dom_{hash(code)}",
                 title="Inefficient DOM Access",
@@ -693,16 +730,13 @@ class JavaScriptBugDetector:
         
         return bugs
     
-    def _detect_memory_leaks(self, code: str, file_path: str) -> List[BugReport]:
+    def _detect_memory_leaks(self, code: str, file_path: str, tokens: Dict[str, List[int]]) -> List[BugReport]:
         """Detect potential memory leaks."""
         bugs = []
         
         # Event listeners without removal
-        listener_pattern = r'addEventListener\s*\('
-        remove_pattern = r'removeEventListener\s*\('
-        
-        add_count = len(re.findall(listener_pattern, code))
-        remove_count = len(re.findall(remove_pattern, code))
+        add_count = len(tokens['add_listener'])
+        remove_count = len(tokens['remove_listener'])
         
         if add_count > remove_count + 2:  # Allow some variance
             bugs.append(BugReport(
@@ -719,14 +753,12 @@ class JavaScriptBugDetector:
         
         return bugs
     
-    def _detect_type_coercion_issues(self, code: str, file_path: str) -> List[BugReport]:
+    def _detect_type_coercion_issues(self, code: str, file_path: str, lines: LineIndex) -> List[BugReport]:
         """Detect problematic type coercion."""
         bugs = []
         
         # == instead of ===
-        loose_equality_pattern = r'[^!=]==[^=]'
-        for match in re.finditer(loose_equality_pattern, code):
-            line_num = code[:match.start()].count('\n') + 1
+        for match in self.LOOSE_EQUALITY_PATTERN.finditer(code):
             bugs.append(BugReport(
                 id=f"type_coercion_{hash(match.group())}",
                 title="Loose Equality Comparison",
@@ -735,20 +767,19 @@ class JavaScriptBugDetector:
                 category=BugCategory.TYPE_SAFETY,
                 bug_type=BugType.TYPE_MISMATCH,
                 file_path=file_path,
-                line_number=line_num,
+                line_number=lines.line_of(match.start()),
                 suggested_fix="Use strict equality (===) instead of loose equality (==)",
                 confidence_score=0.8
             ))
         
         return bugs
     
-    def _detect_undefined_variables(self, code: str, file_path: str) -> List[BugReport]:
+    def _detect_undefined_variables(self, code: str, file_path: str, tokens: Dict[str, List[int]]) -> List[BugReport]:
         """Detect potential undefined variable usage."""
         bugs = []
         
         # Basic undefined check (simplified)
-        undefined_pattern = r'\bundefined\b'
-        if re.search(undefined_pattern, code):
+        if tokens['undefined']:
             bugs.append(BugReport(
                 id=f"undefined_check_{hash(code)}",
                 title="Undefined Variable Check",
@@ -764,12 +795,66 @@ class JavaScriptBugDetector:
         return bugs
 
 
+# File extensions scanned by analyze_paths, and their languages
+LANGUAGE_BY_EXTENSION = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.jsx': 'javascript',
+    '.mjs': 'javascript',
+    '.cjs': 'javascript',
+    '.ts': 'typescript',
+    '.tsx': 'typescript',
+}
+
+# Directories analyze_paths never descends into
+SKIPPED_DIRECTORIES = {
+    '.git', '.hg', '.svn', '__pycache__', 'node_modules', '.venv', 'venv',
+    '.tox', '.mypy_cache', '.pytest_cache', 'dist', 'build',
+}
+
+# Fingerprint of the detection rules; cached results from other versions are stale
+with open(__file__, 'rb') as _source:
+    ANALYZER_VERSION = hashlib.sha256(_source.read()).hexdigest()[:16]
+
+# Kind of persistent cache entries holding detector results
+BUG_DETECTION_CACHE_KIND = 'bug_detection'
+
+_worker_engine: Optional['BugDetectionEngine'] = None
+
+
+def _analyze_file_in_worker(job: Tuple[str, str, str]) -> List[BugReport]:
+    """Process pool entry point: detect bugs in one file's code."""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = BugDetectionEngine()
+    code, language, file_path = job
+    return _worker_engine.detect_bugs(code, language, file_path)
+
+
 class BugDetectionEngine:
     """Main bug detection engine that coordinates different detectors."""
     
-    def __init__(self):
+    # Below this many changed files a scan runs in-process
+    parallel_threshold = 16
+    # Results kept in memory; older ones are reloaded from the persistent cache
+    max_cached_files = 2048
+    
+    def __init__(self, cache: Optional[AnalysisCache] = None):
+        """
+        Initialize the engine.
+        
+        Args:
+            cache: Persistent analysis cache; results are then kept across
+                processes and restarts until the detection rules change
+        """
         self.python_detector = PythonBugDetector()
         self.javascript_detector = JavaScriptBugDetector()
+        # (content hash, language) -> bugs, so rescans skip unchanged files;
+        # least recently used first
+        self.file_cache: OrderedDict[Tuple[str, str], List[BugReport]] = OrderedDict()
+        self.cache = cache
+        if cache is not None:
+            cache.invalidate(BUG_DETECTION_CACHE_KIND, keep_version=ANALYZER_VERSION)
     
     def analyze_code(
         self,
@@ -780,14 +865,12 @@ class BugDetectionEngine:
     ) -> BugAnalysisResult:
         """Perform comprehensive bug analysis on code."""
         
-        # Get detector based on language
-        if language.lower() in ['python', 'py']:
-            bugs = self.python_detector.analyze_code(code, file_path)
-        elif language.lower() in ['javascript', 'js', 'typescript', 'ts']:
-            bugs = self.javascript_detector.analyze_code(code, file_path)
-        else:
-            # Generic analysis for unsupported languages
-            bugs = self._generic_analysis(code, file_path)
+        key = (hashlib.sha256(code.encode('utf-8', errors='replace')).hexdigest(), language)
+        bugs = self._load_cached(key)
+        if bugs is None:
+            bugs = self.detect_bugs(code, language, file_path)
+            self._store(key, bugs)
+        bugs = self._stamp(bugs, file_path)
         
         # Filter by categories if specified
         if include_categories:
@@ -798,6 +881,143 @@ class BugDetectionEngine:
         
         return analysis_result
     
+    def detect_bugs(self, code: str, language: str, file_path: str = "unknown") -> List[BugReport]:
+        """Run the detector for a language and return its bug reports."""
+        # Get detector based on language
+        if language.lower() in ['python', 'py']:
+            return self.python_detector.analyze_code(code, file_path)
+        elif language.lower() in ['javascript', 'js', 'typescript', 'ts']:
+            return self.javascript_detector.analyze_code(code, file_path)
+        else:
+            # Generic analysis for unsupported languages
+            return self._generic_analysis(code, file_path)
+    
+    def analyze_paths(
+        self,
+        paths: Union[str, List[str]],
+        include_categories: Optional[List[BugCategory]] = None,
+        max_workers: Optional[int] = None
+    ) -> PathScanResult:
+        """
+        Scan files and directory trees for bugs.
+        
+        Files are matched to a language by extension. Results are cached by
+        content hash, so rescanning a tree only analyzes files that changed;
+        when enough files changed they are analyzed in a process pool.
+        
+        Args:
+            paths: Files and directories to scan
+            include_categories: Only report bugs in these categories
+            max_workers: Size of the process pool (default: CPU count)
+        
+        Returns:
+            PathScanResult with bugs per file and metrics over all of them
+        """
+        start_time = datetime.now()
+        if isinstance(paths, str):
+            paths = [paths]
+        
+        # Hash every file, keeping the ones not analyzed before
+        file_keys: Dict[str, Tuple[str, str]] = {}
+        results: Dict[Tuple[str, str], List[BugReport]] = {}
+        jobs: Dict[Tuple[str, str], Tuple[str, str, str]] = {}
+        for file_path, language in self._iter_source_files(paths):
+            try:
+                with open(file_path, 'rb') as f:
+                    content = f.read()
+            except OSError:
+                continue
+            key = (hashlib.sha256(content).hexdigest(), language)
+            file_keys[file_path] = key
+            if key in results or key in jobs:
+                continue
+            cached = self._load_cached(key)
+            if cached is None:
+                jobs[key] = (content.decode('utf-8', errors='replace'), language, file_path)
+            else:
+                results[key] = cached
+        
+        if len(jobs) >= self.parallel_threshold and max_workers != 1:
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(jobs) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                executor_results = executor.map(_analyze_file_in_worker, jobs.values(), chunksize=chunksize)
+                for key, bugs in zip(jobs, executor_results, strict=True):
+                    results[key] = bugs
+                    self._store(key, bugs)
+        else:
+            for key, job in jobs.items():
+                results[key] = self.detect_bugs(*job)
+                self._store(key, results[key])
+        
+        bugs_by_file: Dict[str, List[BugReport]] = {}
+        for file_path, key in file_keys.items():
+            bugs = self._stamp(results[key], file_path)
+            if include_categories:
+                bugs = [bug for bug in bugs if bug.category in include_categories]
+            bugs_by_file[file_path] = bugs
+        
+        return PathScanResult(
+            bugs_by_file=bugs_by_file,
+            analysis=self._calculate_analysis_metrics(
+                [bug for bugs in bugs_by_file.values() for bug in bugs]
+            ),
+            files_scanned=len(file_keys),
+            files_analyzed=len(jobs),
+            scan_time=(datetime.now() - start_time).total_seconds()
+        )
+    
+    def _load_cached(self, key: Tuple[str, str]) -> Optional[List[BugReport]]:
+        """Cached bugs for (content hash, language), promoted from the persistent cache."""
+        bugs = self.file_cache.get(key)
+        if bugs is not None:
+            self.file_cache.move_to_end(key)
+        elif self.cache is not None:
+            cached = self.cache.get(BUG_DETECTION_CACHE_KIND, ':'.join(key), ANALYZER_VERSION)
+            if cached is not None:
+                bugs = [BugReport.from_dict(data) for data in cached]
+                self._remember(key, bugs)
+        return bugs
+    
+    def _store(self, key: Tuple[str, str], bugs: List[BugReport]):
+        """Cache freshly detected bugs in memory and in the persistent cache."""
+        self._remember(key, bugs)
+        if self.cache is not None:
+            self.cache.put(
+                BUG_DETECTION_CACHE_KIND, ':'.join(key), ANALYZER_VERSION,
+                [bug.to_dict() for bug in bugs]
+            )
+    
+    def _remember(self, key: Tuple[str, str], bugs: List[BugReport]):
+        """Keep bugs in the in-memory cache, evicting the least recently used."""
+        self.file_cache[key] = bugs
+        self.file_cache.move_to_end(key)
+        while len(self.file_cache) > self.max_cached_files:
+            self.file_cache.popitem(last=False)
+    
+    def _stamp(self, bugs: List[BugReport], file_path: str) -> List[BugReport]:
+        """Cached reports relabelled for the file they are reported for."""
+        # Files with identical content share cached reports
+        if bugs and bugs[0].file_path != file_path:
+            return [dataclasses.replace(bug, file_path=file_path) for bug in bugs]
+        return bugs
+    
+    def _iter_source_files(self, paths: List[str]):
+        """Yield (file path, language) for supported files under the paths."""
+        for path in paths:
+            if os.path.isfile(path):
+                language = LANGUAGE_BY_EXTENSION.get(os.path.splitext(path)[1].lower())
+                if language:
+                    yield path, language
+                continue
+            
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if d not in SKIPPED_DIRECTORIES)
+                for name in sorted(files):
+                    language = LANGUAGE_BY_EXTENSION.get(os.path.splitext(name)[1].lower())
+                    if language:
+                        yield os.path.join(root, name), language
+    
     def _generic_analysis(self, code: str, file_path: str) -> List[BugReport]:
         """Generic analysis for unsupported languages."""
         bugs = []
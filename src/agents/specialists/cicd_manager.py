@@ -9,6 +9,8 @@ import textwrap
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 
+from .template_engine import memoized_render
+
 
 @dataclass
 class PipelineConfig:
@@ -34,6 +36,7 @@ class CICDManager:
         self.supported_platforms = ['github', 'gitlab', 'jenkins', 'azure', 'bitbucket']
         self.templates = {}
         
+    @memoized_render
     def generate_pipeline(self, config: PipelineConfig) -> Dict[str, str]:
         """Generate complete CI/CD pipeline configuration"""
         if config.platform == 'github':
@@ -22,7 +22,7 @@ from src.agents.base.enhanced_agent import (
     AgentCapability
 )
 from src.agents.base.types import AgentType, TaskType
-from src.core.routing.router import RoutingContext, RoutingStrategy
+from src.core.routing.router import LLMRouter, RoutingStrategy
 from src.core.routing.providers.base import LLMResponse
 
 
@@ -63,12 +63,12 @@ class CTOAgent(EnhancedBaseAgent):
     - Risk assessment and mitigation strategies
     """
     
-    def __init__(self, config: Optional[CTOAgentConfig] = None):
+    def __init__(self, config: Optional[CTOAgentConfig] = None, llm_router: Optional[LLMRouter] = None):
         """Initialize CTO Agent with specialized configuration."""
         if config is None:
             config = CTOAgentConfig()
         
-        super().__init__(config)
+        super().__init__(config, llm_router=llm_router)
         
         # CTO-specific knowledge areas
         self.expertise_areas = [
@@ -320,11 +320,10 @@ class CTOAgent(EnhancedBaseAgent):
         
         return "1. Review and validate recommendations\n2. Create implementation plan\n3. Begin execution with team"
     
-    async def _customize_prompt(self, task: EnhancedTask, context: str) -> str:
-        """Customize prompts with CTO-specific expertise and frameworks."""
-        
-        # Build CTO-specific context
-        cto_context = f"""
+    def _get_system_prompt(self) -> str:
+        """CTO expertise and frameworks, identical for every task."""
+        return f"""{super()._get_system_prompt()}
+
 You are the CTO (Chief Technology Officer) of AIOSv3, a cutting-edge AI agent platform. Your expertise includes:
 
 **Core Competencies:**
@@ -359,7 +358,10 @@ When making recommendations, consider:
 - Be decisive but acknowledge uncertainties
 - Structure responses for easy consumption by technical teams
 """
-
+    
+    async def _customize_prompt(self, task: EnhancedTask, context: str) -> str:
+        """Customize prompts with task-specific CTO guidance."""
+        
         # Task-specific guidance
         task_guidance = {
             TaskType.SYSTEM_DESIGN: """
@@ -400,9 +402,7 @@ Focus on:
 Provide thoughtful technical leadership perspective on this request.
 """)
         
-        return f"""{cto_context}
-
-{guidance}
+        return f"""{guidance}
 
 **Task Complexity**: {task.complexity}/10
 **Privacy Sensitive**: {task.privacy_sensitive}
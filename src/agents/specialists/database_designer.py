@@ -72,9 +72,14 @@ class DatabaseDesigner:
         base_class = self._generate_base_class()
         models = []
         
+        # Group relationships once instead of scanning them for every table
+        relationships_by_table: Dict[str, List[RelationshipSpec]] = {}
+        for rel in relationships:
+            relationships_by_table.setdefault(rel.from_table, []).append(rel)
+        
         # Generate table models
         for table in tables:
-            model = self._generate_model(table, relationships)
+            model = self._generate_model(table, relationships_by_table.get(table.name, []))
             models.append(model)
         
         # Generate association tables for many-to-many
@@ -8,6 +8,8 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 
+from .template_engine import CompiledTemplate, memoized_render
+
 
 class APIStyle(Enum):
     """API design styles Marcus can use."""
@@ -41,13 +43,8 @@ class ModelSpec:
     examples: Optional[Dict[str, Any]] = None
 
 
-class FastAPITemplates:
-    """Marcus's collection of FastAPI templates and patterns."""
-    
-    @staticmethod
-    def get_base_app_template() -> str:
-        """Get base FastAPI application template."""
-        return '''"""
+# Compiled once; rendered for every generated project
+BASE_APP_TEMPLATE = CompiledTemplate('''"""
 {description}
 
 Built with ❤️ by Marcus Chen
@@ -113,7 +110,16 @@ async def health_check():
         "database": "connected",
         "version": "{version}"
     }}
-'''
+''')
+
+
+class FastAPITemplates:
+    """Marcus's collection of FastAPI templates and patterns."""
+    
+    @staticmethod
+    def get_base_app_template() -> str:
+        """Get base FastAPI application template."""
+        return BASE_APP_TEMPLATE.source
 
     @staticmethod
     def get_model_template(spec: ModelSpec) -> str:
@@ -483,10 +489,11 @@ class FastAPICodeGenerator:
     def __init__(self):
         self.templates = FastAPITemplates()
         
+    @memoized_render
     def generate_api_structure(self, project_name: str, description: str) -> Dict[str, str]:
         """Generate complete API project structure."""
         return {
-            "main.py": self.templates.get_base_app_template().format(
+            "main.py": BASE_APP_TEMPLATE.render(
                 title=project_name,
                 description=description,
                 version="1.0.0"
@@ -501,6 +508,7 @@ class FastAPICodeGenerator:
             "README.md": self._generate_readme(project_name, description),
         }
     
+    @memoized_render
     def generate_crud_api(self, resource_name: str, fields: Dict[str, str]) -> Dict[str, str]:
         """Generate a complete CRUD API for a resource."""
         model_spec = ModelSpec(
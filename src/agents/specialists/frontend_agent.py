@@ -138,7 +138,8 @@ class FrontendAgent(MonitoringAgent):
         self.aria_patterns = {}  # Store ARIA pattern library
         
         # Initialize message queue for collaboration
-        self.message_queue = MessageQueue()
+        if self.message_queue is None:
+            self.message_queue = MessageQueue()
         self.collaboration_partners = {}  # Track active collaborations
         
     async def on_start(self) -> None:
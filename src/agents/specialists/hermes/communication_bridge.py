@@ -7,10 +7,14 @@ Translates technical updates into user-friendly language and vice versa.
 import asyncio
 import json
 import logging
+import re
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from enum import Enum
 
+from src.agents.specialists.hermes.keyword_matcher import build_trie_pattern
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,11 +44,19 @@ class CommunicationBridge:
     Handles translation, filtering, and routing of messages.
     """
     
+    # Recently translated strings remembered, as progress details repeat often
+    translation_cache_size = 1024
+    
+    # Terms above which translation uses one compiled longest-match pattern;
+    # for smaller tables a str.replace per term is faster
+    compile_threshold = 100
+    
     def __init__(self):
         """Initialize the communication bridge."""
         self.message_queue: List[Dict[str, Any]] = []
         self.conversation_context: Dict[str, Any] = {}
         self.technical_to_plain: Dict[str, str] = self._load_translation_mappings()
+        self._compile_translations()
         self.update_filters = {
             "show_progress": True,
             "show_blockers": True,
@@ -132,12 +144,36 @@ class CommunicationBridge:
         
         return True
     
+    def _compile_translations(self) -> None:
+        """Compile large translation tables into one longest-match pattern."""
+        self._translation_pattern = None
+        terms = [technical for technical in self.technical_to_plain if technical]
+        if len(terms) > self.compile_threshold:
+            self._translation_pattern = re.compile(build_trie_pattern(terms))
+        self._translate_cached = lru_cache(maxsize=self.translation_cache_size)(
+            self._substitute_terms
+        )
+    
+    def add_translations(self, mappings: Dict[str, str]) -> None:
+        """Add or override technical term mappings."""
+        self.technical_to_plain.update(mappings)
+        self._compile_translations()
+    
+    def _substitute_terms(self, text: str) -> str:
+        """Replace every technical term with its plain-language equivalent."""
+        mappings = self.technical_to_plain
+        if self._translation_pattern is not None:
+            return self._translation_pattern.sub(lambda match: mappings[match.group()], text)
+        for technical, plain in mappings.items():
+            if technical:
+                text = text.replace(technical, plain)
+        return text
+    
     def _translate_technical_terms(self, text: str) -> str:
         """Translate technical terms to user-friendly language."""
-        result = text
-        for technical, plain in self.technical_to_plain.items():
-            result = result.replace(technical, plain)
-        return result
+        if not text:
+            return text
+        return self._translate_cached(text)
     
     def _format_progress_update(self, update: Dict[str, Any]) -> str:
         """Format a progress update for the user."""
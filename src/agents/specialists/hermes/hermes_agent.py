@@ -5,6 +5,7 @@ The messenger god who guides users through natural conversation to create
 software projects using our pantheon of AI developers.
 """
 
+import os
 import json
 import uuid
 from datetime import datetime
@@ -16,6 +17,8 @@ from src.agents.base.monitoring_agent import MonitoringAgent
 from src.agents.base.exceptions import AgentError
 from src.core.routing.router import LLMRouter
 from src.core.memory.memory_manager import MemoryManager
+from src.agents.specialists.hermes.keyword_matcher import KeywordMatcher
+from src.agents.specialists.hermes.session_store import HermesSessionStore
 
 # Define task-related types locally for now
 from enum import Enum
@@ -260,7 +263,8 @@ class HermesAgent(MonitoringAgent):
         name: str = "Hermes",
         persona_config: Optional[PersonaConfig] = None,
         llm_router: Optional[LLMRouter] = None,
-        memory_manager: Optional[MemoryManager] = None
+        memory_manager: Optional[MemoryManager] = None,
+        session_store: Optional[HermesSessionStore] = None
     ):
         """Initialize Hermes with configurable persona."""
         super().__init__(name=name, role="concierge")
@@ -269,14 +273,20 @@ class HermesAgent(MonitoringAgent):
         self.llm_router = llm_router
         self.memory_manager = memory_manager
         
-        # Active conversations
-        self.conversations: Dict[str, ConversationState] = {}
+        # Conversations are persisted per turn; recently used ones stay in memory
+        if session_store is None:
+            session_store = HermesSessionStore(
+                os.getenv("HERMES_SESSION_DB", ":memory:"),
+                state_factory=ConversationState
+            )
+        self.sessions = session_store
         
         # Platform knowledge
         self.platform_knowledge = self._load_platform_knowledge()
         
         # Intent patterns
         self.intent_patterns = self._load_intent_patterns()
+        self.intent_matcher = KeywordMatcher(self.intent_patterns)
         
         self._logger.info(
             f"Hermes initialized with persona: {self.persona.tone}, "
@@ -353,7 +363,8 @@ Track the conversation intent and be ready to hand off to the development team."
     async def process_conversation(
         self,
         user_input: str,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None
     ) -> Tuple[str, ConversationState]:
         """
         Process a conversation turn with intent tracking.
@@ -361,12 +372,10 @@ Track the conversation intent and be ready to hand off to the development team."
         Returns:
             Tuple of (response, conversation_state)
         """
-        # Get or create conversation state
-        if session_id and session_id in self.conversations:
-            state = self.conversations[session_id]
-        else:
-            state = ConversationState()
-            self.conversations[state.session_id] = state
+        # Resume a stored session, or start a new one if it is unknown
+        state = self.sessions.get(session_id) if session_id else None
+        if state is None:
+            state = self.sessions.create(user_id=user_id)
         
         # Add user message
         state.add_message("user", user_input)
@@ -392,6 +401,9 @@ Track the conversation intent and be ready to hand off to the development team."
         # Check if ready for handoff
         state.ready_for_handoff = self._check_handoff_ready(state)
         
+        # Persist this turn's changes
+        self.sessions.save_turn(state)
+        
         # Log intent tracking
         self._logger.info(
             f"Turn {state.turn_count} - Intent: {intent_bucket.value} "
@@ -411,19 +423,11 @@ Track the conversation intent and be ready to hand off to the development team."
         Returns:
             Tuple of (bucket, specific_type, confidence)
         """
-        input_lower = user_input.lower()
-        
-        # Check for build intent
-        build_matches = sum(1 for word in self.intent_patterns["build"] 
-                          if word in input_lower)
-        
-        # Check for automate intent
-        automate_matches = sum(1 for word in self.intent_patterns["automate"] 
-                             if word in input_lower)
-        
-        # Check for analyze intent
-        analyze_matches = sum(1 for word in self.intent_patterns["analyze"] 
-                            if word in input_lower)
+        # One scan counts the matches for every intent
+        hits = self.intent_matcher.scan(user_input)
+        build_matches = hits.count("build")
+        automate_matches = hits.count("automate")
+        analyze_matches = hits.count("analyze")
         
         # Determine primary intent
         if build_matches > max(automate_matches, analyze_matches):
@@ -431,15 +435,15 @@ Track the conversation intent and be ready to hand off to the development team."
             confidence = min(0.95, 0.3 + (build_matches * 0.15))
             
             # Detect specific type
-            if "ecommerce" in input_lower or "store" in input_lower or "shop" in input_lower:
+            if "ecommerce" in hits.found or "store" in hits.found or "shop" in hits.found:
                 specific_type = "ecommerce_site"
-            elif "portfolio" in input_lower:
+            elif "portfolio" in hits.found:
                 specific_type = "portfolio_site"
-            elif "blog" in input_lower:
+            elif "blog" in hits.found:
                 specific_type = "blog_site"
-            elif "api" in input_lower:
+            elif "api" in hits.found:
                 specific_type = "api_service"
-            elif "app" in input_lower:
+            elif "app" in hits.found:
                 specific_type = "web_app"
             else:
                 specific_type = "website"
@@ -559,11 +563,10 @@ Track the conversation intent and be ready to hand off to the development team."
         format: str = "markdown"
     ) -> Optional[str]:
         """Export a conversation session."""
-        if session_id not in self.conversations:
+        state = self.sessions.get(session_id)
+        if state is None:
             return None
         
-        state = self.conversations[session_id]
-        
         if format == "markdown":
             return state.export_markdown()
         elif format == "json":
@@ -571,21 +574,14 @@ Track the conversation intent and be ready to hand off to the development team."
         else:
             raise ValueError(f"Unsupported export format: {format}")
     
-    def get_active_sessions(self) -> List[Dict[str, Any]]:
-        """Get summary of active conversation sessions."""
-        sessions = []
-        
-        for session_id, state in self.conversations.items():
-            sessions.append({
-                "session_id": session_id,
-                "created_at": state.created_at.isoformat(),
-                "turn_count": state.turn_count,
-                "intent": state.intent_state.current_bucket.value,
-                "confidence": state.intent_state.confidence,
-                "ready_for_handoff": state.ready_for_handoff
-            })
-        
-        return sessions
+    def get_active_sessions(
+        self,
+        user_id: Optional[str] = None,
+        intent: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get summaries of stored sessions, most recently active first."""
+        return self.sessions.list_sessions(user_id=user_id, intent=intent, limit=limit)
     
     async def process_task(self, task: Dict[str, Any]) -> TaskResult:
         """Process a task (for compatibility with base agent interface)."""
@@ -593,7 +589,9 @@ Track the conversation intent and be ready to hand off to the development team."
         user_input = task.get("user_input", "")
         session_id = task.get("session_id")
         
-        response, state = await self.process_conversation(user_input, session_id)
+        response, state = await self.process_conversation(
+            user_input, session_id, user_id=task.get("user_id")
+        )
         
         return TaskResult(
             task_id=task.get("task_id", str(uuid.uuid4())),
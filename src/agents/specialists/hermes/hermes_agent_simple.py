@@ -2,6 +2,7 @@
 Simplified Hermes Agent for testing without full infrastructure dependencies.
 """
 
+import os
 import json
 import uuid
 import logging
@@ -10,6 +11,9 @@ from enum import Enum
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 
+from src.agents.specialists.hermes.keyword_matcher import KeywordMatcher
+from src.agents.specialists.hermes.session_store import HermesSessionStore
+
 
 class IntentBucket(Enum):
     """High-level intent categories for conversation routing."""
@@ -210,13 +214,24 @@ class ConversationState:
 class SimpleHermesAgent:
     """Simplified Hermes agent for testing."""
     
-    def __init__(self, persona_config: Optional[PersonaConfig] = None):
+    def __init__(
+        self,
+        persona_config: Optional[PersonaConfig] = None,
+        session_store: Optional[HermesSessionStore] = None
+    ):
         """Initialize Hermes with configurable persona."""
         self.name = "Hermes"
         self.persona = persona_config or PersonaConfig()
-        self.conversations: Dict[str, ConversationState] = {}
+        # Sessions are persisted per turn; recently used ones stay in memory
+        if session_store is None:
+            session_store = HermesSessionStore(
+                os.getenv("HERMES_SESSION_DB", ":memory:"),
+                state_factory=ConversationState
+            )
+        self.sessions = session_store
         self.platform_knowledge = self._load_platform_knowledge()
         self.intent_patterns = self._load_intent_patterns()
+        self.intent_matcher = KeywordMatcher(self.intent_patterns)
         self.logger = logging.getLogger("hermes")
     
     def _load_platform_knowledge(self) -> Dict[str, Any]:
@@ -252,18 +267,26 @@ class SimpleHermesAgent:
             ]
         }
     
+    def _get_session(
+        self,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> ConversationState:
+        """Resume a stored session, or start a new one if it is unknown."""
+        state = self.sessions.get(session_id) if session_id else None
+        if state is None:
+            state = self.sessions.create(user_id=user_id)
+        return state
+    
     def process_conversation(
         self,
         user_input: str,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None
     ) -> Tuple[str, ConversationState]:
         """Process a conversation turn with intent tracking."""
         # Get or create conversation state
-        if session_id and session_id in self.conversations:
-            state = self.conversations[session_id]
-        else:
-            state = ConversationState()
-            self.conversations[state.session_id] = state
+        state = self._get_session(session_id, user_id)
         
         # Add user message
         state.add_message("user", user_input)
@@ -293,6 +316,9 @@ class SimpleHermesAgent:
         # Check if ready for handoff
         state.ready_for_handoff = self._check_handoff_ready(state)
         
+        # Persist this turn's changes
+        self.sessions.save_turn(state)
+        
         self.logger.info(
             f"Turn {state.turn_count} - Intent: {intent_bucket.value} "
             f"({confidence:.0%}) - Type: {specific_type}"
@@ -306,15 +332,11 @@ class SimpleHermesAgent:
         state: ConversationState
     ) -> Tuple[IntentBucket, Optional[str], float]:
         """Detect user intent from input."""
-        input_lower = user_input.lower()
-        
-        # Count matches for each intent
-        build_matches = sum(1 for word in self.intent_patterns["build"] 
-                          if word in input_lower)
-        automate_matches = sum(1 for word in self.intent_patterns["automate"] 
-                             if word in input_lower)
-        analyze_matches = sum(1 for word in self.intent_patterns["analyze"] 
-                            if word in input_lower)
+        # One scan counts the matches for every intent
+        hits = self.intent_matcher.scan(user_input)
+        build_matches = hits.count("build")
+        automate_matches = hits.count("automate")
+        analyze_matches = hits.count("analyze")
         
         # Determine primary intent
         if build_matches > max(automate_matches, analyze_matches):
@@ -322,13 +344,13 @@ class SimpleHermesAgent:
             confidence = min(0.95, 0.3 + (build_matches * 0.15))
             
             # Detect specific type
-            if any(word in input_lower for word in ["ecommerce", "store", "shop"]):
+            if any(word in hits.found for word in ["ecommerce", "store", "shop"]):
                 specific_type = "ecommerce_site"
-            elif "portfolio" in input_lower:
+            elif "portfolio" in hits.found:
                 specific_type = "portfolio_site"
-            elif "blog" in input_lower:
+            elif "blog" in hits.found:
                 specific_type = "blog_site"
-            elif "api" in input_lower:
+            elif "api" in hits.found:
                 specific_type = "api_service"
             else:
                 specific_type = "website"
@@ -433,11 +455,10 @@ class SimpleHermesAgent:
         format: str = "markdown"
     ) -> Optional[str]:
         """Export a conversation session."""
-        if session_id not in self.conversations:
+        state = self.sessions.get(session_id)
+        if state is None:
             return None
         
-        state = self.conversations[session_id]
-        
         if format == "markdown":
             return state.export_markdown()
         elif format == "json":
@@ -445,18 +466,11 @@ class SimpleHermesAgent:
         else:
             raise ValueError(f"Unsupported export format: {format}")
     
-    def get_active_sessions(self) -> List[Dict[str, Any]]:
-        """Get summary of active conversation sessions."""
-        sessions = []
-        
-        for session_id, state in self.conversations.items():
-            sessions.append({
-                "session_id": session_id,
-                "created_at": state.created_at.isoformat(),
-                "turn_count": state.turn_count,
-                "intent": state.intent_state.current_bucket.value,
-                "confidence": state.intent_state.confidence,
-                "ready_for_handoff": state.ready_for_handoff
-            })
-        
-        return sessions
\ No newline at end of file
+    def get_active_sessions(
+        self,
+        user_id: Optional[str] = None,
+        intent: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get summaries of stored sessions, most recently active first."""
+        return self.sessions.list_sessions(user_id=user_id, intent=intent, limit=limit)
\ No newline at end of file
@@ -7,7 +7,9 @@ Connects to the LLMRouter for intelligent, context-aware conversations.
 import os
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+from dataclasses import astuple
+from functools import lru_cache
+from typing import Optional, List, AsyncIterator, Tuple
 
 from src.agents.specialists.hermes.hermes_agent_simple import (
     SimpleHermesAgent,
@@ -15,6 +17,7 @@ from src.agents.specialists.hermes.hermes_agent_simple import (
     ConversationState,
     IntentBucket
 )
+from src.agents.specialists.hermes.session_store import HermesSessionStore
 from src.core.routing.router import LLMRouter, RoutingContext, RoutingPolicy, RoutingStrategy
 from src.core.routing.providers.base import LLMRequest, ModelCapability
 from src.core.routing.providers.claude import ClaudeProvider
@@ -25,6 +28,80 @@ from src.core.routing.providers.local import LocalProvider
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT_TEMPLATE = """You are Hermes, the friendly concierge for an AI software development platform.
+
+{persona_modifiers}
+
+Your responses should:
+1. Be warm, helpful, and encouraging
+2. Ask clarifying questions when needed
+3. Use simple language for non-technical users
+4. Guide users toward defining their project clearly
+5. Track and acknowledge what you've learned about their needs
+
+Remember: You're helping them communicate with our AI development team:
+- Apollo (Backend): APIs, databases, system architecture
+- Aphrodite (Frontend): UI/UX, web interfaces, design
+- Athena (QA): Testing, quality assurance, security
+- Hephaestus (DevOps): Deployment, CI/CD, infrastructure"""
+
+
+@lru_cache(maxsize=64)
+def render_system_prompt(persona: Tuple) -> str:
+    """
+    Render the stable Hermes system prompt for a persona.
+    
+    Args:
+        persona: PersonaConfig field values, as returned by ``astuple``
+        
+    Returns:
+        The system prompt, byte-identical for every turn with this persona
+    """
+    modifiers = PersonaConfig(*persona).get_system_prompt_modifiers()
+    return SYSTEM_PROMPT_TEMPLATE.format(persona_modifiers=modifiers)
+
+
+class _TurnStream:
+    """
+    Response chunks of a streamed turn that finishes the turn exactly once.
+
+    Unlike an async generator, closing it before the first chunk was read
+    still records the (empty) reply and persists the turn.
+    """
+    
+    def __init__(self, hermes: "HermesWithLLM", user_input: str, state: ConversationState):
+        self._hermes = hermes
+        self._user_input = user_input
+        self._state = state
+        self._chunks: List[str] = []
+        self._stream = hermes._stream_llm_response(user_input, state)
+        self._finished = False
+    
+    def __aiter__(self) -> "_TurnStream":
+        return self
+    
+    async def __anext__(self) -> str:
+        if self._finished:
+            raise StopAsyncIteration
+        try:
+            chunk = await self._stream.__anext__()
+        except BaseException:
+            # Finished, failed or cancelled: the turn ends here
+            await self.aclose()
+            raise
+        self._chunks.append(chunk)
+        return chunk
+    
+    async def aclose(self):
+        """Stop the stream and finish the turn with what was received."""
+        if self._finished:
+            return
+        self._finished = True
+        try:
+            await self._stream.aclose()
+        finally:
+            self._hermes._finish_turn(self._user_input, self._state, "".join(self._chunks))
+
 
 class HermesWithLLM(SimpleHermesAgent):
     """Enhanced Hermes with real LLM capabilities."""
@@ -32,10 +109,11 @@ class HermesWithLLM(SimpleHermesAgent):
     def __init__(
         self,
         persona_config: Optional[PersonaConfig] = None,
-        llm_router: Optional[LLMRouter] = None
+        llm_router: Optional[LLMRouter] = None,
+        session_store: Optional[HermesSessionStore] = None
     ):
         """Initialize Hermes with LLM support."""
-        super().__init__(persona_config=persona_config)
+        super().__init__(persona_config=persona_config, session_store=session_store)
         self.llm_router = llm_router
         self._complexity_threshold = 5  # Threshold for using cloud LLMs
     
@@ -136,21 +214,20 @@ class HermesWithLLM(SimpleHermesAgent):
         
         return min(10, complexity)
     
-    async def _generate_llm_response(
+    def _build_llm_request(
         self,
         user_input: str,
         state: ConversationState
-    ) -> str:
-        """Generate response using LLM router."""
-        if not self.llm_router:
-            await self.initialize_llm_router()
-        
+    ) -> Tuple[LLMRequest, RoutingContext, Optional[RoutingPolicy], int]:
+        """Build the LLM request and routing inputs for a turn."""
         # Assess complexity
         complexity = self._assess_complexity(user_input, state)
         
-        # Build conversation messages
+        # Build conversation messages, stable system prompt first so providers
+        # can cache it across turns
         messages = [
-            {"role": "system", "content": self._get_enhanced_system_prompt(state)}
+            {"role": "system", "content": self._get_system_prompt_prefix()},
+            {"role": "system", "content": self._get_turn_context(state)}
         ]
         
         # Add conversation history (last 6 messages for context)
@@ -168,7 +245,9 @@ class HermesWithLLM(SimpleHermesAgent):
             messages=messages,
             model_id="auto",  # Let router choose the best model
             temperature=0.7,
-            max_tokens=500
+            max_tokens=500,
+            cache_prefix_messages=1,
+            metadata={"prompt_cache_key": "hermes"}
         )
         
         # Create routing context
@@ -195,24 +274,48 @@ class HermesWithLLM(SimpleHermesAgent):
                 max_cost_per_request=0.05
             )
         
+        return request, context, policy, complexity
+    
+    async def _route_llm_request(
+        self,
+        request: LLMRequest,
+        context: RoutingContext,
+        policy: Optional[RoutingPolicy],
+        complexity: int
+    ):
+        """Route a request and return (provider, routing_decision)."""
+        routing_decision = await self.llm_router.route_request(
+            request=request,
+            context=context,
+            policy=policy
+        )
+        
+        logger.info(
+            f"Routed to {routing_decision.provider_name} "
+            f"(complexity: {complexity}, cost: ${routing_decision.estimated_cost:.4f})"
+        )
+        
+        # Update request with actual model ID
+        request.model_id = routing_decision.model_id
+        
+        return self.llm_router.providers[routing_decision.provider_name], routing_decision
+    
+    async def _generate_llm_response(
+        self,
+        user_input: str,
+        state: ConversationState
+    ) -> str:
+        """Generate response using LLM router."""
+        if not self.llm_router:
+            await self.initialize_llm_router()
+        
+        request, context, policy, complexity = self._build_llm_request(user_input, state)
+        
         try:
             # Route and execute request
-            routing_decision = await self.llm_router.route_request(
-                request=request,
-                context=context,
-                policy=policy
-            )
-            
-            logger.info(
-                f"Routed to {routing_decision.provider_name} "
-                f"(complexity: {complexity}, cost: ${routing_decision.estimated_cost:.4f})"
+            provider, routing_decision = await self._route_llm_request(
+                request, context, policy, complexity
             )
-            
-            # Update request with actual model ID
-            request.model_id = routing_decision.model_id
-            
-            # Execute request
-            provider = self.llm_router.providers[routing_decision.provider_name]
             response = await provider.generate(request)
             
             # Track metrics
@@ -224,51 +327,64 @@ class HermesWithLLM(SimpleHermesAgent):
             logger.error(f"LLM generation failed: {e}")
             return self._get_fallback_response(state)
     
-    def _get_enhanced_system_prompt(self, state: ConversationState) -> str:
-        """Generate enhanced system prompt with context."""
-        base_prompt = f"""You are Hermes, the friendly concierge for an AI software development platform.
-
-Current conversation context:
+    async def _stream_llm_response(
+        self,
+        user_input: str,
+        state: ConversationState
+    ) -> AsyncIterator[str]:
+        """Stream response chunks from the routed provider as they arrive."""
+        if not self.llm_router:
+            await self.initialize_llm_router()
+        
+        request, context, policy, complexity = self._build_llm_request(user_input, state)
+        
+        streamed = False
+        try:
+            provider, routing_decision = await self._route_llm_request(
+                request, context, policy, complexity
+            )
+            async for chunk in provider.generate_stream(request):
+                if chunk:
+                    streamed = True
+                    yield chunk
+            
+            # Track metrics
+            self._track_llm_usage(routing_decision, complexity)
+            
+        except Exception as e:
+            logger.error(f"LLM streaming failed: {e}")
+            if not streamed:
+                yield self._get_fallback_response(state)
+    
+    def _get_system_prompt_prefix(self) -> str:
+        """Get the stable system prompt for this persona, rendered once per config."""
+        return render_system_prompt(astuple(self.persona))
+    
+    def _get_turn_context(self, state: ConversationState) -> str:
+        """Generate the per-turn conversation context that follows the stable prefix."""
+        context = f"""Current conversation context:
 - Intent: {state.intent_state.current_bucket.value}
 - Confidence: {state.intent_state.confidence:.0%}
 - Turn: {state.turn_count}
-- Requirements gathered: {len(state.project_requirements)}
-
-{self.persona.get_system_prompt_modifiers()}
-
-Your responses should:
-1. Be warm, helpful, and encouraging
-2. Ask clarifying questions when needed
-3. Use simple language for non-technical users
-4. Guide users toward defining their project clearly
-5. Track and acknowledge what you've learned about their needs
-
-Remember: You're helping them communicate with our AI development team:
-- Apollo (Backend): APIs, databases, system architecture
-- Aphrodite (Frontend): UI/UX, web interfaces, design
-- Athena (QA): Testing, quality assurance, security
-- Hephaestus (DevOps): Deployment, CI/CD, infrastructure"""
+- Requirements gathered: {len(state.project_requirements)}"""
         
         # Add specific context based on intent
         if state.intent_state.current_bucket == IntentBucket.BUILD:
-            base_prompt += "\n\nFocus on understanding what they want to build and who will use it."
+            context += "\n\nFocus on understanding what they want to build and who will use it."
         elif state.intent_state.current_bucket == IntentBucket.AUTOMATE:
-            base_prompt += "\n\nFocus on understanding their current workflow and pain points."
+            context += "\n\nFocus on understanding their current workflow and pain points."
         
-        return base_prompt
+        return context
     
-    async def process_conversation(
+    def _start_turn(
         self,
         user_input: str,
-        session_id: Optional[str] = None
-    ) -> tuple[str, ConversationState]:
-        """Process conversation with LLM support."""
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> ConversationState:
+        """Record the user message and update intent before responding."""
         # Get or create conversation state
-        if session_id and session_id in self.conversations:
-            state = self.conversations[session_id]
-        else:
-            state = ConversationState()
-            self.conversations[state.session_id] = state
+        state = self._get_session(session_id, user_id)
         
         # Add user message
         state.add_message("user", user_input)
@@ -285,14 +401,17 @@ Remember: You're helping them communicate with our AI development team:
             user_input=user_input
         )
         
-        # Generate response with LLM
-        response = await self._generate_llm_response(user_input, state)
+        return state
+    
+    def _finish_turn(self, user_input: str, state: ConversationState, response: str):
+        """Record the response, extract requirements and persist the turn."""
+        intent = state.intent_state
         
         # Add assistant message
         state.add_message("assistant", response)
         
         # Extract any requirements (enhanced with context)
-        if intent_bucket == IntentBucket.BUILD:
+        if intent.current_bucket == IntentBucket.BUILD:
             self._extract_requirements(user_input, state)
             # Also extract from response context
             self._extract_from_conversation_context(state)
@@ -300,13 +419,56 @@ Remember: You're helping them communicate with our AI development team:
         # Check if ready for handoff
         state.ready_for_handoff = self._check_handoff_ready(state)
         
+        # Persist this turn's changes
+        self.sessions.save_turn(state)
+        
         self.logger.info(
-            f"Turn {state.turn_count} - Intent: {intent_bucket.value} "
-            f"({confidence:.0%}) - Type: {specific_type}"
+            f"Turn {state.turn_count} - Intent: {intent.current_bucket.value} "
+            f"({intent.confidence:.0%}) - Type: {intent.specific_type}"
         )
+    
+    async def process_conversation(
+        self,
+        user_input: str,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> tuple[str, ConversationState]:
+        """Process conversation with LLM support."""
+        state = self._start_turn(user_input, session_id, user_id)
+        
+        # Generate response with LLM
+        response = await self._generate_llm_response(user_input, state)
+        
+        self._finish_turn(user_input, state, response)
         
         return response, state
     
+    async def stream_conversation(
+        self,
+        user_input: str,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> Tuple[ConversationState, AsyncIterator[str]]:
+        """
+        Process a conversation turn with a streamed response.
+        
+        Intent is updated before this returns, so the state (and its
+        session id) is available before the first token. Requirement
+        extraction, the handoff check and persistence run once the
+        stream ends, or is closed early with the partial response, even
+        if it is closed before the first chunk was read.
+        
+        Args:
+            user_input: The user's message
+            session_id: Session to continue, or None to start one
+            user_id: Optional user a new session belongs to
+            
+        Returns:
+            Tuple of (conversation_state, async iterator of response chunks)
+        """
+        state = self._start_turn(user_input, session_id, user_id)
+        return state, _TurnStream(self, user_input, state)
+    
     def _extract_from_conversation_context(self, state: ConversationState):
         """Extract additional requirements from conversation context."""
         # This is a simplified version - could be enhanced with NLP
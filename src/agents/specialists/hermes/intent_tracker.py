@@ -7,10 +7,11 @@ seamless handoff to task execution workflows.
 
 import re
 from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from src.agents.specialists.hermes.hermes_agent import IntentBucket
+from src.agents.specialists.hermes.keyword_matcher import KeywordMatcher
 
 
 @dataclass
@@ -22,11 +23,15 @@ class ProjectType:
     keywords: List[str]
     questions: List[str]
     required_info: List[str]
+    _matcher: Optional[KeywordMatcher] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def matches(self, text: str) -> int:
         """Count keyword matches in text."""
-        text_lower = text.lower()
-        return sum(1 for keyword in self.keywords if keyword in text_lower)
+        if self._matcher is None:
+            self._matcher = KeywordMatcher({self.id: self.keywords})
+        return self._matcher.scan(text).count(self.id)
 
 
 class IntentTracker:
@@ -40,6 +45,17 @@ class IntentTracker:
         """Initialize the intent tracker with project definitions."""
         self.project_types = self._initialize_project_types()
         self.intent_keywords = self._initialize_intent_keywords()
+        self.keyword_matcher = self._build_keyword_matcher()
+        
+    def _build_keyword_matcher(self) -> KeywordMatcher:
+        """Compile intent and project keyword tables into one matcher."""
+        tables = {
+            f"intent:{intent_name}": keywords
+            for intent_name, keywords in self.intent_keywords.items()
+        }
+        for project in self.project_types:
+            tables[f"project:{project.id}"] = project.keywords
+        return KeywordMatcher(tables)
         
     def _initialize_project_types(self) -> List[ProjectType]:
         """Define all supported project types."""
@@ -232,20 +248,14 @@ class IntentTracker:
         Returns:
             Tuple of (bucket, specific_type, confidence, metadata)
         """
-        input_lower = user_input.lower()
+        # One scan finds the hits for every intent and project type
+        hits = self.keyword_matcher.scan(user_input)
         
         # Calculate weighted scores for each intent
         intent_scores = {}
-        for intent_name, keywords in self.intent_keywords.items():
-            score = 0.0
-            matches = []
-            
-            for keyword, weight in keywords.items():
-                if keyword in input_lower:
-                    score += weight
-                    matches.append(keyword)
-            
-            intent_scores[intent_name] = (score, matches)
+        for intent_name in self.intent_keywords:
+            table = f"intent:{intent_name}"
+            intent_scores[intent_name] = (hits.score(table), hits.matches(table))
         
         # Find the highest scoring intent
         best_intent = max(intent_scores.items(), key=lambda x: x[1][0])
@@ -273,7 +283,7 @@ class IntentTracker:
             # Find matching project types
             for project in self.project_types:
                 if project.category == bucket:
-                    match_count = project.matches(user_input)
+                    match_count = hits.count(f"project:{project.id}")
                     if match_count > 0:
                         project_matches.append((project, match_count))
             
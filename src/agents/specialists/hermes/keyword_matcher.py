@@ -0,0 +1,155 @@
+"""
+Compiled multi-pattern keyword matching for Hermes intent detection.
+
+All keyword tables (intent buckets, project types, ...) are merged into one
+matcher, so the input is lower-cased and scanned once per turn and hits are
+shared by every table. Large keyword sets are compiled into a single
+trie-shaped regular expression whose cost does not grow with the number of
+keywords. Matching keeps the semantics of ``keyword in text``: substring
+hits, overlaps included, each keyword counted once per table.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+KeywordTable = Union[Mapping[str, float], Iterable[str]]
+
+
+def build_trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Build a regex whose branches share common keyword prefixes.
+
+    At any position the pattern matches the longest keyword starting there.
+    """
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def to_pattern(node: Dict) -> str:
+        branches = [
+            re.escape(char) + to_pattern(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            # Greedy optional: prefer the longer keyword
+            return body + "?" if len(branches) == 1 and len(body) == 1 else f"(?:{body})?"
+        return body
+
+    return to_pattern(trie)
+
+
+@dataclass
+class KeywordHits:
+    """Keyword hits for one scanned text, grouped by table."""
+    found: Set[str]
+    tables: Dict[str, List[Tuple[str, float]]] = field(repr=False)
+
+    def matches(self, table: str) -> List[str]:
+        """Matched keywords of a table, in table order."""
+        return [keyword for keyword, _ in self.tables[table] if keyword in self.found]
+
+    def count(self, table: str) -> int:
+        """Number of distinct keywords of a table found in the text."""
+        return sum(1 for keyword, _ in self.tables[table] if keyword in self.found)
+
+    def score(self, table: str) -> float:
+        """Sum of the weights of a table's matched keywords."""
+        return sum(weight for keyword, weight in self.tables[table] if keyword in self.found)
+
+
+class KeywordMatcher:
+    """
+    Matches many weighted keyword tables against text in a single pass.
+
+    Below ``compile_threshold`` distinct keywords, CPython's substring
+    search over the de-duplicated keyword set is fastest. Above it, the
+    keywords are compiled into one regex shaped like a trie, which
+    scans for the leftmost-longest keyword. Keywords contained in a match
+    are added from a precomputed table. The scan then resumes at the first
+    offset inside the match where another keyword could start and run past
+    its end (e.g. "pi" for "api" and "pipeline"), or after the match.
+    """
+
+    # Distinct keywords above which the trie regex is used
+    compile_threshold = 256
+
+    def __init__(
+        self,
+        tables: Mapping[str, KeywordTable],
+        compile_threshold: Optional[int] = None
+    ):
+        """
+        Compile keyword tables.
+
+        Args:
+            tables: Table name to either ``{keyword: weight}`` or a list of
+                keywords (weight 1.0 each)
+            compile_threshold: Override the class-level threshold
+        """
+        if compile_threshold is not None:
+            self.compile_threshold = compile_threshold
+
+        self.tables: Dict[str, List[Tuple[str, float]]] = {}
+        for name, keywords in tables.items():
+            if isinstance(keywords, Mapping):
+                entries = [(k.lower(), float(w)) for k, w in keywords.items()]
+            else:
+                entries = [(k.lower(), 1.0) for k in keywords]
+            self.tables[name] = entries
+
+        keywords = {keyword for entries in self.tables.values() for keyword, _ in entries}
+        keywords.discard("")
+        self._keywords = tuple(sorted(keywords))
+        self.compiled = bool(keywords) and len(keywords) > self.compile_threshold
+        if not self.compiled:
+            self._pattern = None
+            return
+
+        # Keywords implied by a match (every keyword it contains)
+        self._contained: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(
+                {keyword[i:j] for i in range(len(keyword))
+                 for j in range(i + 1, len(keyword) + 1)} & keywords
+            )
+            for keyword in keywords
+        }
+        # Where to resume scanning after a match of each keyword
+        prefixes = {k[:j] for k in keywords for j in range(1, len(k))}
+        self._resume: Dict[str, int] = {
+            keyword: self._resume_offset(keyword, prefixes) for keyword in keywords
+        }
+        self._pattern = re.compile(build_trie_pattern(keywords))
+
+    @staticmethod
+    def _resume_offset(keyword: str, prefixes: Set[str]) -> int:
+        """First offset whose suffix is a proper prefix of another keyword."""
+        for i in range(1, len(keyword)):
+            if keyword[i:] in prefixes:
+                return i
+        return len(keyword)
+
+    def scan(self, text: str) -> KeywordHits:
+        """Find all keywords of all tables in ``text`` with one pass."""
+        text = text.lower()
+        if not self.compiled:
+            found = {keyword for keyword in self._keywords if keyword in text}
+            return KeywordHits(found=found, tables=self.tables)
+
+        found: Set[str] = set()
+        seen: Set[str] = set()
+        search = self._pattern.search
+        match = search(text)
+        while match:
+            keyword = match.group()
+            if keyword not in seen:
+                seen.add(keyword)
+                found.update(self._contained[keyword])
+            match = search(text, match.start() + self._resume[keyword])
+        return KeywordHits(found=found, tables=self.tables)
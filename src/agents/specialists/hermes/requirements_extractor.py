@@ -5,8 +5,11 @@ Uses patterns, NLP techniques, and domain knowledge to extract structured requir
 """
 
 import re
+import random
+import zlib
 import logging
-from typing import List, Dict, Tuple, Optional, Set
+from functools import cache, lru_cache
+from typing import List, Dict, Tuple, FrozenSet
 from dataclasses import dataclass
 from enum import Enum
 
@@ -37,6 +40,95 @@ class ExtractedRequirement:
     source_text: str  # Original text this came from
 
 
+_MINHASH_PRIME = (1 << 61) - 1
+
+
+@cache
+def _minhash_coefficients(count: int, seed: int) -> Tuple[Tuple[int, int], ...]:
+    """Random (a, b) pairs for the hash family (a * x + b) mod prime."""
+    # Hash coefficients, not secrets, so a seeded PRNG is what we want
+    rng = random.Random(seed)  # noqa: S311
+    return tuple(
+        (rng.randrange(1, _MINHASH_PRIME), rng.randrange(0, _MINHASH_PRIME))
+        for _ in range(count)
+    )
+
+
+@lru_cache(maxsize=65536)
+def _word_hashes(word: str, count: int, seed: int) -> Tuple[int, ...]:
+    """Hash a word under every function of the family (cached per word)."""
+    h = zlib.crc32(word.encode())
+    return tuple((a * h + b) % _MINHASH_PRIME for a, b in _minhash_coefficients(count, seed))
+
+
+class SignatureIndex:
+    """
+    MinHash index for finding near-duplicate texts without pairwise scans.
+
+    Each text is reduced to its word set and a MinHash signature of it. The
+    signature is cut into bands that act as bucket keys, so texts whose word
+    Jaccard similarity is above the threshold share a bucket with near
+    certainty. Bucket candidates are confirmed with the exact similarity.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, bands: int = 32, seed: int = 1):
+        """
+        Initialize an empty index.
+
+        Args:
+            threshold: Similarity above which texts count as duplicates
+            num_perm: Number of MinHash permutations per signature
+            bands: Number of LSH bands the signature is split into
+            seed: Seed for the permutation coefficients
+        """
+        self.threshold = threshold
+        self.rows = num_perm // bands
+        self.bands = bands
+        self.num_perm = self.rows * bands
+        self.seed = seed
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        self._word_sets: List[FrozenSet[str]] = []
+
+    def __len__(self) -> int:
+        return len(self._word_sets)
+
+    def _band_keys(self, words: FrozenSet[str]) -> List[Tuple[int, Tuple[int, ...]]]:
+        """MinHash the word set and return one bucket key per band."""
+        signature = iter(map(min, zip(*(
+            _word_hashes(word, self.num_perm, self.seed) for word in words
+        ), strict=True)))
+        # Chunk the signature into bands by zipping one shared iterator
+        return list(enumerate(zip(*[signature] * self.rows, strict=False)))
+
+    def add_if_new(self, text: str) -> bool:
+        """
+        Add text unless a near-duplicate is already indexed.
+
+        Args:
+            text: Text to index
+
+        Returns:
+            True if the text was added, False if it is a near-duplicate
+        """
+        words = frozenset(text.lower().split())
+        if not words:
+            # Empty texts are never similar to anything
+            return True
+
+        keys = self._band_keys(words)
+        candidates = set().union(*(self._buckets.get(key, ()) for key in keys))
+        for candidate in candidates:
+            other = self._word_sets[candidate]
+            if len(words & other) / len(words | other) > self.threshold:
+                return False
+
+        position = len(self._word_sets)
+        self._word_sets.append(words)
+        for key in keys:
+            self._buckets.setdefault(key, []).append(position)
+        return True
+
+
 class RequirementsExtractor:
     """Extracts technical requirements from natural language."""
     
@@ -107,44 +199,95 @@ class RequirementsExtractor:
                 "default": ["Processing Pipeline", "Worker Service", "Job Queue"],
             },
         }
+
+        self._compile_patterns()
+
+    def _compile_patterns(self):
+        """Compile all requirement patterns once, plus a combined scanner."""
+        self._patterns: List[Tuple[RequirementType, re.Pattern]] = [
+            (req_type, re.compile(pattern, re.IGNORECASE))
+            for req_type, patterns in self.requirement_patterns.items()
+            for pattern in patterns
+        ]
+        # Alternative p<i> matches wherever pattern i does
+        self._scanner = re.compile(
+            "|".join(f"(?P<p{i}>{pattern.pattern})" for i, (_, pattern) in enumerate(self._patterns)),
+            re.IGNORECASE
+        )
+
+    def _scan(self, text: str) -> List[Tuple[int, re.Match]]:
+        """
+        Find the matches of every requirement pattern in one pass.
+
+        The combined scanner stops at each position where some pattern
+        matches. Patterns that can match there are confirmed individually,
+        and each one resumes after its own last match, so the result equals
+        a separate ``finditer`` per pattern.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            (pattern index, match) pairs in pattern order, then text order
+        """
+        next_start = [0] * len(self._patterns)
+        found = []
+        search = self._scanner.search
+        match = search(text)
+        while match:
+            start = match.start()
+            # Alternatives before the reported one do not match here
+            for i in range(int(match.lastgroup[1:]), len(self._patterns)):
+                if start < next_start[i]:
+                    continue
+                hit = self._patterns[i][1].match(text, start)
+                if hit:
+                    found.append((i, hit))
+                    next_start[i] = hit.end()
+            match = search(text, start + 1)
+
+        found.sort(key=lambda item: (item[0], item[1].start()))
+        return found
     
     def extract_requirements(self, text: str) -> List[ExtractedRequirement]:
         """Extract all technical requirements from text."""
         requirements = []
         text_lower = text.lower()
         
+        seen: Dict[RequirementType, SignatureIndex] = {}
+        
         # Extract requirements by type
-        for req_type, patterns in self.requirement_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-                for match in matches:
-                    # Extract the requirement description
-                    if match.groups():
-                        description = match.group(1).strip()
-                    else:
-                        description = match.group(0).strip()
-                    
-                    # Skip very short matches
-                    if len(description) < 5:
-                        continue
-                    
-                    # Get components for this requirement
-                    components = self._identify_components(req_type, description)
-                    
-                    # Calculate confidence based on pattern match quality
-                    confidence = self._calculate_confidence(description, match)
-                    
-                    requirement = ExtractedRequirement(
-                        type=req_type,
-                        description=self._clean_description(description),
-                        components=components,
-                        confidence=confidence,
-                        source_text=match.group(0)
-                    )
-                    
-                    # Avoid duplicates
-                    if not self._is_duplicate(requirement, requirements):
-                        requirements.append(requirement)
+        for index, match in self._scan(text_lower):
+            req_type = self._patterns[index][0]
+            
+            # Extract the requirement description
+            if match.groups():
+                description = match.group(1).strip()
+            else:
+                description = match.group(0).strip()
+            
+            # Skip very short matches
+            if len(description) < 5:
+                continue
+            
+            # Get components for this requirement
+            components = self._identify_components(req_type, description)
+            
+            # Calculate confidence based on pattern match quality
+            confidence = self._calculate_confidence(description, match)
+            
+            requirement = ExtractedRequirement(
+                type=req_type,
+                description=self._clean_description(description),
+                components=components,
+                confidence=confidence,
+                source_text=match.group(0)
+            )
+            
+            # Avoid near-duplicates of the same type
+            index_for_type = seen.setdefault(req_type, SignatureIndex(threshold=0.8))
+            if index_for_type.add_if_new(requirement.description):
+                requirements.append(requirement)
         
         # Extract implicit requirements
         requirements.extend(self._extract_implicit_requirements(text))
@@ -201,28 +344,6 @@ class RequirementsExtractor:
         
         return description
     
-    def _is_duplicate(self, req: ExtractedRequirement, existing: List[ExtractedRequirement]) -> bool:
-        """Check if requirement is duplicate of existing ones."""
-        for existing_req in existing:
-            # Same type and similar description
-            if (existing_req.type == req.type and 
-                self._similarity(existing_req.description, req.description) > 0.8):
-                return True
-        return False
-    
-    def _similarity(self, text1: str, text2: str) -> float:
-        """Calculate simple text similarity (0.0 to 1.0)."""
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        return len(intersection) / len(union)
-    
     def _extract_implicit_requirements(self, text: str) -> List[ExtractedRequirement]:
         """Extract requirements that are implied but not explicitly stated."""
         implicit_reqs = []
@@ -0,0 +1,423 @@
+"""
+Persistent session store for Hermes conversations.
+
+Sessions are kept in SQLite: one summary row per session (indexed by user,
+intent bucket and last activity), plus append-only message and intent
+snapshot rows. Each turn writes only what changed since the previous save,
+and a bounded LRU keeps recently used ``ConversationState`` objects in
+memory while the rest are loaded on demand.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    user_id TEXT,
+    created_at TEXT NOT NULL,
+    last_activity TEXT NOT NULL,
+    turn_count INTEGER NOT NULL DEFAULT 0,
+    intent_bucket TEXT,
+    specific_type TEXT,
+    confidence REAL NOT NULL DEFAULT 0.0,
+    ready_for_handoff INTEGER NOT NULL DEFAULT 0,
+    user_context TEXT NOT NULL DEFAULT '{}',
+    project_requirements TEXT NOT NULL DEFAULT '{}',
+    intent_metadata TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_user ON sessions (user_id, last_activity);
+CREATE INDEX IF NOT EXISTS idx_sessions_intent ON sessions (intent_bucket, last_activity);
+CREATE INDEX IF NOT EXISTS idx_sessions_activity ON sessions (last_activity);
+
+CREATE TABLE IF NOT EXISTS session_messages (
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    timestamp TEXT,
+    turn INTEGER,
+    PRIMARY KEY (session_id, seq)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS session_intents (
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    turn INTEGER NOT NULL,
+    bucket TEXT NOT NULL,
+    specific_type TEXT,
+    confidence REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    user_input TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (session_id, seq)
+) WITHOUT ROWID;
+"""
+
+SESSION_UPSERT = """
+INSERT INTO sessions (
+    session_id, user_id, created_at, last_activity, turn_count, intent_bucket,
+    specific_type, confidence, ready_for_handoff, user_context,
+    project_requirements, intent_metadata
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(session_id) DO UPDATE SET
+    user_id = excluded.user_id,
+    last_activity = excluded.last_activity,
+    turn_count = excluded.turn_count,
+    intent_bucket = excluded.intent_bucket,
+    specific_type = excluded.specific_type,
+    confidence = excluded.confidence,
+    ready_for_handoff = excluded.ready_for_handoff,
+    user_context = excluded.user_context,
+    project_requirements = excluded.project_requirements,
+    intent_metadata = excluded.intent_metadata
+"""
+
+
+class HermesSessionStore:
+    """
+    SQLite-backed Hermes session store with an in-memory LRU.
+
+    The store is agnostic of which Hermes variant owns it: ``state_factory``
+    is the ``ConversationState`` class to rebuild sessions with. It may be
+    shared across threads (e.g. by a web server's worker threads).
+
+    The default ``":memory:"`` database lives only as long as the store, so
+    sessions are not persistent unless a file path is given (the Hermes
+    agents read it from ``HERMES_SESSION_DB``).
+    """
+
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        state_factory: Optional[Callable[..., Any]] = None,
+        max_cached: int = 256,
+        idle_timeout: float = 1800.0
+    ):
+        """
+        Open (or create) a session store.
+
+        Args:
+            db_path: SQLite database path, or ":memory:" for a store that
+                is discarded with the process
+            state_factory: ConversationState class used to build sessions
+            max_cached: Maximum sessions kept in memory
+            idle_timeout: Seconds after which an unused session is evicted
+        """
+        self.db_path = db_path
+        self.state_factory = state_factory
+        self.max_cached = max_cached
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        if db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+        # session_id -> state, least recently used first
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        # Every state still referenced anywhere, so a session evicted while a
+        # caller holds it (e.g. mid-turn) is reused instead of loaded twice
+        self._live: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+        self._last_used: Dict[str, float] = {}
+        # session_id -> (messages, intent snapshots) already written
+        self._persisted: Dict[str, Tuple[int, int]] = {}
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            if session_id in self._cache:
+                return True
+            row = self.conn.execute(
+                "SELECT 1 FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    @property
+    def cached(self) -> List[str]:
+        """Session ids currently held in memory, least recently used first."""
+        return list(self._cache)
+
+    def create(self, user_id: Optional[str] = None) -> Any:
+        """
+        Start a new session and write its summary row.
+
+        Args:
+            user_id: Optional user the session belongs to
+
+        Returns:
+            The new ConversationState
+        """
+        state = self.state_factory()
+        if user_id is not None:
+            state.user_context["user_id"] = user_id
+
+        self._persisted[state.session_id] = (0, 0)
+        self.save_turn(state)
+        return state
+
+    def get(self, session_id: str) -> Optional[Any]:
+        """
+        Get a session, loading it from the database if it is not cached.
+
+        Args:
+            session_id: Session to fetch
+
+        Returns:
+            The ConversationState, or None if the session does not exist
+        """
+        with self._lock:
+            state = self._cache.get(session_id)
+            if state is None:
+                state = self._live.get(session_id)
+            if state is None:
+                state = self._load(session_id)
+                if state is None:
+                    return None
+            self._touch(state)
+            return state
+
+    def save_turn(self, state: Any):
+        """
+        Persist what changed in a session since it was last saved.
+
+        New messages and intent snapshots are appended; the summary row is
+        rewritten. Everything is committed in one transaction.
+
+        Args:
+            state: Session to save
+        """
+        with self._lock:
+            session_id = state.session_id
+            saved_messages, saved_intents = self._persisted_counts(session_id)
+            intent_state = state.intent_state
+
+            new_messages = [
+                (session_id, seq, msg["role"], msg["content"], msg.get("timestamp"), msg.get("turn"))
+                for seq, msg in enumerate(state.messages[saved_messages:], start=saved_messages)
+            ]
+            new_intents = [
+                (
+                    session_id, seq, snapshot.turn, snapshot.bucket.value,
+                    snapshot.specific_type, snapshot.confidence,
+                    snapshot.timestamp.isoformat(), snapshot.user_input
+                )
+                for seq, snapshot in enumerate(
+                    intent_state.evolution[saved_intents:], start=saved_intents
+                )
+            ]
+
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO session_messages VALUES (?, ?, ?, ?, ?, ?)",
+                    new_messages
+                )
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO session_intents VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    new_intents
+                )
+                self.conn.execute(SESSION_UPSERT, (
+                    session_id,
+                    state.user_context.get("user_id"),
+                    state.created_at.isoformat(),
+                    datetime.now().isoformat(),
+                    state.turn_count,
+                    intent_state.current_bucket.value,
+                    intent_state.specific_type,
+                    intent_state.confidence,
+                    int(state.ready_for_handoff),
+                    json.dumps(state.user_context, default=str),
+                    json.dumps(state.project_requirements, default=str),
+                    json.dumps(intent_state.metadata, default=str)
+                ))
+
+            self._persisted[session_id] = (len(state.messages), len(intent_state.evolution))
+            self._touch(state)
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        intent: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Summarize sessions from the index without loading them.
+
+        Args:
+            user_id: Only sessions of this user
+            intent: Only sessions whose current intent bucket has this value
+            since: Only sessions active at or after this time
+            limit: Maximum number of sessions to return
+
+        Returns:
+            Session summaries, most recently active first
+        """
+        clauses, params = [], []
+        if user_id is not None:
+            clauses.append("user_id = ?")
+            params.append(user_id)
+        if intent is not None:
+            clauses.append("intent_bucket = ?")
+            params.append(intent)
+        if since is not None:
+            clauses.append("last_activity >= ?")
+            params.append(since.isoformat())
+
+        query = (
+            "SELECT session_id, user_id, created_at, last_activity, turn_count, "
+            "intent_bucket, confidence, ready_for_handoff FROM sessions"
+        )
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY last_activity DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self.conn.execute(query, params).fetchall()
+
+        return [
+            {
+                "session_id": row["session_id"],
+                "user_id": row["user_id"],
+                "created_at": row["created_at"],
+                "last_activity": row["last_activity"],
+                "turn_count": row["turn_count"],
+                "intent": row["intent_bucket"],
+                "confidence": row["confidence"],
+                "ready_for_handoff": bool(row["ready_for_handoff"])
+            }
+            for row in rows
+        ]
+
+    def evict_idle(self) -> int:
+        """
+        Drop sessions unused for longer than ``idle_timeout`` from memory.
+
+        Returns:
+            Number of sessions evicted
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        evicted = 0
+        with self._lock:
+            while self._cache:
+                session_id = next(iter(self._cache))
+                if self._last_used[session_id] > cutoff:
+                    break
+                self._evict(session_id)
+                evicted += 1
+        return evicted
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._cache.clear()
+            self._live.clear()
+            self._last_used.clear()
+            self._persisted.clear()
+            self.conn.close()
+
+    def _touch(self, state: Any):
+        """Mark a session as most recently used and enforce the bounds."""
+        session_id = state.session_id
+        self._cache[session_id] = state
+        self._cache.move_to_end(session_id)
+        self._live[session_id] = state
+        self._last_used[session_id] = time.monotonic()
+
+        while len(self._cache) > self.max_cached:
+            self._evict(next(iter(self._cache)))
+        self.evict_idle()
+
+    def _evict(self, session_id: str):
+        """Drop a cached session's strong reference; it is already persisted."""
+        self._cache.pop(session_id, None)
+        self._last_used.pop(session_id, None)
+        self._persisted.pop(session_id, None)
+
+    def _persisted_counts(self, session_id: str) -> Tuple[int, int]:
+        """Messages and snapshots already stored for a session."""
+        counts = self._persisted.get(session_id)
+        if counts is None:
+            counts = (
+                self.conn.execute(
+                    "SELECT COUNT(*) FROM session_messages WHERE session_id = ?", (session_id,)
+                ).fetchone()[0],
+                self.conn.execute(
+                    "SELECT COUNT(*) FROM session_intents WHERE session_id = ?", (session_id,)
+                ).fetchone()[0]
+            )
+        return counts
+
+    def _load(self, session_id: str) -> Optional[Any]:
+        """Rebuild a ConversationState from its stored rows."""
+        row = self.conn.execute(
+            "SELECT * FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        state = self.state_factory(
+            session_id=session_id,
+            created_at=datetime.fromisoformat(row["created_at"]),
+            turn_count=row["turn_count"],
+            user_context=json.loads(row["user_context"]),
+            project_requirements=json.loads(row["project_requirements"]),
+            ready_for_handoff=bool(row["ready_for_handoff"])
+        )
+        state.messages = [
+            {
+                "role": msg["role"],
+                "content": msg["content"],
+                "timestamp": msg["timestamp"],
+                "turn": msg["turn"]
+            }
+            for msg in self.conn.execute(
+                "SELECT role, content, timestamp, turn FROM session_messages "
+                "WHERE session_id = ? ORDER BY seq",
+                (session_id,)
+            )
+        ]
+
+        # Replay the intent history through the state's own update()
+        intent_state = state.intent_state
+        bucket_type = type(intent_state.current_bucket)
+        for snapshot in self.conn.execute(
+            "SELECT turn, bucket, specific_type, confidence, timestamp, user_input "
+            "FROM session_intents WHERE session_id = ? ORDER BY seq",
+            (session_id,)
+        ):
+            intent_state.update(
+                turn=snapshot["turn"],
+                bucket=bucket_type(snapshot["bucket"]),
+                specific_type=snapshot["specific_type"],
+                confidence=snapshot["confidence"],
+                user_input=snapshot["user_input"]
+            )
+            intent_state.evolution[-1].timestamp = datetime.fromisoformat(snapshot["timestamp"])
+
+        if row["intent_bucket"] is not None:
+            intent_state.current_bucket = bucket_type(row["intent_bucket"])
+        intent_state.specific_type = row["specific_type"]
+        intent_state.confidence = row["confidence"]
+        intent_state.metadata = json.loads(row["intent_metadata"])
+
+        self._persisted[session_id] = (len(state.messages), len(intent_state.evolution))
+        return state
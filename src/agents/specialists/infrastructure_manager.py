@@ -9,6 +9,8 @@ import json
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 
+from .template_engine import memoized_render
+
 
 @dataclass
 class InfrastructureSpec:
@@ -60,6 +62,7 @@ class InfrastructureManager:
         self.supported_providers = ['aws', 'gcp', 'azure']
         self.supported_tools = ['terraform', 'cloudformation', 'ansible', 'pulumi']
         
+    @memoized_render
     def generate_infrastructure(self, spec: InfrastructureSpec) -> Dict[str, str]:
         """Generate complete infrastructure configuration"""
         configs = {}
@@ -11,6 +11,11 @@ import textwrap
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 
+from .template_engine import memoized_render
+
+# libyaml emitter when available; same output as the pure-Python one
+YAML_DUMPER = getattr(yaml, 'CDumper', yaml.Dumper)
+
 
 @dataclass
 class MonitoringSpec:
@@ -65,6 +70,7 @@ class MonitoringManager:
         self.supported_backends = ['prometheus', 'datadog', 'cloudwatch', 'newrelic']
         self.supported_log_backends = ['elasticsearch', 'cloudwatch', 'splunk']
         
+    @memoized_render
     def generate_monitoring_stack(self, spec: MonitoringSpec) -> Dict[str, str]:
         """Generate complete monitoring stack configuration"""
         configs = {}
@@ -310,7 +316,7 @@ remote_write:
             }
             rules_yaml['groups'][0]['rules'].append(rule)
             
-        return yaml.dump(rules_yaml, default_flow_style=False)
+        return yaml.dump(rules_yaml, Dumper=YAML_DUMPER, default_flow_style=False)
         
     def _generate_overview_dashboard(self, spec: MonitoringSpec) -> str:
         """Generate Grafana overview dashboard"""
@@ -637,7 +643,7 @@ datasources:
             }]
         config['receivers'].append(warning_receiver)
         
-        return yaml.dump(config, default_flow_style=False)
+        return yaml.dump(config, Dumper=YAML_DUMPER, default_flow_style=False)
         
     def _generate_fluentbit_config(self, spec: MonitoringSpec) -> str:
         """Generate Fluent Bit configuration"""
@@ -7,7 +7,9 @@ Specializes in automated testing, bug detection, quality assurance, and team col
 import asyncio
 import json
 import logging
+import os
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
 from enum import Enum
@@ -29,9 +31,132 @@ from .bug_detector import (
     BugDetectionEngine, BugReport, BugSeverity, BugCategory,
     BugAnalysisResult, PythonBugDetector, JavaScriptBugDetector
 )
+from .analysis_cache import AnalysisCache, content_hash, version_hash
 
 logger = logging.getLogger(__name__)
 
+# Cache of analysis results and LLM reviews; point QA_ANALYSIS_CACHE_PATH at
+# a file to keep it across restarts and share it between QA agents
+DEFAULT_ANALYSIS_CACHE_PATH = os.environ.get("QA_ANALYSIS_CACHE_PATH", ":memory:")
+
+CODE_REVIEW_PROMPT = """
+        As Alex Thompson, a detail-oriented QA Engineer, review this code:
+        
+        {description}
+        
+        Provide a thorough quality assessment covering:
+        1. Code quality and maintainability
+        2. Potential bugs and edge cases
+        3. Security vulnerabilities
+        4. Performance considerations
+        5. Testing gaps and recommendations
+        6. Compliance with best practices
+        
+        Be specific about issues found and provide actionable recommendations.
+        """
+
+BUG_DETECTION_GUIDANCE_PROMPT = """
+        As Alex Thompson, a methodical QA Engineer, provide guidance on this bug detection request:
+        
+        {description}
+        
+        Since no code was provided, give advice on:
+        1. What types of bugs to look for in this context
+        2. Testing strategies to find issues
+        3. Tools and techniques for bug detection
+        4. Common pitfalls to avoid
+        5. Quality checkpoints to implement
+        
+        Be specific and actionable in your recommendations.
+        """
+
+# Generation settings per cached prompt; the prompt version covers them so
+# changing a template or its settings invalidates earlier outputs
+CODE_REVIEW_SETTINGS = {"max_tokens": 1000, "temperature": 0.2}
+BUG_DETECTION_GUIDANCE_SETTINGS = {"max_tokens": 800, "temperature": 0.4}
+CODE_REVIEW_PROMPT_VERSION = version_hash(CODE_REVIEW_PROMPT, sorted(CODE_REVIEW_SETTINGS.items()))
+BUG_DETECTION_GUIDANCE_PROMPT_VERSION = version_hash(
+    BUG_DETECTION_GUIDANCE_PROMPT, sorted(BUG_DETECTION_GUIDANCE_SETTINGS.items())
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_bug_detection_description(description: str) -> Dict[str, Any]:
+    """Parse a bug detection request; memoized since review cycles resend the same text."""
+    
+    description_lower = description.lower()
+    
+    # Detect if code is provided
+    has_code = any(keyword in description_lower for keyword in [
+        "def ", "function", "class ", "import", "from ", "const ", "let ", "var ",
+        "```", "public class", "private ", "public ", "static "
+    ])
+    
+    # Extract code if present
+    code = ""
+    if has_code:
+        # Try to extract code blocks first
+        code_blocks = re.findall(r'```[\w]*\n(.*?)\n```', description, re.DOTALL)
+        if code_blocks:
+            code = code_blocks[0]
+        else:
+            # Look for code patterns and extract larger chunks
+            lines = description.split('\n')
+            code_lines = []
+            in_code = False
+            
+            for line in lines:
+                if any(keyword in line.lower() for keyword in ["def ", "function", "class ", "import"]):
+                    in_code = True
+                
+                if in_code:
+                    code_lines.append(line)
+                    
+            if code_lines:
+                code = '\n'.join(code_lines)
+            else:
+                # Fallback: assume entire description is code if keywords found
+                code = description
+    
+    # Detect programming language
+    language = "python"  # Default
+    if any(keyword in description_lower for keyword in ["javascript", "js", "react", "node", "const ", "let "]):
+        language = "javascript"
+    elif any(keyword in description_lower for keyword in ["typescript", "ts"]):
+        language = "typescript"
+    elif any(keyword in description_lower for keyword in ["java", "public class"]):
+        language = "java"
+    elif any(keyword in description_lower for keyword in ["python", "py", "def ", "import"]):
+        language = "python"
+    elif any(keyword in description_lower for keyword in ["c#", "csharp", "using system"]):
+        language = "csharp"
+    
+    # Detect specific bug categories to focus on
+    categories = []
+    if any(keyword in description_lower for keyword in ["security", "vulnerability", "injection", "xss"]):
+        categories.append(BugCategory.SECURITY)
+    if any(keyword in description_lower for keyword in ["performance", "slow", "optimization", "memory"]):
+        categories.append(BugCategory.PERFORMANCE)
+    if any(keyword in description_lower for keyword in ["logic", "bug", "error", "issue"]):
+        categories.append(BugCategory.LOGIC)
+    if any(keyword in description_lower for keyword in ["quality", "maintainability", "refactor"]):
+        categories.append(BugCategory.CODE_QUALITY)
+    
+    # Extract file path if mentioned
+    file_path = None
+    file_match = re.search(r'file[:\s]+([^\s,]+)', description_lower)
+    if file_match:
+        file_path = file_match.group(1)
+    
+    return {
+        "has_code": has_code,
+        "code": code,
+        "language": language,
+        "categories": categories if categories else None,
+        "file_path": file_path,
+        "description": description
+    }
+
 
 class QATaskType(Enum):
     """Extended task types specific to QA Engineering."""
@@ -173,6 +298,7 @@ class QAAgent(MonitoringAgent):
         agent_id: str = "alex_thompson",
         name: str = "Alex Thompson",
         config: Optional[AgentConfig] = None,
+        analysis_cache: Optional[AnalysisCache] = None,
         **kwargs
     ):
         # Initialize with QA-specific configuration
@@ -234,11 +360,18 @@ class QAAgent(MonitoringAgent):
         # Initialize test generation engine
         self.test_generator = TestGenerator()
         
+        # Analysis results and LLM reviews are cached by content hash and
+        # analyzer/prompt version, so review cycles only pay for changed code.
+        # Outputs of older prompt versions are never served and age out of
+        # the cache instead of being deleted on every construction.
+        self.analysis_cache = analysis_cache or AnalysisCache(DEFAULT_ANALYSIS_CACHE_PATH)
+        
         # Initialize bug detection engine
-        self.bug_detector = BugDetectionEngine()
+        self.bug_detector = BugDetectionEngine(cache=self.analysis_cache)
         
         # Initialize message queue for team collaboration
-        self.message_queue = MessageQueue()
+        if self.message_queue is None:
+            self.message_queue = MessageQueue()
         
         # Set up collaboration topics and handlers
         self.collaboration_topics = [
@@ -354,41 +487,22 @@ class QAAgent(MonitoringAgent):
         # Analyze code review complexity
         complexity = self._assess_code_review_complexity(description)
         
-        prompt = f"""
-        As Alex Thompson, a detail-oriented QA Engineer, review this code:
-        
-        {description}
-        
-        Provide a thorough quality assessment covering:
-        1. Code quality and maintainability
-        2. Potential bugs and edge cases
-        3. Security vulnerabilities
-        4. Performance considerations
-        5. Testing gaps and recommendations
-        6. Compliance with best practices
-        
-        Be specific about issues found and provide actionable recommendations.
-        """
-        
-        llm_response = await llm_integration.generate(
-            prompt=prompt,
-            agent_id=self.agent_id,
-            task_type=TaskType.CODE_REVIEW,
-            complexity=complexity,
-            max_tokens=1000,
-            temperature=0.2,  # Very low temperature for consistent reviews
+        # Very low temperature for consistent reviews
+        review = await self._cached_llm_review(
+            "code_review", CODE_REVIEW_PROMPT, CODE_REVIEW_PROMPT_VERSION, description,
+            complexity=complexity, **CODE_REVIEW_SETTINGS
         )
         
         # Update collaboration metrics
         self.team_interactions["marcus_chen"]["reviews_requested"] += 1
         
         return {
-            "review": llm_response.content,
+            "review": review,
             "complexity": complexity,
-            "quality_score": self._calculate_quality_score(llm_response.content),
-            "action_items": self._extract_action_items(llm_response.content),
+            "quality_score": self._calculate_quality_score(review),
+            "action_items": self._extract_action_items(review),
             "success": True,
-            "response": llm_response.content
+            "response": review
         }
 
     async def handle_qa_specific_task(self, qa_task_type: QATaskType, description: str) -> Dict[str, Any]:
@@ -1274,109 +1388,22 @@ class QAAgent(MonitoringAgent):
     async def _parse_bug_detection_request(self, description: str) -> Dict[str, Any]:
         """Parse bug detection request to understand what analysis is needed."""
         
-        description_lower = description.lower()
-        
-        # Detect if code is provided
-        has_code = any(keyword in description_lower for keyword in [
-            "def ", "function", "class ", "import", "from ", "const ", "let ", "var ",
-            "```", "public class", "private ", "public ", "static "
-        ])
-        
-        # Extract code if present
-        code = ""
-        if has_code:
-            # Try to extract code blocks first
-            code_blocks = re.findall(r'```[\w]*\n(.*?)\n```', description, re.DOTALL)
-            if code_blocks:
-                code = code_blocks[0]
-            else:
-                # Look for code patterns and extract larger chunks
-                lines = description.split('\n')
-                code_lines = []
-                in_code = False
-                
-                for line in lines:
-                    if any(keyword in line.lower() for keyword in ["def ", "function", "class ", "import"]):
-                        in_code = True
-                    
-                    if in_code:
-                        code_lines.append(line)
-                        
-                if code_lines:
-                    code = '\n'.join(code_lines)
-                else:
-                    # Fallback: assume entire description is code if keywords found
-                    code = description
-        
-        # Detect programming language
-        language = "python"  # Default
-        if any(keyword in description_lower for keyword in ["javascript", "js", "react", "node", "const ", "let "]):
-            language = "javascript"
-        elif any(keyword in description_lower for keyword in ["typescript", "ts"]):
-            language = "typescript"
-        elif any(keyword in description_lower for keyword in ["java", "public class"]):
-            language = "java"
-        elif any(keyword in description_lower for keyword in ["python", "py", "def ", "import"]):
-            language = "python"
-        elif any(keyword in description_lower for keyword in ["c#", "csharp", "using system"]):
-            language = "csharp"
-        
-        # Detect specific bug categories to focus on
-        categories = []
-        if any(keyword in description_lower for keyword in ["security", "vulnerability", "injection", "xss"]):
-            categories.append(BugCategory.SECURITY)
-        if any(keyword in description_lower for keyword in ["performance", "slow", "optimization", "memory"]):
-            categories.append(BugCategory.PERFORMANCE)
-        if any(keyword in description_lower for keyword in ["logic", "bug", "error", "issue"]):
-            categories.append(BugCategory.LOGIC)
-        if any(keyword in description_lower for keyword in ["quality", "maintainability", "refactor"]):
-            categories.append(BugCategory.CODE_QUALITY)
-        
-        # Extract file path if mentioned
-        file_path = None
-        file_match = re.search(r'file[:\s]+([^\s,]+)', description_lower)
-        if file_match:
-            file_path = file_match.group(1)
-        
-        return {
-            "has_code": has_code,
-            "code": code,
-            "language": language,
-            "categories": categories if categories else None,
-            "file_path": file_path,
-            "description": description
-        }
+        config = _parse_bug_detection_description(description)
+        # Copy so callers cannot change the memoized result
+        return {**config, "categories": list(config["categories"]) if config["categories"] else None}
     
     async def _provide_bug_detection_guidance(self, description: str) -> Dict[str, Any]:
         """Provide bug detection guidance when no code is provided."""
         
         # Use LLM to provide general guidance
-        prompt = f"""
-        As Alex Thompson, a methodical QA Engineer, provide guidance on this bug detection request:
-        
-        {description}
-        
-        Since no code was provided, give advice on:
-        1. What types of bugs to look for in this context
-        2. Testing strategies to find issues
-        3. Tools and techniques for bug detection
-        4. Common pitfalls to avoid
-        5. Quality checkpoints to implement
-        
-        Be specific and actionable in your recommendations.
-        """
-        
-        llm_response = await llm_integration.generate(
-            prompt=prompt,
-            agent_id=self.agent_id,
-            task_type=TaskType.CODE_REVIEW,
-            complexity=5,
-            max_tokens=800,
-            temperature=0.4,
+        guidance = await self._cached_llm_review(
+            "bug_detection_guidance", BUG_DETECTION_GUIDANCE_PROMPT,
+            BUG_DETECTION_GUIDANCE_PROMPT_VERSION, description,
+            complexity=5, **BUG_DETECTION_GUIDANCE_SETTINGS
         )
         
         return {
-            "guidance": llm_response.content,
+            "guidance": guidance,
             "suggested_actions": [
                 "Provide code for specific bug analysis",
                 "Use static analysis tools",
@@ -1384,9 +1411,37 @@ class QAAgent(MonitoringAgent):
                 "Set up continuous quality monitoring"
             ],
             "success": True,
-            "response": llm_response.content
+            "response": guidance
         }
     
+    async def _cached_llm_review(
+        self,
+        kind: str,
+        template: str,
+        version: str,
+        description: str,
+        complexity: int,
+        max_tokens: int,
+        temperature: float
+    ) -> str:
+        """Generate an LLM review of ``description``, reusing earlier output for unchanged input."""
+        key = content_hash(description)
+        cached = self.analysis_cache.get(kind, key, version)
+        if cached is not None:
+            self.logger.debug(f"Reusing cached {kind} output")
+            return cached
+        
+        llm_response = await llm_integration.generate(
+            prompt=template.format(description=description),
+            agent_id=self.agent_id,
+            task_type=TaskType.CODE_REVIEW,
+            complexity=complexity,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        self.analysis_cache.put(kind, key, version, llm_response.content)
+        return llm_response.content
+    
     async def _format_bug_analysis_response(self, analysis_result: BugAnalysisResult, config: Dict[str, Any]) -> str:
         """Format bug analysis results with Alex's personality."""
         
@@ -0,0 +1,196 @@
+"""
+Shared template engine for the code generators.
+
+Templates are parsed once when they are defined instead of on every render,
+generator outputs are memoized by a hash of the spec they were rendered
+from, and multi-file outputs can be written out file by file, to a
+directory or as a streamed tar archive, without building the bundle in
+memory first.
+"""
+
+import hashlib
+import io
+import os
+import tarfile
+import threading
+from collections import OrderedDict
+from functools import wraps
+from string import Formatter
+from typing import Any, BinaryIO, Callable, Mapping, Optional, Tuple, Union
+
+
+class CompiledTemplate:
+    """
+    A ``str.format`` template parsed once into literal text and fields.
+
+    Rendering joins the pre-split segments instead of re-parsing the
+    template, which matters for the large scaffold templates.
+    """
+
+    def __init__(self, source: str):
+        """
+        Compile a template.
+
+        Args:
+            source: Template text in ``str.format`` syntax; fields must be
+                plain names, e.g. ``{title}`` or ``{count:>4}``
+        """
+        self.source = source
+        self._segments: Tuple[Tuple[str, Optional[str], Optional[str], str], ...] = tuple(
+            (literal, field, conversion, spec or "")
+            for literal, field, spec, conversion in Formatter().parse(source)
+        )
+        for _, field, _, _ in self._segments:
+            if field is not None and not field.isidentifier():
+                raise ValueError(f"Unsupported template field: {{{field}}}")
+        self.fields = frozenset(field for _, field, _, _ in self._segments if field is not None)
+        # Templates without fields always render to the same text
+        self._static = None if self.fields else "".join(segment[0] for segment in self._segments)
+
+    def render(self, **context: Any) -> str:
+        """Render the template with the given field values."""
+        if self._static is not None:
+            return self._static
+
+        parts = []
+        for literal, field, conversion, spec in self._segments:
+            parts.append(literal)
+            if field is None:
+                continue
+            value = context[field]
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "a":
+                value = ascii(value)
+            parts.append(format(value, spec) if spec or not isinstance(value, str) else value)
+        return "".join(parts)
+
+
+def spec_hash(*parts: Any) -> str:
+    """
+    Stable hash of a generator spec.
+
+    Specs are dataclasses, enums and builtin containers, whose reprs are
+    deterministic and cover every field.
+    """
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """Thread-safe LRU cache of rendered generator outputs."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached output for a key, or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any):
+        """Cache an output, evicting the least recently used beyond ``maxsize``."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached output."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+# Outputs shared by every generator instance in the process
+render_cache = RenderCache()
+
+
+def memoized_render(method: Callable) -> Callable:
+    """
+    Memoize a generator method by a hash of its arguments.
+
+    The method's output must depend only on its arguments, not on instance
+    state. Multi-file outputs are returned as fresh dicts so callers can
+    add to them without touching the cached copy.
+    """
+    name = method.__qualname__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = spec_hash(name, args, kwargs)
+        output = render_cache.get(key)
+        if output is None:
+            output = method(self, *args, **kwargs)
+            render_cache.put(key, output)
+        return dict(output) if isinstance(output, dict) else output
+
+    return wrapper
+
+
+def write_bundle(
+    files: Mapping[str, str],
+    destination: Union[str, BinaryIO],
+    compress: bool = True
+) -> int:
+    """
+    Write a multi-file generator output, one file at a time.
+
+    Args:
+        files: Relative path -> file content, as returned by the generators
+        destination: Directory to write into, a ``.tar``/``.tar.gz``/``.tgz``
+            path, or a binary stream to write a tar archive to
+        compress: Gzip the archive when writing to a stream
+
+    Returns:
+        Number of content bytes written
+    """
+    if isinstance(destination, str) and not destination.endswith((".tar", ".tar.gz", ".tgz")):
+        total = 0
+        root = os.path.abspath(destination)
+        for relative_path, content in files.items():
+            path = os.path.abspath(os.path.join(root, relative_path))
+            if os.path.commonpath([root, path]) != root:
+                raise ValueError(f"Bundle path escapes destination: {relative_path}")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = content.encode("utf-8")
+            with open(path, "wb") as f:
+                f.write(data)
+            total += len(data)
+        return total
+
+    if isinstance(destination, str):
+        mode = "w:gz" if destination.endswith((".gz", ".tgz")) else "w"
+        with tarfile.open(destination, mode) as archive:
+            return _write_tar(archive, files)
+
+    # Stream mode writes members as they come without seeking back
+    with tarfile.open(fileobj=destination, mode="w|gz" if compress else "w|") as archive:
+        return _write_tar(archive, files)
+
+
+def _write_tar(archive: tarfile.TarFile, files: Mapping[str, str]) -> int:
+    """Add files to an archive with fixed metadata, so equal bundles have identical members."""
+    total = 0
+    for relative_path, content in files.items():
+        data = content.encode("utf-8")
+        info = tarfile.TarInfo(relative_path)
+        info.size = len(data)
+        info.mode = 0o644
+        info.mtime = 0
+        archive.addfile(info, io.BytesIO(data))
+        total += len(data)
+    return total
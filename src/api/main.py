@@ -3,8 +3,10 @@ FastAPI application for AIOSv3 platform.
 Provides REST API endpoints for interacting with agents.
 """
 
+import json
 import logging
 import os
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from typing import Any
 
@@ -12,6 +14,7 @@ import uvicorn
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 # Load environment variables from .env file
@@ -19,6 +22,7 @@ load_dotenv()
 
 from src.agents.base.agent import Task
 from src.agents.specialists.cto_agent import CTOAgent
+from src.agents.specialists.hermes.hermes_with_llm import HermesWithLLM
 from src.core.routing.llm_client import llm_factory
 from src.core.routing.router import LLMRouter
 
@@ -31,6 +35,7 @@ logger = logging.getLogger(__name__)
 # Global agents registry
 agents_registry = {}
 llm_router = None
+hermes_agent = None
 
 
 @asynccontextmanager
@@ -49,6 +54,10 @@ async def lifespan(app: FastAPI):
     agents_registry["cto"] = cto_agent
     await cto_agent.start()
 
+    # Create Hermes (its LLM router is initialized on first use)
+    global hermes_agent
+    hermes_agent = HermesWithLLM()
+
     logger.info("AIOSv3 platform started successfully")
 
     yield
@@ -132,6 +141,25 @@ class ChatResponse(BaseModel):
     follow_up_actions: list[str] = []
 
 
+class HermesMessage(BaseModel):
+    """Request model for a Hermes conversation turn."""
+
+    message: str
+    session_id: str | None = None
+    user_id: str | None = None
+
+
+class HermesResponse(BaseModel):
+    """Response model for a Hermes conversation turn."""
+
+    response: str
+    session_id: str
+    intent: str
+    confidence: float
+    ready_for_handoff: bool
+    project_requirements: dict[str, Any] = {}
+
+
 # Dependency to get agents
 def get_agent(agent_id: str):
     """Get an agent by ID."""
@@ -169,7 +197,7 @@ async def list_agents():
             name=agent.name,
             is_active=agent.is_active,
             capabilities=agent.capabilities,
-            tasks_completed=len(agent.task_history),
+            tasks_completed=agent.task_history.total,
         )
         for agent_id, agent in agents_registry.items()
     ]
@@ -184,7 +212,7 @@ async def get_agent_status(agent_id: str):
         name=agent.name,
         is_active=agent.is_active,
         capabilities=agent.capabilities,
-        tasks_completed=len(agent.task_history),
+        tasks_completed=agent.task_history.total,
     )
 
 
@@ -223,7 +251,7 @@ async def get_agent_tasks(agent_id: str, limit: int = 10):
     """Get recent tasks for an agent."""
     agent = get_agent(agent_id)
 
-    recent_tasks = agent.task_history[-limit:] if agent.task_history else []
+    recent_tasks = agent.task_history.recent(limit)
 
     return [
         {
@@ -274,6 +302,95 @@ async def chat_with_cto(message: ChatMessage):
     )
 
 
+def get_hermes() -> HermesWithLLM:
+    """Get the Hermes concierge agent."""
+    if hermes_agent is None:
+        raise HTTPException(status_code=503, detail="Hermes is not initialized")
+    return hermes_agent
+
+
+def hermes_turn_summary(state) -> dict[str, Any]:
+    """Summarize a Hermes conversation state after a turn."""
+    return {
+        "session_id": state.session_id,
+        "intent": state.intent_state.current_bucket.value,
+        "confidence": state.intent_state.confidence,
+        "ready_for_handoff": state.ready_for_handoff,
+        "project_requirements": state.project_requirements,
+    }
+
+
+def sse_event(event: str, data: dict[str, Any]) -> str:
+    """Format a server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """Streaming response that runs ``on_close`` however the response ends.
+
+    The body iterator's own cleanup does not run if the client disconnects
+    before the first chunk is requested, so the source is closed here.
+    """
+
+    def __init__(self, content, on_close: Callable[[], Awaitable[None]], **kwargs):
+        super().__init__(content, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.on_close()
+
+
+@app.post("/hermes/chat", response_model=HermesResponse)
+async def chat_with_hermes(message: HermesMessage):
+    """Chat with Hermes and receive the complete reply."""
+
+    hermes = get_hermes()
+    response, state = await hermes.process_conversation(
+        message.message, message.session_id, user_id=message.user_id
+    )
+
+    return HermesResponse(response=response, **hermes_turn_summary(state))
+
+
+@app.post("/hermes/chat/stream")
+async def stream_chat_with_hermes(message: HermesMessage):
+    """Chat with Hermes, streaming the reply as server-sent events.
+
+    Emits a ``session`` event with the session id and detected intent, one
+    ``delta`` event per response chunk, and a ``done`` event with the state
+    after requirement extraction.
+    """
+
+    hermes = get_hermes()
+    state, chunks = await hermes.stream_conversation(
+        message.message, message.session_id, user_id=message.user_id
+    )
+
+    async def events():
+        yield sse_event(
+            "session",
+            {
+                "session_id": state.session_id,
+                "intent": state.intent_state.current_bucket.value,
+                "confidence": state.intent_state.confidence,
+            },
+        )
+        async for chunk in chunks:
+            yield sse_event("delta", {"text": chunk})
+        yield sse_event("done", hermes_turn_summary(state))
+
+    # Finishes the turn, with the partial reply if the client left early
+    return ClosingStreamingResponse(
+        events(),
+        on_close=chunks.aclose,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.post("/cto/project-plan")
 async def create_project_plan(project_request: dict[str, Any]):
     """Request CTO to create a project plan."""
@@ -0,0 +1,356 @@
+"""
+Multi-agent process host for AIOSv3 platform.
+
+Runs many agents in one process on shared infrastructure clients: one LLM
+router with its provider connection pools, one message queue connection,
+one memory store and the process-wide metrics registry. Each agent keeps
+its own state and runs in its own task, so a failing agent does not take
+the others down. A team too large for one event loop can be spread over a
+small pool of host processes, one per core.
+"""
+
+import asyncio
+import importlib
+import inspect
+import logging
+import multiprocessing
+import os
+import signal
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union
+
+from src.core.messaging.queue import MessageQueue
+from src.core.monitoring.metrics import AIOSv3Metrics, get_metrics
+from src.core.routing.llm_integration import LLMIntegration
+from src.core.routing.router import LLMRouter
+
+logger = logging.getLogger(__name__)
+
+AgentFactory = Callable[..., Any]
+
+
+@dataclass
+class AgentSpec:
+    """
+    Picklable description of an agent to create in a host process.
+
+    ``factory`` is an agent class or factory function, or its import path as
+    ``"package.module:name"`` so the spec can be sent to another process.
+    """
+
+    factory: Union[str, AgentFactory]
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+    def resolve(self) -> AgentFactory:
+        """Import the factory if it was given by path."""
+        if callable(self.factory):
+            return self.factory
+        module_name, _, attribute = self.factory.partition(":")
+        return getattr(importlib.import_module(module_name), attribute)
+
+
+class AgentHost:
+    """
+    Runs a team of agents in one process on shared infrastructure.
+
+    Agents are created through ``add_agent``, which passes the shared router,
+    message queue and memory store to every constructor parameter that takes
+    one. The host initializes and shuts down the clients it created itself;
+    clients handed in by the caller are left to the caller.
+    """
+
+    # Keyword arguments BaseAgent takes for the shared clients
+    BASE_AGENT_PARAMETERS = {"llm_router", "message_queue", "memory_store"}
+
+    def __init__(
+        self,
+        llm_router: Optional[LLMRouter] = None,
+        message_queue: Optional[MessageQueue] = None,
+        memory_store: Any = None,
+        metrics: Optional[AIOSv3Metrics] = None,
+        stop_timeout: float = 30.0,
+    ):
+        """
+        Initialize the host.
+
+        Args:
+            llm_router: Shared router; one with the configured providers is
+                created if omitted
+            message_queue: Shared message queue; one is created if omitted
+            memory_store: Shared memory store, if any
+            metrics: Metrics registry; the process-wide one if omitted
+            stop_timeout: Seconds each agent is given to stop
+        """
+        self._llm: Optional[LLMIntegration] = None
+        if llm_router is None:
+            self._llm = LLMIntegration()
+            llm_router = self._llm.router
+        self._owns_message_queue = message_queue is None
+
+        self.llm_router = llm_router
+        self.message_queue = message_queue or MessageQueue()
+        self.memory_store = memory_store
+        self.metrics = metrics or get_metrics()
+        self.stop_timeout = stop_timeout
+
+        self.agents: dict[str, Any] = {}
+        self.failures: dict[str, str] = {}
+        self._agent_tasks: dict[str, asyncio.Task] = {}
+        # Agents launched and neither failed nor stopped; an agent's run task
+        # ends once its start() returns, while the agent keeps running
+        self._running: set[str] = set()
+        self._started = False
+
+    @property
+    def running_agents(self) -> list[str]:
+        """IDs of agents that have been started and not failed or stopped."""
+        return [agent_id for agent_id in self.agents if agent_id in self._running]
+
+    def shared_kwargs(self, factory: AgentFactory) -> dict[str, Any]:
+        """Shared clients for the parameters ``factory`` accepts."""
+        shared = {
+            "llm_router": self.llm_router,
+            "routing_system": self.llm_router,
+            "message_queue": self.message_queue,
+        }
+        if self.memory_store is not None:
+            shared["memory_store"] = self.memory_store
+
+        parameters = inspect.signature(factory).parameters
+        accepted = set(parameters)
+        if any(p.kind is p.VAR_KEYWORD for p in parameters.values()):
+            # Extra keyword arguments are passed on to BaseAgent
+            accepted |= self.BASE_AGENT_PARAMETERS
+        return {name: value for name, value in shared.items() if name in accepted}
+
+    async def add_agent(
+        self, factory: Union[str, AgentFactory, AgentSpec], **kwargs: Any
+    ) -> Any:
+        """
+        Create an agent on the shared infrastructure.
+
+        If the host is running, the agent is started right away.
+
+        Args:
+            factory: Agent class, factory function, import path or AgentSpec
+            **kwargs: Agent-specific constructor arguments; they take
+                precedence over the shared clients
+
+        Returns:
+            The created agent
+        """
+        if not isinstance(factory, AgentSpec):
+            factory = AgentSpec(factory=factory, kwargs=kwargs)
+        create = factory.resolve()
+
+        agent = create(**{**self.shared_kwargs(create), **factory.kwargs})
+        if inspect.isawaitable(agent):
+            agent = await agent
+
+        agent_id = self._agent_id(agent)
+        if agent_id in self.agents:
+            raise ValueError(f"Agent {agent_id} is already hosted")
+
+        self.agents[agent_id] = agent
+        if self._started:
+            self._launch(agent_id)
+        return agent
+
+    async def remove_agent(self, agent_id: str) -> None:
+        """Stop an agent and remove it from the host."""
+        if agent_id not in self.agents:
+            return
+        await self._stop_agent(agent_id)
+        del self.agents[agent_id]
+        self.failures.pop(agent_id, None)
+        self._update_metrics()
+
+    async def start(self) -> None:
+        """Connect the shared clients and start every agent."""
+        if self._started:
+            return
+
+        logger.info(f"Starting agent host with {len(self.agents)} agents")
+
+        if self._llm is not None:
+            await self._llm.initialize()
+
+        if self._owns_message_queue and not self.message_queue.is_connected:
+            try:
+                await self.message_queue.connect()
+            except Exception as e:
+                logger.warning(f"Agent host running without message queue: {e}")
+
+        self._started = True
+        for agent_id in self.agents:
+            self._launch(agent_id)
+        self._update_metrics()
+
+    async def stop(self) -> None:
+        """Stop every agent, then the shared clients the host created."""
+        if not self._started:
+            return
+
+        logger.info(f"Stopping agent host with {len(self.agents)} agents")
+        await asyncio.gather(
+            *(self._stop_agent(agent_id) for agent_id in list(self.agents))
+        )
+
+        # Agents share the per-process monitoring reporters; close each once
+        reporters = {
+            id(agent.reporter): agent.reporter
+            for agent in self.agents.values()
+            if getattr(agent, "reporter", None) is not None
+        }
+        for reporter in reporters.values():
+            try:
+                await reporter.close()
+            except Exception as e:
+                logger.warning(f"Error closing monitoring reporter: {e}")
+
+        if self._owns_message_queue and self.message_queue.is_connected:
+            await self.message_queue.disconnect()
+        if self._llm is not None:
+            await self._llm.shutdown()
+
+        self._started = False
+        self._update_metrics()
+
+    async def serve(self) -> None:
+        """Run the host until SIGINT or SIGTERM, then stop it."""
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        await self.start()
+        try:
+            await stop_event.wait()
+        finally:
+            await self.stop()
+
+    def get_status(self) -> dict[str, Any]:
+        """Status of the host and each hosted agent."""
+        agents = {}
+        for agent_id, agent in self.agents.items():
+            get_status = getattr(agent, "get_status", None)
+            try:
+                status = get_status() if callable(get_status) else {}
+            except Exception as e:
+                status = {"error": str(e)}
+            agents[agent_id] = {
+                **status,
+                "running": agent_id in self.running_agents,
+                "failure": self.failures.get(agent_id),
+            }
+
+        return {
+            "pid": os.getpid(),
+            "started": self._started,
+            "agent_count": len(self.agents),
+            "running_agents": len(self.running_agents),
+            "failed_agents": len(self.failures),
+            "agents": agents,
+        }
+
+    def _agent_id(self, agent: Any) -> str:
+        """The ID an agent is known by, whichever base class it has."""
+        return str(getattr(agent, "id", None) or agent.agent_id)
+
+    def _launch(self, agent_id: str) -> None:
+        """Start an agent in its own task."""
+        self._running.add(agent_id)
+        task = asyncio.create_task(self._run_agent(agent_id))
+        self._agent_tasks[agent_id] = task
+        task.add_done_callback(lambda _: self._update_metrics())
+
+    async def _run_agent(self, agent_id: str) -> None:
+        """
+        Start one agent, isolating its failures from the rest of the team.
+
+        Agents whose ``start`` returns once they are up keep running on
+        their own background tasks; agents whose ``start`` runs their main
+        loop keep this task alive until they are stopped.
+        """
+        agent = self.agents[agent_id]
+        try:
+            await agent.start()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._running.discard(agent_id)
+            self.failures[agent_id] = str(e)
+            logger.error(f"Hosted agent {agent_id} failed: {e}")
+            self.metrics.track_error("agent_host", type(e).__name__)
+
+    async def _stop_agent(self, agent_id: str) -> None:
+        """Stop an agent and cancel its run task."""
+        agent = self.agents[agent_id]
+        task = self._agent_tasks.pop(agent_id, None)
+        self._running.discard(agent_id)
+
+        if agent_id not in self.failures:
+            try:
+                await asyncio.wait_for(agent.stop(), timeout=self.stop_timeout)
+            except Exception as e:
+                logger.warning(f"Error stopping hosted agent {agent_id}: {e}")
+
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def _update_metrics(self) -> None:
+        """Publish the number of running agents."""
+        self.metrics.set_active_agents(len(self.running_agents))
+
+
+def _serve_specs(specs: list[AgentSpec]) -> None:
+    """Entry point of a host process."""
+
+    async def serve() -> None:
+        host = AgentHost()
+        for spec in specs:
+            try:
+                await host.add_agent(spec)
+            except Exception as e:
+                logger.error(f"Could not create agent from {spec.factory}: {e}")
+        await host.serve()
+
+    asyncio.run(serve())
+
+
+def run_host_pool(
+    specs: list[AgentSpec], processes: Optional[int] = None
+) -> list[multiprocessing.Process]:
+    """
+    Spread a team over a pool of host processes.
+
+    Agents are dealt round-robin to ``processes`` host processes, one per
+    core by default, each with its own shared router, queue connection and
+    monitoring session. Factories must be given by import path.
+
+    Args:
+        specs: Agents to run
+        processes: Number of host processes
+
+    Returns:
+        The started processes; send them SIGTERM to stop the team
+    """
+    processes = max(1, min(processes or os.cpu_count() or 1, len(specs)))
+    context = multiprocessing.get_context("spawn")
+
+    pool = []
+    for index in range(processes):
+        process = context.Process(
+            target=_serve_specs,
+            args=(specs[index::processes],),
+            name=f"aios-agent-host-{index}",
+        )
+        process.start()
+        pool.append(process)
+
+    logger.info(f"Started {processes} host processes for {len(specs)} agents")
+    return pool
@@ -8,6 +8,7 @@ for all agents in the system.
 import asyncio
 import json
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -27,6 +28,73 @@ from src.core.monitoring.metrics import get_metrics
 
 logger = logging.getLogger(__name__)
 
+# Bump when the layout of the registry-wide indices changes; registries
+# rebuild them from the per-agent keys on startup when the stored version
+# is older.
+INDEX_VERSION = 1
+
+# Applies one agent's health transition to the indices and aggregate
+# counters atomically, reading the previously counted summary server-side.
+# Counters are clamped at zero so a missed update cannot drive them negative.
+#
+# KEYS: health index, heartbeat index, summary hash, agent id set,
+#       agent health hash
+# ARGV: agent id, agent delta (1 register, -1 deregister, 0 update),
+#       agent type, health summary JSON ('' to untrack), heartbeat score,
+#       health TTL, then health hash field/value pairs (update only)
+TRACK_HEALTH_SCRIPT = """
+local function add(field, delta)
+    local value = tonumber(redis.call('HGET', KEYS[3], field) or '0') + delta
+    if value < 0 then
+        value = 0
+    end
+    redis.call('HSET', KEYS[3], field, tostring(value))
+end
+
+local agent_delta = tonumber(ARGV[2])
+if agent_delta == 0 and redis.call('EXISTS', KEYS[5]) == 0 then
+    return 0
+end
+
+local previous = redis.call('HGET', KEYS[1], ARGV[1])
+if previous then
+    previous = cjson.decode(previous)
+    add('state:' .. previous.state, -1)
+    add(previous.is_healthy and 'healthy_agents' or 'unhealthy_agents', -1)
+    add('health_score_sum', -previous.health_score)
+end
+
+if ARGV[4] == '' then
+    redis.call('ZREM', KEYS[2], ARGV[1])
+    redis.call('HDEL', KEYS[1], ARGV[1])
+else
+    local health = cjson.decode(ARGV[4])
+    add('state:' .. health.state, 1)
+    add(health.is_healthy and 'healthy_agents' or 'unhealthy_agents', 1)
+    add('health_score_sum', health.health_score)
+    redis.call('ZADD', KEYS[2], ARGV[5], ARGV[1])
+    redis.call('HSET', KEYS[1], ARGV[1], ARGV[4])
+end
+
+if #ARGV > 6 then
+    redis.call('HSET', KEYS[5], unpack(ARGV, 7))
+    redis.call('EXPIRE', KEYS[5], ARGV[6])
+end
+
+-- Only count agents actually added to or removed from the id set
+local changed = 0
+if agent_delta > 0 then
+    changed = redis.call('SADD', KEYS[4], ARGV[1])
+elseif agent_delta < 0 then
+    changed = redis.call('SREM', KEYS[4], ARGV[1])
+end
+if changed == 1 then
+    add('total_agents', agent_delta)
+    add('type:' .. ARGV[3], agent_delta)
+end
+return 1
+"""
+
 
 class AgentRegistry:
     """
@@ -66,6 +134,17 @@ class AgentRegistry:
         # Registry state
         self.is_running = False
 
+        # Maintained indices (avoid KEYS scans and per-agent round-trips)
+        self.agents_key = f"{registry_prefix}:index:agents"
+        self.heartbeats_key = f"{registry_prefix}:index:heartbeats"
+        self.agent_health_key = f"{registry_prefix}:index:health"
+        self.summary_key = f"{registry_prefix}:stats:summary"
+        self.index_version_key = f"{registry_prefix}:index:version"
+        self._track_health_script: Any = None
+
+        # Number of agents fetched per pipelined round-trip
+        self.batch_size = 500
+
     async def initialize(self) -> None:
         """Initialize the registry and start background processes."""
         try:
@@ -74,7 +153,12 @@ class AgentRegistry:
             # Connect to Redis
             self.redis = redis.from_url(self.redis_url, decode_responses=True)
             await self._test_redis_connection()
-            
+            self._track_health_script = self.redis.register_script(TRACK_HEALTH_SCRIPT)
+
+            # Build indices for agents registered under an older layout
+            if await self.redis.get(self.index_version_key) != str(INDEX_VERSION):
+                await self.rebuild_indices()
+
             # Start background cleanup task
             self._cleanup_task = asyncio.create_task(self._cleanup_loop())
             
@@ -120,7 +204,15 @@ class AgentRegistry:
             
             # Create registry entries
             timestamp = datetime.utcnow()
-            
+            health = AgentHealth(
+                agent_id=agent_id,
+                state=request.initial_state,
+                last_heartbeat=timestamp,
+            )
+
+            # Write all registry entries in a single round-trip
+            pipe = self.redis.pipeline(transaction=True)
+
             # Store agent metadata
             metadata_key = f"{self.registry_prefix}:agents:{agent_id}:metadata"
             metadata_data = {
@@ -129,28 +221,30 @@ class AgentRegistry:
                 "endpoint": request.endpoint,
                 "config": request.config,
             }
-            await self.redis.hset(metadata_key, mapping=metadata_data)
-            
+            pipe.hset(metadata_key, mapping=metadata_data)
+
             # Initialize health record
             health_key = f"{self.registry_prefix}:agents:{agent_id}:health"
-            health_data = AgentHealth(
-                agent_id=agent_id,
-                state=request.initial_state,
-                last_heartbeat=timestamp,
-            ).model_dump()
-            await self.redis.hset(health_key, mapping=health_data)
-            
+            pipe.hset(health_key, mapping=health.model_dump())
+
             # Initialize statistics
             stats_key = f"{self.registry_prefix}:agents:{agent_id}:stats"
-            stats_data = AgentStats(agent_id=agent_id, last_active=timestamp).model_dump()
-            await self.redis.hset(stats_key, mapping=stats_data)
-            
-            # Add to type-based indices
-            await self._add_to_indices(agent_id, request.metadata)
-            
+            stats_data = AgentStats(
+                agent_id=agent_id, last_active=timestamp
+            ).model_dump()
+            pipe.hset(stats_key, mapping=stats_data)
+
             # Set expiration for health monitoring
-            await self.redis.expire(health_key, int(self.stale_agent_timeout))
-            
+            pipe.expire(health_key, int(self.stale_agent_timeout))
+
+            # Add to type-based and registry-wide indices
+            self._add_to_indices(pipe, agent_id, request.metadata)
+            await self._track_health(
+                agent_id, health, agent_type=request.metadata.type, client=pipe
+            )
+
+            await pipe.execute()
+
             # Update metrics
             self.metrics.track_agent_operation(
                 agent_id=agent_id,
@@ -188,25 +282,31 @@ class AgentRegistry:
         """Deregister an agent from the registry."""
         try:
             logger.info(f"Deregistering agent {agent_id}")
-            
+
             # Get agent metadata before removal
             metadata = await self.get_agent_metadata(agent_id)
             if not metadata:
                 logger.warning(f"Attempted to deregister non-existent agent {agent_id}")
                 return False
-            
+
             # Remove from all registry keys
             keys_to_delete = [
                 f"{self.registry_prefix}:agents:{agent_id}:metadata",
                 f"{self.registry_prefix}:agents:{agent_id}:health", 
                 f"{self.registry_prefix}:agents:{agent_id}:stats",
             ]
-            
-            await self.redis.delete(*keys_to_delete)
-            
-            # Remove from indices
-            await self._remove_from_indices(agent_id, metadata)
-            
+
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.delete(*keys_to_delete)
+
+            # Remove from indices and aggregate counters
+            self._remove_from_indices(pipe, agent_id, metadata)
+            await self._track_health(
+                agent_id, None, agent_type=metadata.type, client=pipe
+            )
+
+            await pipe.execute()
+
             # Update metrics
             self.metrics.track_agent_operation(
                 agent_id=agent_id,
@@ -229,20 +329,18 @@ class AgentRegistry:
     async def update_agent_health(self, agent_id: str, health: AgentHealth) -> bool:
         """Update an agent's health status."""
         try:
-            health_key = f"{self.registry_prefix}:agents:{agent_id}:health"
-            
-            # Check if agent exists
-            if not await self.redis.exists(health_key):
-                logger.warning(f"Attempted to update health for non-existent agent {agent_id}")
+            # Existence check, health write, TTL refresh and counter updates
+            # run as one script so concurrent updates cannot double count
+            updated = await self._track_health(
+                agent_id, health, health_data=health.model_dump()
+            )
+
+            if not updated:
+                logger.warning(
+                    f"Attempted to update health for non-existent agent {agent_id}"
+                )
                 return False
-            
-            # Update health data
-            health_data = health.model_dump()
-            await self.redis.hset(health_key, mapping=health_data)
-            
-            # Refresh expiration
-            await self.redis.expire(health_key, int(self.stale_agent_timeout))
-            
+
             # Update metrics
             self.metrics.track_agent_operation(
                 agent_id=agent_id,
@@ -305,22 +403,9 @@ class AgentRegistry:
             
             if not data:
                 return None
-            
-            return AgentHealth(
-                agent_id=data["agent_id"],
-                state=AgentState(data["state"]),
-                last_heartbeat=datetime.fromisoformat(data["last_heartbeat"]),
-                last_task_completed=datetime.fromisoformat(data["last_task_completed"]) if data.get("last_task_completed") else None,
-                error_count=int(data.get("error_count", 0)),
-                last_error=data.get("last_error"),
-                memory_usage_mb=float(data.get("memory_usage_mb", 0)),
-                cpu_usage_percent=float(data.get("cpu_usage_percent", 0)),
-                response_time_ms=float(data.get("response_time_ms", 0)),
-                uptime_seconds=float(data.get("uptime_seconds", 0)),
-                is_healthy=data.get("is_healthy", "true").lower() == "true",
-                health_score=float(data.get("health_score", 1.0)),
-            )
-            
+
+            return self._parse_health(data)
+
         except Exception as e:
             logger.error(f"Failed to get health for agent {agent_id}: {e}")
             return None
@@ -363,15 +448,12 @@ class AgentRegistry:
                 agent_ids = await self.redis.smembers(type_key)
             else:
                 # Get all agents
-                pattern = f"{self.registry_prefix}:agents:*:metadata"
-                keys = await self.redis.keys(pattern)
-                agent_ids = [key.split(":")[-2] for key in keys]
-            
+                agent_ids = await self.redis.smembers(self.agents_key)
+
             # Apply additional filters
             if state or healthy_only:
                 filtered_ids = []
-                for agent_id in agent_ids:
-                    health = await self.get_agent_health(agent_id)
+                async for agent_id, health in self._iter_agent_health(agent_ids):
                     if not health:
                         continue
                     
@@ -405,6 +487,8 @@ class AgentRegistry:
     async def get_registry_stats(self) -> dict[str, Any]:
         """Get overall registry statistics."""
         try:
+            summary = await self.redis.hgetall(self.summary_key)
+
             stats = {
                 "total_agents": 0,
                 "agents_by_type": {},
@@ -413,46 +497,24 @@ class AgentRegistry:
                 "unhealthy_agents": 0,
                 "average_health_score": 0.0,
             }
-            
-            # Get all agent IDs
-            pattern = f"{self.registry_prefix}:agents:*:metadata"
-            keys = await self.redis.keys(pattern)
-            agent_ids = [key.split(":")[-2] for key in keys]
-            
-            stats["total_agents"] = len(agent_ids)
-            
-            if not agent_ids:
-                return stats
-            
-            total_health_score = 0.0
-            
-            for agent_id in agent_ids:
-                # Get agent metadata and health
-                metadata = await self.get_agent_metadata(agent_id)
-                health = await self.get_agent_health(agent_id)
-                
-                if metadata:
-                    # Count by type
-                    agent_type = metadata.type.value
-                    stats["agents_by_type"][agent_type] = stats["agents_by_type"].get(agent_type, 0) + 1
-                
-                if health:
-                    # Count by state
-                    state = health.state.value
-                    stats["agents_by_state"][state] = stats["agents_by_state"].get(state, 0) + 1
-                    
-                    # Count healthy vs unhealthy
-                    if health.is_healthy:
-                        stats["healthy_agents"] += 1
-                    else:
-                        stats["unhealthy_agents"] += 1
-                    
-                    total_health_score += health.health_score
-            
+
+            # Counters are maintained incrementally on every registry write
+            for field, value in summary.items():
+                if field.startswith("type:") and int(value) > 0:
+                    stats["agents_by_type"][field[5:]] = int(value)
+                elif field.startswith("state:") and int(value) > 0:
+                    stats["agents_by_state"][field[6:]] = int(value)
+
+            stats["total_agents"] = int(summary.get("total_agents", 0))
+            stats["healthy_agents"] = int(summary.get("healthy_agents", 0))
+            stats["unhealthy_agents"] = int(summary.get("unhealthy_agents", 0))
+
             # Calculate average health score
-            if agent_ids:
-                stats["average_health_score"] = total_health_score / len(agent_ids)
-            
+            if stats["total_agents"]:
+                stats["average_health_score"] = (
+                    float(summary.get("health_score_sum", 0.0)) / stats["total_agents"]
+                )
+
             return stats
             
         except Exception as e:
@@ -492,27 +554,218 @@ class AgentRegistry:
         
         return queues
 
-    async def _add_to_indices(self, agent_id: str, metadata: AgentMetadata) -> None:
-        """Add agent to various indices for quick lookup."""
+    def _add_to_indices(
+        self, pipe: Any, agent_id: str, metadata: AgentMetadata
+    ) -> None:
+        """Queue adding an agent to the type and capability indices."""
         # Type-based index
         type_key = f"{self.registry_prefix}:indices:type:{metadata.type.value}"
-        await self.redis.sadd(type_key, agent_id)
-        
+        pipe.sadd(type_key, agent_id)
+
         # Capability-based indices
         for capability in metadata.capabilities:
-            capability_key = f"{self.registry_prefix}:indices:capability:{capability.name}"
-            await self.redis.sadd(capability_key, agent_id)
+            capability_key = (
+                f"{self.registry_prefix}:indices:capability:{capability.name}"
+            )
+            pipe.sadd(capability_key, agent_id)
 
-    async def _remove_from_indices(self, agent_id: str, metadata: AgentMetadata) -> None:
-        """Remove agent from all indices."""
+    def _remove_from_indices(
+        self, pipe: Any, agent_id: str, metadata: AgentMetadata
+    ) -> None:
+        """Queue removing an agent from the type and capability indices."""
         # Type-based index
         type_key = f"{self.registry_prefix}:indices:type:{metadata.type.value}"
-        await self.redis.srem(type_key, agent_id)
-        
+        pipe.srem(type_key, agent_id)
+
         # Capability-based indices
         for capability in metadata.capabilities:
-            capability_key = f"{self.registry_prefix}:indices:capability:{capability.name}"
-            await self.redis.srem(capability_key, agent_id)
+            capability_key = (
+                f"{self.registry_prefix}:indices:capability:{capability.name}"
+            )
+            pipe.srem(capability_key, agent_id)
+
+    async def _track_health(
+        self,
+        agent_id: str,
+        health: AgentHealth | None,
+        agent_type: AgentType | None = None,
+        health_data: dict[str, Any] | None = None,
+        client: Any = None,
+    ) -> bool:
+        """
+        Apply an agent's health transition to the indices and counters.
+
+        ``health`` is the new health (None when deregistering). Passing
+        ``agent_type`` registers (or, with no health, deregisters) the agent
+        in the id set and totals; without it the update only applies if the
+        agent's health key still exists, in which case ``health_data`` is
+        written to it. With a pipeline as ``client`` the script is queued
+        and the result is not meaningful.
+        """
+        if agent_type is None:
+            agent_delta = 0
+        else:
+            agent_delta = 1 if health is not None else -1
+
+        summary = ""
+        heartbeat = 0.0
+        if health is not None:
+            summary = json.dumps(
+                {
+                    "state": health.state.value,
+                    "is_healthy": health.is_healthy,
+                    "health_score": health.health_score,
+                }
+            )
+            heartbeat = health.last_heartbeat.timestamp()
+
+        args: list[Any] = [
+            agent_id,
+            agent_delta,
+            agent_type.value if agent_type else "",
+            summary,
+            heartbeat,
+            int(self.stale_agent_timeout),
+        ]
+        for field, value in (health_data or {}).items():
+            args.extend((field, value))
+
+        result = await self._track_health_script(
+            keys=[
+                self.agent_health_key,
+                self.heartbeats_key,
+                self.summary_key,
+                self.agents_key,
+                f"{self.registry_prefix}:agents:{agent_id}:health",
+            ],
+            args=args,
+            client=client,
+        )
+        return bool(result)
+
+    async def rebuild_indices(self) -> int:
+        """
+        Rebuild the registry-wide indices and counters from the agent keys.
+
+        Used on startup to migrate agents registered before the indices
+        existed, and to repair counters that have drifted. Agents whose
+        health key has expired are indexed with a zero heartbeat so the
+        cleanup loop removes them.
+
+        Returns:
+            Number of agents indexed
+        """
+        prefix = f"{self.registry_prefix}:agents:"
+        agent_ids = [
+            key[len(prefix) : -len(":metadata")]
+            async for key in self.redis.scan_iter(
+                match=f"{prefix}*:metadata", count=self.batch_size
+            )
+        ]
+
+        # Agent types, fetched in pipelined batches
+        agent_types: dict[str, str] = {}
+        for i in range(0, len(agent_ids), self.batch_size):
+            batch = agent_ids[i : i + self.batch_size]
+            pipe = self.redis.pipeline(transaction=False)
+            for agent_id in batch:
+                pipe.hget(f"{prefix}{agent_id}:metadata", "type")
+            results = await pipe.execute()
+            agent_types.update(zip(batch, results, strict=True))
+
+        summary: dict[str, Any] = {
+            "total_agents": len(agent_ids),
+            "healthy_agents": 0,
+            "unhealthy_agents": 0,
+            "health_score_sum": 0.0,
+        }
+        heartbeats: dict[str, float] = {}
+        health_index: dict[str, str] = {}
+        for agent_type in agent_types.values():
+            summary[f"type:{agent_type}"] = summary.get(f"type:{agent_type}", 0) + 1
+
+        async for agent_id, health in self._iter_agent_health(agent_ids):
+            if health is None:
+                heartbeats[agent_id] = 0.0
+                continue
+
+            state_field = f"state:{health.state.value}"
+            summary[state_field] = summary.get(state_field, 0) + 1
+            if health.is_healthy:
+                summary["healthy_agents"] += 1
+            else:
+                summary["unhealthy_agents"] += 1
+            summary["health_score_sum"] += health.health_score
+            heartbeats[agent_id] = health.last_heartbeat.timestamp()
+            health_index[agent_id] = json.dumps(
+                {
+                    "state": health.state.value,
+                    "is_healthy": health.is_healthy,
+                    "health_score": health.health_score,
+                }
+            )
+
+        # Swap the indices in one transaction
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(
+            self.agents_key,
+            self.heartbeats_key,
+            self.agent_health_key,
+            self.summary_key,
+        )
+        if agent_ids:
+            pipe.sadd(self.agents_key, *agent_ids)
+            pipe.zadd(self.heartbeats_key, heartbeats)
+        if health_index:
+            pipe.hset(self.agent_health_key, mapping=health_index)
+        pipe.hset(self.summary_key, mapping=summary)
+        pipe.set(self.index_version_key, INDEX_VERSION)
+        await pipe.execute()
+
+        logger.info(f"Rebuilt registry indices for {len(agent_ids)} agents")
+        return len(agent_ids)
+
+    def _parse_health(self, data: dict[str, str]) -> AgentHealth:
+        """Convert a health hash back to AgentHealth."""
+        return AgentHealth(
+            agent_id=data["agent_id"],
+            state=AgentState(data["state"]),
+            last_heartbeat=datetime.fromisoformat(data["last_heartbeat"]),
+            last_task_completed=(
+                datetime.fromisoformat(data["last_task_completed"])
+                if data.get("last_task_completed")
+                else None
+            ),
+            error_count=int(data.get("error_count", 0)),
+            last_error=data.get("last_error"),
+            memory_usage_mb=float(data.get("memory_usage_mb", 0)),
+            cpu_usage_percent=float(data.get("cpu_usage_percent", 0)),
+            response_time_ms=float(data.get("response_time_ms", 0)),
+            uptime_seconds=float(data.get("uptime_seconds", 0)),
+            is_healthy=data.get("is_healthy", "true").lower() == "true",
+            health_score=float(data.get("health_score", 1.0)),
+        )
+
+    async def _iter_agent_health(
+        self, agent_ids: Any
+    ) -> AsyncIterator[tuple[str, AgentHealth | None]]:
+        """Fetch health records with pipelined HGETALL batches."""
+        agent_ids = list(agent_ids)
+
+        for i in range(0, len(agent_ids), self.batch_size):
+            batch = agent_ids[i : i + self.batch_size]
+
+            pipe = self.redis.pipeline(transaction=False)
+            for agent_id in batch:
+                pipe.hgetall(f"{self.registry_prefix}:agents:{agent_id}:health")
+            results = await pipe.execute()
+
+            for agent_id, data in zip(batch, results, strict=True):
+                try:
+                    yield agent_id, self._parse_health(data) if data else None
+                except Exception as e:
+                    logger.error(f"Failed to parse health for agent {agent_id}: {e}")
+                    yield agent_id, None
 
     async def _cleanup_loop(self) -> None:
         """Background loop to cleanup stale agents."""
@@ -528,20 +781,15 @@ class AgentRegistry:
     async def _cleanup_stale_agents(self) -> None:
         """Remove agents that haven't sent heartbeats."""
         try:
-            cutoff_time = datetime.utcnow() - timedelta(seconds=self.stale_agent_timeout)
-            
-            # Get all agent IDs
-            pattern = f"{self.registry_prefix}:agents:*:health"
-            keys = await self.redis.keys(pattern)
-            
-            stale_agents = []
-            for key in keys:
-                agent_id = key.split(":")[-2]
-                health = await self.get_agent_health(agent_id)
-                
-                if health and health.last_heartbeat < cutoff_time:
-                    stale_agents.append(agent_id)
-            
+            cutoff_time = datetime.utcnow() - timedelta(
+                seconds=self.stale_agent_timeout
+            )
+
+            # Agents whose last heartbeat is older than the cutoff
+            stale_agents = await self.redis.zrangebyscore(
+                self.heartbeats_key, "-inf", cutoff_time.timestamp()
+            )
+
             # Remove stale agents
             for agent_id in stale_agents:
                 logger.warning(f"Removing stale agent {agent_id}")
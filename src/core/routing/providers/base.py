@@ -100,6 +100,9 @@ class LLMRequest(BaseModel):
     functions: Optional[list[dict[str, Any]]] = None
     function_call: Union[str, dict, None] = None
     user_id: Optional[str] = None
+    # Number of leading messages that form a stable prompt prefix, such as
+    # a rendered system prompt, which providers may cache between requests
+    cache_prefix_messages: int = 0
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
@@ -114,6 +117,8 @@ class LLMResponse(BaseModel):
     input_tokens: int = 0
     output_tokens: int = 0
     total_tokens: int = 0
+    cached_input_tokens: int = 0  # Input tokens read from the prompt cache
+    cache_write_tokens: int = 0  # Input tokens written to the prompt cache
 
     # Cost information
     input_cost: float = 0.0
@@ -168,6 +173,13 @@ class LLMProvider(ABC):
         self._models: dict[str, ModelInfo] = {}
         self._last_health_check: Optional[datetime] = None
         self._health_status = ProviderHealthStatus(provider_name=self.provider_name)
+        self._cache_stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "input_tokens": 0,
+            "cached_input_tokens": 0,
+            "cache_write_tokens": 0,
+        }
 
     @property
     def name(self) -> str:
@@ -233,6 +245,27 @@ class LLMProvider(ABC):
         output_cost = output_tokens * model_info.output_cost_per_token
         return input_cost + output_cost
 
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get prompt cache usage across all responses from this provider."""
+        stats = dict(self._cache_stats)
+        stats["cached_token_ratio"] = (
+            stats["cached_input_tokens"] / stats["input_tokens"]
+            if stats["input_tokens"]
+            else 0.0
+        )
+        return stats
+
+    def _record_cache_usage(
+        self, input_tokens: int, cached_input_tokens: int, cache_write_tokens: int
+    ) -> None:
+        """Add one request's cached-prefix token counts to the provider stats."""
+        self._cache_stats["requests"] += 1
+        self._cache_stats["input_tokens"] += input_tokens
+        self._cache_stats["cached_input_tokens"] += cached_input_tokens
+        self._cache_stats["cache_write_tokens"] += cache_write_tokens
+        if cached_input_tokens:
+            self._cache_stats["cache_hits"] += 1
+
     def get_performance_score(self, model_id: str) -> float:
         """Get performance score for a model (0.0-1.0)."""
         model_info = self.get_model_info(model_id)
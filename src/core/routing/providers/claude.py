@@ -45,6 +45,10 @@ class ClaudeProvider(LLMProvider):
     and streaming responses.
     """
 
+    # Prompt cache pricing relative to the model's input token price
+    CACHE_WRITE_COST_MULTIPLIER = 1.25
+    CACHE_READ_COST_MULTIPLIER = 0.1
+
     # Claude model definitions
     CLAUDE_MODELS = {
         "claude-3-5-sonnet-20241022": ModelInfo(
@@ -229,7 +233,10 @@ class ClaudeProvider(LLMProvider):
 
                             event_data = json.loads(data)
 
-                            if event_data.get("type") == "content_block_delta":
+                            if event_data.get("type") == "message_start":
+                                usage = event_data.get("message", {}).get("usage", {})
+                                self._record_usage(usage)
+                            elif event_data.get("type") == "content_block_delta":
                                 delta = event_data.get("delta", {})
                                 if delta.get("type") == "text_delta":
                                     yield delta.get("text", "")
@@ -295,13 +302,17 @@ class ClaudeProvider(LLMProvider):
 
     def _prepare_request_payload(self, request: LLMRequest) -> dict[str, Any]:
         """Prepare the request payload for Claude API."""
+        system, messages = self._prepare_messages(request)
         payload = {
             "model": request.model_id,
-            "messages": request.messages,
+            "messages": messages,
             "max_tokens": request.max_tokens or self.config.max_tokens_default,
             "temperature": request.temperature,
         }
 
+        if system:
+            payload["system"] = system
+
         # Optional parameters
         if request.top_p is not None:
             payload["top_p"] = request.top_p
@@ -315,6 +326,47 @@ class ClaudeProvider(LLMProvider):
 
         return payload
 
+    def _prepare_messages(
+        self, request: LLMRequest
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Split messages into Claude's top-level system blocks and chat turns.
+
+        The last block inside the request's stable prefix gets a cache
+        breakpoint, so the API reuses everything up to it across requests.
+        """
+        system: list[dict[str, Any]] = []
+        messages: list[dict[str, Any]] = []
+        breakpoint_target = None
+
+        for index, message in enumerate(request.messages):
+            if message["role"] == "system":
+                system.append({"type": "text", "text": message["content"]})
+                target = system[-1]
+            else:
+                messages.append(
+                    {"role": message["role"], "content": message["content"]}
+                )
+                target = messages[-1]
+
+            if index < request.cache_prefix_messages:
+                breakpoint_target = target
+
+        if breakpoint_target is not None:
+            cache_control = {"type": "ephemeral"}
+            if "role" in breakpoint_target:
+                breakpoint_target["content"] = [
+                    {
+                        "type": "text",
+                        "text": breakpoint_target["content"],
+                        "cache_control": cache_control,
+                    }
+                ]
+            else:
+                breakpoint_target["cache_control"] = cache_control
+
+        return system, messages
+
     def _convert_functions_to_tools(
         self, functions: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
@@ -351,16 +403,23 @@ class ClaudeProvider(LLMProvider):
 
         # Extract usage information
         usage = response_data.get("usage", {})
-        input_tokens = usage.get("input_tokens", 0)
+        input_tokens, cached_input_tokens, cache_write_tokens = self._record_usage(
+            usage
+        )
         output_tokens = usage.get("output_tokens", 0)
 
-        # Calculate costs
+        # Calculate costs, with cache reads and writes priced off the input rate
         model_info = self.get_model_info(request.model_id)
         input_cost = 0.0
         output_cost = 0.0
 
         if model_info:
-            input_cost = input_tokens * model_info.input_cost_per_token
+            uncached_tokens = input_tokens - cached_input_tokens - cache_write_tokens
+            input_cost = model_info.input_cost_per_token * (
+                uncached_tokens
+                + cache_write_tokens * self.CACHE_WRITE_COST_MULTIPLIER
+                + cached_input_tokens * self.CACHE_READ_COST_MULTIPLIER
+            )
             output_cost = output_tokens * model_info.output_cost_per_token
 
         return LLMResponse(
@@ -369,6 +428,8 @@ class ClaudeProvider(LLMProvider):
             provider=self.provider_name,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            cached_input_tokens=cached_input_tokens,
+            cache_write_tokens=cache_write_tokens,
             total_tokens=input_tokens + output_tokens,
             input_cost=input_cost,
             output_cost=output_cost,
@@ -379,6 +440,21 @@ class ClaudeProvider(LLMProvider):
             request_id=response_data.get("id"),
         )
 
+    def _record_usage(self, usage: dict[str, Any]) -> tuple[int, int, int]:
+        """
+        Record prompt cache usage and return (input, cached, written) tokens.
+
+        Claude reports cache reads and writes separately from ``input_tokens``,
+        so the total prompt size is the sum of all three.
+        """
+        cached_input_tokens = usage.get("cache_read_input_tokens") or 0
+        cache_write_tokens = usage.get("cache_creation_input_tokens") or 0
+        input_tokens = (
+            usage.get("input_tokens", 0) + cached_input_tokens + cache_write_tokens
+        )
+        self._record_cache_usage(input_tokens, cached_input_tokens, cache_write_tokens)
+        return input_tokens, cached_input_tokens, cache_write_tokens
+
     async def _verify_api_access(self) -> None:
         """Verify API access by making a test request."""
         try:
@@ -38,6 +38,8 @@ class LocalConfig(ProviderConfig):
     auto_pull_models: bool = False
     default_max_tokens: int = 2048
     default_temperature: float = 0.7
+    # How long Ollama keeps a model, and so its cached prompt prefix, loaded
+    prefix_keep_alive: str = "30m"
 
 
 class LocalProvider(LLMProvider):
@@ -398,6 +400,17 @@ class LocalProvider(LLMProvider):
         else:
             return 1
 
+    def _prefix_cache_options(self, request: LLMRequest) -> dict[str, Any]:
+        """
+        Ollama options that keep a stable prompt prefix warm.
+
+        Ollama reuses the KV cache for a repeated prefix while the model
+        stays loaded, so requests with one keep the model around longer.
+        """
+        if not request.cache_prefix_messages:
+            return {}
+        return {"keep_alive": self.config.prefix_keep_alive}
+
     async def _generate_ollama(
         self, request: LLMRequest, start_time: float
     ) -> LLMResponse:
@@ -413,6 +426,7 @@ class LocalProvider(LLMProvider):
                     "temperature": request.temperature,
                     "num_predict": request.max_tokens or self.config.default_max_tokens,
                 },
+                **self._prefix_cache_options(request),
             }
 
             response = await self.client.post(self.api_paths["generate"], json=payload)
@@ -426,6 +440,7 @@ class LocalProvider(LLMProvider):
                     "temperature": request.temperature,
                     "num_predict": request.max_tokens or self.config.default_max_tokens,
                 },
+                **self._prefix_cache_options(request),
             }
 
             response = await self.client.post(self.api_paths["chat"], json=payload)
@@ -491,10 +506,21 @@ class LocalProvider(LLMProvider):
             message = choices[0].get("message", {})
             content = message.get("content", "")
 
+        # vLLM reports prefix cache hits the same way OpenAI does
+        usage = response_data.get("usage") or {}
+        input_tokens = usage.get("prompt_tokens", 0)
+        cached_input_tokens = (usage.get("prompt_tokens_details") or {}).get(
+            "cached_tokens", 0
+        )
+        self._record_cache_usage(input_tokens, cached_input_tokens, 0)
+
         return self._create_response(
             content=content,
             model_id=request.model_id,
+            input_tokens=input_tokens,
+            output_tokens=usage.get("completion_tokens", 0),
             response_time_ms=response_time,
+            cached_input_tokens=cached_input_tokens,
             metadata={"provider_type": self.config.provider_type},
         )
 
@@ -508,6 +534,7 @@ class LocalProvider(LLMProvider):
                 "temperature": request.temperature,
                 "num_predict": request.max_tokens or self.config.default_max_tokens,
             },
+            **self._prefix_cache_options(request),
         }
 
         async with self.client.stream(
@@ -44,6 +44,9 @@ class OpenAIProvider(LLMProvider):
     function calling, and streaming responses.
     """
 
+    # Cached prompt tokens are billed at a discount on the input token price
+    CACHED_INPUT_COST_MULTIPLIER = 0.5
+
     # OpenAI model definitions
     OPENAI_MODELS = {
         "gpt-4-turbo": ModelInfo(
@@ -313,6 +316,12 @@ class OpenAIProvider(LLMProvider):
             if request.function_call:
                 payload["function_call"] = request.function_call
 
+        # OpenAI caches stable prefixes automatically; a cache key keeps
+        # requests sharing one prefix on the same cache
+        prompt_cache_key = request.metadata.get("prompt_cache_key")
+        if request.cache_prefix_messages and prompt_cache_key:
+            payload["prompt_cache_key"] = prompt_cache_key
+
         # Response format
         if hasattr(request, "response_format"):
             payload["response_format"] = request.response_format
@@ -342,14 +351,22 @@ class OpenAIProvider(LLMProvider):
         usage = response_data.get("usage", {})
         input_tokens = usage.get("prompt_tokens", 0)
         output_tokens = usage.get("completion_tokens", 0)
+        cached_input_tokens = (usage.get("prompt_tokens_details") or {}).get(
+            "cached_tokens", 0
+        )
+        self._record_cache_usage(input_tokens, cached_input_tokens, 0)
 
-        # Calculate costs
+        # Calculate costs, with cached prompt tokens at the discounted rate
         model_info = self.get_model_info(request.model_id)
         input_cost = 0.0
         output_cost = 0.0
 
         if model_info:
-            input_cost = input_tokens * model_info.input_cost_per_token
+            input_cost = model_info.input_cost_per_token * (
+                input_tokens
+                - cached_input_tokens
+                + cached_input_tokens * self.CACHED_INPUT_COST_MULTIPLIER
+            )
             output_cost = output_tokens * model_info.output_cost_per_token
 
         return LLMResponse(
@@ -359,6 +376,7 @@ class OpenAIProvider(LLMProvider):
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             total_tokens=input_tokens + output_tokens,
+            cached_input_tokens=cached_input_tokens,
             input_cost=input_cost,
             output_cost=output_cost,
             total_cost=input_cost + output_cost,
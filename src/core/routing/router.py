@@ -287,6 +287,7 @@ class LLMRouter:
                 status[provider_name] = {
                     "health": health.model_dump(),
                     "stats": stats,
+                    "prompt_cache": provider.get_cache_stats(),
                     "available_models": [
                         model.id for model in await provider.get_models()
                     ],
@@ -14,6 +14,7 @@ import os
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from collections.abc import Callable
 from typing import Any, BinaryIO, Optional, Dict
 from urllib.parse import urlparse
 
@@ -164,7 +165,8 @@ class ObjectStorage:
         content_type: str | None = None,
         metadata: dict[str, str] | None = None,
         tags: dict[str, str] | None = None,
-        progress_callback: callable | None = None,
+        progress_callback: Callable | None = None,
+        file_hash: str | None = None,
     ) -> StorageMetadata:
         """
         Upload a file to object storage.
@@ -177,6 +179,7 @@ class ObjectStorage:
             metadata: User metadata for the object
             tags: Tags for the object
             progress_callback: Callback for upload progress
+            file_hash: Precomputed SHA-256 of the file; calculated if omitted
 
         Returns:
             StorageMetadata: Metadata of uploaded object
@@ -191,7 +194,8 @@ class ObjectStorage:
             content_type = self._get_content_type(file_path)
 
         # Calculate file hash for integrity checking
-        file_hash = await self._calculate_file_hash(file_path)
+        if file_hash is None:
+            file_hash = await self.calculate_file_hash(file_path)
 
         # Prepare metadata
         object_metadata = metadata or {}
@@ -226,8 +230,16 @@ class ObjectStorage:
 
             logger.info(f"Uploaded file {file_path} to {bucket_name}/{object_key}")
 
-            # Get object metadata
-            return await self.get_object_metadata(bucket_name, object_key)
+            # Build metadata from the write result instead of a follow-up HEAD
+            return StorageMetadata(
+                object_key=object_key,
+                size=file_path.stat().st_size,
+                last_modified=result.last_modified or datetime.utcnow(),
+                etag=result.etag,
+                content_type=content_type,
+                version_id=result.version_id,
+                user_metadata=object_metadata,
+            )
 
         except S3Error as e:
             logger.error(f"Failed to upload file {file_path}: {e}")
@@ -498,6 +510,50 @@ class ObjectStorage:
             logger.error(f"Failed to delete {bucket_name}/{object_key}: {e}")
             raise
 
+    async def delete_objects(
+        self,
+        bucket_name: str,
+        objects: list[tuple[str, str | None]],
+    ) -> list[dict[str, str]]:
+        """
+        Delete many objects (or object versions) with multi-object delete.
+
+        Args:
+            bucket_name: Bucket containing the objects
+            objects: (object_key, version_id) pairs; version_id may be None
+
+        Returns:
+            list: Errors reported by the server, one dict per failed object
+        """
+        from minio.deleteobjects import DeleteObject
+
+        delete_list = [
+            DeleteObject(object_key, version_id) for object_key, version_id in objects
+        ]
+
+        def _remove_sync() -> list[dict[str, str]]:
+            # remove_objects is lazy; errors are only sent once it is consumed
+            return [
+                {
+                    "object": error.name,
+                    "version_id": error.version_id or "",
+                    "error": error.message,
+                }
+                for error in self.client.remove_objects(bucket_name, delete_list)
+            ]
+
+        try:
+            errors = await asyncio.get_event_loop().run_in_executor(None, _remove_sync)
+
+            logger.info(
+                f"Bulk-deleted {len(delete_list) - len(errors)} objects in {bucket_name}"
+            )
+            return errors
+
+        except S3Error as e:
+            logger.error(f"Failed to bulk delete objects in {bucket_name}: {e}")
+            raise
+
     async def list_objects(
         self,
         bucket_name: str,
@@ -626,13 +682,13 @@ class ObjectStorage:
                 "error": str(e),
             }
 
-    async def _calculate_file_hash(self, file_path: Path) -> str:
+    async def calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA-256 hash of a file."""
         hasher = hashlib.sha256()
 
         def _hash_file():
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
+                for chunk in iter(lambda: f.read(65536), b""):
                     hasher.update(chunk)
             return hasher.hexdigest()
 
@@ -81,10 +81,16 @@ class VersionManager:
     - Storage optimization
     """
 
-    def __init__(self, storage: ObjectStorage | None = None):
+    # S3 multi-object delete accepts at most 1000 keys per request
+    delete_batch_size = 1000
+
+    def __init__(
+        self, storage: ObjectStorage | None = None, max_delete_concurrency: int = 4
+    ):
         """Initialize version manager."""
         self.storage = storage
         self.versioning_configs: dict[str, VersioningConfig] = {}
+        self.max_delete_concurrency = max_delete_concurrency
 
     async def initialize(self) -> None:
         """Initialize version manager."""
@@ -284,33 +290,33 @@ class VersionManager:
         cleanup_result = {
             "bucket_name": bucket_name,
             "cleanup_timestamp": datetime.utcnow().isoformat(),
+            "objects_scanned": 0,
             "versions_deleted": 0,
             "space_freed": 0,
             "errors": [],
         }
 
         try:
-            # Determine which objects to process
+            # One versioned listing for the whole bucket (or object), grouped by key
+            versions_by_key = await self._list_versions_by_key(
+                bucket_name, prefix=object_key
+            )
             if object_key:
-                objects_to_process = [object_key]
-            else:
-                # Get all objects in bucket
-                all_objects = await self.storage.list_objects(bucket_name)
-                objects_to_process = [obj.object_key for obj in all_objects]
-
-            for obj_key in objects_to_process:
-                try:
-                    cleanup_stats = await self._cleanup_object_versions(
-                        bucket_name, obj_key, cleanup_config
-                    )
+                versions_by_key = {object_key: versions_by_key.get(object_key, [])}
+
+            # Evaluate the policy in memory, then delete in bulk
+            versions_to_delete = []
+            for versions in versions_by_key.values():
+                versions_to_delete.extend(
+                    self._select_versions_to_delete(versions, cleanup_config)
+                )
 
-                    cleanup_result["versions_deleted"] += cleanup_stats["deleted"]
-                    cleanup_result["space_freed"] += cleanup_stats["space_freed"]
+            delete_stats = await self._delete_versions(bucket_name, versions_to_delete)
 
-                except Exception as e:
-                    cleanup_result["errors"].append(
-                        {"object": obj_key, "error": str(e)}
-                    )
+            cleanup_result["objects_scanned"] = len(versions_by_key)
+            cleanup_result["versions_deleted"] = delete_stats["deleted"]
+            cleanup_result["space_freed"] = delete_stats["space_freed"]
+            cleanup_result["errors"].extend(delete_stats["errors"])
 
             logger.info(
                 f"Cleanup completed: {cleanup_result['versions_deleted']} versions deleted, "
@@ -417,60 +423,115 @@ class VersionManager:
             return bucket_name.endswith(pattern[1:])
         return bucket_name == pattern
 
-    async def _cleanup_object_versions(
-        self, bucket_name: str, object_key: str, config: VersioningConfig
-    ) -> dict[str, int]:
-        """Clean up versions for a specific object."""
-        versions = await self.get_versions(bucket_name, object_key)
+    async def _list_versions_by_key(
+        self, bucket_name: str, prefix: str | None = None
+    ) -> dict[str, list[VersionInfo]]:
+        """List all versions in a single pass and group them by object key."""
+        objects = await self.storage.list_objects(
+            bucket_name=bucket_name, prefix=prefix, include_versions=True
+        )
 
-        if len(versions) <= 1:
-            return {"deleted": 0, "space_freed": 0}
+        versions_by_key: dict[str, list[VersionInfo]] = {}
+        for obj in objects:
+            versions_by_key.setdefault(obj.object_key, []).append(
+                VersionInfo(
+                    version_id=obj.version_id or "latest",
+                    object_key=obj.object_key,
+                    created_at=obj.last_modified,
+                    created_by="unknown",  # Not needed for policy evaluation
+                    size=obj.size,
+                    checksum=obj.etag,
+                    tags=obj.tags or {},
+                )
+            )
+
+        # Newest first, so the head of each list is the latest version
+        for versions in versions_by_key.values():
+            versions.sort(key=lambda v: v.created_at, reverse=True)
+            versions[0].is_latest = True
 
-        # Determine which versions to delete
-        versions_to_delete = []
+        return versions_by_key
+
+    def _select_versions_to_delete(
+        self, versions: list[VersionInfo], config: VersioningConfig
+    ) -> list[VersionInfo]:
+        """Apply a cleanup policy to the versions of one object (newest first)."""
+        if len(versions) <= 1:
+            return []
 
         if config.cleanup_policy == CleanupPolicy.KEEP_RECENT:
             # Keep only the most recent N versions
-            if len(versions) > config.max_versions:
-                versions_to_delete = versions[config.max_versions :]
+            return versions[config.max_versions :]
 
-        elif config.cleanup_policy == CleanupPolicy.TIME_BASED:
+        if config.cleanup_policy == CleanupPolicy.TIME_BASED:
             # Delete versions older than retention period
             cutoff_date = datetime.utcnow() - timedelta(days=config.retention_days)
-            versions_to_delete = [
+            return [
                 v for v in versions if v.created_at < cutoff_date and not v.is_latest
             ]
 
-        elif config.cleanup_policy == CleanupPolicy.KEEP_IMPORTANT:
+        if config.cleanup_policy == CleanupPolicy.KEEP_IMPORTANT:
             # Keep versions with preserve tags
             preserve_tags = config.preserve_tags or []
-            versions_to_delete = [
+            return [
                 v
                 for v in versions
                 if not v.is_latest and not any(tag in v.tags for tag in preserve_tags)
             ]
 
-        # Execute deletions
+        return []
+
+    async def _delete_versions(
+        self, bucket_name: str, versions: list[VersionInfo]
+    ) -> dict[str, Any]:
+        """Delete versions with batched multi-object deletes."""
+        batches = [
+            versions[i : i + self.delete_batch_size]
+            for i in range(0, len(versions), self.delete_batch_size)
+        ]
+        semaphore = asyncio.Semaphore(self.max_delete_concurrency)
+
+        async def _delete_batch(batch: list[VersionInfo]) -> list[dict[str, str]]:
+            async with semaphore:
+                return await self.storage.delete_objects(
+                    bucket_name,
+                    [
+                        (
+                            v.object_key,
+                            v.version_id if v.version_id != "latest" else None,
+                        )
+                        for v in batch
+                    ],
+                )
+
+        results = await asyncio.gather(
+            *(_delete_batch(batch) for batch in batches), return_exceptions=True
+        )
+
         deleted_count = 0
         space_freed = 0
+        errors: list[dict[str, str]] = []
 
-        for version in versions_to_delete:
-            try:
-                await self.storage.delete_object(
-                    bucket_name=bucket_name,
-                    object_key=object_key,
-                    version_id=(
-                        version.version_id if version.version_id != "latest" else None
-                    ),
+        for batch, result in zip(batches, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Failed to delete batch of {len(batch)} versions: {result}"
                 )
-
+                errors.append({"general": str(result)})
+                continue
+
+            failed = {(e["object"], e["version_id"]) for e in result}
+            errors.extend(result)
+            for version in batch:
+                version_id = (
+                    version.version_id if version.version_id != "latest" else ""
+                )
+                if (version.object_key, version_id) in failed:
+                    continue
                 deleted_count += 1
                 space_freed += version.size
 
-            except Exception as e:
-                logger.warning(f"Failed to delete version {version.version_id}: {e}")
-
-        return {"deleted": deleted_count, "space_freed": space_freed}
+        return {"deleted": deleted_count, "space_freed": space_freed, "errors": errors}
 
     async def _save_versioning_config(
         self, pattern: str, config: VersioningConfig
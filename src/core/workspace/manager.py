@@ -6,8 +6,11 @@ for multi-agent collaboration on shared artifacts.
 """
 
 import asyncio
+import heapq
 import json
 import logging
+import random
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -15,6 +18,11 @@ from pathlib import Path
 from typing import Any
 
 from src.core.storage.object_store import ObjectStorage, get_object_storage
+from src.core.workspace.manifest import (
+    ManifestFileEntry,
+    WorkspaceManifest,
+    WorkspaceManifestIndex,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +90,19 @@ class FileConflict:
     resolution_result: str | None = None
 
 
+@dataclass
+class TreeTransferProgress:
+    """Progress of a directory upload or download, emitted per file."""
+
+    file_path: str
+    action: str  # "uploaded", "downloaded", "skipped" or "failed"
+    files_done: int
+    files_total: int
+    bytes_done: int
+    bytes_total: int
+    error: str | None = None
+
+
 class WorkspaceManager:
     """
     Manages agent workspaces for isolated and collaborative work.
@@ -94,12 +115,33 @@ class WorkspaceManager:
     - Access control and permissions
     """
 
+    # Every Nth scheduled sync of a workspace reconciles against storage
+    full_sync_every = 10
+    # Fraction of sync_interval used to spread scheduled syncs apart
+    sync_jitter = 0.1
+    # Scheduled syncs allowed to run at the same time
+    max_concurrent_syncs = 4
+
     def __init__(self, storage: ObjectStorage | None = None):
         """Initialize workspace manager."""
         self.storage = storage
         self.active_workspaces: dict[str, WorkspaceConfig] = {}
-        self.sync_tasks: dict[str, asyncio.Task] = {}
         self.conflict_queue: list[FileConflict] = []
+        # Built here when storage is injected, so the manager is usable
+        # before initialize(); initialize() then loads or rebuilds it
+        self.manifest: WorkspaceManifestIndex | None = (
+            WorkspaceManifestIndex(storage) if storage is not None else None
+        )
+
+        # Shared sync scheduler: heap of (due time, workspace_id)
+        self._sync_schedule: list[tuple[float, str]] = []
+        self._scheduled_workspaces: set[str] = set()
+        self._sync_wakeup = asyncio.Event()
+        self._sync_scheduler_task: asyncio.Task | None = None
+        self._sync_tasks: set[asyncio.Task] = set()
+        self._sync_slots = asyncio.Semaphore(self.max_concurrent_syncs)
+        self._sync_cursors: dict[str, int] = {}
+        self._sync_counts: dict[str, int] = {}
 
     async def initialize(self) -> None:
         """Initialize workspace manager."""
@@ -109,8 +151,31 @@ class WorkspaceManager:
         # Load existing workspace configurations
         await self._load_workspace_configs()
 
+        # Load the manifest index, building it once from storage if missing
+        if self.manifest is None:
+            self.manifest = WorkspaceManifestIndex(self.storage)
+        if await self.manifest.load():
+            # Configs written after the last index flush are not in it yet
+            self.manifest.sync_workspaces(self.active_workspaces)
+        else:
+            await self.manifest.rebuild(self.active_workspaces)
+
         logger.info("Workspace manager initialized")
 
+    async def shutdown(self) -> None:
+        """Stop the sync scheduler and persist pending manifest changes."""
+        if self._sync_scheduler_task:
+            self._sync_scheduler_task.cancel()
+            self._sync_scheduler_task = None
+        for task in list(self._sync_tasks):
+            task.cancel()
+        await asyncio.gather(*self._sync_tasks, return_exceptions=True)
+        self._sync_schedule.clear()
+        self._scheduled_workspaces.clear()
+
+        if self.manifest:
+            await self.manifest.close()
+
     async def create_workspace(
         self,
         workspace_id: str,
@@ -136,8 +201,9 @@ class WorkspaceManager:
         # Save workspace configuration
         await self._save_workspace_config(workspace_config)
 
-        # Add to active workspaces
+        # Add to active workspaces and the manifest index
         self.active_workspaces[workspace_id] = workspace_config
+        self.manifest.add_workspace(workspace_config)
 
         # Start sync task if auto-sync is enabled
         if workspace_config.auto_sync:
@@ -148,63 +214,39 @@ class WorkspaceManager:
 
     async def get_workspace(self, workspace_id: str) -> WorkspaceConfig | None:
         """Get workspace configuration."""
-        if workspace_id in self.active_workspaces:
-            return self.active_workspaces[workspace_id]
+        config = self.active_workspaces.get(workspace_id)
+        if config is None:
+            # Try to load from storage
+            config = await self._load_workspace_config(workspace_id)
+
+        # Workspaces created elsewhere are indexed on first access
+        if config and self.manifest.get(workspace_id) is None:
+            self.manifest.add_workspace(config, is_new=False)
 
-        # Try to load from storage
-        return await self._load_workspace_config(workspace_id)
+        return config
 
     async def list_workspaces(
         self,
         agent_id: str | None = None,
         workspace_type: WorkspaceType | None = None,
     ) -> list[WorkspaceMetadata]:
-        """List available workspaces."""
+        """List available workspaces from the manifest index."""
         workspaces = []
 
-        # List workspace marker files
-        objects = await self.storage.list_objects(
-            bucket_name=self.storage.workspaces_bucket,
-            prefix="workspaces/",
-            recursive=True,
-        )
-
-        workspace_configs = [
-            obj for obj in objects if obj.object_key.endswith(".workspace")
-        ]
-
-        for config_obj in workspace_configs:
-            try:
-                # Load workspace config
-                data = await self.storage.download_data(
-                    bucket_name=self.storage.workspaces_bucket,
-                    object_key=config_obj.object_key,
-                )
-
-                config_data = json.loads(data.decode("utf-8"))
-                workspace_id = config_data.get("workspace_id")
-
-                # Apply filters
-                if agent_id and config_data.get("owner_agent_id") != agent_id:
-                    if agent_id not in config_data.get("authorized_agents", []):
-                        continue
-
-                if (
-                    workspace_type
-                    and config_data.get("workspace_type") != workspace_type.value
-                ):
-                    continue
-
-                # Get workspace statistics
-                metadata = await self._get_workspace_metadata(workspace_id, config_data)
-                workspaces.append(metadata)
+        for manifest in self.manifest.entries.values():
+            # Apply filters
+            if (
+                agent_id
+                and manifest.owner_agent_id != agent_id
+                and agent_id not in manifest.authorized_agents
+            ):
+                continue
 
-            except Exception as e:
-                logger.warning(
-                    f"Failed to load workspace config {config_obj.object_key}: {e}"
-                )
+            if workspace_type and manifest.workspace_type != workspace_type.value:
                 continue
 
+            workspaces.append(self._get_workspace_metadata(manifest))
+
         return workspaces
 
     async def upload_file(
@@ -267,8 +309,8 @@ class WorkspaceManager:
             metadata=upload_metadata,
         )
 
-        # Update workspace last modified
-        await self._update_workspace_timestamp(workspace_id)
+        # Update the manifest (also bumps workspace last modified)
+        await self.manifest.record_upload(workspace_id, file_path, result)
 
         logger.info(
             f"Uploaded {file_path} to workspace {workspace_id} by agent {agent_id}"
@@ -311,6 +353,185 @@ class WorkspaceManager:
         )
         return result
 
+    async def upload_tree(
+        self,
+        workspace_id: str,
+        local_dir: Path,
+        agent_id: str,
+        prefix: str = "",
+        metadata: dict[str, Any] | None = None,
+        max_concurrency: int = 8,
+    ) -> AsyncIterator[TreeTransferProgress]:
+        """
+        Upload a local directory into a workspace.
+
+        Files whose SHA-256 matches the workspace manifest are skipped; the
+        rest are uploaded with at most ``max_concurrency`` transfers in
+        flight. Yields one progress event per file as it completes.
+        """
+        workspace = await self.get_workspace(workspace_id)
+        if not workspace:
+            raise ValueError(f"Workspace {workspace_id} not found")
+
+        # Check permissions once for the whole tree
+        if not self._check_write_permission(workspace, agent_id):
+            raise PermissionError(
+                f"Agent {agent_id} not authorized to write to workspace {workspace_id}"
+            )
+
+        local_dir = Path(local_dir)
+        local_files = {
+            prefix + path.relative_to(local_dir).as_posix(): path
+            for path in sorted(local_dir.rglob("*"))
+            if path.is_file()
+        }
+        known_files = await self.manifest.get_files(workspace_id)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def transfer(file_path: str, local_path: Path) -> TreeTransferProgress:
+            size = local_path.stat().st_size
+            async with semaphore:
+                try:
+                    file_hash = await self.storage.calculate_file_hash(local_path)
+                    known = known_files.get(file_path)
+                    if known and known.file_hash == file_hash:
+                        return self._progress(file_path, "skipped", size)
+
+                    if known:
+                        conflict = await self._handle_file_conflict(
+                            workspace, file_path, agent_id, known
+                        )
+                        if conflict and not conflict.resolved:
+                            self.conflict_queue.append(conflict)
+                            raise RuntimeError(
+                                f"File conflict detected for {file_path} - requires resolution"
+                            )
+
+                    result = await self.storage.upload_file(
+                        bucket_name=self.storage.workspaces_bucket,
+                        object_key=f"workspaces/{workspace_id}/files/{file_path}",
+                        file_path=local_path,
+                        metadata={
+                            "workspace_id": workspace_id,
+                            "uploaded_by": agent_id,
+                            "upload_timestamp": datetime.utcnow().isoformat(),
+                            "file_path": file_path,
+                            **(metadata or {}),
+                        },
+                        file_hash=file_hash,
+                    )
+                    await self.manifest.record_upload(
+                        workspace_id, file_path, result, file_hash=file_hash
+                    )
+                    return self._progress(file_path, "uploaded", size)
+
+                except Exception as e:
+                    logger.warning(f"Failed to upload {file_path}: {e}")
+                    return self._progress(file_path, "failed", size, str(e))
+
+        async for progress in self._run_transfers(
+            [transfer(path, local) for path, local in local_files.items()],
+            files_total=len(local_files),
+            bytes_total=sum(p.stat().st_size for p in local_files.values()),
+        ):
+            yield progress
+
+        logger.info(
+            f"Uploaded tree {local_dir} to workspace {workspace_id} by agent {agent_id}"
+        )
+
+    async def download_tree(
+        self,
+        workspace_id: str,
+        local_dir: Path,
+        agent_id: str,
+        prefix: str = "",
+        max_concurrency: int = 8,
+    ) -> AsyncIterator[TreeTransferProgress]:
+        """
+        Download workspace files under ``prefix`` into a local directory.
+
+        Local files whose SHA-256 already matches the manifest are skipped;
+        the rest are downloaded with at most ``max_concurrency`` transfers in
+        flight. Yields one progress event per file as it completes.
+        """
+        workspace = await self.get_workspace(workspace_id)
+        if not workspace:
+            raise ValueError(f"Workspace {workspace_id} not found")
+
+        # Check permissions once for the whole tree
+        if not self._check_read_permission(workspace, agent_id):
+            raise PermissionError(
+                f"Agent {agent_id} not authorized to read from workspace {workspace_id}"
+            )
+
+        local_dir = Path(local_dir)
+        files = await self.manifest.get_files(workspace_id)
+        entries = [entry for path, entry in files.items() if path.startswith(prefix)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def transfer(entry: ManifestFileEntry) -> TreeTransferProgress:
+            local_path = local_dir / entry.file_path[len(prefix) :]
+            async with semaphore:
+                try:
+                    if (
+                        entry.file_hash
+                        and local_path.is_file()
+                        and await self.storage.calculate_file_hash(local_path)
+                        == entry.file_hash
+                    ):
+                        return self._progress(entry.file_path, "skipped", entry.size)
+
+                    await self.storage.download_file(
+                        bucket_name=self.storage.workspaces_bucket,
+                        object_key=f"workspaces/{workspace_id}/files/{entry.file_path}",
+                        file_path=local_path,
+                    )
+                    return self._progress(entry.file_path, "downloaded", entry.size)
+
+                except Exception as e:
+                    logger.warning(f"Failed to download {entry.file_path}: {e}")
+                    return self._progress(entry.file_path, "failed", entry.size, str(e))
+
+        async for progress in self._run_transfers(
+            [transfer(entry) for entry in entries],
+            files_total=len(entries),
+            bytes_total=sum(entry.size for entry in entries),
+        ):
+            yield progress
+
+        # Update workspace last accessed
+        await self._update_workspace_timestamp(workspace_id, access_only=True)
+
+        logger.info(
+            f"Downloaded tree from workspace {workspace_id} to {local_dir} by agent {agent_id}"
+        )
+
+    async def delete_file(
+        self, workspace_id: str, file_path: str, agent_id: str
+    ) -> None:
+        """Delete a file from a workspace."""
+        workspace = await self.get_workspace(workspace_id)
+        if not workspace:
+            raise ValueError(f"Workspace {workspace_id} not found")
+
+        # Check permissions
+        if not self._check_write_permission(workspace, agent_id):
+            raise PermissionError(
+                f"Agent {agent_id} not authorized to write to workspace {workspace_id}"
+            )
+
+        await self.storage.delete_object(
+            bucket_name=self.storage.workspaces_bucket,
+            object_key=f"workspaces/{workspace_id}/files/{file_path}",
+        )
+
+        await self.manifest.record_delete(workspace_id, file_path)
+
+        logger.info(
+            f"Deleted {file_path} from workspace {workspace_id} by agent {agent_id}"
+        )
+
     async def list_workspace_files(
         self, workspace_id: str, agent_id: str, prefix: str | None = None
     ) -> list[dict[str, Any]]:
@@ -353,8 +574,17 @@ class WorkspaceManager:
 
         return files
 
-    async def sync_workspace(self, workspace_id: str) -> dict[str, Any]:
-        """Manually sync a workspace."""
+    async def sync_workspace(
+        self, workspace_id: str, full: bool = False
+    ) -> dict[str, Any]:
+        """
+        Sync a workspace.
+
+        Only files changed since the previous sync are checked, using the
+        manifest change journal. A full sync (first sync, journal overflow,
+        or ``full=True``) first reconciles the manifest with storage by ETag
+        and then checks every file.
+        """
         workspace = await self.get_workspace(workspace_id)
         if not workspace:
             raise ValueError(f"Workspace {workspace_id} not found")
@@ -362,18 +592,37 @@ class WorkspaceManager:
         sync_result = {
             "workspace_id": workspace_id,
             "sync_timestamp": datetime.utcnow().isoformat(),
+            "mode": "delta",
             "conflicts_detected": 0,
             "files_synced": 0,
             "errors": [],
         }
 
         try:
-            # Get all files in workspace
-            files = await self.list_workspace_files(
-                workspace_id, workspace.owner_agent_id
+            cursor = self._sync_cursors.get(workspace_id)
+            changes = (
+                None
+                if full or cursor is None
+                else self.manifest.changes_since(workspace_id, cursor)
             )
 
-            for file_info in files:
+            if changes is None:
+                sync_result["mode"] = "full"
+                await self.manifest.reconcile(workspace_id)
+                changed_paths = None
+            else:
+                changed_paths = [c.file_path for c in changes if c.action != "delete"]
+
+            position = self.manifest.journal_position(workspace_id)
+            files = await self.manifest.get_files(workspace_id)
+            entries = (
+                list(files.values())
+                if changed_paths is None
+                else [files[p] for p in changed_paths if p in files]
+            )
+
+            for entry in entries:
+                file_info = self._file_info(workspace_id, entry)
                 try:
                     # Check for conflicts with other agents
                     await self._check_file_sync_conflicts(workspace, file_info)
@@ -385,8 +634,10 @@ class WorkspaceManager:
                         {"file": file_info["file_path"], "error": str(e)}
                     )
 
+            self._sync_cursors[workspace_id] = position
+
             logger.info(
-                f"Synced workspace {workspace_id}: {sync_result['files_synced']} files, {sync_result['conflicts_detected']} conflicts"
+                f"Synced workspace {workspace_id} ({sync_result['mode']}): {sync_result['files_synced']} files, {sync_result['conflicts_detected']} conflicts"
             )
 
         except Exception as e:
@@ -576,9 +827,7 @@ class WorkspaceManager:
         except Exception as e:
             logger.warning(f"Failed to load workspace configurations: {e}")
 
-    async def _load_workspace_config(
-        self, workspace_id: str
-    ) -> WorkspaceConfig | None:
+    async def _load_workspace_config(self, workspace_id: str) -> WorkspaceConfig | None:
         """Load a specific workspace configuration."""
         try:
             return await self._load_workspace_config_from_object(
@@ -671,31 +920,65 @@ class WorkspaceManager:
 
         return conflict
 
-    async def _get_workspace_metadata(
-        self, workspace_id: str, config_data: dict
-    ) -> WorkspaceMetadata:
-        """Get metadata for a workspace."""
-        # Count files and calculate size
-        files = await self.storage.list_objects(
-            bucket_name=self.storage.workspaces_bucket,
-            prefix=f"workspaces/{workspace_id}/files/",
+    def _progress(
+        self, file_path: str, action: str, size: int, error: str | None = None
+    ) -> TreeTransferProgress:
+        """Create a per-file progress event; totals are filled in by the runner."""
+        return TreeTransferProgress(
+            file_path=file_path,
+            action=action,
+            files_done=0,
+            files_total=0,
+            bytes_done=size,
+            bytes_total=0,
+            error=error,
         )
 
-        total_size = sum(obj.size for obj in files)
+    async def _run_transfers(
+        self, transfers: list, files_total: int, bytes_total: int
+    ) -> AsyncIterator[TreeTransferProgress]:
+        """Run transfer coroutines concurrently, yielding progress as they finish."""
+        tasks = [asyncio.ensure_future(transfer) for transfer in transfers]
+        files_done = 0
+        bytes_done = 0
 
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                progress = await next_done
+                files_done += 1
+                bytes_done += progress.bytes_done
+                progress.files_done = files_done
+                progress.files_total = files_total
+                progress.bytes_done = bytes_done
+                progress.bytes_total = bytes_total
+                yield progress
+        finally:
+            # Stop outstanding transfers if the caller abandons the stream
+            for task in tasks:
+                task.cancel()
+
+    def _file_info(self, workspace_id: str, entry: ManifestFileEntry) -> dict[str, Any]:
+        """Build a file info dict for a manifest entry."""
+        return {
+            "file_path": entry.file_path,
+            "size": entry.size,
+            "last_modified": entry.last_modified,
+            "etag": entry.etag,
+            "version_id": entry.version_id,
+            "object_key": f"workspaces/{workspace_id}/files/{entry.file_path}",
+        }
+
+    def _get_workspace_metadata(self, manifest: WorkspaceManifest) -> WorkspaceMetadata:
+        """Get metadata for a workspace from its manifest entry."""
         return WorkspaceMetadata(
-            workspace_id=workspace_id,
-            workspace_type=WorkspaceType(config_data["workspace_type"]),
-            owner_agent_id=config_data["owner_agent_id"],
-            created_at=datetime.fromisoformat(
-                config_data.get("created_at", "2024-01-01T00:00:00")
-            ),
-            last_accessed=datetime.utcnow(),  # Would be tracked separately
-            last_modified=datetime.fromisoformat(
-                config_data.get("updated_at", "2024-01-01T00:00:00")
-            ),
-            file_count=len(files),
-            total_size=total_size,
+            workspace_id=manifest.workspace_id,
+            workspace_type=WorkspaceType(manifest.workspace_type),
+            owner_agent_id=manifest.owner_agent_id,
+            created_at=manifest.created_at,
+            last_accessed=manifest.last_accessed,
+            last_modified=manifest.last_modified,
+            file_count=manifest.file_count,
+            total_size=manifest.total_size,
             version_count=0,  # Would require separate tracking
         )
 
@@ -703,29 +986,90 @@ class WorkspaceManager:
         self, workspace_id: str, access_only: bool = False
     ) -> None:
         """Update workspace timestamp."""
-        # This would update workspace metadata
-        # For now, we'll skip the implementation as it requires additional tracking
-        pass
+        self.manifest.touch(workspace_id, access_only=access_only)
 
     async def _start_sync_task(self, config: WorkspaceConfig) -> None:
-        """Start automatic sync task for workspace."""
-        if config.workspace_id in self.sync_tasks:
+        """Add a workspace to the shared sync scheduler."""
+        if config.workspace_id in self._scheduled_workspaces:
             return
 
-        async def sync_loop():
-            while True:
-                try:
-                    await asyncio.sleep(config.sync_interval)
-                    await self.sync_workspace(config.workspace_id)
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    logger.error(
-                        f"Sync task error for workspace {config.workspace_id}: {e}"
-                    )
+        self._scheduled_workspaces.add(config.workspace_id)
+        heapq.heappush(
+            self._sync_schedule,
+            (self._next_sync_time(config), config.workspace_id),
+        )
+        self._sync_wakeup.set()
+
+        if self._sync_scheduler_task is None or self._sync_scheduler_task.done():
+            self._sync_scheduler_task = asyncio.create_task(self._sync_scheduler())
 
-        task = asyncio.create_task(sync_loop())
-        self.sync_tasks[config.workspace_id] = task
+    def _next_sync_time(self, config: WorkspaceConfig) -> float:
+        """Next due time for a workspace sync, jittered to avoid bursts."""
+        # Scheduling jitter only, so a non-cryptographic generator is fine
+        spread = self.sync_jitter
+        jitter = random.uniform(1 - spread, 1 + spread)  # noqa: S311
+        return asyncio.get_running_loop().time() + config.sync_interval * jitter
+
+    async def _sync_scheduler(self) -> None:
+        """Single loop that runs due syncs for all auto-sync workspaces."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            try:
+                if not self._sync_schedule:
+                    await self._sync_wakeup.wait()
+                    self._sync_wakeup.clear()
+                    continue
+
+                due, workspace_id = self._sync_schedule[0]
+                delay = due - loop.time()
+                if delay > 0:
+                    # Wake early if a workspace with an earlier due time is added
+                    try:
+                        await asyncio.wait_for(self._sync_wakeup.wait(), delay)
+                    except TimeoutError:
+                        pass
+                    self._sync_wakeup.clear()
+                    continue
+
+                heapq.heappop(self._sync_schedule)
+                config = self.active_workspaces.get(workspace_id)
+                if config is None or not config.auto_sync:
+                    self._scheduled_workspaces.discard(workspace_id)
+                    continue
+
+                # A slow workspace only holds its own slot; the workspace is
+                # rescheduled when its sync finishes
+                await self._sync_slots.acquire()
+                task = asyncio.create_task(self._run_scheduled_sync(workspace_id))
+                self._sync_tasks.add(task)
+                task.add_done_callback(self._sync_tasks.discard)
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Sync scheduler error: {e}")
+
+    async def _run_scheduled_sync(self, workspace_id: str) -> None:
+        """Run one scheduled sync, then put the workspace back on the schedule."""
+        try:
+            count = self._sync_counts.get(workspace_id, 0)
+            self._sync_counts[workspace_id] = count + 1
+            await self.sync_workspace(
+                workspace_id, full=count % self.full_sync_every == 0
+            )
+        except Exception as e:
+            logger.error(f"Scheduled sync of workspace {workspace_id} failed: {e}")
+        finally:
+            self._sync_slots.release()
+            config = self.active_workspaces.get(workspace_id)
+            if config is None or not config.auto_sync:
+                self._scheduled_workspaces.discard(workspace_id)
+            elif workspace_id in self._scheduled_workspaces:
+                heapq.heappush(
+                    self._sync_schedule, (self._next_sync_time(config), workspace_id)
+                )
+                self._sync_wakeup.set()
 
     async def _check_file_sync_conflicts(
         self, workspace: WorkspaceConfig, file_info: dict
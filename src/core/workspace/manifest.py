@@ -0,0 +1,556 @@
+"""
+Workspace manifest index for AIOSv3.
+
+Keeps per-workspace summaries (file count, total size, timestamps, access
+list) and file listings in memory, persisted to object storage, so workspace
+queries do not need to scan and download objects one by one.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from src.core.storage.object_store import ObjectStorage, StorageMetadata
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ManifestFileEntry:
+    """A file tracked in a workspace manifest."""
+
+    file_path: str
+    size: int
+    etag: str
+    last_modified: datetime
+    version_id: str | None = None
+    file_hash: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the entry for storage."""
+        return {
+            "file_path": self.file_path,
+            "size": self.size,
+            "etag": self.etag,
+            "last_modified": self.last_modified.isoformat(),
+            "version_id": self.version_id,
+            "file_hash": self.file_hash,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ManifestFileEntry":
+        """Deserialize an entry from storage."""
+        return cls(
+            file_path=data["file_path"],
+            size=data["size"],
+            etag=data["etag"],
+            last_modified=datetime.fromisoformat(data["last_modified"]),
+            version_id=data.get("version_id"),
+            file_hash=data.get("file_hash"),
+        )
+
+
+@dataclass
+class ManifestChange:
+    """A journaled change to a workspace file."""
+
+    seq: int
+    file_path: str
+    action: str  # "upsert" or "delete"
+    etag: str | None
+    recorded_at: datetime
+
+
+@dataclass
+class WorkspaceManifest:
+    """Summary of a workspace kept in the manifest index."""
+
+    workspace_id: str
+    workspace_type: str
+    owner_agent_id: str
+    authorized_agents: list[str]
+    created_at: datetime
+    last_modified: datetime
+    last_accessed: datetime
+    file_count: int = 0
+    total_size: int = 0
+    # Loaded lazily; None until the workspace's file manifest is read
+    files: dict[str, ManifestFileEntry] | None = field(default=None, repr=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the summary (without files) for the index object."""
+        return {
+            "workspace_id": self.workspace_id,
+            "workspace_type": self.workspace_type,
+            "owner_agent_id": self.owner_agent_id,
+            "authorized_agents": self.authorized_agents,
+            "created_at": self.created_at.isoformat(),
+            "last_modified": self.last_modified.isoformat(),
+            "last_accessed": self.last_accessed.isoformat(),
+            "file_count": self.file_count,
+            "total_size": self.total_size,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "WorkspaceManifest":
+        """Deserialize a summary from the index object."""
+        return cls(
+            workspace_id=data["workspace_id"],
+            workspace_type=data["workspace_type"],
+            owner_agent_id=data["owner_agent_id"],
+            authorized_agents=data.get("authorized_agents", []),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            last_modified=datetime.fromisoformat(data["last_modified"]),
+            last_accessed=datetime.fromisoformat(data["last_accessed"]),
+            file_count=data.get("file_count", 0),
+            total_size=data.get("total_size", 0),
+        )
+
+
+class WorkspaceManifestIndex:
+    """
+    Incrementally maintained index of workspaces and their files.
+
+    Summaries for every workspace live in a single index object; each
+    workspace's file listing lives next to it in its own manifest object and
+    is loaded on first use. Mutations are applied in memory and written back
+    in the background after ``flush_delay`` seconds, so bursts of uploads
+    cost one write per touched manifest.
+    """
+
+    index_key = "index/workspaces.json"
+
+    def __init__(
+        self,
+        storage: ObjectStorage,
+        flush_delay: float = 1.0,
+        journal_size: int = 1000,
+    ):
+        """Initialize the manifest index."""
+        self.storage = storage
+        self.flush_delay = flush_delay
+        self.journal_size = journal_size
+        self.entries: dict[str, WorkspaceManifest] = {}
+        # In-memory change journals; a restart simply forces one full sync
+        self._journals: dict[str, deque[ManifestChange]] = {}
+        self._journal_seq: dict[str, int] = {}
+        self._dirty_workspaces: set[str] = set()
+        self._index_dirty = False
+        self._flush_task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def files_prefix(workspace_id: str) -> str:
+        """Object key prefix for files in a workspace."""
+        return f"workspaces/{workspace_id}/files/"
+
+    @staticmethod
+    def manifest_key(workspace_id: str) -> str:
+        """Object key of a workspace's file manifest."""
+        return f"workspaces/{workspace_id}/.manifest.json"
+
+    async def load(self) -> bool:
+        """Load the index object. Returns False if it does not exist yet."""
+        try:
+            data = await self.storage.download_data(
+                bucket_name=self.storage.workspaces_bucket, object_key=self.index_key
+            )
+        except Exception:
+            return False
+
+        index_data = json.loads(data.decode("utf-8"))
+        self.entries = {
+            item["workspace_id"]: WorkspaceManifest.from_dict(item)
+            for item in index_data.get("workspaces", [])
+        }
+
+        logger.info(f"Loaded manifest index with {len(self.entries)} workspaces")
+        return True
+
+    async def rebuild(self, configs: dict[str, Any]) -> None:
+        """
+        Rebuild the index from workspace configs and a single bucket listing.
+
+        Args:
+            configs: WorkspaceConfig objects keyed by workspace ID
+        """
+        objects = await self.storage.list_objects(
+            bucket_name=self.storage.workspaces_bucket,
+            prefix="workspaces/",
+            recursive=True,
+        )
+
+        files_by_workspace: dict[str, dict[str, ManifestFileEntry]] = {}
+        for obj in objects:
+            parts = obj.object_key.split("/", 3)
+            if len(parts) < 4 or parts[2] != "files":
+                continue
+            files_by_workspace.setdefault(parts[1], {})[parts[3]] = (
+                self._entry_from_metadata(parts[3], obj)
+            )
+
+        now = datetime.utcnow()
+        self.entries = {}
+        for workspace_id, config in configs.items():
+            files = files_by_workspace.get(workspace_id, {})
+            last_modified = max(
+                (entry.last_modified for entry in files.values()), default=now
+            )
+            self.entries[workspace_id] = WorkspaceManifest(
+                workspace_id=workspace_id,
+                workspace_type=config.workspace_type.value,
+                owner_agent_id=config.owner_agent_id,
+                authorized_agents=list(config.authorized_agents),
+                created_at=now,
+                last_modified=last_modified,
+                last_accessed=now,
+                file_count=len(files),
+                total_size=sum(entry.size for entry in files.values()),
+                files=files,
+            )
+
+        self._dirty_workspaces.update(self.entries)
+        self._index_dirty = True
+        await self.flush()
+
+        logger.info(f"Rebuilt manifest index for {len(self.entries)} workspaces")
+
+    def sync_workspaces(self, configs: dict[str, Any]) -> int:
+        """
+        Reconcile a loaded index with the workspace configs in storage.
+
+        A config saved shortly before a crash may not have reached the index
+        yet, and a deleted workspace may still be listed in it. Missing
+        workspaces are added (their files are listed on first use) and
+        stale entries are dropped.
+
+        Args:
+            configs: WorkspaceConfig objects keyed by workspace ID
+
+        Returns:
+            Number of entries added or dropped
+        """
+        missing = [wid for wid in configs if wid not in self.entries]
+        stale = [wid for wid in self.entries if wid not in configs]
+
+        for workspace_id in missing:
+            self.add_workspace(configs[workspace_id], is_new=False)
+        for workspace_id in stale:
+            del self.entries[workspace_id]
+            self._dirty_workspaces.discard(workspace_id)
+
+        if stale:
+            self._index_dirty = True
+            self._schedule_flush()
+        if missing or stale:
+            logger.info(
+                f"Reconciled manifest index: added {len(missing)}, dropped {len(stale)}"
+            )
+        return len(missing) + len(stale)
+
+    def get(self, workspace_id: str) -> WorkspaceManifest | None:
+        """Get the summary for a workspace."""
+        return self.entries.get(workspace_id)
+
+    def add_workspace(self, config: Any, is_new: bool = True) -> WorkspaceManifest:
+        """
+        Register a workspace in the index.
+
+        Args:
+            config: WorkspaceConfig of the workspace
+            is_new: Whether the workspace is known to be empty; otherwise its
+                files are listed on first use
+        """
+        now = datetime.utcnow()
+        manifest = WorkspaceManifest(
+            workspace_id=config.workspace_id,
+            workspace_type=config.workspace_type.value,
+            owner_agent_id=config.owner_agent_id,
+            authorized_agents=list(config.authorized_agents),
+            created_at=now,
+            last_modified=now,
+            last_accessed=now,
+            files={} if is_new else None,
+        )
+        self.entries[config.workspace_id] = manifest
+        self._mark_dirty(config.workspace_id)
+        return manifest
+
+    async def get_files(self, workspace_id: str) -> dict[str, ManifestFileEntry]:
+        """Get the file listing of a workspace, loading it on first use."""
+        manifest = self.entries.get(workspace_id)
+        if manifest is None:
+            raise KeyError(workspace_id)
+
+        if manifest.files is None:
+            async with self._lock:
+                if manifest.files is None:
+                    manifest.files = await self._load_files(workspace_id)
+                    manifest.file_count = len(manifest.files)
+                    manifest.total_size = sum(
+                        entry.size for entry in manifest.files.values()
+                    )
+
+        return manifest.files
+
+    async def record_upload(
+        self,
+        workspace_id: str,
+        file_path: str,
+        metadata: StorageMetadata,
+        file_hash: str | None = None,
+    ) -> ManifestFileEntry:
+        """Record an uploaded (new or replaced) file."""
+        files = await self.get_files(workspace_id)
+        manifest = self.entries[workspace_id]
+
+        entry = self._entry_from_metadata(file_path, metadata, file_hash)
+        previous = files.get(file_path)
+        if previous:
+            manifest.total_size -= previous.size
+        else:
+            manifest.file_count += 1
+
+        files[file_path] = entry
+        manifest.total_size += entry.size
+        manifest.last_modified = datetime.utcnow()
+
+        self._journal(workspace_id, file_path, "upsert", entry.etag)
+        self._mark_dirty(workspace_id)
+        return entry
+
+    async def record_delete(self, workspace_id: str, file_path: str) -> None:
+        """Record a deleted file."""
+        files = await self.get_files(workspace_id)
+        manifest = self.entries[workspace_id]
+
+        previous = files.pop(file_path, None)
+        if previous:
+            manifest.file_count -= 1
+            manifest.total_size -= previous.size
+            manifest.last_modified = datetime.utcnow()
+            self._journal(workspace_id, file_path, "delete", None)
+            self._mark_dirty(workspace_id)
+
+    def journal_position(self, workspace_id: str) -> int:
+        """Sequence number of the latest journaled change for a workspace."""
+        return self._journal_seq.get(workspace_id, 0)
+
+    def changes_since(
+        self, workspace_id: str, position: int
+    ) -> list[ManifestChange] | None:
+        """
+        Get changes journaled after ``position``, latest change per file.
+
+        Returns None if the journal no longer reaches back to ``position``,
+        in which case the caller must fall back to a full sync.
+        """
+        journal = self._journals.get(workspace_id)
+        if not journal:
+            return [] if position == self.journal_position(workspace_id) else None
+        if position < journal[0].seq - 1:
+            return None
+
+        latest: dict[str, ManifestChange] = {}
+        for change in journal:
+            if change.seq > position:
+                latest[change.file_path] = change
+        return sorted(latest.values(), key=lambda c: c.seq)
+
+    async def reconcile(self, workspace_id: str) -> int:
+        """
+        Compare the manifest against one storage listing by ETag.
+
+        Changes made outside this index (other processes, direct bucket
+        writes) are applied and journaled. Returns the number of changes found.
+        """
+        files = await self.get_files(workspace_id)
+        prefix = self.files_prefix(workspace_id)
+        objects = await self.storage.list_objects(
+            bucket_name=self.storage.workspaces_bucket, prefix=prefix
+        )
+
+        changes = 0
+        seen = set()
+        for obj in objects:
+            file_path = obj.object_key[len(prefix) :]
+            seen.add(file_path)
+            known = files.get(file_path)
+            if known is None or known.etag != obj.etag:
+                await self.record_upload(workspace_id, file_path, obj)
+                changes += 1
+
+        for file_path in set(files) - seen:
+            await self.record_delete(workspace_id, file_path)
+            changes += 1
+
+        return changes
+
+    def touch(self, workspace_id: str, access_only: bool = False) -> None:
+        """Update workspace access (and optionally modification) time."""
+        manifest = self.entries.get(workspace_id)
+        if manifest is None:
+            return
+
+        now = datetime.utcnow()
+        manifest.last_accessed = now
+        if not access_only:
+            manifest.last_modified = now
+
+        # Access times only go into the index, not the file manifest
+        self._index_dirty = True
+        self._schedule_flush()
+
+    async def flush(self) -> None:
+        """Write dirty file manifests and the index back to storage."""
+        async with self._lock:
+            dirty = self._dirty_workspaces
+            self._dirty_workspaces = set()
+            index_dirty = self._index_dirty
+            self._index_dirty = False
+
+            try:
+                await self._write(dirty, index_dirty)
+            except Exception:
+                # Keep the changes so the next flush retries them
+                self._dirty_workspaces |= dirty
+                self._index_dirty = self._index_dirty or index_dirty
+                raise
+
+    async def close(self) -> None:
+        """Cancel any pending background flush and flush synchronously."""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self.flush()
+
+    # Private helper methods
+
+    async def _write(self, dirty: set[str], index_dirty: bool) -> None:
+        """Upload the given file manifests and, if needed, the index."""
+        for workspace_id in dirty:
+            manifest = self.entries.get(workspace_id)
+            if manifest is None or manifest.files is None:
+                continue
+            await self.storage.upload_data(
+                bucket_name=self.storage.workspaces_bucket,
+                object_key=self.manifest_key(workspace_id),
+                data=json.dumps(
+                    {
+                        "workspace_id": workspace_id,
+                        "files": [f.to_dict() for f in manifest.files.values()],
+                    }
+                ),
+                content_type="application/json",
+            )
+
+        if index_dirty or dirty:
+            await self.storage.upload_data(
+                bucket_name=self.storage.workspaces_bucket,
+                object_key=self.index_key,
+                data=json.dumps(
+                    {
+                        "updated_at": datetime.utcnow().isoformat(),
+                        "workspaces": [m.to_dict() for m in self.entries.values()],
+                    }
+                ),
+                content_type="application/json",
+            )
+
+    def _journal(
+        self, workspace_id: str, file_path: str, action: str, etag: str | None
+    ) -> None:
+        """Append a change to a workspace's bounded journal."""
+        seq = self._journal_seq.get(workspace_id, 0) + 1
+        self._journal_seq[workspace_id] = seq
+
+        journal = self._journals.get(workspace_id)
+        if journal is None:
+            journal = self._journals[workspace_id] = deque(maxlen=self.journal_size)
+        journal.append(
+            ManifestChange(
+                seq=seq,
+                file_path=file_path,
+                action=action,
+                etag=etag,
+                recorded_at=datetime.utcnow(),
+            )
+        )
+
+    def _mark_dirty(self, workspace_id: str) -> None:
+        """Mark a workspace manifest (and the index) for writing."""
+        self._dirty_workspaces.add(workspace_id)
+        self._index_dirty = True
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Schedule a delayed background flush if none is pending."""
+        if self._flush_task and not self._flush_task.done():
+            return
+
+        async def delayed_flush():
+            try:
+                await asyncio.sleep(self.flush_delay)
+                await self.flush()
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.error(f"Failed to flush workspace manifest index: {e}")
+
+        flush = delayed_flush()
+        try:
+            self._flush_task = asyncio.create_task(flush)
+        except RuntimeError:
+            # No running loop (e.g. synchronous callers); flush on next close()
+            flush.close()
+            self._flush_task = None
+
+    async def _load_files(self, workspace_id: str) -> dict[str, ManifestFileEntry]:
+        """Load a workspace's file manifest, rebuilding it from a listing if absent."""
+        try:
+            data = await self.storage.download_data(
+                bucket_name=self.storage.workspaces_bucket,
+                object_key=self.manifest_key(workspace_id),
+            )
+            manifest_data = json.loads(data.decode("utf-8"))
+            return {
+                item["file_path"]: ManifestFileEntry.from_dict(item)
+                for item in manifest_data.get("files", [])
+            }
+        except Exception as e:
+            logger.debug(f"No file manifest for workspace {workspace_id}: {e}")
+
+        prefix = self.files_prefix(workspace_id)
+        objects = await self.storage.list_objects(
+            bucket_name=self.storage.workspaces_bucket, prefix=prefix
+        )
+        files = {
+            obj.object_key[len(prefix) :]: self._entry_from_metadata(
+                obj.object_key[len(prefix) :], obj
+            )
+            for obj in objects
+        }
+        self._mark_dirty(workspace_id)
+        return files
+
+    @staticmethod
+    def _entry_from_metadata(
+        file_path: str, metadata: StorageMetadata, file_hash: str | None = None
+    ) -> ManifestFileEntry:
+        """Build a file entry from object metadata."""
+        if file_hash is None and metadata.user_metadata:
+            file_hash = metadata.user_metadata.get(
+                "x-amz-meta-file-hash"
+            ) or metadata.user_metadata.get("file-hash")
+
+        return ManifestFileEntry(
+            file_path=file_path,
+            size=metadata.size,
+            etag=metadata.etag,
+            last_modified=metadata.last_modified,
+            version_id=metadata.version_id,
+            file_hash=file_hash,
+        )
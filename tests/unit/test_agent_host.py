@@ -0,0 +1,92 @@
+"""
+Unit tests for the multi-agent process host.
+"""
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.agents.base.agent import AgentConfig, BaseAgent, Task
+from src.agents.base.types import AgentState, AgentType
+from src.core.messaging.queue import MessageQueue
+from src.core.orchestration.host import AgentHost, AgentSpec
+
+
+class HostedAgent(BaseAgent):
+    """Agent that only takes a router from the host."""
+
+    def __init__(self, agent_id: str, llm_router=None, fail: bool = False):
+        config = AgentConfig(
+            name=f"Hosted {agent_id}",
+            description="Agent for host tests",
+            agent_type=AgentType.GENERALIST,
+            capabilities=["general"],
+            model_preferences={},
+        )
+        super().__init__(agent_id=agent_id, config=config, llm_router=llm_router)
+        self.fail = fail
+
+    async def on_start(self) -> None:
+        if self.fail:
+            raise RuntimeError("cannot start")
+
+    async def _execute_task_internal(self, task: Task, model_id: str) -> dict[str, Any]:
+        return {}
+
+
+def make_host() -> AgentHost:
+    """Create a host on caller-owned clients."""
+    return AgentHost(llm_router=MagicMock(), message_queue=MessageQueue(), metrics=MagicMock())
+
+
+class TestAgentHost:
+    """Test shared clients and per-agent isolation."""
+
+    def test_shared_clients_match_constructor_parameters(self):
+        """Test that only accepted parameters receive shared clients."""
+        host = make_host()
+
+        def with_kwargs(name: str, **kwargs):
+            return kwargs
+
+        assert host.shared_kwargs(HostedAgent) == {"llm_router": host.llm_router}
+        assert host.shared_kwargs(with_kwargs) == {
+            "llm_router": host.llm_router,
+            "message_queue": host.message_queue,
+        }
+
+    @pytest.mark.asyncio
+    async def test_agents_share_router_and_fail_in_isolation(self):
+        """Test that agents share one router while a failing agent stays contained."""
+        host = make_host()
+        first = await host.add_agent(HostedAgent, agent_id="first")
+        second = await host.add_agent(AgentSpec("tests.unit.test_agent_host:HostedAgent", {"agent_id": "second"}))
+        await host.add_agent(HostedAgent, agent_id="broken", fail=True)
+
+        await host.start()
+        # Run tasks end once start() returns; the agents keep running
+        await asyncio.gather(*host._agent_tasks.values())
+
+        assert first.llm_router is second.llm_router is host.llm_router
+        assert first.task_history is not second.task_history
+        assert (first.state, second.state) == (AgentState.IDLE, AgentState.IDLE)
+        assert "cannot start" in host.failures["broken"]
+        status = host.get_status()
+        assert status["failed_agents"] == 1
+        assert host.running_agents == ["first", "second"]
+        assert status["running_agents"] == 2
+        assert status["agents"]["first"]["running"]
+        assert not status["agents"]["broken"]["running"]
+        host.metrics.set_active_agents.assert_called_with(2)
+
+        with pytest.raises(ValueError):
+            await host.add_agent(HostedAgent, agent_id="first")
+
+        await host.stop()
+
+        assert (first.state, second.state) == (AgentState.STOPPED, AgentState.STOPPED)
+        assert host.running_agents == []
+        host.metrics.set_active_agents.assert_called_with(0)
+        host.metrics.track_error.assert_called_once_with("agent_host", "AgentInitializationError")
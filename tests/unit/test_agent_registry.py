@@ -2,9 +2,11 @@
 Unit tests for the agent registry and discovery system.
 """
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from src.agents.base.types import (
     AgentHealth,
@@ -21,11 +23,28 @@ from src.core.orchestration.discovery import AgentDiscovery
 
 
 @pytest.fixture
-def mock_redis():
+def mock_pipeline():
+    """Create a mock Redis pipeline (commands queue, execute awaits)."""
+    pipeline_mock = MagicMock()
+    pipeline_mock.execute = AsyncMock(return_value=[])
+    return pipeline_mock
+
+
+@pytest.fixture
+def mock_health_script():
+    """Create a mock for the registered health-tracking script."""
+    return AsyncMock(return_value=1)
+
+
+@pytest.fixture
+def mock_redis(mock_pipeline, mock_health_script):
     """Create a mock Redis client."""
     redis_mock = AsyncMock()
     redis_mock.ping = AsyncMock()
+    redis_mock.get = AsyncMock(return_value="1")  # Indices already built
+    redis_mock.register_script = MagicMock(return_value=mock_health_script)
     redis_mock.hset = AsyncMock()
+    redis_mock.hget = AsyncMock(return_value=None)
     redis_mock.hgetall = AsyncMock()
     redis_mock.exists = AsyncMock()
     redis_mock.expire = AsyncMock()
@@ -33,8 +52,10 @@ def mock_redis():
     redis_mock.sadd = AsyncMock()
     redis_mock.srem = AsyncMock()
     redis_mock.smembers = AsyncMock()
+    redis_mock.zrangebyscore = AsyncMock()
     redis_mock.keys = AsyncMock()
     redis_mock.close = AsyncMock()
+    redis_mock.pipeline = MagicMock(return_value=mock_pipeline)
     return redis_mock
 
 
@@ -108,7 +129,9 @@ class TestAgentRegistry:
                 await registry.initialize()
 
     @pytest.mark.asyncio
-    async def test_agent_registration_success(self, mock_redis, registration_request):
+    async def test_agent_registration_success(
+        self, mock_redis, mock_pipeline, mock_health_script, registration_request
+    ):
         """Test successful agent registration."""
         mock_redis.hgetall.return_value = {}  # Agent doesn't exist
         
@@ -123,9 +146,19 @@ class TestAgentRegistry:
             assert "backend_developer" in response.assigned_queues
             assert "agent.broadcast" in response.assigned_queues
             
-            # Verify Redis calls
-            assert mock_redis.hset.call_count >= 3  # metadata, health, stats
-            mock_redis.sadd.assert_called()  # Adding to indices
+            # Verify Redis calls are pipelined in one round-trip
+            assert mock_pipeline.hset.call_count >= 3  # metadata, health, stats
+            mock_pipeline.sadd.assert_any_call(
+                "aiosv3:registry:indices:type:backend_developer", "test-agent-123"
+            )
+            mock_pipeline.execute.assert_awaited_once()
+
+            # Indices and counters are updated by the script in the same transaction
+            kwargs = mock_health_script.await_args.kwargs
+            assert kwargs["client"] is mock_pipeline
+            assert "aiosv3:registry:index:agents" in kwargs["keys"]
+            assert kwargs["args"][:3] == ["test-agent-123", 1, "backend_developer"]
+            assert json.loads(kwargs["args"][3])["state"] == "idle"
 
     @pytest.mark.asyncio
     async def test_agent_registration_duplicate(self, mock_redis, registration_request, agent_metadata):
@@ -149,7 +182,9 @@ class TestAgentRegistry:
                 await registry.register_agent(registration_request)
 
     @pytest.mark.asyncio
-    async def test_agent_deregistration(self, mock_redis, agent_metadata):
+    async def test_agent_deregistration(
+        self, mock_redis, mock_pipeline, mock_health_script, agent_metadata
+    ):
         """Test agent deregistration."""
         # Mock existing agent
         mock_redis.hgetall.return_value = {
@@ -169,14 +204,15 @@ class TestAgentRegistry:
             success = await registry.deregister_agent("test-agent-123")
             
             assert success
-            mock_redis.delete.assert_called()
-            mock_redis.srem.assert_called()
+            mock_pipeline.delete.assert_called()
+            mock_pipeline.srem.assert_called()
+            kwargs = mock_health_script.await_args.kwargs
+            assert kwargs["client"] is mock_pipeline
+            assert kwargs["args"][:4] == ["test-agent-123", -1, "backend_developer", ""]
 
     @pytest.mark.asyncio
-    async def test_health_update(self, mock_redis, agent_health):
+    async def test_health_update(self, mock_redis, mock_health_script, agent_health):
         """Test agent health update."""
-        mock_redis.exists.return_value = True
-        
         with patch('redis.asyncio.from_url', return_value=mock_redis):
             registry = AgentRegistry()
             await registry.initialize()
@@ -184,8 +220,24 @@ class TestAgentRegistry:
             success = await registry.update_agent_health("test-agent-123", agent_health)
             
             assert success
-            mock_redis.hset.assert_called()
-            mock_redis.expire.assert_called()
+            # One atomic script call, not a read followed by a write
+            mock_health_script.assert_awaited_once()
+            kwargs = mock_health_script.await_args.kwargs
+            assert kwargs["client"] is None
+            assert kwargs["keys"][-1] == "aiosv3:registry:agents:test-agent-123:health"
+            args = kwargs["args"]
+            assert args[:3] == ["test-agent-123", 0, ""]
+            assert json.loads(args[3]) == {
+                "state": "idle",
+                "is_healthy": True,
+                "health_score": 0.95,
+            }
+            assert dict(zip(args[6::2], args[7::2], strict=True))["state"] == AgentState.IDLE
+            mock_redis.hget.assert_not_called()
+
+            # Health updates for unknown agents are rejected by the script
+            mock_health_script.return_value = 0
+            assert not await registry.update_agent_health("ghost", agent_health)
 
     @pytest.mark.asyncio
     async def test_get_agent_metadata(self, mock_redis):
@@ -273,53 +325,18 @@ class TestAgentRegistry:
     @pytest.mark.asyncio
     async def test_registry_stats(self, mock_redis):
         """Test getting registry statistics."""
-        # Mock Redis responses for stats
-        mock_redis.keys.return_value = [
-            "aiosv3:registry:agents:agent-1:metadata",
-            "aiosv3:registry:agents:agent-2:metadata",
-        ]
-        
-        # Mock metadata responses
-        metadata_responses = [
-            {
-                "id": "agent-1",
-                "type": "backend_developer",
-                "name": "Agent 1",
-                "description": "Test agent 1",
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat(),
-                "tags": "[]",
-            },
-            {
-                "id": "agent-2",
-                "type": "frontend_developer", 
-                "name": "Agent 2",
-                "description": "Test agent 2",
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat(),
-                "tags": "[]",
-            },
-        ]
-        
-        # Mock health responses
-        health_responses = [
-            {
-                "agent_id": "agent-1",
-                "state": "idle",
-                "last_heartbeat": datetime.utcnow().isoformat(),
-                "is_healthy": "true",
-                "health_score": "0.9",
-            },
-            {
-                "agent_id": "agent-2", 
-                "state": "busy",
-                "last_heartbeat": datetime.utcnow().isoformat(),
-                "is_healthy": "true",
-                "health_score": "0.8",
-            },
-        ]
-        
-        mock_redis.hgetall.side_effect = metadata_responses + health_responses
+        # Counters maintained incrementally in the summary hash
+        mock_redis.hgetall.return_value = {
+            "total_agents": "2",
+            "type:backend_developer": "1",
+            "type:frontend_developer": "1",
+            "type:qa_engineer": "0",
+            "state:idle": "1",
+            "state:busy": "1",
+            "healthy_agents": "2",
+            "unhealthy_agents": "0",
+            "health_score_sum": "1.7",
+        }
         
         with patch('redis.asyncio.from_url', return_value=mock_redis):
             registry = AgentRegistry()
@@ -332,23 +349,17 @@ class TestAgentRegistry:
             assert stats["unhealthy_agents"] == 0
             assert "backend_developer" in stats["agents_by_type"]
             assert "frontend_developer" in stats["agents_by_type"]
-            assert stats["average_health_score"] == 0.85
+            assert "qa_engineer" not in stats["agents_by_type"]
+            assert stats["average_health_score"] == pytest.approx(0.85)
+            mock_redis.hgetall.assert_called_once_with("aiosv3:registry:stats:summary")
+            mock_redis.keys.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_stale_agent_cleanup(self, mock_redis):
+    async def test_stale_agent_cleanup(self, mock_redis, mock_pipeline):
         """Test cleanup of stale agents."""
-        # Mock stale agent
-        stale_time = datetime.utcnow() - timedelta(minutes=10)
-        mock_redis.keys.return_value = ["aiosv3:registry:agents:stale-agent:health"]
+        # Mock stale agent found in the heartbeat index
+        mock_redis.zrangebyscore.return_value = ["stale-agent"]
         mock_redis.hgetall.side_effect = [
-            # Health data for stale agent
-            {
-                "agent_id": "stale-agent",
-                "state": "idle",
-                "last_heartbeat": stale_time.isoformat(),
-                "is_healthy": "true",
-                "health_score": "0.9",
-            },
             # Metadata for stale agent (for removal)
             {
                 "id": "stale-agent",
@@ -368,7 +379,80 @@ class TestAgentRegistry:
             await registry._cleanup_stale_agents()
             
             # Verify deletion was called
-            mock_redis.delete.assert_called()
+            mock_redis.zrangebyscore.assert_called_once()
+            mock_redis.keys.assert_not_called()
+            mock_pipeline.delete.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_indices_rebuilt_from_existing_agents(self, mock_redis, mock_pipeline):
+        """Test that agents from an older layout are indexed on initialize."""
+        mock_redis.get.return_value = None  # No index version stored yet
+
+        async def scan_iter(match, count):
+            assert match == "aiosv3:registry:agents:*:metadata"
+            for agent_id in ("agent-1", "agent-2", "agent-3"):
+                yield f"aiosv3:registry:agents:{agent_id}:metadata"
+
+        mock_redis.scan_iter = scan_iter
+        now = datetime.utcnow()
+        mock_pipeline.execute.side_effect = [
+            ["backend_developer", "backend_developer", "qa_engineer"],
+            [
+                {
+                    "agent_id": "agent-1",
+                    "state": "idle",
+                    "last_heartbeat": now.isoformat(),
+                    "is_healthy": "true",
+                    "health_score": "0.9",
+                },
+                {
+                    "agent_id": "agent-2",
+                    "state": "busy",
+                    "last_heartbeat": now.isoformat(),
+                    "is_healthy": "false",
+                    "health_score": "0.3",
+                },
+                {},  # Health key expired
+            ],
+            [],
+        ]
+
+        with patch('redis.asyncio.from_url', return_value=mock_redis):
+            registry = AgentRegistry()
+            await registry.initialize()
+
+        mock_pipeline.delete.assert_called_once_with(
+            "aiosv3:registry:index:agents",
+            "aiosv3:registry:index:heartbeats",
+            "aiosv3:registry:index:health",
+            "aiosv3:registry:stats:summary",
+        )
+        mock_pipeline.sadd.assert_called_once_with(
+            "aiosv3:registry:index:agents", "agent-1", "agent-2", "agent-3"
+        )
+        heartbeats = mock_pipeline.zadd.call_args.args[1]
+        assert heartbeats["agent-3"] == 0.0  # Picked up by stale cleanup
+        assert heartbeats["agent-1"] == pytest.approx(now.timestamp())
+
+        summary = mock_pipeline.hset.call_args_list[-1].kwargs["mapping"]
+        assert summary == {
+            "total_agents": 3,
+            "type:backend_developer": 2,
+            "type:qa_engineer": 1,
+            "state:idle": 1,
+            "state:busy": 1,
+            "healthy_agents": 1,
+            "unhealthy_agents": 1,
+            "health_score_sum": pytest.approx(1.2),
+        }
+        mock_pipeline.set.assert_called_once_with("aiosv3:registry:index:version", 1)
+
+        # Already-migrated registries skip the rebuild
+        mock_redis.get.return_value = "1"
+        mock_pipeline.delete.reset_mock()
+        with patch('redis.asyncio.from_url', return_value=mock_redis):
+            await AgentRegistry().initialize()
+        mock_pipeline.delete.assert_not_called()
 
 
 class TestAgentDiscovery:
@@ -0,0 +1,55 @@
+"""
+Unit tests for the persistent QA analysis cache.
+"""
+
+from unittest.mock import patch
+
+from src.agents.specialists import bug_detector
+from src.agents.specialists.analysis_cache import AnalysisCache, content_hash
+from src.agents.specialists.bug_detector import BugDetectionEngine
+
+CODE = '''
+def load(cursor, user_id):
+    try:
+        cursor.execute("SELECT * FROM users WHERE id = %s" % user_id)
+    except:
+        pass
+'''
+
+
+class TestAnalysisCache:
+    """Test content-addressed storage and version invalidation."""
+
+    def test_entries_are_keyed_by_content_and_version(self, tmp_path):
+        """Test lookups, persistence and pruning of stale versions."""
+        path = str(tmp_path / "analysis.db")
+        cache = AnalysisCache(path)
+        cache.put("code_review", content_hash("x = 1"), "v1", "looks fine")
+        cache.put("code_review", content_hash("x = 2"), "v0", "stale")
+        cache.close()
+
+        cache = AnalysisCache(path)
+        assert cache.get("code_review", content_hash("x = 1"), "v1") == "looks fine"
+        assert cache.get("code_review", content_hash("x = 1"), "v2") is None
+        assert cache.invalidate("code_review", keep_version="v1") == 1
+        assert len(cache) == 1
+        assert cache.stats["hits"] == cache.stats["misses"] == 1
+
+    def test_engine_reuses_results_until_rules_change(self):
+        """Test that a new engine is served from the cache and rule changes invalidate it."""
+        cache = AnalysisCache()
+        first = BugDetectionEngine(cache=cache).analyze_code(CODE, "python", "a.py")
+
+        engine = BugDetectionEngine(cache=cache)
+        with patch.object(engine, "detect_bugs") as detect_bugs:
+            second = engine.analyze_code(CODE, "python", "b.py")
+        detect_bugs.assert_not_called()
+        assert second.total_bugs == first.total_bugs > 0
+        assert {bug.file_path for bug in second.critical_issues} == {"b.py"}
+        assert [bug.bug_type for bug in second.critical_issues] == [
+            bug.bug_type for bug in first.critical_issues
+        ]
+
+        with patch.object(bug_detector, "ANALYZER_VERSION", "changed-rules"):
+            BugDetectionEngine(cache=cache)
+        assert len(cache) == 0
@@ -0,0 +1,118 @@
+"""
+Unit tests for the QA bug detection engine.
+"""
+
+from unittest.mock import patch
+
+from src.agents.specialists.analysis_cache import AnalysisCache
+from src.agents.specialists.bug_detector import (
+    BugDetectionEngine,
+    BugType,
+    JavaScriptBugDetector,
+    LineIndex,
+    PythonBugDetector,
+)
+
+SAMPLE = '''
+import random
+
+api_key = "sk-1234567890abcdef"
+
+def load(cursor, user_id):
+    try:
+        cursor.execute("SELECT * FROM users WHERE id = %s" % user_id)
+    except:
+        pass
+    return random.randint(7, 42)
+'''
+
+
+class TestPythonBugDetector:
+    """Test the single-pass rule dispatch."""
+
+    def test_findings_are_grouped_by_analysis_pass(self):
+        """Test that findings keep the security-to-quality pass order."""
+        bugs = PythonBugDetector().analyze_code(SAMPLE, "sample.py")
+
+        assert [bug.bug_type for bug in bugs] == [
+            BugType.HARDCODED_SECRETS,
+            BugType.INSECURE_RANDOMNESS,
+            BugType.SQL_INJECTION,
+            BugType.MISSING_VALIDATION,
+            BugType.EMPTY_CATCH_BLOCK,
+            BugType.IMPROPER_ERROR_HANDLING,
+            BugType.MAGIC_NUMBER,
+            BugType.MAGIC_NUMBER,
+        ]
+
+
+class TestJavaScriptBugDetector:
+    """Test the line index and the combined token scan."""
+
+    def test_findings_report_line_numbers(self):
+        """Test line lookups for findings on short and minified lines."""
+        code = "let a = 1;\nif (a == b) { eval(x); }\n\nel.innerHTML = query.html; x==y"
+
+        assert [LineIndex(code).line_of(offset) for offset in (0, 10, 11, 36, len(code))] == [
+            1, 1, 2, 3, 4
+        ]
+
+        bugs = JavaScriptBugDetector().analyze_code(code, "app.js")
+        assert [(bug.bug_type, bug.line_number) for bug in bugs] == [
+            (BugType.XSS_VULNERABILITY, 4),
+            (BugType.XSS_VULNERABILITY, 2),
+            (BugType.TYPE_MISMATCH, 2),
+            (BugType.TYPE_MISMATCH, 4),
+        ]
+
+
+class TestAnalyzePaths:
+    """Test repository scanning and the per-file result cache."""
+
+    def test_rescan_only_analyzes_changed_files(self, tmp_path):
+        """Test that unchanged files are served from the cache."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "pkg" / "a.py").write_text(SAMPLE)
+        (tmp_path / "pkg" / "copy.py").write_text(SAMPLE)
+        (tmp_path / "pkg" / "b.js").write_text("if (a == b) { eval(x); }")
+        (tmp_path / "node_modules" / "dep.js").write_text("eval(x);")
+        (tmp_path / "notes.txt").write_text("TODO")
+
+        engine = BugDetectionEngine()
+        engine.parallel_threshold = 2
+        first = engine.analyze_paths(str(tmp_path))
+
+        assert sorted(first.bugs_by_file) == [
+            str(tmp_path / "pkg" / name) for name in ("a.py", "b.js", "copy.py")
+        ]
+        assert (first.files_scanned, first.files_analyzed) == (3, 2)
+        copied = first.bugs_by_file[str(tmp_path / "pkg" / "copy.py")]
+        assert {bug.file_path for bug in copied} == {str(tmp_path / "pkg" / "copy.py")}
+
+        (tmp_path / "pkg" / "b.js").write_text("if (a === b) { run(x); }")
+        second = engine.analyze_paths(str(tmp_path))
+
+        assert (second.files_scanned, second.files_analyzed) == (3, 1)
+        assert second.bugs_by_file[str(tmp_path / "pkg" / "b.js")] == []
+        assert second.analysis.total_bugs == first.analysis.total_bugs - 2
+
+    def test_memory_cache_is_bounded(self, tmp_path):
+        """Test that a scan larger than the memory cache still reports every file."""
+        for i in range(5):
+            (tmp_path / f"mod{i}.py").write_text(f"{SAMPLE}\nvalue = {i}\n")
+
+        engine = BugDetectionEngine(cache=AnalysisCache())
+        engine.max_cached_files = 2
+        first = engine.analyze_paths(str(tmp_path), max_workers=1)
+
+        assert len(engine.file_cache) == 2
+        assert all(first.bugs_by_file.values())
+
+        # Evicted results come back from the persistent cache
+        with patch.object(engine, "detect_bugs") as detect_bugs:
+            second = engine.analyze_paths(str(tmp_path), max_workers=1)
+        detect_bugs.assert_not_called()
+        assert second.files_analyzed == 0
+        assert second.analysis.total_bugs == first.analysis.total_bugs
+        assert len(engine.file_cache) == 2
@@ -0,0 +1,52 @@
+"""
+Unit tests for CommunicationBridge term translation.
+"""
+
+from src.agents.specialists.hermes.communication_bridge import CommunicationBridge
+
+DETAILS = (
+    "Finished the api endpoint and database schema, then ran a security audit "
+    "before containerization and deployment behind the load balancer"
+)
+
+
+def make_bridge(compile_threshold):
+    """Create a bridge that compiles tables above ``compile_threshold`` terms."""
+    bridge = CommunicationBridge()
+    bridge.compile_threshold = compile_threshold
+    bridge._compile_translations()
+    return bridge
+
+
+class TestTermTranslation:
+    """Test the compiled translation pattern and the translation cache."""
+
+    def test_compiled_pattern_matches_replace_loop(self):
+        """Test that both translation modes give the same text."""
+        compiled = make_bridge(compile_threshold=0)
+        loop = make_bridge(compile_threshold=10 ** 9)
+
+        assert compiled._translation_pattern is not None
+        assert loop._translation_pattern is None
+        assert compiled._translate_technical_terms(DETAILS) == loop._translate_technical_terms(DETAILS)
+        assert "packaging for deployment and making it live" in loop._translate_technical_terms(DETAILS)
+
+    def test_compiled_pattern_prefers_longest_term(self):
+        """Test single-pass, longest-match substitution."""
+        bridge = make_bridge(compile_threshold=0)
+        bridge.add_translations({"api": "interface", "test": "check"})
+
+        translated = bridge._translate_technical_terms("api endpoint and api rate limiting, unit test")
+
+        assert translated == "connection point and usage controls, quality check"
+        assert bridge._translate_technical_terms("api") == "interface"
+
+    def test_repeated_details_are_cached(self):
+        """Test that repeated progress details are translated once."""
+        bridge = CommunicationBridge()
+
+        for _ in range(3):
+            bridge._translate_technical_terms(DETAILS)
+
+        info = bridge._translate_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
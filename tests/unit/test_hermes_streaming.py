@@ -0,0 +1,110 @@
+"""
+Unit tests for streamed Hermes conversation turns.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from starlette.requests import ClientDisconnect
+
+from src.agents.specialists.hermes.hermes_with_llm import HermesWithLLM
+
+
+class StreamingProvider:
+    """Provider that streams a fixed reply."""
+
+    chunks = ["Great, ", "tell me ", "more!"]
+
+    async def generate(self, request):
+        return SimpleNamespace(content="".join(self.chunks))
+
+    async def generate_stream(self, request):
+        for chunk in self.chunks:
+            yield chunk
+
+
+class FakeRouter:
+    """Router that always picks the streaming provider."""
+
+    providers = {"fake": StreamingProvider()}
+
+    async def route_request(self, request, context, policy=None):
+        return SimpleNamespace(
+            provider_name="fake", model_id="fake-model", estimated_cost=0.0
+        )
+
+
+class TestHermesStreaming:
+    """Test the streaming conversation API."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_chunks_then_finishes_turn(self):
+        """Test that intent is ready up front and the turn is saved after the stream."""
+        hermes = HermesWithLLM(llm_router=FakeRouter())
+
+        state, chunks = await hermes.stream_conversation(
+            "I want to build an online store in 3 weeks"
+        )
+        assert state.intent_state.current_bucket.value == "build_something"
+        assert len(state.messages) == 1
+
+        received = [chunk async for chunk in chunks]
+
+        assert received == StreamingProvider.chunks
+        assert state.messages[-1]["content"] == "Great, tell me more!"
+        assert state.project_requirements["timeline"] == "3 week"
+        assert hermes.sessions.list_sessions()[0]["turn_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_closed_stream_keeps_partial_reply(self):
+        """Test that a client disconnect still records the turn."""
+        hermes = HermesWithLLM(llm_router=FakeRouter())
+
+        state, chunks = await hermes.stream_conversation("hello")
+        async for _ in chunks:
+            break
+        await chunks.aclose()
+
+        stored = hermes.sessions.get(state.session_id)
+        assert [m["role"] for m in stored.messages] == ["user", "assistant"]
+        assert stored.messages[-1]["content"] == "Great, "
+
+    @pytest.mark.asyncio
+    async def test_stream_closed_before_first_chunk_finishes_turn(self):
+        """Test that closing an unread stream still records the turn once."""
+        hermes = HermesWithLLM(llm_router=FakeRouter())
+
+        state, chunks = await hermes.stream_conversation("hello")
+        await chunks.aclose()
+        await chunks.aclose()
+
+        stored = hermes.sessions.get(state.session_id)
+        assert [m["role"] for m in stored.messages] == ["user", "assistant"]
+        assert stored.messages[-1]["content"] == ""
+        assert [chunk async for chunk in chunks] == []
+
+    @pytest.mark.asyncio
+    async def test_endpoint_finishes_turn_when_client_leaves_early(self, monkeypatch):
+        """Test that a disconnect before the body starts still saves the turn."""
+        from src.api import main
+
+        hermes = HermesWithLLM(llm_router=FakeRouter())
+        monkeypatch.setattr(main, "hermes_agent", hermes)
+        response = await main.stream_chat_with_hermes(
+            main.HermesMessage(message="hello")
+        )
+
+        async def receive():
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            raise OSError("client disconnected")
+
+        # Under ASGI 2.4 Starlette reports the failed send as a ClientDisconnect
+        scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+        with pytest.raises(ClientDisconnect):
+            await response(scope, receive, send)
+
+        session = hermes.sessions.list_sessions()[0]
+        stored = hermes.sessions.get(session["session_id"])
+        assert [m["role"] for m in stored.messages] == ["user", "assistant"]
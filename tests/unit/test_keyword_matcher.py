@@ -0,0 +1,68 @@
+"""
+Unit tests for the compiled Hermes keyword matcher.
+"""
+
+import random
+
+from src.agents.specialists.hermes.intent_tracker import IntentTracker
+from src.agents.specialists.hermes.keyword_matcher import KeywordMatcher
+
+
+def naive_matches(keywords, text):
+    """Reference implementation: one substring scan per keyword."""
+    text_lower = text.lower()
+    return [keyword for keyword in keywords if keyword in text_lower]
+
+
+class TestKeywordMatcher:
+    """Test single-pass keyword matching."""
+
+    def test_overlapping_and_prefix_keywords(self):
+        """Test that nested and overlapping keywords are all found."""
+        keywords = ["app", "application", "cat", "at", "plication", "api", "pipeline"]
+
+        for threshold in (0, 1000):
+            matcher = KeywordMatcher({"t": keywords}, compile_threshold=threshold)
+            hits = matcher.scan("An APPLICATION for cats via a rapipeline")
+
+            assert hits.matches("t") == keywords
+
+    def test_weighted_scores_per_table(self):
+        """Test that each table is scored from the same scan."""
+        matcher = KeywordMatcher({
+            "build": {"build": 1.0, "app": 0.9},
+            "fix": {"fix": 0.8, "bug": 0.5},
+        })
+
+        hits = matcher.scan("Build an app, then build another app")
+
+        assert hits.score("build") == 1.9
+        assert hits.count("fix") == 0
+        assert hits.matches("fix") == []
+
+    def test_compiled_matches_naive_substring_semantics(self):
+        """Test that the compiled scan equals per-keyword substring checks."""
+        tracker = IntentTracker()
+        matcher = KeywordMatcher(
+            {name: dict(table) for name, table in tracker.keyword_matcher.tables.items()},
+            compile_threshold=0,
+        )
+        assert matcher.compiled
+        keywords = sorted({k for table in matcher.tables.values() for k, _ in table})
+        rng = random.Random(7)
+        words = keywords + ["the", "a", "we", "xyz", "data-driven", "re-view"]
+
+        for _ in range(200):
+            text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 40)))
+            text = text.replace(" ", rng.choice([" ", "", "-"]), rng.randint(0, 5))
+            hits = matcher.scan(text)
+            for name, table in matcher.tables.items():
+                expected = naive_matches([k for k, _ in table], text)
+                assert hits.matches(name) == expected
+
+    def test_project_type_matches(self):
+        """Test that ProjectType.matches keeps its count semantics."""
+        tracker = IntentTracker()
+        ecommerce = next(p for p in tracker.project_types if p.id == "ecommerce_site")
+
+        assert ecommerce.matches("An online store with a shopping cart") == 3
@@ -0,0 +1,165 @@
+"""
+Unit tests for the batched monitoring activity reporter.
+"""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from projects.monitoring.src.activity_reporter import ActivityReporter
+
+
+class FakeTransport:
+    """Records batches and heartbeats instead of sending them."""
+
+    def __init__(self):
+        self.online = True
+        self.batches: list[list[str]] = []
+        self.heartbeats: dict[str, dict] = {}
+
+    async def post_batch(self, batch):
+        if not self.online:
+            return False
+        self.batches.append([activity["id"] for activity in batch])
+        return True
+
+    async def post_heartbeat(self, registration_id, status_data):
+        self.heartbeats[registration_id] = status_data
+        return True
+
+
+def make_reporter(tmp_path, **kwargs) -> tuple[ActivityReporter, FakeTransport]:
+    """Create a reporter whose requests go to a fake transport."""
+    kwargs.setdefault("flush_interval", 60)
+    reporter = ActivityReporter(
+        "http://monitoring.test",
+        "test-key",
+        spill_path=str(tmp_path / "spill.jsonl"),
+        **kwargs,
+    )
+    transport = FakeTransport()
+    reporter._post_batch = transport.post_batch
+    reporter._post_heartbeat = transport.post_heartbeat
+    return reporter, transport
+
+
+def activity(activity_id: str, status: str = "info") -> dict:
+    """Create an activity as reported by an agent."""
+    return {"id": activity_id, "agent_id": "agent-1", "status": status}
+
+
+class TestBatching:
+    """Test batches, heartbeats and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_batches_and_coalesced_heartbeats(self, tmp_path):
+        """Test that activities go out in batches and only the latest heartbeat."""
+        reporter, transport = make_reporter(tmp_path, batch_size=3)
+
+        for i in range(7):
+            reporter.report(activity(f"a{i}"))
+        reporter.heartbeat("reg-1", {"tasks": 1})
+        reporter.heartbeat("reg-1", {"tasks": 2})
+        reporter.heartbeat("reg-2", {"tasks": 5})
+        await reporter.close()
+
+        assert transport.batches == [["a0", "a1", "a2"], ["a3", "a4", "a5"], ["a6"]]
+        assert transport.heartbeats == {"reg-1": {"tasks": 2}, "reg-2": {"tasks": 5}}
+        assert reporter.stats["heartbeats_coalesced"] == 1
+        assert reporter.stats["heartbeats_sent"] == 2
+
+    @pytest.mark.asyncio
+    async def test_sampling_above_watermark_and_drop_oldest(self, tmp_path):
+        """Test that info events are sampled when busy and the oldest dropped."""
+        reporter, transport = make_reporter(
+            tmp_path, max_queue=10, sample_watermark=0.5, sample_every=2
+        )
+
+        kept = [reporter.report(activity(f"i{i}")) for i in range(15)]
+        assert kept == [True] * 5 + [False, True] * 5
+        assert reporter.stats["sampled_out"] == 5
+
+        # Errors are never sampled out; the oldest queued activity makes room
+        assert reporter.report(activity("e", status="error"))
+        assert reporter.stats["dropped"] == 1
+        assert [queued["id"] for queued in reporter.queue] == [
+            "i1",
+            "i2",
+            "i3",
+            "i4",
+            "i6",
+            "i8",
+            "i10",
+            "i12",
+            "i14",
+            "e",
+        ]
+        await reporter.close()
+
+
+class TestSpill:
+    """Test spilling while the server is down and replaying afterwards."""
+
+    @pytest.mark.asyncio
+    async def test_replay_keeps_order(self, tmp_path):
+        """Test that spilled activities are sent before newer ones, in order."""
+        reporter, transport = make_reporter(tmp_path, batch_size=2)
+        transport.online = False
+
+        for i in range(5):
+            reporter.report(activity(f"a{i}"))
+        await reporter.flush()
+
+        assert not reporter.queue
+        assert reporter.stats["spilled"] == 5
+        assert not transport.batches
+
+        transport.online = True
+        reporter.report(activity("a5"))
+        await reporter.close()
+
+        assert [i for batch in transport.batches for i in batch] == [
+            f"a{i}" for i in range(6)
+        ]
+        assert reporter.stats["replayed"] == 5
+        assert not reporter.spill_path.exists()
+        assert not reporter.replay_path.exists()
+
+
+class TestServerResponses:
+    """Test how batch responses from the server are handled."""
+
+    @pytest.mark.asyncio
+    async def test_only_invalid_payloads_are_dropped(self, tmp_path):
+        """Test that a 400 is retried unless the server marks the batch invalid."""
+        responses = [
+            web.json_response({"error": "Failed to store activities"}, status=500),
+            web.json_response({"error": "database is locked"}, status=400),
+            web.json_response(
+                {"error": "Expected a list", "code": "invalid_payload"}, status=400
+            ),
+            web.json_response({"status": "stored"}),
+        ]
+
+        async def post_batch(request):
+            return responses.pop(0)
+
+        app = web.Application()
+        app.router.add_post("/api/activities/batch", post_batch)
+        async with TestServer(app) as server:
+            reporter = ActivityReporter(
+                str(server.make_url("")),
+                "test-key",
+                spill_path=str(tmp_path / "spill.jsonl"),
+            )
+            batch = [activity("a0")]
+
+            assert not await reporter._post_batch(batch)
+            assert not await reporter._post_batch(batch)
+            assert not reporter.online
+            assert await reporter._post_batch(batch)
+            assert reporter.stats["rejected"] == 1
+            assert await reporter._post_batch(batch)
+            assert reporter.stats["sent"] == 1
+            assert reporter.online
+            await reporter.close()
@@ -0,0 +1,112 @@
+"""
+Unit tests for the monitoring WebSocket broadcaster.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from projects.monitoring.src.broadcaster import BroadcastClient, WebSocketBroadcaster
+
+
+class FakeWebSocket:
+    """WebSocket stub whose sends can be held to simulate a slow client."""
+
+    def __init__(self, slow: bool = False):
+        self.closed = False
+        self.sent: list[dict] = []
+        self.release = asyncio.Event()
+        if not slow:
+            self.release.set()
+
+    async def send_str(self, frame: str):
+        await self.release.wait()
+        self.sent.append(json.loads(frame))
+
+
+async def settle():
+    """Let sender tasks run."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestBroadcastClient:
+    """Test per-client queueing policy."""
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest_and_reports_overflow(self):
+        """Test that a slow client loses its oldest frames, then is told how many."""
+        ws = FakeWebSocket(slow=True)
+        client = BroadcastClient(ws, max_queue_size=3)
+        client.start()
+
+        client.send_json({"n": 0})
+        await settle()  # Frame 0 is now in flight
+        for n in range(1, 7):
+            client.send_json({"n": n})
+
+        assert client.queued == 3
+        assert client.dropped == 3
+
+        ws.release.set()
+        await settle()
+
+        assert ws.sent == [
+            {"n": 0},
+            {"type": "overflow", "dropped": 3},
+            {"n": 4},
+            {"n": 5},
+            {"n": 6},
+        ]
+        assert client.sent == 4
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_coalesced_frames_keep_position_and_latest_value(self):
+        """Test that frames sharing a key replace each other without being dropped."""
+        ws = FakeWebSocket(slow=True)
+        client = BroadcastClient(ws, max_queue_size=3)
+
+        client.enqueue(json.dumps({"agent": "a", "v": 1}), coalesce_key="a")
+        client.enqueue(json.dumps({"n": 1}))
+        for v in range(2, 5):
+            client.enqueue(json.dumps({"agent": "a", "v": v}), coalesce_key="a")
+        client.enqueue(json.dumps({"agent": "b", "v": 1}), coalesce_key="b")
+
+        assert client.queued == 3
+        assert (client.coalesced, client.dropped) == (3, 0)
+
+        client.start()
+        ws.release.set()
+        await settle()
+
+        assert ws.sent == [{"agent": "a", "v": 4}, {"n": 1}, {"agent": "b", "v": 1}]
+        await client.close()
+
+
+class TestWebSocketBroadcaster:
+    """Test fan-out across clients."""
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_delay_others(self):
+        """Test that publishing never waits on a stalled client."""
+        broadcaster = WebSocketBroadcaster(max_queue_size=2)
+        fast_ws, slow_ws = FakeWebSocket(), FakeWebSocket(slow=True)
+        fast = broadcaster.register(fast_ws)
+        slow = broadcaster.register(slow_ws)
+        filtered = broadcaster.register(FakeWebSocket())
+        filtered.filter.agent_ids = {"other"}
+
+        for n in range(10):
+            assert broadcaster.publish({"n": n}, agent_id="agent-1") == 2
+            await settle()
+
+        assert [m["n"] for m in fast_ws.sent] == list(range(10))
+        assert slow.queued == 2
+        assert broadcaster.get_stats()["dropped"] == slow.dropped == 7
+        assert fast.dropped == filtered.sent == 0
+
+        slow_ws.closed = True
+        await broadcaster.close()
+        assert len(broadcaster) == 0
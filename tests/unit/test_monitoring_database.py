@@ -0,0 +1,161 @@
+"""
+Unit tests for the monitoring database ingestion writer.
+"""
+
+import asyncio
+import sqlite3
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from projects.monitoring.src.database import (
+    MonitoringDatabase,
+    encode_cursor,
+    partition_table,
+)
+
+
+def make_activity(
+    activity_id: str, stored_at: datetime, agent_id: str = "agent-1"
+) -> dict:
+    """Create an activity as stored by the monitoring server."""
+    return {
+        "id": activity_id,
+        "agent_id": agent_id,
+        "agent_name": "Agent",
+        "type": "task",
+        "status": "success",
+        "message": f"activity {activity_id}",
+        "metadata": {},
+        "stored_at": stored_at.isoformat(),
+    }
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path of a fresh monitoring database."""
+    return str(tmp_path / "monitoring.db")
+
+
+class TestIngestionWriter:
+    """Test group commits and write serialization."""
+
+    @pytest.mark.asyncio
+    async def test_cleanup_runs_alongside_ingestion(self, db_path):
+        """Test that retention cleanup does not interleave with a batch."""
+        async with MonitoringDatabase(db_path) as database:
+            now = datetime.utcnow()
+            old = [
+                make_activity(f"old-{i}", now - timedelta(days=40)) for i in range(50)
+            ]
+            await database.store_activities(old)
+
+            new = [make_activity(f"new-{i}", now) for i in range(200)]
+            stored, deleted = await asyncio.gather(
+                database.store_activities(new),
+                database.cleanup_old_activities(days=30),
+            )
+
+            assert len(stored) == 200
+            assert deleted == 50
+            assert await database.get_activity_count() == 200
+            assert len(await database.get_activities(limit=500)) == 200
+
+    @pytest.mark.asyncio
+    async def test_writer_survives_failed_rollback(self, db_path):
+        """Test that a failing rollback fails the batch but not the writer."""
+        async with MonitoringDatabase(db_path) as database:
+            now = datetime.utcnow()
+            await database.store_activity(make_activity("a-1", now))
+
+            database.db.rollback = AsyncMock(
+                side_effect=sqlite3.OperationalError("disk I/O error")
+            )
+            with pytest.raises(sqlite3.IntegrityError):
+                await database.store_activity(make_activity("a-1", now))
+
+            assert not database._writer_task.done()
+            del database.db.rollback
+            await database.store_activity(make_activity("a-2", now))
+            assert await database.get_activity_count() == 2
+
+
+class TestStatistics:
+    """Test statistics served from rollups."""
+
+    @pytest.mark.asyncio
+    async def test_activities_24h_uses_hourly_rollups(self, db_path):
+        """Test the 24h count and backfilling hourly rollups for older databases."""
+        now = datetime.utcnow()
+        async with MonitoringDatabase(db_path) as database:
+            await database.store_activities(
+                [
+                    make_activity(f"recent-{i}", now - timedelta(minutes=i))
+                    for i in range(5)
+                ]
+                + [make_activity(f"old-{i}", now - timedelta(days=2)) for i in range(3)]
+            )
+
+            stats = await database.get_statistics()
+            assert stats["total_activities"] == 8
+            assert stats["activities_24h"] == 5
+
+            # Simulate a database written before hourly rollups existed
+            await database.db.execute("DELETE FROM activity_hourly_rollups")
+            await database.db.commit()
+
+        async with MonitoringDatabase(db_path) as database:
+            cursor = await database.db.execute(
+                "SELECT SUM(count), COUNT(*) FROM activity_hourly_rollups"
+            )
+            total, hours = await cursor.fetchone()
+            assert total == 8 and hours <= 3
+            assert (await database.get_statistics())["activities_24h"] == 5
+
+
+class TestKeysetPagination:
+    """Test cursor pagination over daily partitions."""
+
+    @pytest.mark.asyncio
+    async def test_pages_cross_day_boundary(self, db_path):
+        """Test that following cursors walks both partitions newest first."""
+        midnight = datetime(2026, 3, 2)
+        activities = [
+            make_activity(f"a{minute:+d}", midnight + timedelta(minutes=minute))
+            for minute in range(-3, 3)
+        ]
+        # Two activities sharing a timestamp are ordered by id
+        activities.append(make_activity("a+0b", midnight))
+
+        async with MonitoringDatabase(db_path) as database:
+            await database.store_activities(activities)
+            assert database._partitions == ["2026-03-01", "2026-03-02"]
+
+            ids, pages, cursor = [], 0, None
+            while True:
+                page = [
+                    entry
+                    async for entry in database.iter_activities(
+                        limit=2, cursor=cursor, fields=["id"]
+                    )
+                ]
+                ids.extend(activity["id"] for activity, _ in page)
+                pages += 1
+                if len(page) < 2:
+                    break
+                cursor = encode_cursor(page[-1][1])
+
+        assert ids == ["a+2", "a+1", "a+0b", "a+0", "a-1", "a-2", "a-3"]
+        assert pages == 4
+
+
+class TestPartitionTable:
+    """Test partition table names, which are interpolated into SQL."""
+
+    def test_only_day_partitions_are_accepted(self):
+        """Test that anything but a YYYY-MM-DD day is rejected."""
+        assert partition_table("2026-03-01") == "activities_20260301"
+        for day in ("2026-3-1", "2026-03-01; DROP TABLE agents", ""):
+            with pytest.raises(ValueError):
+                partition_table(day)
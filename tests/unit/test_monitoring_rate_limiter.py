@@ -0,0 +1,93 @@
+"""
+Unit tests for the monitoring server rate limiters.
+"""
+
+import logging
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from projects.monitoring.src import rate_limiter
+from projects.monitoring.src.rate_limiter import (
+    RedisRateLimiter,
+    SlidingWindowRateLimiter,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the limiters' wall clock with a settable one."""
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+async def allowed(limiter, key: str, attempts: int) -> int:
+    """Count how many of ``attempts`` requests are allowed."""
+    return sum([await limiter.allow(key) for _ in range(attempts)])
+
+
+class TestSlidingWindowRateLimiter:
+    """Test the in-process sliding-window counter."""
+
+    @pytest.mark.asyncio
+    async def test_counts_carry_across_the_window_edge(self, clock):
+        """Test that the previous window is weighted by its remaining overlap."""
+        limiter = SlidingWindowRateLimiter(limit=10, window=60.0)
+
+        clock.now = 59.9
+        assert await allowed(limiter, "a", 15) == 10
+
+        # Just past the edge the previous window still counts in full
+        clock.now = 60.0
+        assert await allowed(limiter, "a", 5) == 0
+
+        # Halfway through, half of it has slid out
+        clock.now = 90.0
+        assert await allowed(limiter, "a", 10) == 5
+
+        # Two windows on, only the last window's 5 requests remain, fully weighted
+        clock.now = 120.0
+        assert await allowed(limiter, "a", 10) == 5
+
+        # Keys are independent
+        assert await allowed(limiter, "b", 12) == 10
+
+    @pytest.mark.asyncio
+    async def test_key_table_is_bounded(self, clock):
+        """Test that the least recently seen keys are evicted."""
+        limiter = SlidingWindowRateLimiter(limit=1, window=60.0, max_keys=2)
+
+        for key in ("a", "b", "c"):
+            assert await limiter.allow(key)
+
+        assert len(limiter) == 2
+        assert await limiter.allow("a")  # Evicted, so counted afresh
+        assert not await limiter.allow("c")
+
+
+class TestRedisRateLimiter:
+    """Test failing open when Redis is unavailable."""
+
+    @pytest.mark.asyncio
+    async def test_fail_open_is_counted_and_logged_once_per_window(self, clock, caplog):
+        """Test that backend errors allow requests, visibly."""
+        limiter = RedisRateLimiter("redis://localhost:6379", limit=10, window=60.0)
+        limiter._script = AsyncMock(side_effect=ConnectionError("connection refused"))
+        clock.now = 1000.0
+
+        with caplog.at_level(logging.WARNING, logger="enhanced_monitoring_server"):
+            assert await allowed(limiter, "a", 3) == 3
+            clock.now = 1061.0
+            assert await limiter.allow("a")
+
+        assert limiter.get_stats() == {"backend": "redis", "fail_open": 4}
+        messages = [record.getMessage() for record in caplog.records]
+        assert len(messages) == 2
+        assert "allowed 3 request(s) unchecked (4 total)" in messages[1]
+
+        limiter._script = AsyncMock(return_value=0)
+        assert not await limiter.allow("a")
+        assert limiter.fail_open_count == 4
+        await limiter.close()
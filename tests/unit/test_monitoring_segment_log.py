@@ -0,0 +1,94 @@
+"""
+Unit tests for the monitoring segmented activity log.
+"""
+
+import json
+
+from projects.monitoring.src.segment_log import SegmentedLog
+
+
+def open_log(tmp_path, **kwargs) -> SegmentedLog:
+    """Open a log with small segments and read blocks."""
+    log = SegmentedLog(
+        str(tmp_path / "activities.jsonl"), max_segment_bytes=200, **kwargs
+    )
+    log.read_block_size = 16
+    return log
+
+
+def fill(log: SegmentedLog, start: int, stop: int):
+    """Append numbered records."""
+    for n in range(start, stop):
+        log.append({"n": n, "message": "x" * 10})
+
+
+class TestSegmentedLog:
+    """Test rotation, tails and recovery."""
+
+    def test_rotation_and_tail_across_segments(self, tmp_path):
+        """Test that tails span segments and survive a reopen."""
+        log = open_log(tmp_path)
+        fill(log, 0, 30)
+
+        assert len(log.segments) >= 3
+        assert [s["offset"] for s in log.segments] == [
+            sum(s["count"] for s in log.segments[:i]) for i in range(len(log.segments))
+        ]
+        assert log.total_count == 30
+        assert [r["n"] for r in log.tail(12)] == list(range(18, 30))
+        assert [r["n"] for r in log.tail(100)] == list(range(30))
+        log.close()
+
+        reopened = open_log(tmp_path)
+        assert reopened.total_count == 30
+        assert [r["n"] for r in reopened.tail(5)] == list(range(25, 30))
+        reopened.close()
+
+    def test_torn_write_is_dropped_on_open(self, tmp_path):
+        """Test that a partial last record from a crash is cut before appending."""
+        log = open_log(tmp_path)
+        fill(log, 0, 10)
+        log.close()
+        active = log.active_path
+        with open(active, "ab") as f:
+            f.write(b'{"n": 10, "mess')
+
+        log = open_log(tmp_path)
+        assert log.total_count == 10
+        fill(log, 11, 12)
+        log.flush()
+
+        assert not active.read_bytes().endswith(b"mess")
+        assert [r["n"] for r in log.tail(3)] == [8, 9, 11]
+        log.close()
+
+    def test_counts_records_written_after_checkpoint(self, tmp_path):
+        """Test that records appended after the last clean close are counted."""
+        log = open_log(tmp_path)
+        fill(log, 0, 3)
+        log.close()
+
+        # Simulate a crash: records flushed but the log never closed
+        log = open_log(tmp_path)
+        fill(log, 3, 5)
+        log.flush()
+        log._file.close()
+
+        reopened = open_log(tmp_path)
+        assert reopened.total_count == 5
+        reopened.close()
+
+    def test_unreadable_index_is_rebuilt(self, tmp_path):
+        """Test that a torn index is recovered from the segment files."""
+        log = open_log(tmp_path)
+        fill(log, 0, 30)
+        log.close()
+        segments = log.segments
+        log.index_path.write_text('{"segments": [{"name": "activities-0000')
+
+        recovered = open_log(tmp_path)
+        assert recovered.segments == segments
+        assert recovered.total_count == 30
+        assert [r["n"] for r in recovered.tail(3)] == [27, 28, 29]
+        recovered.close()
+        assert json.loads(log.index_path.read_text())["segments"] == segments
@@ -0,0 +1,151 @@
+"""
+Unit tests for the enhanced monitoring server HTTP API.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from projects.monitoring.src.database import MonitoringDatabase
+from projects.monitoring.src.enhanced_monitoring_server import EnhancedMonitoringServer
+
+
+@pytest.fixture
+def server_env(tmp_path, monkeypatch):
+    """Point server logs at a temporary directory and fix the API key."""
+    monkeypatch.setenv("MONITORING_LOG_FILE", str(tmp_path / "logs" / "monitoring.log"))
+    monkeypatch.setenv("MONITORING_API_KEY", "test-key")
+
+
+def make_activities(count: int) -> list[dict]:
+    """Create activities one second apart, oldest first."""
+    start = datetime(2026, 3, 1, 23, 59, 58)
+    return [
+        {
+            "id": f"act-{i}",
+            "agent_id": "agent-1",
+            "type": "task",
+            "status": "success",
+            "message": f"activity {i}",
+            "stored_at": (start + timedelta(seconds=i)).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+async def read_all_pages(client: TestClient) -> tuple[list[dict], list[str]]:
+    """Follow next_cursor through every page of two activities."""
+    pages, ids, cursor = [], [], None
+    while True:
+        params = {"limit": 2, "fields": "id,stored_at"}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(
+            "/api/activities", params=params, headers={"X-API-Key": "test-key"}
+        )
+        assert response.status == 200
+        page = await response.json()
+        pages.append(page)
+        ids.extend(activity["id"] for activity in page["activities"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            return pages, ids
+
+
+class TestGetActivities:
+    """Test the activities endpoint on both storage backends."""
+
+    @pytest.mark.asyncio
+    async def test_database_and_memory_pages_match(self, server_env, tmp_path):
+        """Test that both backends return the same shape, order and pages."""
+        server = EnhancedMonitoringServer()
+        async with TestClient(TestServer(server.app)) as client:
+            server._activities = make_activities(5)
+            memory_pages, memory_ids = await read_all_pages(client)
+
+            server.db = MonitoringDatabase(str(tmp_path / "monitoring.db"))
+            await server.db.initialize()
+            await server.db.store_activities(make_activities(5))
+            db_pages, db_ids = await read_all_pages(client)
+            await server.db.close()
+
+        assert memory_ids == db_ids == ["act-4", "act-3", "act-2", "act-1", "act-0"]
+        for page in memory_pages + db_pages:
+            assert set(page) == {"activities", "count", "total", "next_cursor"}
+            assert page["total"] == 5
+        assert [page["count"] for page in db_pages] == [2, 2, 1]
+        assert [page["activities"] for page in memory_pages] == [
+            page["activities"] for page in db_pages
+        ]
+
+    @pytest.mark.asyncio
+    async def test_read_failure_is_a_json_error(self, server_env):
+        """Test that a failed read returns a 500 instead of a truncated page."""
+        server = EnhancedMonitoringServer()
+        server.db = AsyncMock()
+        server.db.iter_activities = lambda **kwargs: FailingPage()
+
+        async with TestClient(TestServer(server.app)) as client:
+            response = await client.get(
+                "/api/activities", headers={"X-API-Key": "test-key"}
+            )
+            assert response.status == 500
+            assert await response.json() == {"error": "Failed to read activities"}
+
+            response = await client.get(
+                "/api/activities",
+                params={"cursor": "not-a-cursor"},
+                headers={"X-API-Key": "test-key"},
+            )
+            assert response.status == 400
+
+
+class FailingPage:
+    """Activity iterator that fails after the first row."""
+
+    def __init__(self):
+        self.rows = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        self.rows += 1
+        if self.rows > 1:
+            raise OSError("disk I/O error")
+        return {"id": "act-0"}, ("2026-03-01T00:00:00", "act-0")
+
+
+class TestPostActivitiesBatch:
+    """Test status codes of the batch endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_storage_errors_are_not_client_errors(self, server_env):
+        """Test that only malformed batches get a 4xx marked invalid_payload."""
+        server = EnhancedMonitoringServer()
+        server.store_activities = AsyncMock(side_effect=OSError("disk full"))
+        headers = {"X-API-Key": "test-key"}
+
+        async with TestClient(TestServer(server.app)) as client:
+            response = await client.post(
+                "/api/activities/batch",
+                json={"activities": make_activities(2)},
+                headers=headers,
+            )
+            assert response.status == 500
+            assert "code" not in await response.json()
+
+            for body in ({"activities": "nope"}, [1, 2]):
+                response = await client.post(
+                    "/api/activities/batch", json=body, headers=headers
+                )
+                assert response.status == 400
+                assert (await response.json())["code"] == "invalid_payload"
+
+            response = await client.post(
+                "/api/activities/batch", data="{not json", headers=headers
+            )
+            assert response.status == 400
+            assert (await response.json())["code"] == "invalid_payload"
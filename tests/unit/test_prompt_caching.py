@@ -0,0 +1,115 @@
+"""
+Unit tests for prompt-prefix caching across providers and Hermes.
+"""
+
+from src.agents.specialists.hermes.hermes_agent_simple import PersonaConfig
+from src.agents.specialists.hermes.hermes_with_llm import (
+    HermesWithLLM,
+    render_system_prompt,
+)
+from src.core.routing.providers.base import LLMRequest
+from src.core.routing.providers.claude import ClaudeConfig, ClaudeProvider
+from src.core.routing.providers.openai import OpenAIConfig, OpenAIProvider
+
+
+def make_request(**kwargs):
+    """Create a request with a two-part system prompt and a user turn."""
+    return LLMRequest(
+        messages=[
+            {"role": "system", "content": "stable instructions"},
+            {"role": "system", "content": "turn context"},
+            {"role": "user", "content": "hello"},
+        ],
+        model_id="claude-3-5-sonnet-20241022",
+        **kwargs
+    )
+
+
+class TestProviderPromptCaching:
+    """Test cache markers in payloads and cached-token accounting."""
+
+    def test_claude_marks_end_of_stable_prefix(self):
+        """Test that system messages move to blocks with one cache breakpoint."""
+        provider = ClaudeProvider(ClaudeConfig(provider_name="claude", api_key="key"))
+
+        payload = provider._prepare_request_payload(make_request(cache_prefix_messages=1))
+
+        assert payload["system"] == [
+            {"type": "text", "text": "stable instructions", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "turn context"},
+        ]
+        assert payload["messages"] == [{"role": "user", "content": "hello"}]
+
+        uncached = provider._prepare_request_payload(make_request())
+        assert all("cache_control" not in block for block in uncached["system"])
+
+    def test_claude_prices_cache_reads_and_writes(self):
+        """Test that cache usage is counted as input and discounted."""
+        provider = ClaudeProvider(ClaudeConfig(provider_name="claude", api_key="key"))
+        provider._models = provider.CLAUDE_MODELS.copy()
+        request = make_request(cache_prefix_messages=1)
+        price = provider.get_model_info(request.model_id).input_cost_per_token
+
+        response = provider._parse_response(request, {
+            "content": [{"type": "text", "text": "hi"}],
+            "usage": {
+                "input_tokens": 100,
+                "cache_creation_input_tokens": 0,
+                "cache_read_input_tokens": 2000,
+                "output_tokens": 10,
+            },
+        }, 0.0)
+
+        assert response.input_tokens == 2100
+        assert response.cached_input_tokens == 2000
+        assert abs(response.input_cost - price * (100 + 2000 * 0.1)) < 1e-12
+        assert provider.get_cache_stats()["cache_hits"] == 1
+
+    def test_openai_reports_cached_tokens(self):
+        """Test that automatic prefix cache hits are read from usage details."""
+        provider = OpenAIProvider(OpenAIConfig(provider_name="openai", api_key="key"))
+        request = make_request(cache_prefix_messages=1, metadata={"prompt_cache_key": "hermes"})
+
+        assert provider._prepare_request_payload(request)["prompt_cache_key"] == "hermes"
+
+        response = provider._parse_response(request, {
+            "choices": [{"message": {"content": "hi"}}],
+            "usage": {
+                "prompt_tokens": 1500,
+                "completion_tokens": 5,
+                "prompt_tokens_details": {"cached_tokens": 1024},
+            },
+        }, 0.0)
+
+        assert response.cached_input_tokens == 1024
+        assert provider.get_cache_stats()["cached_token_ratio"] == 1024 / 1500
+
+
+class TestHermesSystemPrompt:
+    """Test that Hermes sends a stable, memoized system prompt prefix."""
+
+    def test_prefix_is_stable_across_turns(self):
+        """Test that only the turn context changes between requests."""
+        hermes = HermesWithLLM()
+        state = hermes._get_session(None, None)
+
+        first, *_ = hermes._build_llm_request("I want to build a store", state)
+        state.add_message("user", "I want to build a store")
+        second, *_ = hermes._build_llm_request("It sells shoes", state)
+
+        assert first.cache_prefix_messages == 1
+        assert first.messages[0] == second.messages[0]
+        assert first.messages[1] != second.messages[1]
+
+    def test_rendered_prompt_is_memoized_per_persona(self):
+        """Test that each persona config renders its prompt once."""
+        render_system_prompt.cache_clear()
+        formal = HermesWithLLM(persona_config=PersonaConfig(tone="formal"))
+
+        for _ in range(3):
+            formal._get_system_prompt_prefix()
+        HermesWithLLM()._get_system_prompt_prefix()
+
+        info = render_system_prompt.cache_info()
+        assert (info.misses, info.hits) == (2, 2)
+        assert "formal, business-appropriate" in formal._get_system_prompt_prefix()
@@ -0,0 +1,57 @@
+"""
+Unit tests for single-pass requirements extraction.
+"""
+
+from src.agents.specialists.hermes.requirements_extractor import (
+    RequirementsExtractor,
+    RequirementType,
+    SignatureIndex,
+)
+
+SPEC = """
+I would like to extract information from articles I save to 'read later'
+and create a daily digest. The system should automatically pull articles from
+Pocket, summarize them using AI, and send me an email digest every morning.
+Users should see a dashboard for reading stats. Store invoices, store customer
+records. Display charts of revenue by region, show alerts. Process uploads.
+"""
+
+
+class TestRequirementsExtractor:
+    """Test the combined pattern scanner and near-duplicate index."""
+
+    def test_scan_matches_per_pattern_finditer(self):
+        """Test that the combined scanner finds overlapping matches of every pattern."""
+        extractor = RequirementsExtractor()
+        text = (SPEC * 3).lower()
+
+        expected = [
+            (index, match.span())
+            for index, (_, pattern) in enumerate(extractor._patterns)
+            for match in pattern.finditer(text)
+        ]
+        found = [(index, match.span()) for index, match in extractor._scan(text)]
+
+        assert found == expected
+
+    def test_signature_index_rejects_near_duplicates(self):
+        """Test that only texts above the similarity threshold are rejected."""
+        index = SignatureIndex(threshold=0.8)
+
+        assert index.add_if_new("store customer records in the billing database")
+        assert not index.add_if_new("Store customer records in the billing database")
+        # 6 of 7 words shared (0.857) is a duplicate, 3 of 9 (0.333) is not
+        assert not index.add_if_new("store customer records in the billing")
+        assert index.add_if_new("store customer records for audits")
+        assert index.add_if_new("")
+        assert len(index) == 2
+
+    def test_duplicate_requirements_are_dropped(self):
+        """Test that repeated text yields each requirement once."""
+        extractor = RequirementsExtractor()
+
+        once = extractor.extract_requirements(SPEC)
+        repeated = extractor.extract_requirements(SPEC * 5)
+
+        assert [(r.type, r.description) for r in repeated] == [(r.type, r.description) for r in once]
+        assert any(r.type == RequirementType.DATA_STORAGE for r in once)
@@ -0,0 +1,100 @@
+"""
+Unit tests for the persistent Hermes session store.
+"""
+
+from src.agents.specialists.hermes.hermes_agent_simple import (
+    ConversationState,
+    IntentBucket,
+    SimpleHermesAgent,
+)
+from src.agents.specialists.hermes.session_store import HermesSessionStore
+
+
+def make_store(path, **kwargs):
+    """Create a store for the simple Hermes agent's ConversationState."""
+    return HermesSessionStore(str(path), state_factory=ConversationState, **kwargs)
+
+
+class TestHermesSessionStore:
+    """Test session persistence, lazy loading and eviction."""
+
+    def test_session_resumes_from_another_store(self, tmp_path):
+        """Test that a conversation continues after a restart."""
+        db_path = tmp_path / "sessions.db"
+        hermes = SimpleHermesAgent(session_store=make_store(db_path))
+        _, state = hermes.process_conversation("I want to build an online store", user_id="u1")
+        hermes.process_conversation("It should sell handmade jewelry", state.session_id)
+        original = hermes.sessions.get(state.session_id)
+
+        restarted = SimpleHermesAgent(session_store=make_store(db_path))
+        loaded = restarted.sessions.get(state.session_id)
+
+        assert loaded is not None
+        assert loaded.messages == original.messages
+        assert loaded.turn_count == 2
+        assert loaded.user_context["user_id"] == "u1"
+        assert loaded.project_requirements == original.project_requirements
+        assert loaded.intent_state.to_dict() == original.intent_state.to_dict()
+        assert loaded.intent_state.current_bucket == IntentBucket.BUILD
+
+        restarted.process_conversation("Launch in 3 weeks", state.session_id)
+        assert restarted.sessions.get(state.session_id).turn_count == 3
+
+    def test_turns_append_deltas(self, tmp_path):
+        """Test that each turn only adds its own message rows."""
+        store = make_store(tmp_path / "sessions.db")
+        hermes = SimpleHermesAgent(session_store=store)
+        _, state = hermes.process_conversation("Hello")
+        hermes.process_conversation("I need a blog", state.session_id)
+
+        rows = store.conn.execute(
+            "SELECT seq, role FROM session_messages WHERE session_id = ? ORDER BY seq",
+            (state.session_id,)
+        ).fetchall()
+
+        assert [(row["seq"], row["role"]) for row in rows] == [
+            (0, "user"), (1, "assistant"), (2, "user"), (3, "assistant")
+        ]
+
+    def test_lru_eviction_and_lazy_reload(self, tmp_path):
+        """Test that evicted sessions are reloaded on demand."""
+        store = make_store(tmp_path / "sessions.db", max_cached=2)
+        hermes = SimpleHermesAgent(session_store=store)
+        ids = [hermes.process_conversation(f"Build app {i}")[1].session_id for i in range(3)]
+
+        assert store.cached == ids[1:]
+        assert ids[0] in store
+
+        state = store.get(ids[0])
+        assert state.messages[0]["content"] == "Build app 0"
+        assert store.cached == [ids[2], ids[0]]
+
+    def test_list_sessions_filters(self, tmp_path):
+        """Test querying sessions by user and intent."""
+        hermes = SimpleHermesAgent(session_store=make_store(tmp_path / "sessions.db"))
+        hermes.process_conversation("Build me a website", user_id="alice")
+        hermes.process_conversation("Automate my workflow pipeline", user_id="alice")
+        hermes.process_conversation("Build an api", user_id="bob")
+
+        alice = hermes.get_active_sessions(user_id="alice")
+        builds = hermes.get_active_sessions(intent=IntentBucket.BUILD.value)
+
+        assert len(alice) == 2
+        assert {s["user_id"] for s in builds} == {"alice", "bob"}
+        assert len(hermes.get_active_sessions(limit=1)) == 1
+
+    def test_evicted_session_in_use_is_not_loaded_twice(self, tmp_path):
+        """Test that a state evicted while a caller holds it is reused."""
+        store = make_store(tmp_path / "sessions.db", max_cached=1)
+        hermes = SimpleHermesAgent(session_store=store)
+        in_flight = hermes.process_conversation("Build app 0")[1]
+        hermes.process_conversation("Build app 1")
+
+        assert store.cached != [in_flight.session_id]
+        assert store.get(in_flight.session_id) is in_flight
+
+        session_id = in_flight.session_id
+        hermes.process_conversation("Build app 2")
+        del in_flight
+        reloaded = store.get(session_id)
+        assert reloaded.messages[0]["content"] == "Build app 0"
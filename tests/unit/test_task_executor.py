@@ -0,0 +1,113 @@
+"""
+Unit tests for the BaseAgent worker pool.
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.agents.base.agent import AgentConfig, BaseAgent, Task
+from src.agents.base.types import AgentType, TaskPriority, TaskType
+
+
+class SleepyAgent(BaseAgent):
+    """Agent whose tasks sleep for a given number of seconds."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.started: list[str] = []
+        self.peak_concurrency = 0
+
+    async def _execute_task_internal(self, task: Task, model_id: str) -> dict[str, Any]:
+        self.started.append(task.description)
+        self.peak_concurrency = max(self.peak_concurrency, len(self.current_tasks))
+        await asyncio.sleep(task.parameters.get("sleep", 0.05))
+        return {"done": task.description}
+
+
+def make_agent(max_concurrent_tasks: int = 2, timeout: float = 5.0) -> SleepyAgent:
+    """Create an agent with a small worker pool."""
+    config = AgentConfig(
+        name="Sleepy Agent",
+        description="Agent for worker pool tests",
+        agent_type=AgentType.GENERALIST,
+        capabilities=["general"],
+        model_preferences={"primary": "test-model"},
+        max_concurrent_tasks=max_concurrent_tasks,
+        task_timeout_seconds=timeout,
+    )
+    return SleepyAgent(config=config)
+
+
+def make_task(description: str, priority=TaskPriority.MEDIUM, sleep: float = 0.05) -> Task:
+    """Create a general task."""
+    return Task(
+        type=TaskType.GENERAL,
+        description=description,
+        priority=priority,
+        parameters={"sleep": sleep},
+    )
+
+
+class TestTaskExecutor:
+    """Test bounded parallelism, priorities, timeouts and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_parallel_by_priority(self):
+        """Test that queued tasks start by priority, up to the pool size at once."""
+        agent = make_agent(max_concurrent_tasks=2)
+        blockers = [agent.submit_task(make_task(f"blocker-{i}")) for i in range(2)]
+        await asyncio.sleep(0)
+
+        futures = [
+            agent.submit_task(make_task("low", TaskPriority.LOW)),
+            agent.submit_task(make_task("medium")),
+            agent.submit_task(make_task("critical", TaskPriority.CRITICAL)),
+            agent.submit_task(make_task("high", TaskPriority.HIGH)),
+        ]
+        results = await asyncio.gather(*blockers, *futures)
+
+        assert [result.status for result in results] == ["success"] * 6
+        assert agent.started[2:] == ["critical", "high", "medium", "low"]
+        assert agent.peak_concurrency == 2
+        assert not agent.is_busy
+
+        await agent._stop_workers()
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_cancellation(self):
+        """Test per-task timeouts and cancelling running and queued tasks."""
+        agent = make_agent(max_concurrent_tasks=1, timeout=0.05)
+
+        timed_out = await agent.submit_task(make_task("slow", sleep=1.0))
+        assert timed_out.status == "timeout"
+
+        running_task, queued_task = make_task("running", sleep=1.0), make_task("queued")
+        running = agent.submit_task(running_task)
+        queued = agent.submit_task(queued_task)
+        await asyncio.sleep(0.01)
+        assert agent.cancel_task(running_task.id)
+        assert agent.cancel_task(queued_task.id)
+        assert not agent.cancel_task("missing")
+
+        await asyncio.sleep(0.01)
+        assert running.cancelled() and queued.cancelled()
+        assert agent.started == ["slow", "running"]
+        assert agent.task_history[-1].task_id == running_task.id
+        assert agent.task_history[-1].status == "cancelled"
+
+        await agent._stop_workers()
+
+    @pytest.mark.asyncio
+    async def test_graceful_stop_drains_queue(self):
+        """Test that a graceful stop waits for queued tasks without polling."""
+        agent = make_agent(max_concurrent_tasks=2)
+        await agent.start()
+        futures = [agent.submit_task(make_task(f"task-{i}")) for i in range(5)]
+
+        await agent.stop(graceful=True)
+
+        assert all(future.result().status == "success" for future in futures)
+        assert agent.task_history.total == 5
+        assert not agent._workers
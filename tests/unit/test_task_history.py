@@ -0,0 +1,115 @@
+"""
+Unit tests for the bounded agent task history.
+"""
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.agents.base.agent import AgentConfig, BaseAgent, Task, TaskResult
+from src.agents.base.task_history import TaskHistory
+from src.agents.base.types import AgentType, TaskType
+
+
+def make_result(index: int, status: str = "success", latency: float = 1.0) -> TaskResult:
+    """Create a task result with a small payload."""
+    return TaskResult(
+        task_id=f"task-{index}",
+        agent_id="agent",
+        status=status,
+        result={"output": "x" * 100},
+        error=None if status == "success" else "failed",
+        execution_time=latency,
+        model_used="model-a" if index % 2 else "model-b",
+        cost_estimate=0.01,
+    )
+
+
+class HistoryAgent(BaseAgent):
+    """Agent whose tasks fail when asked to."""
+
+    async def _execute_task_internal(self, task: Task, model_id: str) -> dict[str, Any]:
+        if task.parameters.get("fail"):
+            raise RuntimeError("boom")
+        return {"ok": True}
+
+
+class TestTaskHistory:
+    """Test the ring buffer and its running aggregates."""
+
+    def test_ring_is_bounded_but_aggregates_cover_everything(self):
+        """Test that only recent records are kept while totals keep counting."""
+        history = TaskHistory(capacity=3)
+        for i in range(10):
+            history.append(make_result(i, status="error" if i % 5 == 0 else "success"))
+
+        assert len(history) == 3
+        assert [record.task_id for record in history] == ["task-7", "task-8", "task-9"]
+        assert [record.task_id for record in history.recent(2)] == ["task-8", "task-9"]
+        assert history[-1].task_id == "task-9"
+        assert not hasattr(history[-1], "result")
+
+        assert history.total == 10
+        assert (history.succeeded, history.failed) == (8, 2)
+        assert history.success_rate == 0.8
+        assert history.model_counts == {"model-b": 5, "model-a": 5}
+        assert history.evicted_count == 0
+
+    def test_latency_aggregates(self):
+        """Test the EWMA, mean and histogram of execution times."""
+        history = TaskHistory(ewma_alpha=0.5, latency_buckets=(1.0, 10.0))
+        for i, latency in enumerate([2.0, 4.0, 0.5, 20.0]):
+            history.append(make_result(i, latency=latency))
+
+        assert history.ewma_latency == 10.875
+        assert history.average_latency == 6.625
+        assert history.latency_histogram == [1, 2, 1]
+        assert history.summary()["latency_histogram"] == {"le_1": 1, "le_10": 2, "le_inf": 1}
+
+
+class TestAgentTaskHistory:
+    """Test BaseAgent statistics and flushing of evicted records."""
+
+    @pytest.mark.asyncio
+    async def test_evicted_records_flush_to_memory_store(self):
+        """Test that stats stay current and old records reach the memory store."""
+        config = AgentConfig(
+            name="History Agent",
+            description="Agent with a small history",
+            agent_type=AgentType.GENERALIST,
+            capabilities=["general"],
+            model_preferences={},
+            task_history_size=5,
+        )
+        memory_store = MagicMock()
+        memory_store.store_memory = AsyncMock(return_value="memory-id")
+        agent = HistoryAgent(config=config, memory_store=memory_store, llm_router=MagicMock())
+        agent.task_history.flush_batch_size = 4
+        agent.llm_router.route_request = AsyncMock(return_value=MagicMock(model_id="model-a"))
+
+        for i in range(10):
+            await agent.execute_task(
+                Task(type=TaskType.GENERAL, description=f"task {i}", parameters={"fail": i == 3})
+            )
+            if i == 8:
+                # The fourth eviction triggers a flush of the evicted records
+                await asyncio.gather(*agent._background_tasks)
+
+        assert len(agent.task_history) == 5
+        assert agent.get_status()["tasks_completed"] == 10
+        assert agent.stats.tasks_failed == 1
+        assert agent.stats.success_rate == 0.9
+        assert agent.stats.models_used == {"model-a": 9, "unknown": 1}
+
+        entry = memory_store.store_memory.await_args.args[0]
+        flushed = json.loads(entry.content)
+        assert entry.categories == ["task_history"]
+        assert [record["status"] for record in flushed] == ["success"] * 3 + ["error"]
+
+        # Records evicted since then are flushed on shutdown
+        await agent._save_memory()
+        assert memory_store.store_memory.await_count == 2
+        assert agent.task_history.evicted_count == 0
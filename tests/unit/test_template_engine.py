@@ -0,0 +1,63 @@
+"""
+Unit tests for the code generator template engine.
+"""
+
+import io
+import tarfile
+
+import pytest
+
+from src.agents.specialists.fastapi_generator import FastAPICodeGenerator
+from src.agents.specialists.template_engine import (
+    CompiledTemplate,
+    render_cache,
+    write_bundle,
+)
+
+
+class TestCompiledTemplate:
+    """Test that compiled templates render like str.format."""
+
+    def test_render_matches_str_format(self):
+        """Test fields, escaped braces, conversions and format specs."""
+        source = "def {name}():\n    return {{'count': {count:>4}, 'label': {label!r}}}\n"
+        context = {"name": "stats", "count": 7, "label": "total"}
+
+        template = CompiledTemplate(source)
+
+        assert template.fields == {"name", "count", "label"}
+        assert template.render(**context) == source.format(**context)
+        assert CompiledTemplate("{{static}}").render() == "{static}"
+        with pytest.raises(ValueError):
+            CompiledTemplate("{spec.name}")
+
+
+class TestRenderCache:
+    """Test memoized generators and bundle output."""
+
+    def test_generated_project_is_memoized_and_streamed(self, tmp_path):
+        """Test that repeat renders are cache hits and bundles hold every file."""
+        render_cache.clear()
+        generator = FastAPICodeGenerator()
+
+        files = generator.generate_api_structure("Shop", "Shop {api}")
+        files["extra.py"] = ""
+        again = FastAPICodeGenerator().generate_api_structure("Shop", "Shop {api}")
+
+        assert render_cache.hits == 1
+        assert "extra.py" not in again
+        assert 'title="Shop"' in again["main.py"]
+        assert "Shop {api}" in again["main.py"]
+
+        stream = io.BytesIO()
+        size = write_bundle(again, stream)
+        stream.seek(0)
+        with tarfile.open(fileobj=stream, mode="r:gz") as archive:
+            assert archive.getnames() == list(again)
+            assert archive.extractfile("main.py").read().decode() == again["main.py"]
+        assert size == sum(len(content.encode()) for content in again.values())
+
+        write_bundle({"app/main.py": again["main.py"]}, str(tmp_path))
+        assert (tmp_path / "app" / "main.py").read_text() == again["main.py"]
+        with pytest.raises(ValueError):
+            write_bundle({"../outside.py": ""}, str(tmp_path))
@@ -0,0 +1,122 @@
+"""
+Unit tests for version cleanup in the VersionManager.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.storage.object_store import StorageMetadata
+from src.core.storage.versioning import (
+    CleanupPolicy,
+    VersionInfo,
+    VersioningConfig,
+    VersionManager,
+)
+
+
+def make_version(key: str, version_id: str, age_days: int, size: int = 10):
+    """Create a listed object version."""
+    return StorageMetadata(
+        object_key=key,
+        size=size,
+        last_modified=datetime.utcnow() - timedelta(days=age_days),
+        etag=f"etag-{version_id}",
+        content_type="text/plain",
+        version_id=version_id,
+    )
+
+
+@pytest.fixture
+def mock_storage():
+    """Create a mock object storage."""
+    storage = MagicMock()
+    storage.list_objects = AsyncMock()
+    storage.delete_objects = AsyncMock(return_value=[])
+    return storage
+
+
+class TestVersionCleanup:
+    """Test policy-driven version cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_cleanup_uses_single_listing(self, mock_storage):
+        """Test that cleanup lists once and deletes in bulk."""
+        mock_storage.list_objects.return_value = [
+            make_version("a.txt", "a1", 3),
+            make_version("a.txt", "a2", 2),
+            make_version("a.txt", "a3", 1),
+            make_version("b.txt", "b1", 1),
+        ]
+        manager = VersionManager(storage=mock_storage)
+        config = VersioningConfig(max_versions=1)
+
+        result = await manager.cleanup_old_versions("bucket", config=config)
+
+        mock_storage.list_objects.assert_awaited_once_with(
+            bucket_name="bucket", prefix=None, include_versions=True
+        )
+        mock_storage.delete_objects.assert_awaited_once()
+        _, deleted = mock_storage.delete_objects.await_args.args
+        assert sorted(deleted) == [("a.txt", "a1"), ("a.txt", "a2")]
+        assert result["objects_scanned"] == 2
+        assert result["versions_deleted"] == 2
+        assert result["space_freed"] == 20
+
+    @pytest.mark.asyncio
+    async def test_cleanup_batches_deletes(self, mock_storage):
+        """Test that deletions are split into bounded batches."""
+        mock_storage.list_objects.return_value = [
+            make_version("a.txt", f"a{i}", i) for i in range(5)
+        ]
+        manager = VersionManager(storage=mock_storage)
+        manager.delete_batch_size = 2
+        config = VersioningConfig(max_versions=1)
+
+        result = await manager.cleanup_old_versions("bucket", config=config)
+
+        assert mock_storage.delete_objects.await_count == 2
+        assert result["versions_deleted"] == 4
+
+    @pytest.mark.asyncio
+    async def test_cleanup_reports_delete_errors(self, mock_storage):
+        """Test that per-object delete errors are not counted as deleted."""
+        mock_storage.list_objects.return_value = [
+            make_version("a.txt", "a1", 3),
+            make_version("a.txt", "a2", 1),
+        ]
+        mock_storage.delete_objects.return_value = [
+            {"object": "a.txt", "version_id": "a1", "error": "AccessDenied"}
+        ]
+        manager = VersionManager(storage=mock_storage)
+        config = VersioningConfig(max_versions=1)
+
+        result = await manager.cleanup_old_versions("bucket", config=config)
+
+        assert result["versions_deleted"] == 0
+        assert result["errors"][0]["error"] == "AccessDenied"
+
+    def test_time_based_policy_keeps_latest(self):
+        """Test that time-based cleanup never selects the latest version."""
+        manager = VersionManager(storage=MagicMock())
+        config = VersioningConfig(
+            cleanup_policy=CleanupPolicy.TIME_BASED, retention_days=7
+        )
+        old = [
+            VersionInfo(
+                version_id=f"v{i}",
+                object_key="a.txt",
+                created_at=datetime.utcnow() - timedelta(days=30 + i),
+                created_by="unknown",
+                size=1,
+                checksum="",
+                tags={},
+                is_latest=i == 0,
+            )
+            for i in range(3)
+        ]
+
+        selected = manager._select_versions_to_delete(old, config)
+
+        assert [v.version_id for v in selected] == ["v1", "v2"]
@@ -0,0 +1,244 @@
+"""
+Unit tests for the workspace manifest index.
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.storage.object_store import StorageMetadata
+from src.core.workspace.manager import WorkspaceConfig, WorkspaceManager, WorkspaceType
+from src.core.workspace.manifest import WorkspaceManifestIndex
+
+
+def make_object(key: str, size: int) -> StorageMetadata:
+    """Create listed object metadata."""
+    return StorageMetadata(
+        object_key=key,
+        size=size,
+        last_modified=datetime.utcnow(),
+        etag=f"etag-{key}",
+        content_type="text/plain",
+    )
+
+
+@pytest.fixture
+def mock_storage():
+    """Create a mock object storage."""
+    storage = MagicMock()
+    storage.workspaces_bucket = "agent-workspaces"
+    storage.list_objects = AsyncMock(return_value=[])
+    storage.upload_data = AsyncMock()
+    storage.download_data = AsyncMock(side_effect=Exception("NoSuchKey"))
+    return storage
+
+
+@pytest.fixture
+def workspace_config():
+    """Create a test workspace config."""
+    return WorkspaceConfig(
+        workspace_id="ws-1",
+        workspace_type=WorkspaceType.AGENT_PRIVATE,
+        owner_agent_id="agent-1",
+        authorized_agents=["agent-1"],
+    )
+
+
+class TestWorkspaceManifestIndex:
+    """Test manifest index maintenance."""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_uses_single_listing(self, mock_storage, workspace_config):
+        """Test that a rebuild derives stats from one bucket listing."""
+        mock_storage.list_objects.return_value = [
+            make_object("workspaces/ws-1/.workspace", 50),
+            make_object("workspaces/ws-1/files/a.py", 10),
+            make_object("workspaces/ws-1/files/pkg/b.py", 20),
+        ]
+        index = WorkspaceManifestIndex(mock_storage)
+
+        await index.rebuild({"ws-1": workspace_config})
+
+        mock_storage.list_objects.assert_awaited_once()
+        manifest = index.get("ws-1")
+        assert manifest.file_count == 2
+        assert manifest.total_size == 30
+        assert set(manifest.files) == {"a.py", "pkg/b.py"}
+
+    @pytest.mark.asyncio
+    async def test_incremental_updates(self, mock_storage, workspace_config):
+        """Test that uploads and deletes adjust counts without listing."""
+        index = WorkspaceManifestIndex(mock_storage)
+        index.add_workspace(workspace_config)
+
+        await index.record_upload("ws-1", "a.py", make_object("a.py", 10))
+        await index.record_upload("ws-1", "a.py", make_object("a.py", 15))
+        await index.record_upload("ws-1", "b.py", make_object("b.py", 5))
+        await index.record_delete("ws-1", "b.py")
+
+        manifest = index.get("ws-1")
+        assert manifest.file_count == 1
+        assert manifest.total_size == 15
+        mock_storage.list_objects.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_flush_and_load_round_trip(self, mock_storage, workspace_config):
+        """Test that a flushed index can be loaded back."""
+        index = WorkspaceManifestIndex(mock_storage)
+        index.add_workspace(workspace_config)
+        await index.record_upload("ws-1", "a.py", make_object("a.py", 10))
+        await index.close()
+
+        written = {
+            call.kwargs["object_key"]: call.kwargs["data"]
+            for call in mock_storage.upload_data.await_args_list
+        }
+        mock_storage.download_data = AsyncMock(
+            return_value=written[WorkspaceManifestIndex.index_key].encode()
+        )
+
+        loaded = WorkspaceManifestIndex(mock_storage)
+        assert await loaded.load()
+        assert loaded.get("ws-1").total_size == 10
+        files = json.loads(written[WorkspaceManifestIndex.manifest_key("ws-1")])
+        assert files["files"][0]["file_path"] == "a.py"
+
+    @pytest.mark.asyncio
+    async def test_changes_since_returns_latest_per_file(
+        self, mock_storage, workspace_config
+    ):
+        """Test that the change journal collapses repeated writes."""
+        index = WorkspaceManifestIndex(mock_storage)
+        index.add_workspace(workspace_config)
+        await index.record_upload("ws-1", "a.py", make_object("a.py", 10))
+        position = index.journal_position("ws-1")
+
+        await index.record_upload("ws-1", "b.py", make_object("b.py", 5))
+        await index.record_upload("ws-1", "b.py", make_object("b.py", 6))
+        await index.record_delete("ws-1", "a.py")
+
+        changes = index.changes_since("ws-1", position)
+        assert [(c.file_path, c.action) for c in changes] == [
+            ("b.py", "upsert"),
+            ("a.py", "delete"),
+        ]
+        assert index.changes_since("ws-1", index.journal_position("ws-1")) == []
+
+    @pytest.mark.asyncio
+    async def test_changes_since_detects_journal_overflow(
+        self, mock_storage, workspace_config
+    ):
+        """Test that a cursor older than the journal forces a full sync."""
+        index = WorkspaceManifestIndex(mock_storage, journal_size=2)
+        index.add_workspace(workspace_config)
+        for name in ["a.py", "b.py", "c.py"]:
+            await index.record_upload("ws-1", name, make_object(name, 1))
+
+        assert index.changes_since("ws-1", 0) is None
+        assert len(index.changes_since("ws-1", 1)) == 2
+
+    @pytest.mark.asyncio
+    async def test_reconcile_detects_external_changes(
+        self, mock_storage, workspace_config
+    ):
+        """Test that reconcile journals ETag changes, additions and removals."""
+        index = WorkspaceManifestIndex(mock_storage)
+        index.add_workspace(workspace_config)
+        await index.record_upload("ws-1", "a.py", make_object("a.py", 10))
+        await index.record_upload("ws-1", "b.py", make_object("b.py", 10))
+        position = index.journal_position("ws-1")
+
+        changed = make_object("workspaces/ws-1/files/a.py", 12)
+        changed.etag = "etag-new"
+        mock_storage.list_objects.return_value = [
+            changed,
+            make_object("workspaces/ws-1/files/c.py", 3),
+        ]
+
+        assert await index.reconcile("ws-1") == 3
+        changes = index.changes_since("ws-1", position)
+        assert {(c.file_path, c.action) for c in changes} == {
+            ("a.py", "upsert"),
+            ("c.py", "upsert"),
+            ("b.py", "delete"),
+        }
+        assert index.get("ws-1").total_size == 15
+
+    @pytest.mark.asyncio
+    async def test_sync_workspaces_reconciles_loaded_index(
+        self, mock_storage, workspace_config
+    ):
+        """Test that a loaded index gains missing configs and drops stale ones."""
+        index = WorkspaceManifestIndex(mock_storage)
+        index.add_workspace(workspace_config)
+        stale = WorkspaceConfig(
+            workspace_id="ws-gone",
+            workspace_type=WorkspaceType.AGENT_PRIVATE,
+            owner_agent_id="agent-2",
+            authorized_agents=["agent-2"],
+        )
+        index.add_workspace(stale)
+        await index.flush()
+
+        unflushed = WorkspaceConfig(
+            workspace_id="ws-2",
+            workspace_type=WorkspaceType.AGENT_PRIVATE,
+            owner_agent_id="agent-3",
+            authorized_agents=["agent-3"],
+        )
+        assert index.sync_workspaces({"ws-1": workspace_config, "ws-2": unflushed}) == 2
+        assert set(index.entries) == {"ws-1", "ws-2"}
+        assert index.get("ws-2").files is None
+
+        await index.close()
+        written = json.loads(mock_storage.upload_data.await_args.kwargs["data"])
+        assert [w["workspace_id"] for w in written["workspaces"]] == ["ws-1", "ws-2"]
+
+    @pytest.mark.asyncio
+    async def test_listing_fallback_schedules_flush(
+        self, mock_storage, workspace_config
+    ):
+        """Test that a file manifest rebuilt from a listing is written back."""
+        mock_storage.list_objects.return_value = [
+            make_object("workspaces/ws-1/files/a.py", 10),
+        ]
+        index = WorkspaceManifestIndex(mock_storage, flush_delay=0)
+        index.add_workspace(workspace_config, is_new=False)
+        await index.flush()
+        mock_storage.upload_data.reset_mock()
+
+        files = await index.get_files("ws-1")
+        await index._flush_task
+
+        assert set(files) == {"a.py"}
+        keys = {
+            c.kwargs["object_key"] for c in mock_storage.upload_data.await_args_list
+        }
+        assert WorkspaceManifestIndex.manifest_key("ws-1") in keys
+
+
+class TestManagerWithoutInitialize:
+    """Test a manager used on injected storage without initialize()."""
+
+    @pytest.mark.asyncio
+    async def test_create_and_upload(self, mock_storage, tmp_path):
+        """Test that workspaces and uploads are tracked in the manifest."""
+        mock_storage.get_object_metadata = AsyncMock(side_effect=Exception("NoSuchKey"))
+        mock_storage.upload_file = AsyncMock(return_value=make_object("a.py", 10))
+        (tmp_path / "a.py").write_text("x = 1")
+        manager = WorkspaceManager(storage=mock_storage)
+
+        await manager.create_workspace(
+            "ws-1",
+            WorkspaceType.AGENT_PRIVATE,
+            "agent-1",
+            config={"auto_sync": False},
+        )
+        await manager.upload_file("ws-1", "a.py", tmp_path / "a.py", "agent-1")
+
+        manifest = manager.manifest.get("ws-1")
+        assert (manifest.file_count, manifest.total_size) == (1, 10)
+        assert set(await manager.manifest.get_files("ws-1")) == {"a.py"}
+        await manager.shutdown()
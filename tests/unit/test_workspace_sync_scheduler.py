@@ -0,0 +1,61 @@
+"""
+Unit tests for the WorkspaceManager sync scheduler.
+"""
+
+import asyncio
+from collections import Counter
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.workspace.manager import WorkspaceConfig, WorkspaceManager, WorkspaceType
+
+
+def make_config(workspace_id: str) -> WorkspaceConfig:
+    """Create an auto-sync workspace config with a short interval."""
+    return WorkspaceConfig(
+        workspace_id=workspace_id,
+        workspace_type=WorkspaceType.AGENT_PRIVATE,
+        owner_agent_id="agent-1",
+        authorized_agents=["agent-1"],
+        sync_interval=0.01,
+    )
+
+
+class TestSyncScheduler:
+    """Test dispatch of scheduled syncs."""
+
+    @pytest.mark.asyncio
+    async def test_slow_and_failing_syncs_do_not_stall_others(self):
+        """Test that slow syncs run alongside others and failures are rescheduled."""
+        manager = WorkspaceManager(storage=MagicMock())
+        manager.manifest = MagicMock(close=AsyncMock())
+        manager.sync_jitter = 0
+        calls = Counter()
+        slow_started = asyncio.Event()
+
+        async def sync_workspace(workspace_id: str, full: bool = False):
+            calls[workspace_id] += 1
+            if workspace_id == "slow":
+                slow_started.set()
+                await asyncio.sleep(10)
+            if workspace_id == "broken":
+                raise ValueError("Workspace broken not found")
+            return {}
+
+        manager.sync_workspace = sync_workspace
+        for workspace_id in ("slow", "fast", "broken"):
+            config = make_config(workspace_id)
+            manager.active_workspaces[workspace_id] = config
+            await manager._start_sync_task(config)
+
+        await slow_started.wait()
+        await asyncio.sleep(0.2)
+
+        assert calls["slow"] == 1
+        assert calls["fast"] >= 5
+        assert calls["broken"] >= 5
+        assert manager._scheduled_workspaces == {"slow", "fast", "broken"}
+
+        await manager.shutdown()
+        assert not manager._sync_tasks
@@ -0,0 +1,203 @@
+"""
+Unit tests for WorkspaceManager tree uploads and downloads.
+"""
+
+import asyncio
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.storage.object_store import StorageMetadata
+from src.core.workspace.manager import (
+    ConflictResolution,
+    WorkspaceConfig,
+    WorkspaceManager,
+    WorkspaceType,
+)
+from src.core.workspace.manifest import WorkspaceManifestIndex
+
+
+async def file_hash(path: Path) -> str:
+    """SHA-256 of a local file, like ObjectStorage.calculate_file_hash."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def make_metadata(key: str, size: int) -> StorageMetadata:
+    """Create uploaded object metadata."""
+    return StorageMetadata(
+        object_key=key,
+        size=size,
+        last_modified=datetime.utcnow(),
+        etag=f"etag-{key}",
+        content_type="text/plain",
+    )
+
+
+class TransferTracker:
+    """Fake transfers that record how many are in flight at once."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.uploaded: list[str] = []
+        self.downloaded: list[str] = []
+
+    async def _transfer(self) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def upload_file(self, bucket_name, object_key, file_path, metadata, file_hash):
+        await self._transfer()
+        self.uploaded.append(object_key)
+        return make_metadata(object_key, Path(file_path).stat().st_size)
+
+    async def download_file(self, bucket_name, object_key, file_path):
+        await self._transfer()
+        self.downloaded.append(object_key)
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(file_path).write_text(object_key)
+        return file_path
+
+
+@pytest.fixture
+def tracker():
+    """Create a transfer tracker."""
+    return TransferTracker()
+
+
+@pytest.fixture
+def manager(tracker):
+    """Create a workspace manager on mocked storage with one workspace."""
+    storage = MagicMock()
+    storage.workspaces_bucket = "agent-workspaces"
+    storage.upload_data = AsyncMock()
+    storage.calculate_file_hash = AsyncMock(side_effect=file_hash)
+    storage.upload_file = AsyncMock(side_effect=tracker.upload_file)
+    storage.download_file = AsyncMock(side_effect=tracker.download_file)
+
+    manager = WorkspaceManager(storage=storage)
+    manager.manifest = WorkspaceManifestIndex(storage)
+    config = WorkspaceConfig(
+        workspace_id="ws-1",
+        workspace_type=WorkspaceType.PROJECT_SHARED,
+        owner_agent_id="owner",
+        authorized_agents=["owner", "helper"],
+        auto_sync=False,
+    )
+    manager.active_workspaces["ws-1"] = config
+    manager.manifest.add_workspace(config)
+    return manager
+
+
+def write_tree(root: Path, files: dict[str, str]) -> None:
+    """Write files under a directory."""
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+async def collect(progress_stream) -> list:
+    """Drain a progress stream."""
+    return [progress async for progress in progress_stream]
+
+
+class TestUploadTree:
+    """Test bulk uploads."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_upload_and_progress(self, manager, tracker, tmp_path):
+        """Test bounded concurrency, running totals and skipping unchanged files."""
+        files = {f"pkg/mod{i}.py": "x" * (i + 1) for i in range(6)}
+        write_tree(tmp_path, files)
+
+        events = await collect(
+            manager.upload_tree("ws-1", tmp_path, "owner", max_concurrency=2)
+        )
+
+        assert tracker.peak == 2
+        assert sorted(e.file_path for e in events) == sorted(files)
+        assert {e.action for e in events} == {"uploaded"}
+        assert [e.files_done for e in events] == list(range(1, 7))
+        assert {e.files_total for e in events} == {6}
+        assert {e.bytes_total for e in events} == {21}
+        assert events[-1].bytes_done == 21
+        assert [e.bytes_done for e in events] == sorted(e.bytes_done for e in events)
+
+        (tmp_path / "pkg" / "mod0.py").write_text("changed")
+        events = await collect(manager.upload_tree("ws-1", tmp_path, "owner"))
+
+        actions = {e.file_path: e.action for e in events}
+        assert actions.pop("pkg/mod0.py") == "uploaded"
+        assert set(actions.values()) == {"skipped"}
+        assert len(tracker.uploaded) == 7
+        await manager.manifest.close()
+
+    @pytest.mark.asyncio
+    async def test_conflicts_use_workspace_strategy(self, manager, tracker, tmp_path):
+        """Test that changed files conflict for non-owners under agent priority."""
+        manager.active_workspaces["ws-1"].conflict_resolution = (
+            ConflictResolution.AGENT_PRIORITY
+        )
+        write_tree(tmp_path, {"a.py": "v1", "b.py": "v1"})
+        await collect(manager.upload_tree("ws-1", tmp_path, "owner"))
+
+        write_tree(tmp_path, {"a.py": "v2", "c.py": "new"})
+        events = await collect(manager.upload_tree("ws-1", tmp_path, "helper"))
+
+        actions = {e.file_path: e.action for e in events}
+        assert actions == {"a.py": "failed", "b.py": "skipped", "c.py": "uploaded"}
+        failed = next(e for e in events if e.action == "failed")
+        assert "conflict" in failed.error
+        assert [c.file_path for c in manager.conflict_queue] == ["a.py"]
+        assert failed.files_done <= 3 and events[-1].bytes_done == 7
+
+        # The owner wins under agent priority
+        events = await collect(manager.upload_tree("ws-1", tmp_path, "owner"))
+        assert {e.file_path: e.action for e in events}["a.py"] == "uploaded"
+        assert len(manager.conflict_queue) == 1
+        await manager.manifest.close()
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_agent_is_rejected(self, manager, tmp_path):
+        """Test that write permission is checked before any transfer."""
+        write_tree(tmp_path, {"a.py": "v1"})
+
+        with pytest.raises(PermissionError):
+            await collect(manager.upload_tree("ws-1", tmp_path, "stranger"))
+        manager.storage.upload_file.assert_not_awaited()
+
+
+class TestDownloadTree:
+    """Test bulk downloads."""
+
+    @pytest.mark.asyncio
+    async def test_download_skips_matching_local_files(self, manager, tracker, tmp_path):
+        """Test that only missing or changed local files are downloaded."""
+        source = tmp_path / "source"
+        write_tree(source, {"docs/a.md": "aaa", "docs/b.md": "bb", "src/c.py": "c"})
+        await collect(manager.upload_tree("ws-1", source, "owner"))
+
+        target = tmp_path / "target"
+        write_tree(target, {"a.md": "aaa", "b.md": "stale"})
+        tracker.peak = 0
+        events = await collect(
+            manager.download_tree(
+                "ws-1", target, "helper", prefix="docs/", max_concurrency=1
+            )
+        )
+
+        assert {e.file_path: e.action for e in events} == {
+            "docs/a.md": "skipped",
+            "docs/b.md": "downloaded",
+        }
+        assert tracker.peak == 1
+        assert tracker.downloaded == ["workspaces/ws-1/files/docs/b.md"]
+        assert (events[-1].files_done, events[-1].bytes_done) == (2, 5)
+        assert {e.bytes_total for e in events} == {5}
+        await manager.manifest.close()